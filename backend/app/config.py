@@ -16,6 +16,21 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./wetee.db"
+    DB_ECHO: bool = False  # SQL 로그 출력 (DEBUG와 별개, 필요할 때만 켜기)
+
+    # Database Connection Pool (워커 프로세스 단위, 동기/비동기 엔진 각각 적용)
+    DB_POOL_SIZE: int = 5  # 상시 유지 커넥션 수
+    DB_MAX_OVERFLOW: int = 10  # 부하 시 추가로 여는 커넥션 수 (최대 = POOL_SIZE + MAX_OVERFLOW)
+    DB_POOL_TIMEOUT_SECONDS: int = 30  # 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # 오래된 커넥션 재연결 (서버/프록시 idle timeout보다 짧게, -1 = 사용 안 함)
+    DB_POOL_PRE_PING: bool = True  # 커넥션 사용 전 생존 확인 (DB 재시작/끊긴 커넥션 자동 복구)
+
+    # SQLite (개발/단일 서버) - 연결마다 PRAGMA 적용
+    SQLITE_JOURNAL_MODE: str = "WAL"  # 읽기와 쓰기 동시 진행 (database is locked 감소)
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # WAL에서 안전한 수준으로 fsync 횟수 감소
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # 쓰기 잠금을 바로 실패하지 않고 기다리는 시간
+    SQLITE_MMAP_SIZE_BYTES: int = 268435456  # 256MB 메모리 맵 읽기 (0 = 사용 안 함)
+    SQLITE_CACHE_SIZE_KIB: int = 65536  # 연결당 페이지 캐시 64MB
 
     # JWT - REQUIRED in production
     # 운영 환경에서는 반드시 환경변수로 설정해야 함
@@ -44,6 +59,7 @@ class Settings(BaseSettings):
 
     # Security
     BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4  # bcrypt 전용 스레드 수 (CPU 코어 수 권장)
 
     # Payment Gateway (Toss Payments) - F-006
     TOSS_PAYMENTS_SECRET_KEY: str = ""  # 환경변수에서 로드 (개발: 빈 문자열, 운영: 실제 시크릿 키)
@@ -72,6 +88,64 @@ class Settings(BaseSettings):
     NAVER_SENS_SECRET_KEY: str = ""
     NAVER_SENS_FROM_NUMBER: str = ""
 
+    # Calendar Feed (iCalendar 구독) - F-003
+    CALENDAR_FEED_CACHE_TTL_SECONDS: int = 900  # 사용자별 피드 캐시 유지 시간
+    CALENDAR_FEED_CACHE_MAX_ENTRIES: int = 5000  # 캐시 최대 항목 수 (LRU)
+    CALENDAR_FEED_PAST_DAYS: int = 90  # 피드에 포함할 과거 일정 범위 (일)
+
+    # Schedule Sweeper (지난 일정 자동 완료 처리) - F-003, F-006
+    SCHEDULE_SWEEPER_ENABLED: bool = True
+    SCHEDULE_SWEEPER_INTERVAL_SECONDS: int = 300  # 실행 주기
+    SCHEDULE_SWEEPER_GRACE_MINUTES: int = 30  # 수업 종료 후 대기 시간
+    SCHEDULE_SWEEPER_BATCH_SIZE: int = 500  # UPDATE 1회당 최대 처리 행 수
+    SCHEDULE_SWEEPER_MAX_BATCHES: int = 20  # 1회 실행당 최대 배치 수
+
+    # Attendance Analytics (출결 분석 캐시) - F-004
+    ATTENDANCE_ANALYTICS_CACHE_TTL_SECONDS: int = 600  # (학생, 그룹, 연도)별 분석 결과 캐시 유지 시간
+    ATTENDANCE_ANALYTICS_CACHE_MAX_ENTRIES: int = 2000  # 캐시 최대 항목 수 (LRU)
+
+    # Lesson Read Receipts (수업 기록 읽음 상태 지연 기록) - F-005
+    LESSON_READ_RECEIPT_BUFFER_ENABLED: bool = True  # False면 조회 시 즉시 커밋
+    LESSON_READ_RECEIPT_FLUSH_INTERVAL_SECONDS: int = 5  # 버퍼 기록 주기
+    LESSON_READ_RECEIPT_FLUSH_THRESHOLD: int = 500  # 버퍼가 이 크기에 도달하면 주기를 기다리지 않고 기록
+
+    # Weekly Parent Report (학부모 주간 리포트)
+    WEEKLY_REPORT_RENDER_WORKERS: int = 0  # 렌더링 프로세스 수 (0이면 CPU 수)
+    WEEKLY_REPORT_EMAIL_BATCH_SIZE: int = 100  # SMTP 연결 1회당 발송 수
+
+    # Authorization Context (그룹 멤버십 권한 캐시)
+    AUTHZ_CACHE_TTL_SECONDS: int = 30  # 요청 간 멤버십 캐시 유지 시간 (0이면 요청 범위만)
+    AUTHZ_CACHE_MAX_ENTRIES: int = 10000  # 캐시 최대 사용자 수 (LRU)
+
+    # Group Home (그룹 홈 화면 통합 조회)
+    GROUP_HOME_PARALLEL_QUERIES: bool = True  # 섹션 동시 조회 (SQLite는 항상 순차)
+    GROUP_HOME_QUERY_WORKERS: int = 8  # 섹션 동시 조회 스레드 수 (프로세스 공유, 최대 커넥션 수의 절반 이하로 제한)
+
+    # Shared Store (워커 간 공유 캐시, 선택)
+    REDIS_URL: str = ""  # 예: redis://localhost:6379/0 (비어 있으면 워커별 메모리 캐시만 사용)
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 0.2
+
+    # Principal Cache (인증 사용자 캐시)
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = 30  # 비활성화/프로필 변경이 다른 워커에 반영되는 최대 지연 (0이면 캐시 안 함)
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
+    # Rate Limiting (F-001 보안 강화)
+    RATE_LIMIT_STORAGE_URI: str = ""  # 비어 있으면 REDIS_URL → 없으면 bounded-memory:// (워커별)
+    RATE_LIMIT_STRATEGY: str = "sliding-window-counter"  # fixed-window / moving-window / sliding-window-counter
+    RATE_LIMIT_MEMORY_MAX_KEYS: int = 100000  # bounded-memory 저장소의 키 수 상한
+
+    # Refresh Token Rotation (토큰 계열 저장소) - F-001
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS: int = 10  # 동시 갱신(여러 탭) 허용 시간, 이후 재사용은 계열 폐기
+    REFRESH_TOKEN_REVOKED_CACHE_MAX_ENTRIES: int = 100000  # 폐기 계열 Bloom 필터/LRU 크기 (워커 단위)
+    REFRESH_TOKEN_PURGE_ENABLED: bool = True  # 만료 토큰 정리 백그라운드 워커
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: int = 3600
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = 1000
+    REFRESH_TOKEN_PURGE_MAX_BATCHES: int = 50
+
+    # Async Database (비동기 세션, 선택 - asyncpg/aiosqlite 필요)
+    ASYNC_DB_ENABLED: bool = False  # 핫패스(로그인, 알림, 일정 목록) 비동기 라우트 사용
+    ASYNC_DATABASE_URL: str = ""  # 비어 있으면 DATABASE_URL의 드라이버만 교체 (asyncpg/aiosqlite)
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -0,0 +1,76 @@
+"""
+Background Worker Utilities
+주기 실행 백그라운드 작업 (스레드 기반)
+
+별도 작업 큐(Celery 등) 없이 API 프로세스 안에서 주기적인 정리/집계 작업을 실행합니다.
+- startup 이벤트에서 start(), shutdown 이벤트에서 stop() 호출
+- 작업 함수의 예외는 로그만 남기고 다음 주기에 재시도
+- wake()로 다음 주기를 기다리지 않고 즉시 실행 요청 가능 (버퍼 임계치 도달 등)
+"""
+
+import logging
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicWorker:
+    """
+    interval_seconds 간격으로 func를 실행하는 데몬 스레드
+
+    Usage:
+        worker = PeriodicWorker("schedule-sweeper", 300, run_sweep)
+        worker.start()
+        ...
+        worker.stop()
+    """
+
+    def __init__(self, name: str, interval_seconds: float, func: Callable[[], None]):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.func = func
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """워커 시작 (이미 실행 중이면 무시)"""
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        self._wake_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        logger.info(f"Background worker started: {self.name} (every {self.interval_seconds}s)")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """워커 중지 (진행 중인 실행이 끝날 때까지 최대 timeout초 대기)"""
+        if not self.is_running:
+            return
+
+        self._stop_event.set()
+        self._wake_event.set()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+        logger.info(f"Background worker stopped: {self.name}")
+
+    def wake(self) -> None:
+        """다음 주기를 기다리지 않고 즉시 1회 실행 요청 (실행 중이 아니면 무시)"""
+        self._wake_event.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake_event.wait(self.interval_seconds)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                self.func()
+            except Exception:
+                logger.exception(f"Background worker {self.name} failed")
@@ -0,0 +1,62 @@
+"""
+Bloom Filter
+집합 포함 여부를 고정 크기 비트 배열로 근사 판정
+
+- "없음"은 항상 정확 (거짓 음성 없음), "있음"은 error_rate 확률로 오판 가능
+- 삭제를 지원하지 않으므로 capacity를 넘으면 호출자가 reset 후 다시 채움
+- 폐기된 토큰 ID처럼 대부분의 조회 결과가 "없음"인 집합을 잠금 경합 없이 빠르게 거르는 용도
+"""
+
+import hashlib
+import math
+import threading
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Thread-safe Bloom filter (blake2b 이중 해싱)
+
+    Usage:
+        revoked = BloomFilter(capacity=100000, error_rate=0.01)
+        revoked.add("family-id")
+        if "family-id" in revoked: ...  # 정확한 확인은 별도 저장소에서
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        # 최적 비트 수 m = -n ln p / (ln 2)^2, 해시 수 k = m/n ln 2
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str) -> None:
+        positions = list(self._positions(item))
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        # 비트는 추가만 되므로 읽기는 잠금 없이 수행
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    @property
+    def is_full(self) -> bool:
+        """capacity를 넘어 오판율이 설계값보다 높아진 상태"""
+        return self.count >= self.capacity
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bits = bytearray(len(self._bits))
+            self.count = 0
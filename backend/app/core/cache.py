@@ -0,0 +1,112 @@
+"""
+In-process Cache Utilities
+프로세스 내 TTL + LRU 캐시
+
+외부 캐시 서버(Redis 등) 없이 단일 워커 안에서 반복 계산/조회 결과를 재사용하기 위한 캐시입니다.
+워커 간에는 공유되지 않으므로, 데이터가 바뀌는 쓰기 경로에서 명시적으로 무효화하고
+TTL로 최대 지연 시간을 제한합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe LRU 캐시 (항목별 만료 시간 지원)
+
+    - maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - 만료된 항목은 조회 시점에 제거
+    - hits/misses 통계 제공 (모니터링용)
+
+    Usage:
+        cache = TTLCache(maxsize=1000, ttl_seconds=60)
+        cache.set("key", value)
+        value = cache.get("key")
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (없거나 만료되었으면 default 반환)"""
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key, self._MISSING)
+            if item is self._MISSING:
+                self.misses += 1
+                return default
+
+            expires_at, value = item
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """캐시 저장 (ttl_seconds 미지정 시 기본 TTL 사용)"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """단일 항목 무효화"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """
+        조건에 맞는 항목 일괄 무효화
+
+        Args:
+            predicate: (key, value) -> bool
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        with self._lock:
+            keys = [k for k, (_, v) in self._data.items() if predicate(k, v)]
+            for k in keys:
+                del self._data[k]
+            return len(keys)
+
+    def keys(self) -> List[Hashable]:
+        """만료되지 않은 키 목록 (오래 사용되지 않은 순)"""
+        now = time.monotonic()
+        with self._lock:
+            return [k for k, (expires_at, _) in self._data.items() if expires_at > now]
+
+    def clear(self) -> None:
+        """전체 무효화"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계 (모니터링용)"""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
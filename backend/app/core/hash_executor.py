@@ -0,0 +1,103 @@
+"""
+Password Hash Executor
+비밀번호 해싱(bcrypt) 전용 스레드 풀
+
+bcrypt 해싱/검증은 건당 수십~수백 ms의 CPU 작업입니다. 로그인이 몰리면 요청 스레드 풀(기본 40개)이
+모두 bcrypt를 동시에 돌리며 CPU를 나눠 쓰게 되어 모든 요청의 응답 시간이 함께 늘어납니다.
+해싱을 CPU 코어 수 정도로 제한된 전용 풀에서 실행하면 동시 해싱 수가 제한되고,
+나머지 요청은 대기열에서 순서대로 처리되며 대기 깊이/대기 시간을 지표로 확인할 수 있습니다.
+
+- bcrypt C 확장은 해싱 중 GIL을 해제하므로 스레드 풀로 코어를 병렬 활용
+- 동기 호출(run)은 결과를 기다리고, 비동기 호출자는 submit 결과를 asyncio.wrap_future로 await
+- 통계: stats() (대기/실행 중 작업 수, 최대 대기 깊이, 평균 대기/실행 시간)
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class HashExecutor:
+    """
+    대기열 지표를 수집하는 제한된 스레드 풀 (첫 사용 시 생성)
+
+    Usage:
+        executor = HashExecutor(max_workers=4)
+        hashed = executor.run(pwd_context.hash, password_bytes)
+    """
+
+    def __init__(self, max_workers: int, name: str = "password-hash"):
+        self.max_workers = max(1, max_workers)
+        self.name = name
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        self._pending = 0  # 대기 + 실행 중
+        self._running = 0
+        self.completed = 0
+        self.max_queue_depth = 0
+        self._total_wait_seconds = 0.0
+        self._total_run_seconds = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.name,
+                )
+            return self._executor
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        """작업 제출 (Future 반환)"""
+        enqueued_at = time.monotonic()
+        with self._lock:
+            self._pending += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._pending - self._running)
+
+        def task():
+            started_at = time.monotonic()
+            with self._lock:
+                self._running += 1
+                self._total_wait_seconds += started_at - enqueued_at
+            try:
+                return func(*args)
+            finally:
+                finished_at = time.monotonic()
+                with self._lock:
+                    self._running -= 1
+                    self._pending -= 1
+                    self.completed += 1
+                    self._total_run_seconds += finished_at - started_at
+
+        try:
+            return self._get_executor().submit(task)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """작업을 풀에서 실행하고 결과를 기다림"""
+        return self.submit(func, *args).result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 통계 (모니터링용)"""
+        with self._lock:
+            completed = self.completed
+            return {
+                "workers": self.max_workers,
+                "queued": self._pending - self._running,
+                "running": self._running,
+                "completed": completed,
+                "max_queue_depth": self.max_queue_depth,
+                "avg_wait_ms": round(self._total_wait_seconds / completed * 1000, 2) if completed else 0.0,
+                "avg_run_ms": round(self._total_run_seconds / completed * 1000, 2) if completed else 0.0,
+            }
@@ -4,13 +4,59 @@ API_명세서.md 3.2: Rate Limiting 정책
 
 slowapi를 사용한 Rate Limiting 설정
 보안 강화: 인증된 사용자는 user_id 기반, 미인증 사용자는 IP 기반
+
+저장소 (RATE_LIMIT_STORAGE_URI):
+- redis://... : 모든 워커가 같은 카운터를 공유 (워커 수와 무관하게 정책 한도 적용)
+- bounded-memory:// : 프로세스 내 저장소 (단일 워커/개발/테스트용, 키 수 상한)
+- 미설정 시 REDIS_URL이 있으면 Redis, 없으면 bounded-memory
+
+전략 (RATE_LIMIT_STRATEGY, 기본 sliding-window-counter):
+키당 이전/현재 구간 카운터 2개만 저장하는 근사 슬라이딩 윈도우로,
+고정 윈도우의 경계 몰림 문제 없이 요청 타임스탬프 목록(moving-window)보다 메모리가 적게 듭니다.
+카운터는 구간 길이의 2배가 지나면 만료되므로 더 이상 요청하지 않는 키는 자동으로 제거됩니다.
 """
 
+import heapq
+
+from limits.storage import MemoryStorage
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from fastapi import Request
 from typing import Optional
 
+from app.config import settings
+
+
+class BoundedMemoryStorage(MemoryStorage):
+    """
+    키 수 상한이 있는 프로세스 내 Rate Limit 저장소
+
+    만료된 키는 limits MemoryStorage가 주기적으로 제거하고,
+    만료 전이라도 키 수가 max_keys를 넘으면 만료가 가장 임박한 키(가장 오래 전에 시작된 구간)부터
+    10%를 한 번에 제거해 고유 IP가 폭증해도 메모리가 일정 범위를 넘지 않게 합니다.
+    """
+
+    STORAGE_SCHEME = ["bounded-memory"]
+
+    def __init__(self, uri: Optional[str] = None, max_keys: int = 100000, **options):
+        self.max_keys = max(1, int(max_keys))
+        super().__init__(uri, **options)
+
+    def incr(self, key: str, expiry: float, *args, **kwargs) -> int:
+        count = super().incr(key, expiry, *args, **kwargs)
+        if len(self.storage) > self.max_keys:
+            self._evict()
+        return count
+
+    def _evict(self) -> None:
+        """만료가 임박한 키부터 상한의 10% 제거"""
+        evict_count = max(1, self.max_keys // 10)
+        expirations = list(self.expirations.items())
+        for key, _ in heapq.nsmallest(evict_count, expirations, key=lambda item: item[1]):
+            self.storage.pop(key, None)
+            self.expirations.pop(key, None)
+            self.locks.pop(key, None)
+
 
 def get_identifier(request: Request) -> str:
     """
@@ -25,21 +71,49 @@ def get_identifier(request: Request) -> str:
     Returns:
         str: 클라이언트 식별자 (user_id 또는 IP 주소)
     """
-    # 1. 먼저 request.state에 user 정보가 있는지 확인 (인증 미들웨어에서 설정)
+    # 1. 먼저 request.state에 user 정보가 있는지 확인 (get_current_user 의존성에서 설정)
+    #    limit 데코레이터는 의존성 처리 후 엔드포인트 호출 시점에 검사하므로 인증 라우트에서는 항상 설정됨
     user = getattr(request.state, "user", None)
-    if user and hasattr(user, "user_id"):
+    user_id = getattr(user, "id", None)
+    if user_id:
         # 인증된 사용자: user_id 사용
-        return f"user:{user.user_id}"
-
-    # 2. Authorization 헤더에서 토큰 디코딩 시도 (선택적)
-    # 현재는 단순하게 state.user만 확인하고, 없으면 IP 사용
+        return f"user:{user_id}"
 
-    # 3. 미인증 사용자: IP 주소 사용
+    # 2. 미인증 사용자: IP 주소 사용
     return f"ip:{get_remote_address(request)}"
 
 
+def get_storage_uri() -> str:
+    """Rate Limit 저장소 URI (명시 설정 → REDIS_URL → 프로세스 내 저장소)"""
+    if settings.RATE_LIMIT_STORAGE_URI:
+        return settings.RATE_LIMIT_STORAGE_URI
+    if settings.REDIS_URL:
+        return settings.REDIS_URL
+    return "bounded-memory://"
+
+
+def _storage_options(storage_uri: str) -> dict:
+    if storage_uri.startswith("bounded-memory"):
+        return {"max_keys": settings.RATE_LIMIT_MEMORY_MAX_KEYS}
+    if storage_uri.startswith(("redis", "rediss")):
+        return {
+            "socket_timeout": settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            "socket_connect_timeout": settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        }
+    return {}
+
+
 # Rate Limiter 인스턴스 생성
 # key_func: 클라이언트를 구분하는 기준
 #   - 인증된 사용자: user_id
 #   - 미인증 사용자: IP 주소
-limiter = Limiter(key_func=get_identifier)
+# 공유 저장소 장애 시 워커별 메모리 카운터로 대체 (요청 실패 방지)
+_storage_uri = get_storage_uri()
+limiter = Limiter(
+    key_func=get_identifier,
+    storage_uri=_storage_uri,
+    storage_options=_storage_options(_storage_uri),
+    strategy=settings.RATE_LIMIT_STRATEGY,
+    key_prefix="wetee",
+    in_memory_fallback_enabled=True,
+)
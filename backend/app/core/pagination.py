@@ -0,0 +1,53 @@
+"""
+Cursor Pagination Utilities
+커서 기반 페이지네이션 (keyset pagination)
+
+OFFSET 방식은 페이지가 뒤로 갈수록 건너뛴 행을 모두 읽어야 하므로,
+기록이 계속 쌓이는 목록(출결, 수업 기록 등)은 마지막 항목의 정렬 키를
+불투명한 커서 문자열로 내려주고 다음 요청에서 그 이후만 조회합니다.
+
+Usage:
+    cursor = encode_cursor(last.recorded_at, last.id)
+    recorded_at, item_id = decode_cursor(cursor, datetime, str)
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Type
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(*values: Any) -> str:
+    """정렬 키 값들을 URL-safe 커서 문자열로 인코딩 (datetime은 ISO 8601)"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Type) -> List[Any]:
+    """
+    커서 문자열을 정렬 키 값들로 디코딩
+
+    Args:
+        cursor: encode_cursor()로 만든 문자열
+        types: 각 값의 타입 (datetime이면 ISO 8601 파싱)
+
+    Raises:
+        HTTPException 400: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor length mismatch")
+        return [
+            datetime.fromisoformat(value) if value_type is datetime else value_type(value)
+            for value, value_type in zip(values, types)
+        ]
+    except (ValueError, TypeError, UnicodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_CURSOR", "message": "잘못된 페이지 커서입니다."}
+        )
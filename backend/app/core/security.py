@@ -8,24 +8,48 @@ Based on:
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.config import settings
+from app.core.hash_executor import HashExecutor
+import asyncio
 import hmac
 import hashlib
 import base64
 
 # Password hashing context (bcrypt)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# - 비용(rounds)은 BCRYPT_ROUNDS 설정을 따름
+# - 다른 비용으로 만들어진 해시는 needs_update 대상 → 로그인 성공 시 재해싱
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt 전용 스레드 풀 (동시 해싱 수 제한, 대기열 지표)
+password_hasher = HashExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+
+
+def _password_bytes(password: str) -> bytes:
+    """
+    bcrypt는 최대 72바이트까지만 처리 가능하므로,
+    UTF-8 인코딩 기준 72바이트를 초과하면 잘라냅니다.
+    (bytes로 전달하여 bcrypt의 자동 인코딩 문제 방지)
+    """
+    password_bytes = password.encode('utf-8')
+    if len(password_bytes) > 72:
+        password_bytes = password_bytes[:72]
+    return password_bytes
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt
+    Hash a password using bcrypt (전용 스레드 풀에서 실행, 호출 스레드는 결과를 기다림)
 
-    bcrypt는 최대 72바이트까지만 처리 가능하므로,
-    UTF-8 인코딩 기준 72바이트를 초과하면 자동으로 잘라냅니다.
+    라우트에서는 요청 스레드를 점유하지 않도록 비동기 버전을 await합니다.
 
     Args:
         password: Plain text password
@@ -33,19 +57,14 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    # bcrypt는 72바이트 제한이 있으므로 항상 잘라내기
-    password_bytes = password.encode('utf-8')
-    # 최대 72바이트로 제한하되, UTF-8 문자가 깨지지 않도록 처리
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
-
-    # bytes로 전달하여 bcrypt의 자동 인코딩 문제 방지
-    return pwd_context.hash(password_bytes)
+    return password_hasher.run(pwd_context.hash, _password_bytes(password))
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a password against a hash
+    Verify a password against a hash (전용 스레드 풀에서 실행, 호출 스레드는 결과를 기다림)
+
+    라우트에서는 요청 스레드를 점유하지 않도록 비동기 버전을 await합니다.
 
     Args:
         plain_password: Plain text password to verify
@@ -54,12 +73,43 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    # 비밀번호를 동일한 방식으로 처리 (bytes로 변환, 72바이트 제한)
-    password_bytes = plain_password.encode('utf-8')
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
+    return password_hasher.run(pwd_context.verify, _password_bytes(plain_password), hashed_password)
+
 
-    return pwd_context.verify(password_bytes, hashed_password)
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if the stored hash uses a different cost
+
+    BCRYPT_ROUNDS가 바뀐 뒤 로그인하면 새 비용으로 다시 해싱한 값을 함께 반환합니다.
+    (검증과 재해싱을 같은 작업으로 실행하므로 대기열을 한 번만 거침)
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Stored hashed password
+
+    Returns:
+        (일치 여부, 새 해시 또는 None)
+    """
+    return password_hasher.run(pwd_context.verify_and_update, _password_bytes(plain_password), hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password의 비동기 버전 (이벤트 루프를 막지 않고 전용 풀의 결과를 기다림)"""
+    return await asyncio.wrap_future(password_hasher.submit(pwd_context.hash, _password_bytes(password)))
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password의 비동기 버전"""
+    return await asyncio.wrap_future(
+        password_hasher.submit(pwd_context.verify, _password_bytes(plain_password), hashed_password)
+    )
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password의 비동기 버전"""
+    return await asyncio.wrap_future(
+        password_hasher.submit(pwd_context.verify_and_update, _password_bytes(plain_password), hashed_password)
+    )
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
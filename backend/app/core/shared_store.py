@@ -0,0 +1,90 @@
+"""
+Shared Key-Value Store
+워커 간 공유 캐시 저장소 (선택)
+
+REDIS_URL이 설정되면 Redis 프로토콜 서버를 워커 간 공유 저장소로 사용하고,
+설정되지 않으면 공유 저장소 없이 각 워커의 프로세스 내 캐시만 사용합니다.
+LocalStore는 같은 인터페이스의 프로세스 내 구현으로, 단일 워커 배포와 테스트에서 Redis 대신 사용합니다.
+
+- 값은 문자열로 저장 (호출자가 JSON 직렬화)
+- redis 패키지는 REDIS_URL을 사용할 때만 필요 (pip install redis)
+
+Usage:
+    store = get_shared_store()
+    if store is not None:
+        store.set("principal:user-1", payload, ttl_seconds=30)
+"""
+
+import threading
+from typing import Optional
+
+from app.config import settings
+from app.core.cache import TTLCache
+
+
+class LocalStore:
+    """
+    프로세스 내 공유 저장소 구현 (Redis 대체용)
+
+    TTLCache 위에 RedisStore와 같은 get/set/delete 인터페이스를 제공합니다.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self._cache = TTLCache(maxsize=maxsize, ttl_seconds=60)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self._cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+
+class RedisStore:
+    """
+    Redis 프로토콜 공유 저장소
+
+    저장소 장애가 요청 실패로 이어지지 않도록 호출자는 예외를 캐시 미스로 처리합니다.
+    """
+
+    def __init__(self, url: str):
+        import redis  # 선택 의존성: REDIS_URL 사용 시에만 필요
+
+        self._client = redis.Redis.from_url(
+            url,
+            decode_responses=True,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        )
+
+    @property
+    def client(self):
+        return self._client
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self._client.set(key, value, px=max(1, int(ttl_seconds * 1000)))
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+
+_store: Optional[RedisStore] = None
+_store_lock = threading.Lock()
+
+
+def get_shared_store() -> Optional[RedisStore]:
+    """
+    설정된 공유 저장소 (REDIS_URL 미설정 시 None, 첫 사용 시 연결 생성)
+    """
+    global _store
+    if not settings.REDIS_URL:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = RedisStore(settings.REDIS_URL)
+        return _store
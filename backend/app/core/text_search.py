@@ -0,0 +1,112 @@
+"""
+Full-Text Search Utilities
+n-gram 토큰화 및 DB별 검색 쿼리 생성
+
+한국어는 조사/어미가 붙어 공백 단위 토큰으로는 "이차방정식을"에서 "방정식"을 찾을 수 없으므로
+단어를 글자 n-gram(기본 2글자)으로 잘라 색인합니다. 검색어도 같은 방식으로 자르고,
+연속된 n-gram을 구문(phrase)으로 묶어 단어 내부 부분 문자열과 일치시킵니다.
+
+- SQLite FTS5: "이차 차방 방정" (구문), "수"* (1글자 접두어)
+- PostgreSQL tsquery: 이차 <-> 차방 <-> 방정, 수:*
+
+Usage:
+    tokens = ngram_document("이차방정식 판별식")   # "이차 차방 방정 정식 판별 별식"
+    match = fts5_query("방정식")                   # '"방정 정식"'
+"""
+
+import re
+import unicodedata
+from typing import List, Optional
+
+NGRAM_SIZE = 2
+MAX_QUERY_TERMS = 8  # 검색어 단어 수 상한 (과도하게 긴 쿼리 방지)
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize(text: str) -> str:
+    """NFKC 정규화 + 소문자 (전각/반각, 대소문자 차이 제거)"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def words(text: Optional[str]) -> List[str]:
+    """정규화된 단어 목록 (문장부호/공백 기준 분리, '_'는 구분자로 취급)"""
+    if not text:
+        return []
+    return [w for w in _WORD_PATTERN.findall(normalize(text).replace("_", " ")) if w]
+
+
+def word_ngrams(word: str, n: int = NGRAM_SIZE) -> List[str]:
+    """단어의 글자 n-gram (n보다 짧은 단어는 그대로)"""
+    if len(word) <= n:
+        return [word]
+    return [word[i:i + n] for i in range(len(word) - n + 1)]
+
+
+def ngram_document(text: Optional[str], n: int = NGRAM_SIZE) -> str:
+    """색인용 문서 문자열 (n-gram을 공백으로 연결)"""
+    return " ".join(gram for word in words(text) for gram in word_ngrams(word, n))
+
+
+def query_terms(query: str) -> List[str]:
+    """검색어 단어 목록 (중복 제거, 최대 MAX_QUERY_TERMS개)"""
+    terms = []
+    for word in words(query):
+        if word not in terms:
+            terms.append(word)
+    return terms[:MAX_QUERY_TERMS]
+
+
+def fts5_query(query: str, n: int = NGRAM_SIZE) -> Optional[str]:
+    """
+    SQLite FTS5 MATCH 식 (단어별 n-gram 구문을 AND로 결합)
+
+    Returns:
+        str 또는 None (검색 가능한 단어가 없는 경우)
+    """
+    parts = []
+    for term in query_terms(query):
+        if len(term) < n:
+            parts.append(f'"{term}"*')
+        else:
+            parts.append('"' + " ".join(word_ngrams(term, n)) + '"')
+    return " AND ".join(parts) or None
+
+
+def tsquery(query: str, n: int = NGRAM_SIZE) -> Optional[str]:
+    """
+    PostgreSQL to_tsquery('simple', ...) 식 (단어별 n-gram을 <->로 연결, 단어끼리 &)
+
+    Returns:
+        str 또는 None (검색 가능한 단어가 없는 경우)
+    """
+    parts = []
+    for term in query_terms(query):
+        if len(term) < n:
+            parts.append(f"{term}:*")
+        else:
+            parts.append("(" + " <-> ".join(word_ngrams(term, n)) + ")")
+    return " & ".join(parts) or None
+
+
+def snippet(text: Optional[str], query: str, width: int = 80) -> Optional[str]:
+    """
+    원문에서 첫 번째 검색어 주변을 잘라낸 미리보기 (색인은 n-gram이므로 원문 기준으로 생성)
+
+    Args:
+        text: 원문
+        query: 검색어
+        width: 미리보기 길이 (글자)
+    """
+    if not text:
+        return None
+
+    normalized = normalize(text)
+    positions = [normalized.find(term) for term in query_terms(query)]
+    positions = [p for p in positions if p >= 0]
+    if not positions or len(text) <= width:
+        return text[:width] + ("..." if len(text) > width else "")
+
+    start = max(0, min(positions) - width // 4)
+    end = start + width
+    return ("..." if start > 0 else "") + text[start:end] + ("..." if end < len(text) else "")
@@ -3,25 +3,170 @@ Database connection and session management
 SQLAlchemy 엔진 및 세션 설정
 """
 
-from sqlalchemy import create_engine
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from app.config import settings
 
-# Create SQLAlchemy engine
-# For SQLite, we need to use check_same_thread=False
-# For PostgreSQL, this parameter is not needed
-connect_args = {"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args=connect_args,
-    echo=settings.DEBUG,  # Log SQL queries in debug mode
-)
+def _is_memory_sqlite(url) -> bool:
+    """인메모리 SQLite 여부 (단일 커넥션 풀을 쓰므로 풀 크기 설정 불가)"""
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    create_engine / create_async_engine 공통 옵션 (DB_* 설정)
+
+    - SQLite: check_same_thread=False (요청 스레드 간 커넥션 공유)
+    - 인메모리 SQLite: SQLAlchemy 기본 단일 커넥션 풀 유지 (풀 크기 옵션 미적용)
+    """
+    url = make_url(database_url)
+    options: Dict[str, Any] = {"echo": settings.DB_ECHO}
+
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    if _is_memory_sqlite(url):
+        return options
+
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    return options
+
+
+def _sqlite_pragmas() -> Dict[str, Any]:
+    """연결마다 적용할 SQLite PRAGMA (SQLITE_* 설정, 0 이하 값은 생략)"""
+    pragmas: Dict[str, Any] = {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+    }
+    if settings.SQLITE_MMAP_SIZE_BYTES > 0:
+        pragmas["mmap_size"] = settings.SQLITE_MMAP_SIZE_BYTES
+    if settings.SQLITE_CACHE_SIZE_KIB > 0:
+        pragmas["cache_size"] = -settings.SQLITE_CACHE_SIZE_KIB  # 음수 = KiB 단위
+    return pragmas
+
+
+def _install_sqlite_pragmas(sync_engine: Engine) -> None:
+    """새 DBAPI 커넥션이 열릴 때마다 PRAGMA 적용 (트랜잭션 시작 전이라 journal_mode 변경 가능)"""
+    pragmas = _sqlite_pragmas()
+
+    @event.listens_for(sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def create_db_engine(database_url: Optional[str] = None) -> Engine:
+    """
+    동기 엔진 생성 (커넥션 풀 설정 + SQLite PRAGMA)
+
+    Args:
+        database_url: DB URL (기본: settings.DATABASE_URL)
+
+    Returns:
+        Engine: SQLAlchemy 엔진
+    """
+    database_url = database_url or settings.DATABASE_URL
+    db_engine = create_engine(database_url, **_engine_options(database_url))
+    if db_engine.dialect.name == "sqlite":
+        _install_sqlite_pragmas(db_engine)
+    return db_engine
+
+
+def create_async_db_engine(database_url: Optional[str] = None):
+    """
+    비동기 엔진 생성 (create_db_engine과 같은 풀 설정/PRAGMA, 이벤트는 sync_engine에 등록)
+
+    Args:
+        database_url: 비동기 DB URL (기본: get_async_database_url())
+
+    Returns:
+        AsyncEngine: SQLAlchemy 비동기 엔진
+    """
+    database_url = database_url or get_async_database_url()
+    db_engine = create_async_engine(database_url, **_engine_options(database_url))
+    if db_engine.dialect.name == "sqlite":
+        _install_sqlite_pragmas(db_engine.sync_engine)
+    return db_engine
+
+
+# Async engine (ASYNC_DB_ENABLED)
+# 비동기 라우트(로그인, 알림, 일정 목록)가 요청 스레드 풀 대신 이벤트 루프에서 DB를 기다리도록 사용
+# 드라이버: PostgreSQL → asyncpg, SQLite → aiosqlite (사용할 때만 설치)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url() -> str:
+    """비동기 DB URL (ASYNC_DATABASE_URL 미설정 시 DATABASE_URL의 드라이버만 교체)"""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(settings.DATABASE_URL)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)).render_as_string(
+        hide_password=False
+    )
+
+
+# Create SQLAlchemy engine
+engine = create_db_engine()
 
 # SessionLocal class for creating database sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = None
+AsyncSessionLocal = None
+if settings.ASYNC_DB_ENABLED:
+    async_engine = create_async_db_engine()
+    # 커밋 후 속성 만료 시 지연 로딩(동기 IO)이 일어나지 않도록 expire_on_commit=False
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+def _pool_stats(db_engine: Engine) -> Dict[str, Any]:
+    pool = db_engine.pool
+    stats: Dict[str, Any] = {"dialect": db_engine.dialect.name, "pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            max_connections=pool.size() + settings.DB_MAX_OVERFLOW,
+            timeout_seconds=pool.timeout(),
+        )
+    return stats
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    커넥션 풀 현황 조회 (모니터링용, 워커 프로세스 단위)
+
+    checked_out이 max_connections에 가까우면 요청이 커넥션을 기다리고 있다는 뜻입니다.
+    (DB_POOL_SIZE/DB_MAX_OVERFLOW 조정 또는 느린 쿼리 확인)
+    """
+    stats = {"sync": _pool_stats(engine)}
+    if async_engine is not None:
+        stats["async"] = _pool_stats(async_engine.sync_engine)
+    return stats
+
+
 # Base class for all ORM models
 Base = declarative_base()
 
@@ -47,6 +192,26 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Dependency that provides an async database session.
+    Usage: db: AsyncSession = Depends(get_async_db)
+
+    비동기 데이터베이스 세션을 제공하는 의존성 함수 (ASYNC_DB_ENABLED일 때만 사용 가능)
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("ASYNC_DB_ENABLED=False: 비동기 DB 세션을 사용할 수 없습니다.")
+
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            # 예외 발생 시 롤백 처리 (세션 누수 방지)
+            await db.rollback()
+            print(f"⚠️  Async database session rolled back due to exception: {e}")
+            raise
+
+
 def init_db():
     """
     Initialize database - create all tables
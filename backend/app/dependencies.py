@@ -6,11 +6,13 @@ FastAPI Dependencies
 from typing import Optional
 from fastapi import Depends, HTTPException, status, Header, Request
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.core.security import decode_access_token
 from app.models.user import User
+from app.services.principal_service import PrincipalService
 
 # Cookie key for access token (same as in auth.py)
 COOKIE_ACCESS_TOKEN_KEY = "wetee_access_token"
@@ -47,6 +49,39 @@ def get_current_user(
             return {"user_id": current_user.id}
     """
 
+    user_id = _get_token_user_id(request, authorization)
+
+    # 4. 사용자 조회 (principal 캐시 적중 시 DB 조회 없음)
+    user = PrincipalService.get_user(db, user_id)
+    return _check_user(request, user)
+
+
+async def get_current_user_async(
+    request: Request,
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """
+    get_current_user의 비동기 버전 (비동기 라우트용, ASYNC_DB_ENABLED)
+
+    principal 캐시 적중 시에는 IO 없이 반환되고, 미스일 때만 비동기 세션에서 조회합니다.
+    반환된 User는 비동기 세션에 연결되므로 스냅샷에 없는 컬럼(password_hash 등)은
+    접근 전에 명시적으로 로드해야 합니다.
+    """
+    user_id = _get_token_user_id(request, authorization)
+
+    # 4. 사용자 조회 (동기 principal 캐시 로직을 비동기 세션에서 실행)
+    user = await db.run_sync(PrincipalService.get_user, user_id)
+    return _check_user(request, user)
+
+
+def _get_token_user_id(request: Request, authorization: Optional[str]) -> str:
+    """
+    쿠키 또는 Authorization 헤더의 Access Token을 검증하고 사용자 ID 반환
+
+    Raises:
+        HTTPException 401: 토큰이 없거나, 만료되었거나, 유효하지 않은 경우
+    """
     token = None
 
     # 1. 먼저 쿠키에서 토큰 읽기 (보안 강화)
@@ -89,8 +124,17 @@ def get_current_user(
             },
         )
 
-    # 4. 데이터베이스에서 사용자 조회
-    user = db.query(User).filter(User.id == user_id).first()
+    return user_id
+
+
+def _check_user(request: Request, user: Optional[User]) -> User:
+    """
+    사용자 존재 및 계정 상태 확인
+
+    Raises:
+        HTTPException 401: 사용자가 없는 경우
+        HTTPException 403: 비활성 계정
+    """
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -110,6 +154,9 @@ def get_current_user(
             },
         )
 
+    # 6. Rate Limiting 식별자용 (get_identifier가 user_id 기준으로 제한)
+    request.state.user = user
+
     return user
 
 
@@ -144,4 +191,4 @@ def get_current_active_user(
     return current_user
 
 
-__all__ = ["get_db", "get_current_user", "get_current_active_user"]
+__all__ = ["get_db", "get_async_db", "get_current_user", "get_current_user_async", "get_current_active_user"]
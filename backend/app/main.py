@@ -20,9 +20,11 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.config import settings
-from app.database import init_db
+from app.database import init_db, async_engine, get_pool_stats
 from app.core.limiter import limiter
+from app.core.background import PeriodicWorker
 from app.core.response import success_response, error_response
+from app.core.security import password_hasher
 from app.routers import (
     auth_router,
     profiles_router,
@@ -35,7 +37,11 @@ from app.routers import (
     settlements_router,
     invoices_router,
     payments_router,
+    async_router,
 )
+from app.services.schedule_sweeper_service import ScheduleSweeperService
+from app.services.read_receipt_service import ReadReceiptService
+from app.services.refresh_token_service import RefreshTokenService
 
 # Create FastAPI app
 app = FastAPI(
@@ -74,8 +80,9 @@ app.add_middleware(
 def health_check():
     """
     Health check endpoint
+    (커넥션 풀 현황 포함 - 모니터링에서 checked_out/max_connections 추적)
     """
-    return success_response({"status": "ok"})
+    return success_response({"status": "ok", "db_pool": get_pool_stats()})
 
 
 # ==========================
@@ -83,6 +90,10 @@ def health_check():
 # API 엔드포인트 라우터 등록
 # ==========================
 
+# 비동기 DB 라우트 (로그인, 알림, 일정 목록): 같은 경로의 동기 라우트보다 먼저 등록해 대체
+if settings.ASYNC_DB_ENABLED:
+    app.include_router(async_router, prefix="/api/v1")
+
 # F-001: 회원가입 및 로그인
 app.include_router(auth_router, prefix="/api/v1")
 
@@ -111,6 +122,25 @@ app.include_router(invoices_router, prefix="/api/v1")
 app.include_router(payments_router, prefix="/api/v1")
 
 
+# ==========================
+# Background Workers
+# ==========================
+
+# 지난 일정 자동 완료 처리 (F-003, F-006 정산 연동)
+schedule_sweeper = PeriodicWorker(
+    name="schedule-sweeper",
+    interval_seconds=settings.SCHEDULE_SWEEPER_INTERVAL_SECONDS,
+    func=ScheduleSweeperService.run_once,
+)
+
+# 만료된 Refresh Token 정리 (F-001)
+refresh_token_purger = PeriodicWorker(
+    name="refresh-token-purge",
+    interval_seconds=settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS,
+    func=RefreshTokenService.run_purge_once,
+)
+
+
 # ==========================
 # Startup Event
 # ==========================
@@ -130,6 +160,16 @@ def on_startup():
     init_db()
     print("✅ Database tables created/verified")
 
+    if settings.SCHEDULE_SWEEPER_ENABLED:
+        schedule_sweeper.start()
+
+    if settings.REFRESH_TOKEN_PURGE_ENABLED:
+        refresh_token_purger.start()
+
+    # 수업 기록 읽음 상태 일괄 기록 워커 (F-005)
+    if settings.LESSON_READ_RECEIPT_BUFFER_ENABLED:
+        ReadReceiptService.start()
+
 
 @app.on_event("shutdown")
 def on_shutdown():
@@ -137,6 +177,17 @@ def on_shutdown():
     Application shutdown event
     """
     print("👋 Shutting down WeTee API Server...")
+    schedule_sweeper.stop()
+    refresh_token_purger.stop()
+    ReadReceiptService.shutdown()  # 남은 읽음 상태 기록
+    password_hasher.shutdown()
+
+
+@app.on_event("shutdown")
+async def on_shutdown_async_engine():
+    """비동기 엔진 커넥션 풀 정리 (ASYNC_DB_ENABLED)"""
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 # ==========================
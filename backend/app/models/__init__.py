@@ -8,11 +8,12 @@ from app.models.settings import Settings
 from app.models.notification import Notification
 from app.models.group import Group, GroupMember, InviteCode
 from app.models.schedule import Schedule
-from app.models.attendance import Attendance
+from app.models.attendance import Attendance, AttendanceMonthlyRollup
 from app.models.textbook import Textbook
-from app.models.lesson import LessonRecord, ProgressRecord
+from app.models.lesson import LessonRecord, ProgressRecord, LessonSearchDocument
 from app.models.invoice import Invoice, Payment, Transaction
 from app.models.email_verification import EmailVerificationCode
+from app.models.refresh_token import RefreshToken
 
 __all__ = [
     "User",
@@ -23,11 +24,14 @@ __all__ = [
     "InviteCode",
     "Schedule",
     "Attendance",
+    "AttendanceMonthlyRollup",
     "Textbook",
     "LessonRecord",
     "ProgressRecord",
+    "LessonSearchDocument",
     "Invoice",
     "Payment",
     "Transaction",
     "EmailVerificationCode",
+    "RefreshToken",
 ]
@@ -8,7 +8,7 @@ Related:
 - F-006 (Payment - 정산에 활용)
 """
 
-from sqlalchemy import Column, String, Text, DateTime, Enum as SQLEnum, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import Column, String, Text, DateTime, Enum as SQLEnum, ForeignKey, Integer, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -89,8 +89,10 @@ class Attendance(Base):
     # 데이터베이스_설계서.md: UNIQUE(schedule_id, student_id)
     # 한 일정에 한 학생당 하나의 출결 기록만 허용
     # Note: UNIQUE 제약은 자동으로 복합 인덱스 (schedule_id, student_id)를 생성함
+    # 학생별 출결 목록(최신순, 기간 필터, 커서 페이지네이션)은 (student_id, recorded_at) 인덱스 사용
     __table_args__ = (
         UniqueConstraint('schedule_id', 'student_id', name='uq_attendance_schedule_student'),
+        Index('idx_attendance_student_recorded', 'student_id', 'recorded_at'),
     )
 
     def __repr__(self):
@@ -113,6 +115,55 @@ class Attendance(Base):
         }
 
 
+class AttendanceMonthlyRollup(Base):
+    """
+    AttendanceMonthlyRollups table - 학생별 월간 출결 집계
+
+    Related:
+    - F-004: 출결 통계, 그룹 홈 요약
+
+    Notes:
+    - (group_id, student_id, year, month)당 1행, 연/월은 수업 시작 시각(schedule.start_at) 기준
+    - 출결 생성/수정/배치 체크와 같은 트랜잭션에서 증감 (AttendanceRollupService)
+    - 취소(CANCELED)된 일정의 출결은 집계하지 않음
+    - 원본 데이터와의 재계산/검증: scripts/rebuild_attendance_rollups.py
+    """
+
+    __tablename__ = "attendance_monthly_rollups"
+
+    # Composite Primary Key
+    group_id = Column(String(36), ForeignKey("groups.id", ondelete="CASCADE"), primary_key=True)
+    student_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)
+
+    # Counts per AttendanceStatus
+    present_count = Column(Integer, nullable=False, default=0)
+    late_count = Column(Integer, nullable=False, default=0)
+    early_leave_count = Column(Integer, nullable=False, default=0)
+    absent_count = Column(Integer, nullable=False, default=0)
+
+    # Timestamps
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # 그룹 단위 월별 조회 (통계/그룹 홈 요약)
+    __table_args__ = (
+        Index('idx_attendance_rollup_group_period', 'group_id', 'year', 'month'),
+    )
+
+    def __repr__(self):
+        return f"<AttendanceMonthlyRollup Group:{self.group_id} Student:{self.student_id} {self.year}-{self.month:02d}>"
+
+    @property
+    def total_count(self) -> int:
+        return self.present_count + self.late_count + self.early_leave_count + self.absent_count
+
+    @property
+    def attended_count(self) -> int:
+        """출석 횟수 (결석 제외)"""
+        return self.present_count + self.late_count + self.early_leave_count
+
+
 # TODO(Phase 2): Attendance History 테이블 추가
 # 출결 수정 이력 추적용 (누가, 언제, 무엇을, 왜 수정했는지)
 # class AttendanceHistory(Base):
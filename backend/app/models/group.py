@@ -3,7 +3,7 @@ Group Models - F-002 과외 그룹 생성 및 매칭
 데이터베이스_설계서.md의 groups, group_members 테이블 정의를 기반으로 구현
 """
 
-from sqlalchemy import Column, String, Text, DateTime, Integer, Boolean, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Integer, Boolean, Enum as SQLEnum, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime, timedelta
 import uuid
@@ -151,6 +151,10 @@ class GroupMember(Base):
     group_id = Column(String(36), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
+    # 학부모 멤버의 자녀 (같은 그룹의 학생 user_id, PARENT 역할에서만 사용)
+    # F-004/F-008: 학부모에게는 자녀의 출결 알림만 발송
+    student_id = Column(String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+
     # Role
     role = Column(
         SQLEnum(GroupMemberRole, name="group_member_role", native_enum=False),
@@ -172,6 +176,14 @@ class GroupMember(Base):
     group = relationship("Group", back_populates="members")
     user = relationship("User", foreign_keys=[user_id])
 
+    # 같은 그룹 중복 가입 방지 (동시 가입 요청도 DB에서 차단)
+    # 내 그룹 목록(user_id + 상태)과 그룹별 멤버 수 집계(group_id + 상태)용 복합 인덱스
+    __table_args__ = (
+        UniqueConstraint('group_id', 'user_id', name='uq_group_member_group_user'),
+        Index('idx_group_member_user_status', 'user_id', 'invite_status'),
+        Index('idx_group_member_group_status', 'group_id', 'invite_status'),
+    )
+
     def __repr__(self):
         return f"<GroupMember {self.id} - Group:{self.group_id} User:{self.user_id} ({self.role})>"
 
@@ -185,6 +197,7 @@ class GroupMember(Base):
             "user_id": self.user_id,
             "role": self.role.value,
             "invite_status": self.invite_status.value,
+            "student_id": self.student_id,
             "joined_at": self.joined_at.isoformat() if self.joined_at else None,
         }
 
@@ -222,6 +235,9 @@ class InviteCode(Base):
         index=True,
     )
 
+    # 학부모 초대 시 연결할 자녀 (선택, 가입 시 GroupMember.student_id로 복사)
+    student_id = Column(String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+
     # Usage Limits
     max_uses = Column(Integer, nullable=False, default=1)  # 최대 사용 횟수
     used_count = Column(Integer, nullable=False, default=0)  # 현재 사용 횟수
@@ -247,6 +263,7 @@ class InviteCode(Base):
             "code": self.code,
             "group_id": self.group_id,
             "target_role": self.target_role.value,
+            "student_id": self.student_id,
             "created_by": self.created_by,
             "max_uses": self.max_uses,
             "used_count": self.used_count,
@@ -264,7 +281,12 @@ class InviteCode(Base):
         return self.is_active and not self.is_expired() and self.used_count < self.max_uses
 
     def increment_usage(self):
-        """사용 횟수 증가"""
+        """
+        사용 횟수 증가 (메모리 객체만 갱신)
+
+        동시 요청에서 사용 횟수를 초과할 수 있으므로 가입 처리에는
+        GroupService.redeem_invite_code (조건부 UPDATE)를 사용합니다.
+        """
         self.used_count += 1
         if self.used_count >= self.max_uses:
             self.is_active = False
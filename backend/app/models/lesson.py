@@ -9,7 +9,7 @@ Related:
 - Textbook (진도 기록과 N:1 관계)
 """
 
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, CheckConstraint, Index
+from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, CheckConstraint, Index, DDL, event
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -93,7 +93,8 @@ class LessonRecord(Base):
     # Group과의 관계 (N:1)
     # TODO(F-005): Group 모델에 lesson_records = relationship("LessonRecord", ...) 추가
 
-    # User(Teacher)와의 관계 (N:1)
+    # User(Teacher)와의 관계 (N:1) - 타임라인 조회 시 joinedload로 함께 로드
+    teacher = relationship("User", foreign_keys=[created_by])
     # TODO(F-005): User 모델에 lesson_records = relationship("LessonRecord", ...) 추가 (선택사항)
 
     # ProgressRecord와의 관계 (1:N)
@@ -125,6 +126,104 @@ class LessonRecord(Base):
         }
 
 
+class LessonSearchDocument(Base):
+    """
+    Lesson_search_documents table - 수업 기록 전문 검색 문서
+
+    Related:
+    - F-005: 수업 기록 검색 (LessonSearchService)
+    - LessonRecord와 1:1
+
+    Notes:
+    - 내용/숙제/피드백을 글자 2-gram으로 잘라 저장 (app/core/text_search.py)
+    - SQLite: FTS5 외부 콘텐츠 테이블(lesson_search_fts)이 트리거로 이 테이블과 동기화
+    - PostgreSQL: 생성 컬럼 search_vector(tsvector) + GIN 인덱스
+    - FTS5 content_rowid는 정수여야 하므로 UUID 대신 정수 PK 사용
+    - 수업 기록 생성/수정/삭제 시 같은 트랜잭션에서 갱신
+    """
+
+    __tablename__ = "lesson_search_documents"
+
+    # Primary Key (FTS5 rowid)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Foreign Keys
+    lesson_record_id = Column(
+        String(36),
+        ForeignKey("lesson_records.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    group_id = Column(String(36), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # n-gram Tokens (공백 구분)
+    content_tokens = Column(Text, nullable=False, default="")
+    homework_tokens = Column(Text, nullable=False, default="")
+    feedback_tokens = Column(Text, nullable=False, default="")
+
+    # Timestamps
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<LessonSearchDocument {self.id} - Lesson {self.lesson_record_id}>"
+
+
+# 검색 인덱스 DDL (create_all/drop_all 시 DB 방언별로 실행)
+_SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS lesson_search_fts USING fts5(
+        content_tokens, homework_tokens, feedback_tokens,
+        content='lesson_search_documents', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 0'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS lesson_search_documents_ai AFTER INSERT ON lesson_search_documents BEGIN
+        INSERT INTO lesson_search_fts(rowid, content_tokens, homework_tokens, feedback_tokens)
+        VALUES (new.id, new.content_tokens, new.homework_tokens, new.feedback_tokens);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS lesson_search_documents_ad AFTER DELETE ON lesson_search_documents BEGIN
+        INSERT INTO lesson_search_fts(lesson_search_fts, rowid, content_tokens, homework_tokens, feedback_tokens)
+        VALUES ('delete', old.id, old.content_tokens, old.homework_tokens, old.feedback_tokens);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS lesson_search_documents_au AFTER UPDATE ON lesson_search_documents BEGIN
+        INSERT INTO lesson_search_fts(lesson_search_fts, rowid, content_tokens, homework_tokens, feedback_tokens)
+        VALUES ('delete', old.id, old.content_tokens, old.homework_tokens, old.feedback_tokens);
+        INSERT INTO lesson_search_fts(rowid, content_tokens, homework_tokens, feedback_tokens)
+        VALUES (new.id, new.content_tokens, new.homework_tokens, new.feedback_tokens);
+    END
+    """,
+]
+
+_POSTGRESQL_SEARCH_DDL = [
+    """
+    ALTER TABLE lesson_search_documents ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', content_tokens), 'A') ||
+        setweight(to_tsvector('simple', homework_tokens), 'B') ||
+        setweight(to_tsvector('simple', feedback_tokens), 'C')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_lesson_search_vector ON lesson_search_documents USING GIN (search_vector)
+    """,
+]
+
+for _statement in _SQLITE_SEARCH_DDL:
+    event.listen(LessonSearchDocument.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in _POSTGRESQL_SEARCH_DDL:
+    event.listen(LessonSearchDocument.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+event.listen(
+    LessonSearchDocument.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS lesson_search_fts").execute_if(dialect="sqlite"),
+)
+
+
 class ProgressRecord(Base):
     """
     Progress_records table - 진도 기록
@@ -0,0 +1,50 @@
+"""
+Refresh Token Model - F-001 토큰 갱신 및 로그아웃
+발급한 Refresh Token(jti)과 토큰 계열(family)을 저장하는 테이블
+
+로그인 1회가 하나의 계열을 만들고, 갱신할 때마다 같은 계열 안에서 새 jti로 교체(rotation)됩니다.
+이미 교체된 jti가 다시 사용되면 탈취로 보고 계열 전체를 폐기합니다.
+"""
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+from datetime import datetime
+
+from app.database import Base
+
+
+class RefreshToken(Base):
+    """
+    Refresh tokens table
+
+    - jti: 토큰 ID (JWT jti 클레임)
+    - family_id: 로그인 세션 단위 토큰 계열 (JWT fid 클레임)
+    - used_at: 새 토큰으로 교체된 시각 (교체 후 재사용 = 재사용 감지)
+    - revoked_at: 로그아웃/재사용 감지/비밀번호 재설정으로 폐기된 시각
+
+    Related: F-001 3.1, API_명세서.md 6.1.4
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    jti = Column(String(36), primary_key=True)
+    family_id = Column(String(36), nullable=False)
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    parent_jti = Column(String(36), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    used_at = Column(DateTime, nullable=True)
+    revoked_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # 계열 단위 폐기
+        Index('idx_refresh_token_family', 'family_id'),
+        # 사용자 단위 폐기 (비밀번호 재설정)
+        Index('idx_refresh_token_user_revoked', 'user_id', 'revoked_at'),
+        # 만료 토큰 정리 작업
+        Index('idx_refresh_token_expires', 'expires_at'),
+    )
+
+    def __repr__(self):
+        return f"<RefreshToken {self.jti} family={self.family_id}>"
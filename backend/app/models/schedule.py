@@ -9,7 +9,7 @@ Related:
 - F-006 (Payment - 향후 연결)
 """
 
-from sqlalchemy import Column, String, Text, DateTime, Enum as SQLEnum, ForeignKey, JSON
+from sqlalchemy import Column, String, Text, DateTime, Boolean, Enum as SQLEnum, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -94,6 +94,10 @@ class Schedule(Base):
     # NULL이면 단일 일정
     recurrence_rule = Column(JSON, nullable=True)
 
+    # Series ID (반복 일정 묶음)
+    # 정규 수업 생성 1회로 만들어진 일정들은 같은 series_id를 가짐 (일괄 취소/변경용)
+    series_id = Column(String(36), nullable=True, index=True)
+
     # Location and Memo
     location = Column(String(200), nullable=True)  # 수업 장소
     memo = Column(Text, nullable=True)  # 메모
@@ -107,6 +111,11 @@ class Schedule(Base):
     cancel_reason = Column(Text, nullable=True)
     reschedule_reason = Column(Text, nullable=True)
 
+    # Attendance Missing Flag
+    # 종료된 수업인데 출결 기록이 없어 자동 완료(DONE) 처리하지 못한 경우 True
+    # (ScheduleSweeperService가 설정, 출결 기록 후 다음 실행에서 DONE으로 전환)
+    attendance_missing = Column(Boolean, default=False, nullable=False)
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(
@@ -129,6 +138,12 @@ class Schedule(Base):
     # 한 일정당 하나의 수업 기록만 가능
     lesson_record = relationship("LessonRecord", uselist=False, backref="schedule")
 
+    # Table Arguments: 복합 인덱스
+    # 자동 완료 처리 대상 조회용 (status = SCHEDULED AND end_at < cutoff)
+    __table_args__ = (
+        Index('idx_schedule_status_end_at', 'status', 'end_at'),
+    )
+
     def __repr__(self):
         return f"<Schedule {self.id} - {self.title} ({self.type}) at {self.start_at}>"
 
@@ -146,11 +161,13 @@ class Schedule(Base):
             "end_at": self.end_at.isoformat() if self.end_at else None,
             "status": self.status.value,
             "recurrence_rule": self.recurrence_rule,  # JSON 그대로 반환
+            "series_id": self.series_id,
             "location": self.location,
             "memo": self.memo,
             "original_schedule_id": self.original_schedule_id,
             "cancel_reason": self.cancel_reason,
             "reschedule_reason": self.reschedule_reason,
+            "attendance_missing": self.attendance_missing,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -29,6 +29,8 @@ class Textbook(Base):
     - 한 그룹에서 여러 교재를 사용할 수 있음
     - 교재별로 진도가 독립적으로 누적됨
     - 진도 기록이 있는 교재는 삭제 불가 (숨기기만 가능)
+    - progress_* 컬럼은 진도 기록의 비정규화 집계 (수업 기록 생성/삭제, 일정 삭제 시
+      TextbookService.refresh_progress로 같은 트랜잭션에서 갱신)
     """
 
     __tablename__ = "textbooks"
@@ -52,6 +54,13 @@ class Textbook(Base):
     # Start Page (교재 중간부터 시작하는 경우)
     start_page = Column(Integer, default=1, nullable=False)  # 시작 페이지 (기본 1)
 
+    # Progress Aggregates (비정규화 - 교재 목록/진도 요약 헤더에서 집계 쿼리 없이 사용)
+    progress_current_page = Column(Integer, nullable=True)  # 현재 진도 (가장 큰 end_page, 기록 없으면 NULL)
+    progress_lesson_count = Column(Integer, default=0, nullable=False)  # 진도 기록이 있는 수업 횟수
+    progress_pages_covered = Column(Integer, default=0, nullable=False)  # 누적 진도 페이지 수
+    progress_first_lesson_at = Column(DateTime, nullable=True)  # 첫 수업 시작 시각
+    progress_last_lesson_at = Column(DateTime, nullable=True)  # 마지막 수업 시작 시각
+
     # Status
     is_active = Column(Boolean, default=True, nullable=False, index=True)  # 활성 상태 (숨기기용)
 
@@ -75,6 +75,10 @@ class User(Base):
     language = Column(String(10), default="ko", nullable=False)
     timezone = Column(String(50), default="Asia/Seoul", nullable=False)
 
+    # Calendar Feed (F-003)
+    # iCalendar 구독 URL용 토큰 (재발급 시 이전 URL 무효화)
+    calendar_feed_token = Column(String(64), unique=True, nullable=True, index=True)
+
     def __repr__(self):
         return f"<User {self.email} ({self.role})>"
 
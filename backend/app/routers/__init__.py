@@ -16,6 +16,7 @@ from app.routers.settlements import (
     invoices_router,
     payments_router,
 )
+from app.routers.async_routes import router as async_router
 
 __all__ = [
     "auth_router",
@@ -29,4 +30,5 @@ __all__ = [
     "settlements_router",
     "invoices_router",
     "payments_router",
+    "async_router",
 ]
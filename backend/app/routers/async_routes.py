@@ -0,0 +1,264 @@
+"""
+Async Routes - 요청량이 많은 엔드포인트의 비동기 DB 버전 (ASYNC_DB_ENABLED)
+
+같은 경로의 동기 라우트보다 먼저 등록되어 해당 경로를 대체합니다. (API 스키마에는 동기 라우트만 노출)
+동기 라우트는 요청마다 스레드 풀(기본 40개)의 스레드 하나를 DB 응답 동안 점유하지만,
+비동기 라우트는 이벤트 루프에서 DB 응답을 기다리므로 동시 요청 수가 스레드 수에 묶이지 않습니다.
+
+- POST  /auth/login                      (F-001, 비밀번호 검증은 전용 해시 풀에서 대기)
+- GET   /notifications                   (F-008)
+- GET   /notifications/summary           (F-008, 헤더 벨 아이콘 폴링)
+- PATCH /notifications/{id}/read         (F-008)
+- GET   /schedules                       (F-003)
+
+요청/응답 형식과 에러 코드는 동기 라우트와 동일합니다.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.dependencies import get_current_user_async
+from app.models.user import User
+from app.schemas.auth import LoginRequest, UserResponse
+from app.core.security import verify_and_update_password_async, create_access_token
+from app.core.limiter import limiter
+from app.core.response import success_response
+from app.routers.auth import set_auth_cookies
+from app.services.notification_service import NotificationService
+from app.services.refresh_token_service import RefreshTokenService
+from app.services.schedule_service import ScheduleService
+
+router = APIRouter(include_in_schema=False)
+
+
+# ==========================
+# F-001: 로그인
+# ==========================
+
+
+@router.post("/auth/login")
+@limiter.limit("5/minute")
+async def login_async(
+    request: Request,
+    response: Response,
+    payload: LoginRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    로그인 (비동기 버전)
+
+    POST /api/v1/auth/login
+
+    Related: F-001, API_명세서.md 6.1.3, 3.2
+    """
+    # 1. 이메일로 사용자 조회
+    user = (await db.execute(
+        select(User).where(User.email == payload.email.lower())
+    )).scalars().first()
+
+    # 2. 사용자 없음 또는 비밀번호 불일치 → 동일한 에러 (보안)
+    verified, rehashed_password = False, None
+    if user:
+        verified, rehashed_password = await verify_and_update_password_async(payload.password, user.password_hash)
+    if not verified:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "code": "AUTH004",
+                "message": "이메일 또는 비밀번호가 일치하지 않습니다.",
+            },
+        )
+
+    # 3. 계정 상태 확인
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "code": "AUTH005",
+                "message": "비활성화된 계정입니다.",
+            },
+        )
+
+    # 4. JWT 토큰 생성 (Refresh Token 기록은 세션에 추가만 됨)
+    access_token = create_access_token(data={"sub": user.id})
+    refresh_token = RefreshTokenService.issue(db, user.id)
+
+    # 5. 마지막 로그인 시각 업데이트 (재해시된 비밀번호, Refresh Token 기록과 함께 커밋)
+    user.last_login_at = datetime.utcnow()
+    if rehashed_password:
+        user.password_hash = rehashed_password
+    await db.commit()
+
+    # 6. 토큰을 httpOnly 쿠키로 설정
+    set_auth_cookies(response, access_token, refresh_token)
+
+    user_data = UserResponse(
+        user_id=user.id,
+        email=user.email,
+        name=user.name,
+        role=user.role.value,
+        is_email_verified=user.is_email_verified,
+        created_at=user.created_at,
+    )
+
+    return success_response(
+        data={"user": user_data.model_dump(mode='json')},
+        response=response
+    )
+
+
+# ==========================
+# F-008: 알림
+# ==========================
+
+
+@router.get("/notifications")
+async def get_notifications_async(
+    category: Optional[str] = Query(None, description="카테고리 필터 (all/schedule/attendance/payment/lesson/group/system)"),
+    status: Optional[str] = Query("all", description="상태 필터 (all/read/unread)"),
+    page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기 (1-100)"),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    알림 목록 조회 (비동기 버전)
+
+    GET /api/v1/notifications
+
+    Related: F-008, API_명세서.md 6.8.1
+    """
+    try:
+        result = await NotificationService.get_notifications_async(
+            db=db,
+            user_id=current_user.id,
+            category=category,
+            status=status,
+            page=page,
+            size=size,
+        )
+        return success_response(data=result.model_dump(mode='json'))
+    except Exception as e:
+        await db.rollback()
+        print(f"🔥 Error fetching notifications: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "code": "NOTIFICATION001",
+                "message": "알림 목록을 가져오는 중 오류가 발생했습니다.",
+            },
+        )
+
+
+@router.get("/notifications/summary")
+async def get_notification_summary_async(
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    알림 요약 정보 조회 (비동기 버전)
+
+    GET /api/v1/notifications/summary
+
+    Related: F-008, API_명세서.md 6.8.2
+    """
+    try:
+        summary = await NotificationService.get_summary_async(db=db, user_id=current_user.id)
+        return success_response(data=summary.model_dump(mode='json'))
+    except Exception as e:
+        await db.rollback()
+        print(f"🔥 Error fetching notification summary: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "NOTIFICATION002",
+                "message": "알림 요약 정보를 가져오는 중 오류가 발생했습니다.",
+            },
+        )
+
+
+@router.patch("/notifications/{notification_id}/read", status_code=status.HTTP_204_NO_CONTENT)
+async def mark_notification_as_read_async(
+    notification_id: str,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    알림 읽음 처리 (비동기 버전)
+
+    PATCH /api/v1/notifications/{notification_id}/read
+
+    Related: F-008, API_명세서.md 6.8.3
+    """
+    success = await NotificationService.mark_as_read_async(
+        db=db,
+        user_id=current_user.id,
+        notification_id=notification_id,
+    )
+
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "code": "NOTIFICATION003",
+                "message": "알림을 찾을 수 없습니다.",
+            },
+        )
+
+    return success_response(data={}, status_code=status.HTTP_204_NO_CONTENT)
+
+
+# ==========================
+# F-003: 일정
+# ==========================
+
+
+@router.get("/schedules")
+async def get_schedules_async(
+    group_id: Optional[str] = Query(None, description="그룹 ID 필터"),
+    type: Optional[str] = Query(None, description="일정 타입 필터 (REGULAR/MAKEUP/EXAM/HOLIDAY/OTHER)"),
+    status: Optional[str] = Query(None, description="일정 상태 필터 (SCHEDULED/DONE/CANCELED/RESCHEDULED)"),
+    from_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    to_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기 (1-100)"),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    일정 목록 조회 (비동기 버전)
+
+    GET /api/v1/schedules
+
+    Related: F-003, API_명세서.md 6.3.1
+    """
+    try:
+        result = await ScheduleService.get_schedules_async(
+            db=db,
+            user=current_user,
+            group_id=group_id,
+            schedule_type=type,
+            schedule_status=status,
+            from_date=from_date,
+            to_date=to_date,
+            page=page,
+            size=size,
+        )
+        return success_response(data=result.model_dump(mode='json'))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        await db.rollback()
+        print(f"🔥 Error fetching schedules: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "code": "SCHEDULE001",
+                "message": "일정 목록을 가져오는 중 오류가 발생했습니다.",
+            },
+        )
@@ -20,6 +20,7 @@ from app.schemas.attendance import (
     BatchAttendanceResponse,
 )
 from app.services.attendance_service import AttendanceService
+from app.services.attendance_analytics_service import AttendanceAnalyticsService
 from app.core.response import success_response
 
 router = APIRouter(prefix="/attendances", tags=["attendances"])
@@ -65,9 +66,8 @@ def create_attendance(
             payload=payload
         )
         return success_response(
-            data=result.model_dump(mode='json',
-            status_code=status.HTTP_201_CREATED
-        ) if hasattr(result, 'model_dump') else result
+            data=result.model_dump(mode='json') if hasattr(result, 'model_dump') else result,
+            status_code=status.HTTP_201_CREATED,
         )
     except HTTPException as e:
         raise e
@@ -125,9 +125,8 @@ def batch_create_attendances(
             payload=payload
         )
         return success_response(
-            data=result.model_dump(mode='json',
-            status_code=status.HTTP_201_CREATED
-        ) if hasattr(result, 'model_dump') else result
+            data=result.model_dump(mode='json') if hasattr(result, 'model_dump') else result,
+            status_code=status.HTTP_201_CREATED,
         )
     except HTTPException as e:
         raise e
@@ -313,6 +312,8 @@ def get_attendances_by_student(
     group_id: Optional[str] = Query(None, description="그룹 ID (선택)"),
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    limit: int = Query(50, ge=1, le=100, description="페이지 크기 (1-100)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -322,9 +323,10 @@ def get_attendances_by_student(
     GET /api/v1/attendances/students/{student_id}
 
     **기능**:
-    - 특정 학생의 출결 목록 조회
+    - 특정 학생의 출결 목록 조회 (최신순)
     - 날짜 범위 필터링 지원
-    - 그룹 필터링 지원
+    - 그룹 필터링 지원 (미지정 시 내가 속한 그룹의 출결만)
+    - 커서 페이지네이션
 
     **Path Parameters**:
     - student_id: 학생 ID
@@ -333,10 +335,14 @@ def get_attendances_by_student(
     - group_id: 그룹 ID 필터 (선택)
     - start_date: 시작 날짜 (YYYY-MM-DD, 선택)
     - end_date: 종료 날짜 (YYYY-MM-DD, 선택)
+    - cursor: 다음 페이지 커서 (선택)
+    - limit: 페이지 크기 (기본 50, 최대 100)
 
     **Response**:
     - items: 출결 목록
     - total: 전체 출결 수
+    - next_cursor: 다음 페이지 커서 (마지막 페이지면 null)
+    - has_more: 다음 페이지 존재 여부
 
     Related: F-004
     """
@@ -348,6 +354,8 @@ def get_attendances_by_student(
             group_id=group_id,
             start_date=start_date,
             end_date=end_date,
+            cursor=cursor,
+            limit=limit,
         )
         return success_response(
             data=result.model_dump(mode='json') if hasattr(result, 'model_dump') else result
@@ -430,3 +438,66 @@ def get_attendance_stats(
                 "message": "출결 통계 조회 중 오류가 발생했습니다.",
             },
         )
+
+
+# ==========================
+# 학생 출결 분석
+# ==========================
+
+
+@router.get("/groups/{group_id}/students/{student_id}/analytics")
+def get_student_attendance_analytics(
+    group_id: str = Path(..., description="그룹 ID"),
+    student_id: str = Path(..., description="학생 ID"),
+    year: Optional[int] = Query(None, ge=2000, le=2100, description="연도 (기본: 올해)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    학생 연간 출결 분석
+
+    GET /api/v1/attendances/groups/{group_id}/students/{student_id}/analytics
+
+    **기능**:
+    - 연속 출석 (결석 없이 / 정시 출석) 현재·최장 기록
+    - 연간 출결 히트맵 (주 단위 7칸)
+    - 월별 수업/출석/지각 횟수 및 평균 지각 시간
+    - 선생님은 그룹 학생 전체, 학생은 본인, 학부모는 자녀만 조회 가능
+
+    **Path Parameters**:
+    - group_id: 그룹 ID
+    - student_id: 학생 ID
+
+    **Query Parameters**:
+    - year: 연도 (선택, 기본: 올해)
+
+    **Response**:
+    - streaks: 연속 출석 기록
+    - heatmap_start, heatmap: 히트맵 (0: 수업 없음, 1: 결석, 2: 지각/조퇴, 3: 출석)
+    - monthly: 월별 추이
+
+    Related: F-004
+    """
+    try:
+        result = AttendanceAnalyticsService.get_student_analytics(
+            db=db,
+            user=current_user,
+            group_id=group_id,
+            student_id=student_id,
+            year=year,
+        )
+        return success_response(
+            data=result.model_dump(mode='json') if hasattr(result, 'model_dump') else result
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        db.rollback()
+        print(f"🔥 Error fetching attendance analytics: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "ATTENDANCE008",
+                "message": "출결 분석 조회 중 오류가 발생했습니다.",
+            },
+        )
@@ -4,8 +4,10 @@ API_명세서.md 6.1 기반 인증 엔드포인트 구현
 """
 
 from datetime import datetime
+from typing import Optional, Tuple
 import traceback
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError, IntegrityError
 
@@ -26,10 +28,9 @@ from app.schemas.auth import (
     PasswordResetConfirmRequest,
 )
 from app.core.security import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_and_update_password_async,
     create_access_token,
-    create_refresh_token,
     decode_refresh_token,
     create_password_reset_token,
     decode_password_reset_token,
@@ -37,6 +38,9 @@ from app.core.security import (
 from app.models.email_verification import EmailVerificationCode
 from app.models.group import Group
 from app.core.limiter import limiter
+from app.services.group_service import GroupService
+from app.services.principal_service import PrincipalService
+from app.services.refresh_token_service import RefreshTokenService
 from app.core.response import success_response
 from app.config import settings
 from app.schemas.invite_code import InviteCodeVerifyRequest, InviteCodeVerifyResponse
@@ -120,9 +124,182 @@ def clear_auth_cookies(response: Response) -> None:
     )
 
 
+def _validate_registration(db: Session, payload: RegisterRequest) -> Tuple[UserRole, Optional[InviteCode]]:
+    """
+    회원가입 요청 검증 (이메일 중복, 역할, 초대 코드) - 비동기 라우트에서 스레드 풀로 실행
+
+    Returns:
+        (역할, 초대 코드 또는 None)
+
+    Raises:
+        HTTPException: 중복 이메일 또는 유효하지 않은 초대 코드
+    """
+    # 1. 이메일 중복 확인
+    existing_user = db.query(User).filter(User.email == payload.email.lower()).first()
+    if existing_user:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "code": "AUTH001",
+                "message": "이미 가입된 이메일입니다.",
+            },
+        )
+
+    # 2. 역할 변환 (대문자 -> 소문자)
+    role_map = {
+        "TEACHER": UserRole.TEACHER,
+        "STUDENT": UserRole.STUDENT,
+        "PARENT": UserRole.PARENT,
+    }
+    role = role_map.get(payload.role)
+
+    # 3. STUDENT/PARENT는 초대 코드 필수
+    invite_code_obj = None
+    if role in (UserRole.STUDENT, UserRole.PARENT):
+        if not payload.invite_code:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": "INVITE001",
+                    "message": "학생/학부모 가입에는 초대 코드가 필요합니다.",
+                },
+            )
+
+        # 초대 코드 검증
+        invite_code_obj = db.query(InviteCode).filter(
+            InviteCode.code == payload.invite_code.upper()
+        ).first()
+
+        # 코드 존재 여부
+        if not invite_code_obj:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "code": "INVITE001",
+                    "message": "존재하지 않는 초대 코드입니다.",
+                },
+            )
+
+        # 만료 여부
+        if invite_code_obj.is_expired():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": "INVITE002",
+                    "message": "만료된 초대 코드입니다.",
+                },
+            )
+
+        # 사용 횟수 제한
+        if invite_code_obj.used_count >= invite_code_obj.max_uses:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": "INVITE003",
+                    "message": "초대 코드 사용 횟수를 초과했습니다.",
+                },
+            )
+
+        # 역할 일치 여부
+        role_match = {
+            UserRole.STUDENT: GroupMemberRole.STUDENT,
+            UserRole.PARENT: GroupMemberRole.PARENT,
+        }
+        if invite_code_obj.target_role != role_match.get(role):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": "INVITE004",
+                    "message": f"이 초대 코드는 {invite_code_obj.target_role.value} 역할용입니다.",
+                },
+            )
+
+        # 비활성화 상태 확인
+        if not invite_code_obj.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": "INVITE001",
+                    "message": "사용할 수 없는 초대 코드입니다.",
+                },
+            )
+
+    return role, invite_code_obj
+
+
+def _create_registered_user(
+    db: Session,
+    payload: RegisterRequest,
+    role: UserRole,
+    invite_code_obj: Optional[InviteCode],
+    password_hash: str,
+) -> Tuple[str, str, UserResponse]:
+    """
+    사용자 생성 + 초대 코드 사용 처리 + 토큰 발급 (한 트랜잭션) - 비동기 라우트에서 스레드 풀로 실행
+
+    Returns:
+        (Access Token, Refresh Token, 응답용 사용자 정보)
+    """
+    # 5. User 생성
+    new_user = User(
+        email=payload.email.lower(),
+        password_hash=password_hash,
+        name=payload.name,
+        phone=payload.phone,
+        role=role,
+        is_active=True,
+        is_email_verified=False,  # TODO: 이메일 인증 구현 후 활성화
+    )
+
+    db.add(new_user)
+    db.flush()  # ID 생성 (초대 코드 사용 처리와 한 트랜잭션으로 커밋)
+
+    # 6. 초대 코드 사용 시 사용 횟수 증가 및 그룹 멤버로 추가
+    if invite_code_obj:
+        # 사용 횟수 증가 (조건부 원자적 UPDATE, 검증 후 다른 가입자가 소진했으면 실패)
+        if not GroupService.redeem_invite_code(db, invite_code_obj.id):
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": "INVITE003",
+                    "message": "초대 코드 사용 횟수를 초과했습니다.",
+                },
+            )
+
+        # 그룹 멤버로 추가
+        group_member_role = GroupMemberRole.STUDENT if role == UserRole.STUDENT else GroupMemberRole.PARENT
+        new_member = GroupMember(
+            group_id=invite_code_obj.group_id,
+            user_id=new_user.id,
+            role=group_member_role,
+            student_id=invite_code_obj.student_id,  # 학부모 초대: 연결할 자녀
+            invite_status=GroupMemberInviteStatus.ACCEPTED,
+        )
+        db.add(new_member)
+
+    # 7. JWT 토큰 생성 (회원가입 후 자동 로그인, Refresh Token 계열도 같은 트랜잭션에 기록)
+    access_token = create_access_token(data={"sub": new_user.id})
+    refresh_token = RefreshTokenService.issue(db, new_user.id)
+
+    db.commit()
+    db.refresh(new_user)
+
+    user_data = UserResponse(
+        user_id=new_user.id,
+        email=new_user.email,
+        name=new_user.name,
+        role=new_user.role.value,
+        is_email_verified=new_user.is_email_verified,
+        created_at=new_user.created_at,
+    )
+
+    return access_token, refresh_token, user_data
+
+
 @router.post("/register", status_code=status.HTTP_201_CREATED)
 @limiter.limit("10/minute")
-def register(
+async def register(
     request: Request,
     response: Response,
     payload: RegisterRequest,
@@ -151,153 +328,30 @@ def register(
     - Rate Limiting: 10회/분 (자동 가입 방지)
     - HttpOnly Cookies: 토큰을 안전하게 쿠키로 저장 (XSS 방지)
 
+    **성능**:
+    - 비밀번호 해싱(bcrypt)은 전용 해시 풀에서 await (요청 스레드를 점유하지 않음)
+    - DB 조회/저장만 요청 스레드 풀에서 실행
+
     Related: F-001, F-002, API_명세서.md 6.1.1, 3.2
     """
 
     try:
-        # 1. 이메일 중복 확인
-        existing_user = db.query(User).filter(User.email == payload.email.lower()).first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail={
-                    "code": "AUTH001",
-                    "message": "이미 가입된 이메일입니다.",
-                },
-            )
+        # 1~3. 이메일 중복 확인, 역할 변환, 초대 코드 검증
+        role, invite_code_obj = await run_in_threadpool(_validate_registration, db, payload)
 
-        # 2. 역할 변환 (대문자 -> 소문자)
-        role_map = {
-            "TEACHER": UserRole.TEACHER,
-            "STUDENT": UserRole.STUDENT,
-            "PARENT": UserRole.PARENT,
-        }
-        role = role_map.get(payload.role)
-
-        # 3. STUDENT/PARENT는 초대 코드 필수
-        invite_code_obj = None
-        if role in (UserRole.STUDENT, UserRole.PARENT):
-            if not payload.invite_code:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "code": "INVITE001",
-                        "message": "학생/학부모 가입에는 초대 코드가 필요합니다.",
-                    },
-                )
-
-            # 초대 코드 검증
-            invite_code_obj = db.query(InviteCode).filter(
-                InviteCode.code == payload.invite_code.upper()
-            ).first()
-
-            # 코드 존재 여부
-            if not invite_code_obj:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={
-                        "code": "INVITE001",
-                        "message": "존재하지 않는 초대 코드입니다.",
-                    },
-                )
-
-            # 만료 여부
-            if invite_code_obj.is_expired():
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "code": "INVITE002",
-                        "message": "만료된 초대 코드입니다.",
-                    },
-                )
-
-            # 사용 횟수 제한
-            if invite_code_obj.used_count >= invite_code_obj.max_uses:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "code": "INVITE003",
-                        "message": "초대 코드 사용 횟수를 초과했습니다.",
-                    },
-                )
-
-            # 역할 일치 여부
-            role_match = {
-                UserRole.STUDENT: GroupMemberRole.STUDENT,
-                UserRole.PARENT: GroupMemberRole.PARENT,
-            }
-            if invite_code_obj.target_role != role_match.get(role):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "code": "INVITE004",
-                        "message": f"이 초대 코드는 {invite_code_obj.target_role.value} 역할용입니다.",
-                    },
-                )
-
-            # 비활성화 상태 확인
-            if not invite_code_obj.is_active:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "code": "INVITE001",
-                        "message": "사용할 수 없는 초대 코드입니다.",
-                    },
-                )
-
-        # 4. 비밀번호 해싱
-        password_hash = hash_password(payload.password)
-
-        # 5. User 생성
-        new_user = User(
-            email=payload.email.lower(),
-            password_hash=password_hash,
-            name=payload.name,
-            phone=payload.phone,
-            role=role,
-            is_active=True,
-            is_email_verified=False,  # TODO: 이메일 인증 구현 후 활성화
-        )
-
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
-
-        # 6. 초대 코드 사용 시 그룹 멤버로 추가 및 사용 횟수 증가
-        if invite_code_obj:
-            # 그룹 멤버로 추가
-            group_member_role = GroupMemberRole.STUDENT if role == UserRole.STUDENT else GroupMemberRole.PARENT
-            new_member = GroupMember(
-                group_id=invite_code_obj.group_id,
-                user_id=new_user.id,
-                role=group_member_role,
-                invite_status=GroupMemberInviteStatus.ACCEPTED,
-            )
-            db.add(new_member)
-
-            # 초대 코드 사용 횟수 증가
-            invite_code_obj.increment_usage()
+        # 4. 비밀번호 해싱 (전용 해시 풀)
+        password_hash = await hash_password_async(payload.password)
 
-            db.commit()
-
-        # 7. JWT 토큰 생성 (회원가입 후 자동 로그인)
-        access_token = create_access_token(data={"sub": new_user.id})
-        refresh_token = create_refresh_token(data={"sub": new_user.id})
+        # 5~7. User 생성, 초대 코드 사용 처리, JWT 토큰 생성 (한 트랜잭션)
+        access_token, refresh_token, user_data = await run_in_threadpool(
+            _create_registered_user, db, payload, role, invite_code_obj, password_hash
+        )
 
         # 8. 토큰을 httpOnly 쿠키로 설정 (보안 강화)
         set_auth_cookies(response, access_token, refresh_token)
 
         # 9. 응답 생성 (토큰은 쿠키로만 전달, body에는 사용자 정보만 포함)
         # TODO: 이메일 인증 코드 발송 (F-001 6.1.2)
-        user_data = UserResponse(
-            user_id=new_user.id,
-            email=new_user.email,
-            name=new_user.name,
-            role=new_user.role.value,
-            is_email_verified=new_user.is_email_verified,
-            created_at=new_user.created_at,
-        )
-
         return success_response(
             data={"user": user_data.model_dump(mode='json')},
             status_code=status.HTTP_201_CREATED,
@@ -310,7 +364,7 @@ def register(
 
     except OperationalError as e:
         # DB 스키마 오류 (컬럼 불일치 등)
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         print(f"❌ Database OperationalError: {e}")
         traceback.print_exc()
 
@@ -324,7 +378,7 @@ def register(
 
     except IntegrityError as e:
         # DB 무결성 제약 위반 (UNIQUE, NOT NULL 등)
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         print(f"❌ Database IntegrityError: {e}")
 
         # UNIQUE 제약 위반 (이메일 중복)
@@ -348,7 +402,7 @@ def register(
 
     except Exception as e:
         # 예상하지 못한 에러
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         print(f"❌ Unexpected error during registration: {e}")
         traceback.print_exc()
 
@@ -361,9 +415,41 @@ def register(
         )
 
 
+def _get_user_by_email(db: Session, email: str) -> Optional[User]:
+    """이메일로 사용자 조회 - 비동기 라우트에서 스레드 풀로 실행"""
+    return db.query(User).filter(User.email == email.lower()).first()
+
+
+def _complete_login(db: Session, user: User, rehashed_password: Optional[str]) -> Tuple[str, UserResponse]:
+    """
+    Refresh Token 발급 + 마지막 로그인 시각 저장 - 비동기 라우트에서 스레드 풀로 실행
+
+    BCRYPT_ROUNDS가 바뀐 해시는 새 비용으로 교체하고, Refresh Token 기록과 함께 커밋합니다.
+
+    Returns:
+        (Refresh Token, 응답용 사용자 정보)
+    """
+    refresh_token = RefreshTokenService.issue(db, user.id)
+
+    user.last_login_at = datetime.utcnow()
+    if rehashed_password:
+        user.password_hash = rehashed_password
+    db.commit()
+
+    user_data = UserResponse(
+        user_id=user.id,
+        email=user.email,
+        name=user.name,
+        role=user.role.value,
+        is_email_verified=user.is_email_verified,
+        created_at=user.created_at,
+    )
+    return refresh_token, user_data
+
+
 @router.post("/login")
 @limiter.limit("5/minute")
-def login(
+async def login(
     request: Request,
     response: Response,
     payload: LoginRequest,
@@ -388,14 +474,21 @@ def login(
     - 이메일/비밀번호 오류 시 동일한 에러 메시지 반환 (어느 쪽이 틀렸는지 노출 금지)
     - TODO: 5회 연속 실패 시 계정 잠금 (F-001)
 
+    **성능**:
+    - 비밀번호 검증(bcrypt)은 전용 해시 풀에서 await (요청 스레드를 점유하지 않음)
+    - DB 조회/저장만 요청 스레드 풀에서 실행
+
     Related: F-001, API_명세서.md 6.1.3, 3.2
     """
 
     # 1. 이메일로 사용자 조회
-    user = db.query(User).filter(User.email == payload.email.lower()).first()
+    user = await run_in_threadpool(_get_user_by_email, db, payload.email)
 
     # 2. 사용자 없음 또는 비밀번호 불일치 → 동일한 에러 (보안)
-    if not user or not verify_password(payload.password, user.password_hash):
+    verified, rehashed_password = False, None
+    if user:
+        verified, rehashed_password = await verify_and_update_password_async(payload.password, user.password_hash)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
@@ -426,25 +519,14 @@ def login(
 
     # 4. JWT 토큰 생성
     access_token = create_access_token(data={"sub": user.id})
-    refresh_token = create_refresh_token(data={"sub": user.id})
 
-    # 5. 마지막 로그인 시각 업데이트
-    user.last_login_at = datetime.utcnow()
-    db.commit()
+    # 5. Refresh Token 발급 + 마지막 로그인 시각 업데이트 (BCRYPT_ROUNDS가 바뀐 해시는 새 비용으로 교체)
+    refresh_token, user_data = await run_in_threadpool(_complete_login, db, user, rehashed_password)
 
     # 6. 토큰을 httpOnly 쿠키로 설정 (보안 강화)
     set_auth_cookies(response, access_token, refresh_token)
 
     # 7. 응답 생성 (토큰은 쿠키로만 전달, body에는 사용자 정보만 포함)
-    user_data = UserResponse(
-        user_id=user.id,
-        email=user.email,
-        name=user.name,
-        role=user.role.value,
-        is_email_verified=user.is_email_verified,
-        created_at=user.created_at,
-    )
-
     return success_response(
         data={"user": user_data.model_dump(mode='json')},
         response=response
@@ -657,6 +739,7 @@ def confirm_verification_email(
         user.is_email_verified = True
         user.email_verified_at = datetime.utcnow()
         db.commit()
+        PrincipalService.invalidate_user(user.id)
 
         print(f"✅ Email verified for {user.email}")
 
@@ -797,7 +880,7 @@ def refresh_tokens(request: Request, response: Response, db: Session = Depends(g
     **기능**:
     - httpOnly 쿠키에서 Refresh Token 읽기 (보안 강화)
     - Refresh Token 검증
-    - 새로운 Access Token + Refresh Token 발급
+    - 새로운 Access Token + Refresh Token 발급 (Refresh Token 교체)
     - 새 토큰을 httpOnly 쿠키로 설정
     - 사용자 활성 상태 확인
 
@@ -806,6 +889,7 @@ def refresh_tokens(request: Request, response: Response, db: Session = Depends(g
     - HttpOnly 쿠키: JavaScript에서 토큰 접근 불가
     - Refresh Token 타입 검증
     - 사용자 존재 및 활성 상태 확인
+    - Refresh Token Rotation: 사용한 토큰은 재사용 불가, 재사용 감지 시 같은 로그인 세션의 토큰 전체 폐기
 
     Related: F-001 3.1, API_명세서.md 6.1.4, 3.2
     """
@@ -850,8 +934,8 @@ def refresh_tokens(request: Request, response: Response, db: Session = Depends(g
                 },
             )
 
-        # 4. 사용자 존재 및 활성 상태 확인
-        user = db.query(User).filter(User.id == user_id).first()
+        # 4. 사용자 존재 및 활성 상태 확인 (principal 캐시)
+        user = PrincipalService.get_user(db, user_id)
         if not user:
             clear_auth_cookies(response)
             raise HTTPException(
@@ -872,9 +956,13 @@ def refresh_tokens(request: Request, response: Response, db: Session = Depends(g
                 },
             )
 
-        # 5. 새 토큰 발급
+        # 5. Refresh Token 교체 후 새 토큰 발급
+        try:
+            new_refresh_token = RefreshTokenService.rotate(db, decoded)
+        except HTTPException:
+            clear_auth_cookies(response)
+            raise
         new_access_token = create_access_token({"sub": user.id})
-        new_refresh_token = create_refresh_token({"sub": user.id})
 
         # 6. 새 토큰을 httpOnly 쿠키로 설정
         set_auth_cookies(response, new_access_token, new_refresh_token)
@@ -904,26 +992,41 @@ def refresh_tokens(request: Request, response: Response, db: Session = Depends(g
 
 
 @router.post("/logout", status_code=status.HTTP_200_OK)
-def logout(response: Response, current_user: User = Depends(get_current_user)):
+def logout(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
     """
     로그아웃
 
     POST /api/v1/auth/logout
 
     **기능**:
+    - 현재 로그인 세션의 Refresh Token 계열 폐기 (서버 측 무효화)
     - httpOnly 쿠키에서 토큰 삭제 (보안 강화)
-    - MVP 단계에서는 stateless JWT 사용 (서버에서 별도 무효화 불필요)
 
     **보안 강화**:
     - 쿠키 삭제를 서버에서 처리 (Set-Cookie 헤더로 Max-Age=0 설정)
+    - 탈취된 Refresh Token도 로그아웃 후에는 갱신 불가
     - 클라이언트는 응답만 확인하면 됨
 
-    **향후 개선** (TODO):
-    - Refresh Token을 Redis 블랙리스트나 DB에 저장하여 서버 측 무효화
-    - 토큰 만료 전까지의 보안 강화
-
     Related: F-001, API_명세서.md
     """
+    from jose import JWTError
+
+    # Refresh Token 계열 폐기 (본인 토큰인 경우만)
+    refresh_token = request.cookies.get(COOKIE_REFRESH_TOKEN_KEY)
+    if refresh_token:
+        try:
+            decoded = decode_refresh_token(refresh_token)
+        except JWTError:
+            decoded = {}
+        family_id = decoded.get("fid")
+        if family_id and decoded.get("sub") == current_user.id:
+            RefreshTokenService.revoke_family(db, family_id)
+
     # 쿠키에서 토큰 삭제
     clear_auth_cookies(response)
 
@@ -990,9 +1093,53 @@ def request_password_reset(
         )
 
 
+def _get_user_for_password_reset(db: Session, user_id: str) -> User:
+    """
+    비밀번호 재설정 대상 사용자 조회 - 비동기 라우트에서 스레드 풀로 실행
+
+    Raises:
+        HTTPException: 사용자가 없거나 비활성화된 경우
+    """
+    # 3. 사용자 조회
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "code": "AUTH006",
+                "message": "사용자를 찾을 수 없습니다.",
+            },
+        )
+
+    # 4. 계정 상태 확인
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "code": "AUTH005",
+                "message": "비활성화된 계정입니다.",
+            },
+        )
+
+    return user
+
+
+def _save_reset_password(db: Session, user: User, password_hash: str) -> None:
+    """새 비밀번호 저장 + 기존 로그인 세션 무효화 - 비동기 라우트에서 스레드 풀로 실행"""
+    user.password_hash = password_hash
+    user.updated_at = datetime.utcnow()
+    db.commit()
+    PrincipalService.invalidate_user(user.id)
+
+    # 기존 로그인 세션 무효화 (모든 Refresh Token 계열 폐기)
+    RefreshTokenService.revoke_user(db, user.id)
+
+    print(f"✅ Password reset completed for {user.email}")
+
+
 @router.post("/password-reset/confirm", status_code=status.HTTP_200_OK)
 @limiter.limit("5/minute")
-def confirm_password_reset(
+async def confirm_password_reset(
     request: Request,
     payload: PasswordResetConfirmRequest,
     db: Session = Depends(get_db)
@@ -1006,6 +1153,7 @@ def confirm_password_reset(
     - 토큰 검증
     - 새 비밀번호 저장
     - 기존 토큰 무효화 (JWT이므로 자동 만료)
+    - 비밀번호 해싱(bcrypt)은 전용 해시 풀에서 await, DB 조회/저장만 요청 스레드 풀에서 실행
 
     Related: F-001 시나리오 5
     """
@@ -1037,35 +1185,14 @@ def confirm_password_reset(
                 },
             )
 
-        # 3. 사용자 조회
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "code": "AUTH006",
-                    "message": "사용자를 찾을 수 없습니다.",
-                },
-            )
+        # 3~4. 사용자 조회 및 계정 상태 확인
+        user = await run_in_threadpool(_get_user_for_password_reset, db, user_id)
 
-        # 4. 계정 상태 확인
-        if not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={
-                    "code": "AUTH005",
-                    "message": "비활성화된 계정입니다.",
-                },
-            )
-
-        # 5. 새 비밀번호 해싱 및 저장
-        user.password_hash = hash_password(payload.new_password)
-        user.updated_at = datetime.utcnow()
-        db.commit()
-
-        print(f"✅ Password reset completed for {user.email}")
+        # 5. 새 비밀번호 해싱 (전용 해시 풀)
+        password_hash = await hash_password_async(payload.new_password)
 
-        # TODO: 기존 세션/토큰 무효화 (Redis 블랙리스트 등)
+        # 6. 새 비밀번호 저장 및 기존 로그인 세션 무효화
+        await run_in_threadpool(_save_reset_password, db, user, password_hash)
 
         return success_response(
             data={
@@ -1077,7 +1204,7 @@ def confirm_password_reset(
         raise
 
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         print(f"❌ Error confirming password reset: {e}")
         traceback.print_exc()
 
@@ -21,6 +21,7 @@ from app.schemas.group import (
     JoinGroupResponse,  # 추가
 )
 from app.services.group_service import GroupService
+from app.services.group_home_service import GroupHomeService
 from app.core.response import success_response
 
 router = APIRouter(prefix="/groups", tags=["groups"])
@@ -31,7 +32,8 @@ def get_groups(
     page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기 (1-100)"),
     role: Optional[str] = Query(None, description="역할 필터 (TEACHER/STUDENT/PARENT)"),
-    status: Optional[str] = Query(None, description="상태 필터 (ACTIVE/INACTIVE/ARCHIVED)"),
+    group_status: Optional[str] = Query(None, alias="status", description="상태 필터 (ACTIVE/INACTIVE/ARCHIVED)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -43,18 +45,22 @@ def get_groups(
     **기능**:
     - 로그인한 사용자가 속한 그룹 목록 조회
     - 역할별, 상태별 필터링 지원
-    - 페이지네이션 지원
+    - 페이지네이션 지원 (page 또는 cursor)
     - 최신순 정렬 (created_at DESC)
+    - 멤버 수 포함 (그룹 수와 무관하게 쿼리 2회)
 
     **Query Parameters**:
     - page: 페이지 번호 (기본: 1)
     - size: 페이지 크기 (기본: 20, 최대: 100)
     - role: 역할 필터 (TEACHER/STUDENT/PARENT) - optional
     - status: 상태 필터 (ACTIVE/INACTIVE/ARCHIVED) - optional
+    - cursor: 다음 페이지 커서 - optional (지정 시 page 무시)
 
     **Response**:
     - items: 그룹 목록 (GroupOut[])
     - pagination: 페이지네이션 정보
+    - next_cursor: 다음 페이지 커서 (마지막 페이지면 null)
+    - has_more: 다음 페이지 존재 여부
 
     Related: F-002, API_명세서.md 6.2.1
     """
@@ -65,12 +71,15 @@ def get_groups(
             page=page,
             size=size,
             role_filter=role,
-            status_filter=status,
+            status_filter=group_status,
+            cursor=cursor,
         )
         return success_response(
             data=result.model_dump(mode='json') if hasattr(result, 'model_dump') else result
         )
 
+    except HTTPException as e:
+        raise e
     except Exception as e:
         db.rollback()
         print(f"🔥 Error fetching groups: {e}")
@@ -189,6 +198,64 @@ def get_group_detail(
     )
 
 
+@router.get("/{group_id}/home")
+def get_group_home(
+    group_id: str,
+    schedule_limit: int = Query(5, ge=1, le=20, description="다가오는 일정 개수 (1-20)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    그룹 홈 화면 통합 조회
+
+    GET /api/v1/groups/{group_id}/home
+
+    **기능**:
+    - 그룹 상세 + 멤버 목록
+    - 다가오는 일정 (schedule_limit개)
+    - 활성 교재 및 진도
+    - 이번 달 출결 요약 (학생: 본인, 학부모: 자녀, 선생님: 그룹 전체)
+    - 미결 청구서 (그룹 소유자: 그룹 전체, 학생/학부모: 본인/자녀)
+    - 권한 확인 1회, 섹션별 쿼리 1회 (개별 API 5회 호출 대체)
+
+    **Path Parameters**:
+    - group_id: 그룹 ID
+
+    **Query Parameters**:
+    - schedule_limit: 다가오는 일정 개수 (기본 5, 최대 20)
+
+    **Response**:
+    - GroupHomeResponse
+
+    **Errors**:
+    - 403: 그룹 멤버가 아님
+    - 404: 그룹을 찾을 수 없음
+
+    Related: F-002, F-003, F-004, F-005, F-006
+    """
+    try:
+        result = GroupHomeService.get_group_home(
+            db=db,
+            user=current_user,
+            group_id=group_id,
+            schedule_limit=schedule_limit,
+        )
+        return success_response(data=result.model_dump(mode='json'))
+
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        db.rollback()
+        print(f"🔥 Error fetching group home: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "GROUP007",
+                "message": "그룹 홈 정보를 가져오는 중 오류가 발생했습니다.",
+            },
+        )
+
+
 @router.patch("/{group_id}")
 def update_group(
     group_id: str,
@@ -17,6 +17,7 @@ from app.schemas.lesson import (
     LessonRecordListResponse,
 )
 from app.services.lesson_service import LessonService
+from app.services.lesson_search_service import LessonSearchService
 from app.core.response import success_response
 
 router = APIRouter(prefix="/lesson-records", tags=["lessons"])
@@ -63,9 +64,8 @@ def create_lesson_record(
             payload=payload
         )
         return success_response(
-            data=result.model_dump(mode='json',
-            status_code=status.HTTP_201_CREATED
-        ) if hasattr(result, 'model_dump') else result
+            data=result.model_dump(mode='json') if hasattr(result, 'model_dump') else result,
+            status_code=status.HTTP_201_CREATED,
         )
     except HTTPException as e:
         raise e
@@ -81,6 +81,109 @@ def create_lesson_record(
         )
 
 
+# ==========================
+# 그룹 수업 기록 타임라인
+# ==========================
+
+@router.get("/groups/{group_id}")
+def get_group_lesson_timeline(
+    group_id: str = Path(..., description="그룹 ID"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    limit: int = Query(20, ge=1, le=50, description="페이지 크기"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    그룹 수업 기록 타임라인
+
+    GET /api/v1/lesson-records/groups/{group_id}?cursor=...&limit=20
+
+    **기능**:
+    - 그룹의 수업 기록을 수업 날짜 최신순으로 조회
+    - 진도 기록(교재명 포함), 작성 선생님, 일정 정보 포함
+    - 그룹 멤버만 조회 가능
+    - 커서 기반 페이지네이션 (next_cursor로 다음 페이지 요청)
+
+    **Response**:
+    - LessonTimelineResponse: 수업 기록 목록, next_cursor, has_more
+
+    Related: F-005
+    """
+    try:
+        result = LessonService.get_group_timeline(
+            db=db,
+            user=current_user,
+            group_id=group_id,
+            cursor=cursor,
+            limit=limit,
+        )
+        return success_response(data=result.model_dump(mode='json'))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        db.rollback()
+        print(f"🔥 Error getting lesson timeline: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "LESSON006",
+                "message": "수업 기록 목록 조회 중 오류가 발생했습니다.",
+            },
+        )
+
+
+# ==========================
+# 수업 기록 검색
+# ==========================
+
+@router.get("/search")
+def search_lesson_records(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (수업 내용/숙제/피드백)"),
+    group_id: Optional[str] = Query(None, description="그룹 ID (없으면 내가 속한 모든 그룹)"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    size: int = Query(20, ge=1, le=50, description="페이지 크기"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    수업 기록 검색
+
+    GET /api/v1/lesson-records/search?q=이차방정식&group_id=...&page=1&size=20
+
+    **기능**:
+    - 수업 내용, 숙제, 학생 피드백 전문 검색 (부분 일치, 여러 단어는 모두 포함)
+    - 내가 속한 그룹의 수업 기록만 검색
+    - 관련도순 정렬 (내용 > 숙제 > 피드백 가중치)
+
+    **Response**:
+    - LessonSearchResponse: 검색 결과 (미리보기 포함) 및 페이지네이션 정보
+
+    Related: F-005
+    """
+    try:
+        result = LessonSearchService.search(
+            db=db,
+            user=current_user,
+            query=q,
+            group_id=group_id,
+            page=page,
+            size=size,
+        )
+        return success_response(data=result.model_dump(mode='json'))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        db.rollback()
+        print(f"🔥 Error searching lesson records: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "LESSON005",
+                "message": "수업 기록 검색 중 오류가 발생했습니다.",
+            },
+        )
+
+
 # ==========================
 # 수업 기록 상세 조회
 # ==========================
@@ -233,7 +336,4 @@ def delete_lesson_record(
         )
 
 
-# TODO(Phase 2): 수업 기록 목록 조회 (그룹별 페이지네이션)
-# GET /api/v1/groups/{group_id}/lesson-records
-# TODO(Phase 2): 수업 기록 검색/필터링
 # TODO(Phase 2): 진도 리포트 생성
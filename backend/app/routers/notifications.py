@@ -294,9 +294,8 @@ def create_test_notification(
             test_type=payload.type,
         )
         return success_response(
-            data=notification.model_dump(mode='json',
-            status_code=status.HTTP_201_CREATED
-        ) if hasattr(notification, 'model_dump') else notification
+            data=notification.model_dump(mode='json') if hasattr(notification, 'model_dump') else notification,
+            status_code=status.HTTP_201_CREATED,
         )
     except Exception as e:
         db.rollback()
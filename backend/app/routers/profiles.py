@@ -5,6 +5,7 @@ API_명세서.md 6.7 기반 프로필 및 설정 엔드포인트 구현
 
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError, IntegrityError
 
@@ -238,7 +239,7 @@ def update_notification_settings(
 
 
 @router.post("/me/change-password")
-def change_password(
+async def change_password(
     password_data: PasswordChangeRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -266,10 +267,13 @@ def change_password(
     - 비밀번호 변경 후 클라이언트에서 자동 로그아웃 처리 필요
     - 다른 기기에서 로그인된 세션도 무효화 (TODO: v2)
 
+    **성능**:
+    - 비밀번호 검증/해싱(bcrypt)은 전용 해시 풀에서 await (요청 스레드를 점유하지 않음)
+
     Related: F-007, API_명세서.md 6.7.6
     """
     try:
-        success = ProfileService.change_password(
+        success = await ProfileService.change_password_async(
             db,
             current_user,
             password_data.current_password,
@@ -288,7 +292,7 @@ def change_password(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="비밀번호 변경에 실패했습니다",
@@ -3,7 +3,8 @@ Schedules Router - F-003 수업 일정 관리
 API_명세서.md 6.3 F-003 기반 일정 관련 엔드포인트 구현
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Header
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
@@ -14,10 +15,13 @@ from app.schemas.schedule import (
     CreateRegularSchedulePayload,
     CreateSchedulePayload,
     UpdateSchedulePayload,
+    BulkUpdateSchedulesPayload,
     ScheduleOut,
     ScheduleListResponse,
+    CalendarFeedOut,
 )
 from app.services.schedule_service import ScheduleService
+from app.services.calendar_service import CalendarFeedService
 from app.core.response import success_response
 
 router = APIRouter(prefix="/schedules", tags=["schedules"])
@@ -133,9 +137,8 @@ def create_regular_schedule(
             payload=payload,
         )
         return success_response(
-            data=schedules.model_dump(mode='json',
-            status_code=status.HTTP_201_CREATED
-        ) if hasattr(schedules, 'model_dump') else schedules
+            data=schedules.model_dump(mode='json') if hasattr(schedules, 'model_dump') else schedules,
+            status_code=status.HTTP_201_CREATED,
         )
     except HTTPException as e:
         raise e
@@ -190,9 +193,8 @@ def create_schedule(
             payload=payload,
         )
         return success_response(
-            data=schedule.model_dump(mode='json',
-            status_code=status.HTTP_201_CREATED
-        ) if hasattr(schedule, 'model_dump') else schedule
+            data=schedule.model_dump(mode='json') if hasattr(schedule, 'model_dump') else schedule,
+            status_code=status.HTTP_201_CREATED,
         )
     except HTTPException as e:
         raise e
@@ -210,6 +212,204 @@ def create_schedule(
         )
 
 
+@router.post("/bulk")
+def bulk_update_schedules(
+    payload: BulkUpdateSchedulesPayload,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    일정 일괄 변경 (반복 일정 묶음 / 기간 단위)
+
+    POST /api/v1/schedules/bulk
+
+    **기능**:
+    - 휴강 주간 일괄 취소, 정규 수업 시간 일괄 이동, 장소 일괄 변경
+    - 선생님만 가능
+    - 완료/취소된 일정, 24시간 이내 일정은 제외
+    - 하나의 트랜잭션에서 처리, 알림은 멤버별 1건
+
+    **Request Body**:
+    - group_id: 그룹 ID (필수)
+    - action: "cancel" | "shift" | "change_location" (필수)
+    - series_id: 반복 일정 묶음 ID (선택, 없으면 그룹 전체)
+    - from_date / to_date: 대상 기간 (YYYY-MM-DD, 필수)
+    - shift_minutes: 이동할 시간 (shift일 때 필수)
+    - location: 변경할 장소 (change_location일 때 필수)
+    - reason: 취소/변경 사유 (cancel일 때 필수)
+
+    **Response**:
+    - BulkUpdateSchedulesResponse: action, updated_count, schedule_ids
+
+    Related: F-003, F-008
+    """
+    try:
+        result = ScheduleService.bulk_update_schedules(
+            db=db,
+            user=current_user,
+            payload=payload,
+        )
+        return success_response(data=result.model_dump(mode='json'))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        db.rollback()
+        print(f"🔥 Error bulk updating schedules: {e}")
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "SCHEDULE010",
+                "message": "일정 일괄 변경 중 오류가 발생했습니다.",
+            },
+        )
+
+
+# ==========================
+# Calendar Feed (iCalendar 구독)
+# ==========================
+
+
+@router.get("/calendar/subscription")
+def get_calendar_subscription(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    캘린더 구독 URL 조회
+
+    GET /api/v1/schedules/calendar/subscription
+
+    **기능**:
+    - 휴대폰/PC 캘린더 앱에서 구독할 수 있는 .ics URL 반환
+    - 토큰이 없으면 새로 발급
+
+    **Response**:
+    - CalendarFeedOut: feed_url, token
+
+    Related: F-003
+    """
+    try:
+        token = CalendarFeedService.get_or_create_feed_token(db, current_user)
+        result = CalendarFeedOut(
+            feed_url=str(request.url_for("get_calendar_feed", token=token)),
+            token=token,
+        )
+        return success_response(data=result.model_dump(mode='json'))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        db.rollback()
+        print(f"🔥 Error fetching calendar subscription: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "SCHEDULE007",
+                "message": "캘린더 구독 정보를 가져오는 중 오류가 발생했습니다.",
+            },
+        )
+
+
+@router.post("/calendar/subscription/rotate")
+def rotate_calendar_subscription(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    캘린더 구독 URL 재발급
+
+    POST /api/v1/schedules/calendar/subscription/rotate
+
+    **기능**:
+    - 새 토큰 발급, 기존 구독 URL은 즉시 무효화 (URL 유출 시 사용)
+
+    **Response**:
+    - CalendarFeedOut: feed_url, token
+
+    Related: F-003
+    """
+    try:
+        token = CalendarFeedService.rotate_feed_token(db, current_user)
+        result = CalendarFeedOut(
+            feed_url=str(request.url_for("get_calendar_feed", token=token)),
+            token=token,
+        )
+        return success_response(data=result.model_dump(mode='json'))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        db.rollback()
+        print(f"🔥 Error rotating calendar subscription: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "SCHEDULE008",
+                "message": "캘린더 구독 URL 재발급 중 오류가 발생했습니다.",
+            },
+        )
+
+
+@router.get("/calendar/{token}.ics", name="get_calendar_feed")
+def get_calendar_feed(
+    token: str,
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    iCalendar 피드 (캘린더 앱 구독용, 인증 대신 토큰 사용)
+
+    GET /api/v1/schedules/calendar/{token}.ics
+
+    **기능**:
+    - 사용자가 속한 모든 그룹의 일정을 iCalendar 형식으로 반환
+    - 토큰별 캐시 적중 시 DB 조회 없이 응답
+    - ETag / Last-Modified 조건부 요청 지원 (변경 없으면 304)
+    - 캐시 미스 시 일정을 DB에서 스트리밍하여 생성
+
+    **Response**:
+    - 200 text/calendar
+    - 304 Not Modified
+    - 404 유효하지 않은 토큰
+
+    Related: F-003
+    """
+    cached = CalendarFeedService.get_cached_feed(token)
+    if cached:
+        headers = CalendarFeedService.build_headers(cached)
+        if CalendarFeedService.is_not_modified(cached, if_none_match, if_modified_since):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=cached["body"], media_type=CalendarFeedService.MEDIA_TYPE, headers=headers)
+
+    try:
+        feed = CalendarFeedService.prepare_feed(db, token)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        db.rollback()
+        print(f"🔥 Error preparing calendar feed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "SCHEDULE009",
+                "message": "캘린더 피드 생성 중 오류가 발생했습니다.",
+            },
+        )
+
+    headers = CalendarFeedService.build_headers(feed)
+    if CalendarFeedService.is_not_modified(feed, if_none_match, if_modified_since):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return StreamingResponse(
+        CalendarFeedService.stream_feed(db, token, feed),
+        media_type=CalendarFeedService.MEDIA_TYPE,
+        headers=headers,
+    )
+
+
 @router.get("/{schedule_id}")
 def get_schedule_detail(
     schedule_id: str,
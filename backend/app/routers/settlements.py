@@ -228,9 +228,8 @@ def create_invoice_for_student(
             payload=payload
         )
         return success_response(
-            data=result.model_dump(mode='json',
-            status_code=status.HTTP_201_CREATED
-        ) if hasattr(result, 'model_dump') else result
+            data=result.model_dump(mode='json') if hasattr(result, 'model_dump') else result,
+            status_code=status.HTTP_201_CREATED,
         )
     except HTTPException as e:
         raise e
@@ -282,9 +281,8 @@ def get_invoice_detail(
             invoice_id=invoice_id
         )
         return success_response(
-            data=result.model_dump(mode='json',
-            status_code=status.HTTP_201_CREATED
-        ) if hasattr(result, 'model_dump') else result
+            data=result.model_dump(mode='json') if hasattr(result, 'model_dump') else result,
+            status_code=status.HTTP_201_CREATED,
         )
     except HTTPException as e:
         raise e
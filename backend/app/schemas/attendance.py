@@ -191,6 +191,8 @@ class AttendanceListResponse(BaseModel):
     """
     items: List[AttendanceOut]
     total: int = Field(..., description="총 출결 수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (학생별 조회)")
+    has_more: bool = Field(False, description="다음 페이지 존재 여부")
 
     class Config:
         json_schema_extra = {
@@ -275,6 +277,67 @@ class AttendanceStatsResponse(BaseModel):
         }
 
 
+# ==========================
+# 출결 분석 (연속 출석, 히트맵, 지각 추이)
+# ==========================
+
+
+class AttendanceStreaks(BaseModel):
+    """
+    연속 출석 기록 (수업 횟수 기준)
+    """
+    current: int = Field(..., description="현재 연속 출석 (결석 없이)")
+    longest: int = Field(..., description="최장 연속 출석 (결석 없이)")
+    current_on_time: int = Field(..., description="현재 연속 정시 출석 (PRESENT만)")
+    longest_on_time: int = Field(..., description="최장 연속 정시 출석 (PRESENT만)")
+
+
+class MonthlyAttendanceTrend(BaseModel):
+    """
+    월별 출결/지각 추이
+    """
+    month: int = Field(..., ge=1, le=12)
+    lessons: int = Field(..., description="수업 횟수")
+    attended: int = Field(..., description="출석 횟수 (결석 제외)")
+    late: int = Field(..., description="지각 횟수")
+    avg_late_minutes: Optional[float] = Field(None, description="평균 지각 시간 (분, 지각이 없으면 null)")
+
+
+class AttendanceAnalyticsResponse(BaseModel):
+    """
+    학생 연간 출결 분석 응답
+
+    GET /api/v1/attendances/groups/{group_id}/students/{student_id}/analytics
+    """
+    student: Optional[StudentInfo] = None
+    group_id: str
+    year: int
+    total_lessons: int
+    streaks: AttendanceStreaks
+    heatmap_start: str = Field(..., description="히트맵 첫 칸 날짜 (YYYY-MM-DD, 1월 1일이 속한 주의 월요일)")
+    heatmap: List[List[int]] = Field(
+        default_factory=list,
+        description="주 단위 7칸(월~일) 배열. 0: 수업 없음, 1: 결석, 2: 지각/조퇴, 3: 출석",
+    )
+    monthly: List[MonthlyAttendanceTrend] = Field(default_factory=list)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "student": {"user_id": "student-123", "name": "박민수"},
+                "group_id": "group-456",
+                "year": 2025,
+                "total_lessons": 96,
+                "streaks": {"current": 12, "longest": 31, "current_on_time": 4, "longest_on_time": 15},
+                "heatmap_start": "2024-12-30",
+                "heatmap": [[0, 3, 0, 0, 2, 0, 0]],
+                "monthly": [
+                    {"month": 1, "lessons": 8, "attended": 7, "late": 2, "avg_late_minutes": 7.5}
+                ],
+            }
+        }
+
+
 # ==========================
 # TODO(Phase 2): Advanced Features
 # ==========================
@@ -5,9 +5,14 @@ API_명세서.md 6.2 기반 요청/응답 스키마
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from typing import Optional, Literal, List
 from datetime import datetime
 
+from app.schemas.schedule import ScheduleOut
+from app.schemas.textbook import TextbookOut
+from app.schemas.attendance import AttendanceStats
+from app.schemas.invoice import InvoiceBasicInfo
+
 
 # Group Status Types (프론트엔드와 동일)
 GroupStatusEnum = Literal["ACTIVE", "INACTIVE", "ARCHIVED"]
@@ -92,6 +97,7 @@ class GroupMemberOut(BaseModel):
     user_id: str
     role: GroupMemberRoleEnum
     invite_status: GroupMemberInviteStatusEnum
+    student_id: Optional[str] = None  # 학부모 멤버의 자녀 ID
     joined_at: str  # ISO 8601 format
 
     # TODO(v2): 사용자 상세 정보 추가 (name, profile_image_url 등)
@@ -178,6 +184,8 @@ class GroupListResponse(BaseModel):
     """
     items: list[GroupOut]
     pagination: PaginationInfo
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_more: bool = Field(False, description="다음 페이지 존재 여부")
 
     class Config:
         json_schema_extra = {
@@ -203,10 +211,41 @@ class GroupListResponse(BaseModel):
                     "has_next": False,
                     "has_prev": False,
                 },
+                "next_cursor": None,
+                "has_more": False,
             }
         }
 
 
+# ==========================
+# Group Home Schemas
+# ==========================
+
+
+class GroupHomeAttendance(BaseModel):
+    """
+    그룹 홈 - 이번 달 출결 요약
+    """
+    period_start: str = Field(..., description="집계 시작일 (YYYY-MM-DD)")
+    period_end: str = Field(..., description="집계 종료일 (YYYY-MM-DD)")
+    student_id: Optional[str] = Field(None, description="학생 기준 요약이면 학생 ID (선생님은 그룹 전체)")
+    stats: AttendanceStats
+
+
+class GroupHomeResponse(BaseModel):
+    """
+    그룹 홈 화면 응답 (그룹 상세 + 다가오는 일정 + 교재 진도 + 이번 달 출결 + 미결 청구서)
+
+    GET /api/v1/groups/{group_id}/home
+    """
+    group: GroupOut = Field(..., description="그룹 정보 (멤버 목록, 멤버 수 포함)")
+    my_role: str = Field(..., description="그룹 내 내 역할 (TEACHER/STUDENT/PARENT)")
+    upcoming_schedules: List[ScheduleOut] = Field(default_factory=list, description="다가오는 일정 (시작 시각순)")
+    textbooks: List[TextbookOut] = Field(default_factory=list, description="활성 교재 및 진도")
+    attendance: GroupHomeAttendance
+    open_invoices: List[InvoiceBasicInfo] = Field(default_factory=list, description="미결 청구서 (발송/부분 결제/연체)")
+
+
 # ==========================
 # Member Management Schemas (TODO: Phase 2)
 # ==========================
@@ -239,6 +278,7 @@ class InviteCodeCreate(BaseModel):
     target_role: GroupMemberRoleEnum = Field(..., description="초대할 역할 (STUDENT/PARENT)")
     expires_in_days: Optional[int] = Field(7, ge=1, le=30, description="유효 기간 (일)")
     max_uses: Optional[int] = Field(1, ge=1, le=100, description="최대 사용 횟수")
+    student_id: Optional[str] = Field(None, description="연결할 자녀 학생 ID (PARENT 초대 시 선택)")
 
     class Config:
         json_schema_extra = {
@@ -259,6 +299,7 @@ class InviteCodeOut(BaseModel):
     code: str
     group_id: str
     target_role: GroupMemberRoleEnum  # role → target_role (모델과 일치)
+    student_id: Optional[str] = None  # PARENT 초대 시 연결할 자녀
     created_by: str
     expires_at: str
     max_uses: int
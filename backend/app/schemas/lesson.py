@@ -263,6 +263,80 @@ class LessonRecordListResponse(BaseModel):
         }
 
 
+class LessonTimelineResponse(BaseModel):
+    """
+    그룹 수업 기록 타임라인 응답 (수업 날짜 최신순, 커서 페이지네이션)
+
+    GET /api/v1/lesson-records/groups/{group_id}
+    """
+    items: List[LessonRecordOut]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서")
+    has_more: bool = Field(False, description="다음 페이지 존재 여부")
+
+
+# ==========================
+# Search (전문 검색)
+# ==========================
+
+
+class LessonSearchHit(BaseModel):
+    """
+    수업 기록 검색 결과 항목
+    """
+    lesson_record_id: str
+    group_id: str
+    group_name: Optional[str] = None
+    schedule_id: str
+    schedule_title: Optional[str] = None
+    schedule_date: Optional[str] = None
+
+    snippet: Optional[str] = None  # 검색어 주변 원문 미리보기
+    homework: Optional[str] = None
+    score: float  # 관련도 점수 (클수록 관련도 높음, LIKE 검색 시 0)
+
+    created_at: Optional[str] = None
+
+
+class LessonSearchResponse(BaseModel):
+    """
+    수업 기록 검색 응답 (관련도순, 페이지네이션 포함)
+
+    GET /api/v1/lesson-records/search?q=...
+    """
+    query: str
+    items: List[LessonSearchHit]
+    pagination: PaginationInfo
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "query": "이차방정식",
+                "items": [
+                    {
+                        "lesson_record_id": "lesson-123",
+                        "group_id": "group-789",
+                        "group_name": "수학 A반",
+                        "schedule_id": "schedule-456",
+                        "schedule_title": "수학 정규 수업",
+                        "schedule_date": "2025-11-18",
+                        "snippet": "...이차방정식의 판별식과 근의 공식을 학습...",
+                        "homework": "교과서 67~70페이지",
+                        "score": 4.21,
+                        "created_at": "2025-11-18T16:30:00Z",
+                    }
+                ],
+                "pagination": {
+                    "total": 3,
+                    "page": 1,
+                    "size": 20,
+                    "total_pages": 1,
+                    "has_next": False,
+                    "has_prev": False,
+                },
+            }
+        }
+
+
 # ==========================
 # Progress Summary (진도 요약)
 # ==========================
@@ -4,7 +4,7 @@ API_명세서.md 6.3 F-003 기반 요청/응답 스키마
 프론트엔드 타입 정의(frontend/src/types/schedule.ts)와 일치
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, Literal, Dict, Any, List
 from datetime import datetime
 
@@ -155,6 +155,71 @@ class UpdateSchedulePayload(BaseModel):
         }
 
 
+# Bulk Action Enum
+BulkScheduleActionEnum = Literal["cancel", "shift", "change_location"]
+
+
+class BulkUpdateSchedulesPayload(BaseModel):
+    """
+    일정 일괄 변경 요청 스키마 (반복 일정 묶음 / 기간 단위)
+
+    POST /api/v1/schedules/bulk
+
+    - cancel: 기간 내 일정 일괄 취소 (reason 필수)
+    - shift: 기간 내 일정 시작/종료 시각을 shift_minutes만큼 이동
+    - change_location: 기간 내 일정 장소 일괄 변경
+    """
+    group_id: str = Field(..., description="그룹 ID")
+    action: BulkScheduleActionEnum = Field(..., description="일괄 작업 종류")
+    series_id: Optional[str] = Field(None, description="반복 일정 묶음 ID (없으면 그룹 전체 일정 대상)")
+    from_date: str = Field(..., description="대상 기간 시작 날짜 (YYYY-MM-DD)")
+    to_date: str = Field(..., description="대상 기간 종료 날짜 (YYYY-MM-DD, 포함)")
+    shift_minutes: Optional[int] = Field(None, ge=-1440, le=1440, description="이동할 시간 (분, shift일 때 필수)")
+    location: Optional[str] = Field(None, max_length=200, description="변경할 장소 (change_location일 때 필수)")
+    reason: Optional[str] = Field(None, min_length=5, description="취소/변경 사유 (cancel일 때 필수, 5자 이상)")
+
+    @field_validator("from_date", "to_date")
+    @classmethod
+    def validate_date(cls, v: str) -> str:
+        """
+        YYYY-MM-DD 형식의 실제 날짜인지 검증 (0 채운 형식으로 정규화)
+        """
+        try:
+            return datetime.strptime(v, "%Y-%m-%d").date().isoformat()
+        except ValueError:
+            raise ValueError("date must be a valid date in YYYY-MM-DD format")
+
+    @field_validator("to_date")
+    @classmethod
+    def validate_date_range(cls, v: str, info) -> str:
+        """
+        종료 날짜가 시작 날짜와 같거나 이후인지 검증 (정규화된 YYYY-MM-DD이므로 문자열 비교)
+        """
+        if info.data.get("from_date") and v < info.data["from_date"]:
+            raise ValueError("to_date must be on or after from_date")
+        return v
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "group_id": "group-123",
+                "action": "cancel",
+                "from_date": "2025-12-22",
+                "to_date": "2025-12-28",
+                "reason": "연말 휴강 주간입니다",
+            }
+        }
+
+
+class BulkUpdateSchedulesResponse(BaseModel):
+    """
+    일정 일괄 변경 응답
+    """
+    action: BulkScheduleActionEnum
+    updated_count: int
+    schedule_ids: List[str]
+
+
 class ScheduleOut(BaseModel):
     """
     일정 응답 스키마
@@ -169,6 +234,7 @@ class ScheduleOut(BaseModel):
     end_at: str  # ISO8601 형식
     status: ScheduleStatusEnum
     recurrence_rule: Optional[Dict[str, Any]] = None  # JSON 형식
+    series_id: Optional[str] = None  # 반복 일정 묶음 ID (정규 수업)
     location: Optional[str] = None
     memo: Optional[str] = None
     created_at: str
@@ -187,6 +253,9 @@ class ScheduleOut(BaseModel):
     cancel_reason: Optional[str] = None
     reschedule_reason: Optional[str] = None
 
+    # 종료되었지만 출결 기록이 없는 수업 (자동 완료 보류)
+    attendance_missing: bool = False
+
     # F-005: 수업 기록 연결 (N+1 문제 해결)
     lesson_record_id: Optional[str] = None  # 이 일정에 대한 수업 기록 ID
 
@@ -272,6 +341,29 @@ class ScheduleListResponse(BaseModel):
         }
 
 
+# ==========================
+# Calendar Feed (iCalendar 구독)
+# ==========================
+
+
+class CalendarFeedOut(BaseModel):
+    """
+    캘린더 구독 정보 응답
+
+    GET /api/v1/schedules/calendar/subscription
+    """
+    feed_url: str = Field(..., description="iCalendar 구독 URL (.ics)")
+    token: str = Field(..., description="구독 토큰 (URL에 포함, 재발급 시 이전 URL 무효화)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "feed_url": "https://api.wetee.kr/api/v1/schedules/calendar/Xy3...abc.ics",
+                "token": "Xy3...abc",
+            }
+        }
+
+
 # ==========================
 # TODO(Phase 2): Makeup Slots, Exam Schedules
 # ==========================
@@ -0,0 +1,249 @@
+"""
+Attendance Analytics Service - F-004 출결 분석
+학생별 연간 연속 출석, 출결 히트맵, 월별 지각 추이
+
+한 학생의 1년치 출결을 (날짜, 상태 코드, 지각 시간) 열 배열로 한 번에 가져와
+NumPy 벡터 연산으로 계산하고, 결과는 (학생, 그룹, 연도)별로 캐시합니다.
+출결이 기록/수정되면 해당 키를 무효화합니다.
+"""
+
+from datetime import datetime
+from typing import Optional, Iterable
+
+import numpy as np
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.schedule import Schedule, ScheduleStatus
+from app.models.group import GroupMember, GroupMemberRole, GroupMemberInviteStatus
+from app.models.user import User
+from app.schemas.attendance import (
+    AttendanceAnalyticsResponse,
+    AttendanceStreaks,
+    MonthlyAttendanceTrend,
+    StudentInfo,
+)
+from app.services.authorization_service import AuthorizationService
+
+
+# 상태 코드 (배열 인덱스로 사용)
+STATUS_CODES = {
+    AttendanceStatus.PRESENT: 0,
+    AttendanceStatus.LATE: 1,
+    AttendanceStatus.EARLY_LEAVE: 2,
+    AttendanceStatus.ABSENT: 3,
+}
+PRESENT, LATE, EARLY_LEAVE, ABSENT = 0, 1, 2, 3
+
+# 상태 코드 → 히트맵 단계 (0: 수업 없음, 1: 결석, 2: 지각/조퇴, 3: 출석)
+HEATMAP_LEVELS = np.array([3, 2, 2, 1], dtype=np.int8)
+NO_LESSON = 4  # 하루에 여러 수업이면 가장 낮은 단계를 표시하기 위한 초기값
+
+
+class AttendanceAnalyticsService:
+    """
+    출결 분석 서비스 레이어
+    """
+
+    # (student_id, group_id, year) → AttendanceAnalyticsResponse
+    _cache = TTLCache(
+        maxsize=settings.ATTENDANCE_ANALYTICS_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.ATTENDANCE_ANALYTICS_CACHE_TTL_SECONDS,
+    )
+
+    # ==========================
+    # Cache
+    # ==========================
+
+    @staticmethod
+    def invalidate(group_id: str, student_ids: Iterable[str], year: int) -> None:
+        """출결 기록/수정 시 해당 학생들의 연도 분석 결과 무효화"""
+        for student_id in student_ids:
+            AttendanceAnalyticsService._cache.delete((student_id, group_id, year))
+
+    @staticmethod
+    def invalidate_group(group_id: str) -> None:
+        """일정 삭제 등 그룹 단위 변경 시 그룹의 모든 분석 결과 무효화"""
+        AttendanceAnalyticsService._cache.delete_where(lambda key, _value: key[1] == group_id)
+
+    # ==========================
+    # Analytics
+    # ==========================
+
+    @staticmethod
+    def get_student_analytics(
+        db: Session,
+        user: User,
+        group_id: str,
+        student_id: str,
+        year: Optional[int] = None,
+    ) -> AttendanceAnalyticsResponse:
+        """
+        학생 연간 출결 분석
+
+        권한:
+        - 선생님: 그룹 내 모든 학생
+        - 학생: 본인만
+        - 학부모: 연결된 자녀만 (자녀 미연결 시 그룹 학생)
+
+        Args:
+            db: 데이터베이스 세션
+            user: 현재 사용자
+            group_id: 그룹 ID
+            student_id: 학생 ID
+            year: 연도 (기본: 올해)
+
+        Returns:
+            AttendanceAnalyticsResponse: 연속 출석, 히트맵, 월별 추이
+        """
+        AttendanceAnalyticsService._check_access(db, user, group_id, student_id)
+
+        year = year or datetime.utcnow().year
+        cache_key = (student_id, group_id, year)
+        cached = AttendanceAnalyticsService._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 1년치 출결을 열 단위로 조회 (쿼리 1회, 취소된 일정 제외)
+        rows = db.query(
+            Schedule.start_at,
+            Attendance.status,
+            Attendance.late_minutes,
+        ).join(
+            Schedule, Schedule.id == Attendance.schedule_id
+        ).filter(
+            Schedule.group_id == group_id,
+            Schedule.status != ScheduleStatus.CANCELED,
+            Schedule.start_at >= datetime(year, 1, 1),
+            Schedule.start_at < datetime(year + 1, 1, 1),
+            Attendance.student_id == student_id,
+        ).order_by(Schedule.start_at).all()
+
+        if rows:
+            start_ats, statuses, late_minutes = zip(*rows)
+        else:
+            start_ats, statuses, late_minutes = (), (), ()
+
+        dates = np.array([start_at.date() for start_at in start_ats], dtype="datetime64[D]")
+        codes = np.array([STATUS_CODES[s] for s in statuses], dtype=np.int8)
+        late = np.array([m or 0 for m in late_minutes], dtype=np.float64)
+
+        heatmap_start, heatmap = AttendanceAnalyticsService._heatmap(year, dates, codes)
+
+        student = db.query(User.id, User.name).filter(User.id == student_id).first()
+
+        result = AttendanceAnalyticsResponse(
+            student=StudentInfo(user_id=student.id, name=student.name) if student else None,
+            group_id=group_id,
+            year=year,
+            total_lessons=int(codes.size),
+            streaks=AttendanceAnalyticsService._streaks(codes),
+            heatmap_start=heatmap_start,
+            heatmap=heatmap,
+            monthly=AttendanceAnalyticsService._monthly(dates, codes, late),
+        )
+
+        AttendanceAnalyticsService._cache.set(cache_key, result)
+        return result
+
+    @staticmethod
+    def _check_access(db: Session, user: User, group_id: str, student_id: str) -> None:
+        """그룹 멤버십 및 역할별 조회 가능 학생 확인"""
+        context = AuthorizationService.require_member(db, user, group_id)
+        role = context.role(group_id)
+        linked_student_id = context.linked_student_id(group_id)
+
+        if role == GroupMemberRole.STUDENT and student_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={"code": "FORBIDDEN", "message": "본인의 출결만 조회할 수 있습니다."}
+            )
+
+        if role == GroupMemberRole.PARENT and linked_student_id and linked_student_id != student_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={"code": "FORBIDDEN", "message": "자녀의 출결만 조회할 수 있습니다."}
+            )
+
+    # ==========================
+    # Vectorized Computations
+    # ==========================
+
+    @staticmethod
+    def _runs(mask: np.ndarray) -> tuple:
+        """True 연속 구간의 (마지막 구간 길이, 최장 길이) - 마지막 값이 False면 현재 연속은 0"""
+        if mask.size == 0:
+            return 0, 0
+
+        padded = np.concatenate(([0], mask.astype(np.int8), [0]))
+        edges = np.diff(padded)
+        lengths = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+        if lengths.size == 0:
+            return 0, 0
+
+        current = int(lengths[-1]) if mask[-1] else 0
+        return current, int(lengths.max())
+
+    @staticmethod
+    def _streaks(codes: np.ndarray) -> AttendanceStreaks:
+        """연속 출석 (결석 제외) / 연속 정시 출석 (PRESENT만)"""
+        current, longest = AttendanceAnalyticsService._runs(codes != ABSENT)
+        current_on_time, longest_on_time = AttendanceAnalyticsService._runs(codes == PRESENT)
+        return AttendanceStreaks(
+            current=current,
+            longest=longest,
+            current_on_time=current_on_time,
+            longest_on_time=longest_on_time,
+        )
+
+    @staticmethod
+    def _heatmap(year: int, dates: np.ndarray, codes: np.ndarray) -> tuple:
+        """
+        주 단위(월~일) 히트맵
+
+        Returns:
+            Tuple[str, List[List[int]]]: (첫 칸 날짜, 주별 7칸 단계 배열)
+        """
+        jan1 = np.datetime64(f"{year}-01-01", "D")
+        dec31 = np.datetime64(f"{year}-12-31", "D")
+        # 1970-01-01은 목요일 → 월요일 기준 요일 = (epoch 일수 + 3) % 7
+        start = jan1 - (jan1.astype(np.int64) + 3) % 7
+        weeks = int((dec31 - start).astype(np.int64)) // 7 + 1
+
+        grid = np.full(weeks * 7, NO_LESSON, dtype=np.int8)
+        if dates.size:
+            offsets = (dates - start).astype(np.int64)
+            np.minimum.at(grid, offsets, HEATMAP_LEVELS[codes])
+        grid[grid == NO_LESSON] = 0
+
+        return str(start), grid.reshape(weeks, 7).tolist()
+
+    @staticmethod
+    def _monthly(dates: np.ndarray, codes: np.ndarray, late: np.ndarray) -> list:
+        """월별 수업/출석/지각 횟수 및 평균 지각 시간 (수업이 있는 달만)"""
+        if dates.size == 0:
+            return []
+
+        months = dates.astype("datetime64[M]").astype(np.int64) % 12
+        is_late = codes == LATE
+
+        lessons = np.bincount(months, minlength=12)
+        attended = np.bincount(months, weights=codes != ABSENT, minlength=12)
+        late_counts = np.bincount(months, weights=is_late, minlength=12)
+        late_sums = np.bincount(months, weights=np.where(is_late, late, 0.0), minlength=12)
+
+        trends = []
+        for month in np.flatnonzero(lessons):
+            late_count = int(late_counts[month])
+            trends.append(MonthlyAttendanceTrend(
+                month=int(month) + 1,
+                lessons=int(lessons[month]),
+                attended=int(attended[month]),
+                late=late_count,
+                avg_late_minutes=round(float(late_sums[month] / late_count), 1) if late_count else None,
+            ))
+
+        return trends
@@ -0,0 +1,296 @@
+"""
+Attendance Rollup Service - F-004 출결 월간 집계
+학생별 월간 출결 집계(attendance_monthly_rollups) 증감, 재계산, 검증
+
+출결 통계(F-004)와 그룹 홈 요약은 원본 출결 행을 매번 다시 세지 않고
+(group_id, student_id, year, month) 집계 행을 읽습니다.
+(정산(F-006)은 완료(DONE)된 일정만 청구하므로 집계 대신 원본 출결을 조회)
+- 출결 생성/수정/배치 체크: 호출자의 트랜잭션 안에서 상태별 카운트를 증감
+- 일정 삭제(출결 CASCADE): 해당 월을 원본 데이터로 재계산
+- 백필/검증: scripts/rebuild_attendance_rollups.py
+"""
+
+from datetime import datetime, date
+from typing import Optional, Dict, List, Tuple, Any
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case, cast, extract, literal, select, insert, update, delete, Integer
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.models.attendance import Attendance, AttendanceStatus, AttendanceMonthlyRollup
+from app.models.schedule import Schedule, ScheduleStatus
+
+
+# 출결 상태 → 집계 컬럼명
+STATUS_COLUMNS = {
+    AttendanceStatus.PRESENT: "present_count",
+    AttendanceStatus.LATE: "late_count",
+    AttendanceStatus.EARLY_LEAVE: "early_leave_count",
+    AttendanceStatus.ABSENT: "absent_count",
+}
+
+Period = Tuple[int, int]  # (year, month)
+
+
+class AttendanceRollupService:
+    """
+    출결 월간 집계 서비스 레이어
+    """
+
+    # ==========================
+    # Incremental Updates
+    # ==========================
+
+    @staticmethod
+    def period_of(start_at: datetime) -> Period:
+        """집계 기준 연/월 (수업 시작 시각 기준)"""
+        return start_at.year, start_at.month
+
+    @staticmethod
+    def apply_deltas(
+        db: Session,
+        schedule: Schedule,
+        deltas: Dict[str, Dict[AttendanceStatus, int]],
+    ) -> None:
+        """
+        일정 1건에 대한 학생별 상태 카운트 증감 (커밋하지 않음)
+
+        집계 행이 없으면 먼저 0으로 만들고, 모든 학생을 UPDATE 1회로 증감합니다.
+        (col = col + CASE student_id WHEN ... END 이므로 동시 요청에도 안전)
+
+        Args:
+            db: 데이터베이스 세션 (호출자의 트랜잭션)
+            schedule: 출결이 속한 일정
+            deltas: 학생 ID → {출결 상태: 증감값}
+        """
+        # 취소된 일정의 출결은 집계하지 않음
+        if schedule.status == ScheduleStatus.CANCELED:
+            return
+
+        column_deltas: Dict[str, Dict[str, int]] = {}
+        for student_id, status_deltas in deltas.items():
+            for attendance_status, delta in status_deltas.items():
+                if not delta:
+                    continue
+                column = STATUS_COLUMNS[AttendanceStatus(attendance_status)]
+                per_student = column_deltas.setdefault(column, {})
+                per_student[student_id] = per_student.get(student_id, 0) + delta
+
+        student_ids = sorted({sid for per_student in column_deltas.values() for sid, d in per_student.items() if d})
+        if not student_ids:
+            return
+
+        year, month = AttendanceRollupService.period_of(schedule.start_at)
+        AttendanceRollupService._ensure_rows(db, schedule.group_id, student_ids, year, month)
+
+        values: Dict[str, Any] = {"updated_at": datetime.utcnow()}
+        for column, per_student in column_deltas.items():
+            values[column] = getattr(AttendanceMonthlyRollup, column) + case(
+                per_student, value=AttendanceMonthlyRollup.student_id, else_=0
+            )
+
+        db.execute(
+            update(AttendanceMonthlyRollup)
+            .where(
+                AttendanceMonthlyRollup.group_id == schedule.group_id,
+                AttendanceMonthlyRollup.year == year,
+                AttendanceMonthlyRollup.month == month,
+                AttendanceMonthlyRollup.student_id.in_(student_ids),
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _ensure_rows(db: Session, group_id: str, student_ids: List[str], year: int, month: int) -> None:
+        """집계 행이 없는 학생에 대해 0 카운트 행 생성 (DB 방언별 INSERT ... ON CONFLICT DO NOTHING)"""
+        now = datetime.utcnow()
+        rows = [
+            {
+                "group_id": group_id,
+                "student_id": student_id,
+                "year": year,
+                "month": month,
+                "present_count": 0,
+                "late_count": 0,
+                "early_leave_count": 0,
+                "absent_count": 0,
+                "updated_at": now,
+            }
+            for student_id in student_ids
+        ]
+
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+            db.execute(dialect_insert(AttendanceMonthlyRollup).values(rows).on_conflict_do_nothing())
+            return
+
+        existing = {
+            row[0] for row in db.query(AttendanceMonthlyRollup.student_id).filter(
+                AttendanceMonthlyRollup.group_id == group_id,
+                AttendanceMonthlyRollup.year == year,
+                AttendanceMonthlyRollup.month == month,
+                AttendanceMonthlyRollup.student_id.in_(student_ids),
+            ).all()
+        }
+        missing = [row for row in rows if row["student_id"] not in existing]
+        if missing:
+            db.execute(insert(AttendanceMonthlyRollup), missing)
+
+    # ==========================
+    # Rebuild / Verify
+    # ==========================
+
+    @staticmethod
+    def _aggregate_query(group_id: Optional[str] = None, period: Optional[Period] = None):
+        """원본 출결 행으로부터 (group, student, year, month)별 집계 SELECT"""
+        year_col = cast(extract("year", Schedule.start_at), Integer)
+        month_col = cast(extract("month", Schedule.start_at), Integer)
+
+        query = select(
+            Schedule.group_id,
+            Attendance.student_id,
+            year_col.label("year"),
+            month_col.label("month"),
+            *[
+                func.count(case((Attendance.status == attendance_status, 1))).label(column)
+                for attendance_status, column in STATUS_COLUMNS.items()
+            ],
+        ).join(
+            Schedule, Schedule.id == Attendance.schedule_id
+        ).where(
+            Schedule.status != ScheduleStatus.CANCELED
+        ).group_by(
+            Schedule.group_id, Attendance.student_id, year_col, month_col
+        )
+
+        if group_id:
+            query = query.where(Schedule.group_id == group_id)
+        if period:
+            start, end = AttendanceRollupService._period_bounds(period)
+            query = query.where(Schedule.start_at >= start, Schedule.start_at < end)
+
+        return query
+
+    @staticmethod
+    def _period_bounds(period: Period) -> Tuple[datetime, datetime]:
+        """연/월의 [시작, 다음 달 시작) 범위"""
+        year, month = period
+        start = datetime(year, month, 1)
+        end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+        return start, end
+
+    @staticmethod
+    def rebuild(db: Session, group_id: Optional[str] = None, period: Optional[Period] = None) -> int:
+        """
+        원본 출결로부터 집계 재계산 (DELETE + INSERT ... SELECT, 커밋하지 않음)
+
+        Args:
+            db: 데이터베이스 세션
+            group_id: 그룹 ID (없으면 전체)
+            period: (year, month) (없으면 전체 기간)
+
+        Returns:
+            int: 재생성된 집계 행 수
+        """
+        criteria = []
+        if group_id:
+            criteria.append(AttendanceMonthlyRollup.group_id == group_id)
+        if period:
+            criteria.append(AttendanceMonthlyRollup.year == period[0])
+            criteria.append(AttendanceMonthlyRollup.month == period[1])
+
+        db.execute(delete(AttendanceMonthlyRollup).where(*criteria).execution_options(synchronize_session=False))
+
+        aggregate = AttendanceRollupService._aggregate_query(group_id, period).add_columns(
+            literal(datetime.utcnow()).label("updated_at")
+        )
+        columns = ["group_id", "student_id", "year", "month", *STATUS_COLUMNS.values(), "updated_at"]
+        db.execute(insert(AttendanceMonthlyRollup).from_select(columns, aggregate))
+
+        return db.query(func.count()).select_from(AttendanceMonthlyRollup).filter(*criteria).scalar()
+
+    @staticmethod
+    def verify(db: Session, group_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        집계 테이블과 원본 출결 비교
+
+        Returns:
+            List[Dict]: 불일치 목록 (key, expected, actual), 일치하면 빈 목록
+        """
+        expected = {
+            (row.group_id, row.student_id, row.year, row.month): tuple(getattr(row, c) for c in STATUS_COLUMNS.values())
+            for row in db.execute(AttendanceRollupService._aggregate_query(group_id)).all()
+        }
+
+        query = db.query(AttendanceMonthlyRollup)
+        if group_id:
+            query = query.filter(AttendanceMonthlyRollup.group_id == group_id)
+        actual = {
+            (row.group_id, row.student_id, row.year, row.month): tuple(getattr(row, c) for c in STATUS_COLUMNS.values())
+            for row in query.all()
+        }
+
+        zero = (0,) * len(STATUS_COLUMNS)
+        mismatches = []
+        for key in sorted(set(expected) | set(actual)):
+            if expected.get(key, zero) != actual.get(key, zero):
+                mismatches.append({"key": key, "expected": expected.get(key, zero), "actual": actual.get(key, zero)})
+
+        return mismatches
+
+    # ==========================
+    # Read
+    # ==========================
+
+    @staticmethod
+    def whole_month_span(start_date: date, end_date: date, today: Optional[date] = None) -> Optional[Tuple[Period, Period]]:
+        """
+        날짜 범위가 월 단위로 딱 떨어지면 (시작 월, 종료 월) 반환
+
+        종료일이 오늘 이후인 현재 월은 '이번 달 전체'로 간주합니다.
+        (수업 시작 전에는 출결을 기록할 수 없으므로 미래 출결이 없음)
+
+        Returns:
+            Tuple[Period, Period] 또는 None (집계를 쓸 수 없는 범위)
+        """
+        today = today or datetime.utcnow().date()
+        if start_date.day != 1 or end_date < start_date:
+            return None
+
+        next_day = date.fromordinal(end_date.toordinal() + 1)
+        ends_on_month_end = next_day.day == 1
+        covers_month_to_date = end_date >= today and (end_date.year, end_date.month) == (today.year, today.month)
+        if not (ends_on_month_end or covers_month_to_date):
+            return None
+
+        return (start_date.year, start_date.month), (end_date.year, end_date.month)
+
+    @staticmethod
+    def get_counts(
+        db: Session,
+        group_id: str,
+        start: Period,
+        end: Period,
+        student_id: Optional[str] = None,
+    ) -> Dict[AttendanceStatus, int]:
+        """
+        기간(월 단위, 양 끝 포함) 상태별 출결 합계 (쿼리 1회)
+
+        Returns:
+            Dict[AttendanceStatus, int]: 상태별 횟수
+        """
+        period_key = AttendanceMonthlyRollup.year * 100 + AttendanceMonthlyRollup.month
+        query = db.query(
+            *[func.coalesce(func.sum(getattr(AttendanceMonthlyRollup, column)), 0) for column in STATUS_COLUMNS.values()]
+        ).filter(
+            AttendanceMonthlyRollup.group_id == group_id,
+            period_key >= start[0] * 100 + start[1],
+            period_key <= end[0] * 100 + end[1],
+        )
+        if student_id:
+            query = query.filter(AttendanceMonthlyRollup.student_id == student_id)
+
+        totals = query.one()
+        return {attendance_status: int(total) for attendance_status, total in zip(STATUS_COLUMNS, totals)}
@@ -3,13 +3,17 @@ Attendance Service - F-004 출결 관리 비즈니스 로직
 출결 CRUD, 통계, 권한 검증
 """
 
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, or_
+from sqlalchemy import func, desc, and_, or_, case, select, insert, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
+from app.core.pagination import encode_cursor, decode_cursor
 from app.models.attendance import Attendance, AttendanceStatus
 from app.models.schedule import Schedule, ScheduleStatus
 from app.models.group import Group, GroupMember, GroupMemberRole, GroupMemberInviteStatus
@@ -28,6 +32,9 @@ from app.schemas.attendance import (
     RecentAttendanceRecord,
 )
 from app.services.notification_service import NotificationService
+from app.services.attendance_rollup_service import AttendanceRollupService
+from app.services.attendance_analytics_service import AttendanceAnalyticsService
+from app.services.authorization_service import AuthorizationService
 
 
 class AttendanceService:
@@ -38,6 +45,7 @@ class AttendanceService:
     # Constants
     MAX_CHECK_DAYS = 7  # 수업 종료 후 최대 출결 체크 가능 일수
     MAX_EDIT_DAYS = 7   # 최초 기록 후 최대 수정 가능 일수
+    RECENT_RECORDS_LIMIT = 10  # 통계 응답의 최근 기록 수
 
     @staticmethod
     def _check_schedule_access(db: Session, user: User, schedule_id: str) -> Tuple[Schedule, Group]:
@@ -63,26 +71,11 @@ class AttendanceService:
                 detail={"code": "SCHEDULE_NOT_FOUND", "message": "일정을 찾을 수 없습니다."}
             )
 
-        # 그룹 확인
-        group = db.query(Group).filter(Group.id == schedule.group_id).first()
-        if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"code": "GROUP_NOT_FOUND", "message": "그룹을 찾을 수 없습니다."}
-            )
+        # 그룹 확인 (세션 identity map 재사용)
+        group = AuthorizationService.get_group(db, schedule.group_id)
 
-        # 멤버십 확인
-        membership = db.query(GroupMember).filter(
-            GroupMember.group_id == group.id,
-            GroupMember.user_id == user.id,
-            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-        ).first()
-
-        if not membership:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={"code": "NOT_GROUP_MEMBER", "message": "이 그룹의 멤버가 아닙니다."}
-            )
+        # 멤버십 확인 (요청 단위 권한 컨텍스트)
+        AuthorizationService.require_member(db, user, group.id)
 
         return schedule, group
 
@@ -94,13 +87,7 @@ class AttendanceService:
         Raises:
             HTTPException: 선생님이 아닌 경우
         """
-        membership = db.query(GroupMember).filter(
-            GroupMember.group_id == group.id,
-            GroupMember.user_id == user.id,
-            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-        ).first()
-
-        if not membership or membership.role != GroupMemberRole.TEACHER:
+        if AuthorizationService.get_role(db, user, group.id) != GroupMemberRole.TEACHER:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail={"code": "TEACHER_ONLY", "message": "선생님만 출결을 기록할 수 있습니다."}
@@ -229,8 +216,13 @@ class AttendanceService:
 
         db.add(attendance)
         try:
+            # 월간 집계 증감 (같은 트랜잭션)
+            AttendanceRollupService.apply_deltas(
+                db, schedule, {payload.student_id: {AttendanceStatus(payload.status): 1}}
+            )
             db.commit()
             db.refresh(attendance)
+            AttendanceAnalyticsService.invalidate(group.id, [payload.student_id], schedule.start_at.year)
         except IntegrityError as e:
             db.rollback()
             raise HTTPException(
@@ -238,39 +230,14 @@ class AttendanceService:
                 detail={"code": "ATTENDANCE_CONFLICT", "message": "출결 기록 중 오류가 발생했습니다."}
             )
 
-        # F-008: 출결 기록 알림 발송 (학생 + 학부모에게)
+        # F-008: 출결 기록 알림 발송 (학생 본인 + 해당 학생의 학부모)
         try:
-            # 알림 받을 사용자: 학생 본인 + 해당 학생의 학부모
-            recipient_ids = [payload.student_id]
-
-            # 학생의 학부모 찾기 (같은 그룹 내 PARENT 역할)
-            parents = db.query(GroupMember.user_id).filter(
-                GroupMember.group_id == group.id,
-                GroupMember.role == GroupMemberRole.PARENT,
-                GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-            ).all()
-            recipient_ids.extend([p[0] for p in parents])
-
-            if recipient_ids:
-                status_text = {
-                    AttendanceStatus.PRESENT: "출석",
-                    AttendanceStatus.LATE: "지각",
-                    AttendanceStatus.EARLY_LEAVE: "조퇴",
-                    AttendanceStatus.ABSENT: "결석",
-                }.get(payload.status, str(payload.status))
-
-                schedule_time = schedule.start_at.strftime("%m월 %d일 %H:%M") if schedule.start_at else ""
-                NotificationService.create_notifications_for_group(
-                    db=db,
-                    user_ids=recipient_ids,
-                    notification_type=NotificationType.ATTENDANCE_CHANGED,
-                    title=f"✅ 출결 기록 - {status_text}",
-                    message=f"{schedule.title} ({schedule_time})",
-                    priority=NotificationPriority.NORMAL,
-                    related_resource_type="attendance",
-                    related_resource_id=attendance.id,
-                )
+            notifications = AttendanceService._build_attendance_notifications(
+                db, group, schedule, [attendance]
+            )
+            NotificationService.bulk_create_notifications(db, notifications)
         except Exception as e:
+            db.rollback()
             print(f"⚠️ Warning: Failed to send attendance notification: {e}")
             # 알림 실패는 메인 로직에 영향을 주지 않음
 
@@ -305,91 +272,248 @@ class AttendanceService:
         # 출결 체크 시간 검증
         AttendanceService._validate_check_time(schedule)
 
-        # 출결 생성
-        attendances = []
-        for item in payload.attendances:
-            # 학생이 그룹 멤버인지 확인
-            student_membership = db.query(GroupMember).filter(
+        # 학생별 마지막 항목만 반영 (같은 학생이 중복 전달된 경우)
+        items_by_student = {item.student_id: item for item in payload.attendances}
+        student_ids = list(items_by_student.keys())
+
+        # 1. 그룹 멤버십 일괄 확인 (쿼리 1회)
+        # 배치 중 일부 학생이 그룹에 없으면 스킵 (MVP)
+        member_ids = {
+            row[0] for row in db.query(GroupMember.user_id).filter(
                 GroupMember.group_id == group.id,
-                GroupMember.user_id == item.student_id,
+                GroupMember.user_id.in_(student_ids),
                 GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-            ).first()
-
-            if not student_membership:
-                # 배치 중 일부 학생이 그룹에 없으면 스킵 (또는 에러)
-                # MVP에서는 스킵 처리
-                continue
+            ).all()
+        } if student_ids else set()
+        student_ids = [student_id for student_id in student_ids if student_id in member_ids]
 
-            # 중복 출결 체크
-            existing = db.query(Attendance).filter(
+        # 2. 기존 출결 일괄 조회 (쿼리 1회) - 덮어쓰기 판단 및 월간 집계 증감용
+        existing = {
+            row.student_id: (row.id, row.status)
+            for row in db.query(Attendance.student_id, Attendance.id, Attendance.status).filter(
                 Attendance.schedule_id == schedule_id,
-                Attendance.student_id == item.student_id,
-            ).first()
-
-            if existing:
-                # 이미 있으면 업데이트 (배치 특성상 덮어쓰기)
-                existing.status = item.status
-                existing.late_minutes = item.late_minutes
-                existing.memo = item.notes
-                existing.updated_at = datetime.utcnow()
-                attendances.append(existing)
-            else:
-                # 새로 생성
-                attendance = Attendance(
-                    schedule_id=schedule_id,
-                    student_id=item.student_id,
-                    status=item.status,
-                    late_minutes=item.late_minutes,
-                    memo=item.notes,
-                )
-                db.add(attendance)
-                attendances.append(attendance)
+                Attendance.student_id.in_(student_ids),
+            ).all()
+        } if student_ids else {}
+
+        # 3. 출결 일괄 upsert (이미 있으면 덮어쓰기) + 월간 집계 증감
+        if student_ids:
+            now = datetime.utcnow()
+            rows = [
+                {
+                    "id": str(uuid.uuid4()),
+                    "schedule_id": schedule_id,
+                    "student_id": student_id,
+                    "status": items_by_student[student_id].status,
+                    "late_minutes": items_by_student[student_id].late_minutes,
+                    "memo": items_by_student[student_id].notes,
+                    "recorded_at": now,
+                    "updated_at": now,
+                }
+                for student_id in student_ids
+            ]
+            AttendanceService._bulk_upsert_attendances(db, rows, existing)
+
+            deltas = {}
+            for student_id in student_ids:
+                new_status = AttendanceStatus(items_by_student[student_id].status)
+                old_status = existing[student_id][1] if student_id in existing else None
+                if old_status == new_status:
+                    continue
+                deltas[student_id] = {new_status: 1}
+                if old_status is not None:
+                    deltas[student_id][old_status] = -1
+            AttendanceRollupService.apply_deltas(db, schedule, deltas)
 
         db.commit()
-
-        # F-008: 배치 출결 알림 발송 (각 학생 + 해당 학부모에게)
+        AttendanceAnalyticsService.invalidate(group.id, student_ids, schedule.start_at.year)
+
+        # 4. 결과 재조회 (학생 정보 포함, 쿼리 1회)
+        rows_by_student = {
+            attendance.student_id: (attendance, student_name)
+            for attendance, student_name in db.query(Attendance, User.name).outerjoin(
+                User, User.id == Attendance.student_id
+            ).filter(
+                Attendance.schedule_id == schedule_id,
+                Attendance.student_id.in_(student_ids),
+            ).populate_existing().all()
+        } if student_ids else {}
+        attendances = [rows_by_student[student_id][0] for student_id in student_ids if student_id in rows_by_student]
+
+        # 응답 변환 (알림 발송 커밋으로 객체가 만료되기 전에 변환)
+        attendance_outs = [
+            AttendanceService._to_attendance_out(db, att, student_name=rows_by_student[att.student_id][1])
+            for att in attendances
+        ]
+
+        # F-008: 배치 출결 알림 발송
+        # 수신자별로 묶어 일정당 1건씩 (학생 본인 + 자녀가 있는 학부모), INSERT/커밋 1회
         try:
-            # 학부모 ID 목록 조회
-            parent_ids = [row[0] for row in db.query(GroupMember.user_id).filter(
-                GroupMember.group_id == group.id,
-                GroupMember.role == GroupMemberRole.PARENT,
-                GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-            ).all()]
-
-            # 각 출결에 대해 알림 발송
-            for attendance in attendances:
-                recipient_ids = [attendance.student_id] + parent_ids
-                if recipient_ids:
-                    status_text = {
-                        AttendanceStatus.PRESENT: "출석",
-                        AttendanceStatus.LATE: "지각",
-                        AttendanceStatus.EARLY_LEAVE: "조퇴",
-                        AttendanceStatus.ABSENT: "결석",
-                    }.get(attendance.status, str(attendance.status))
-
-                    schedule_time = schedule.start_at.strftime("%m월 %d일 %H:%M") if schedule.start_at else ""
-                    NotificationService.create_notifications_for_group(
-                        db=db,
-                        user_ids=recipient_ids,
-                        notification_type=NotificationType.ATTENDANCE_CHANGED,
-                        title=f"✅ 출결 기록 - {status_text}",
-                        message=f"{schedule.title} ({schedule_time})",
-                        priority=NotificationPriority.NORMAL,
-                        related_resource_type="attendance",
-                        related_resource_id=attendance.id,
-                    )
+            notifications = AttendanceService._build_attendance_notifications(
+                db,
+                group,
+                schedule,
+                attendances,
+                student_names={student_id: name for student_id, (_, name) in rows_by_student.items()},
+            )
+            NotificationService.bulk_create_notifications(db, notifications)
         except Exception as e:
+            db.rollback()
             print(f"⚠️ Warning: Failed to send batch attendance notifications: {e}")
             # 알림 실패는 메인 로직에 영향을 주지 않음
 
-        # 응답 변환
-        attendance_outs = [AttendanceService._to_attendance_out(db, att) for att in attendances]
-
         return BatchAttendanceResponse(
             schedule_id=schedule_id,
             attendances=attendance_outs
         )
 
+    @staticmethod
+    def _build_attendance_notifications(
+        db: Session,
+        group: Group,
+        schedule: Schedule,
+        attendances: List[Attendance],
+        student_names: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        출결 알림 목록 생성 (수신자별 1건으로 병합)
+
+        - 학생: 본인 출결 1건
+        - 학부모: 자녀(GroupMember.student_id)의 출결만 모아 1건
+          자녀가 연결되지 않은 학부모는 그룹 학생이 1명일 때만 그 학생의 출결을 받음
+
+        Args:
+            db: 데이터베이스 세션
+            group: 그룹
+            schedule: 일정
+            attendances: 알림 대상 출결 목록
+            student_names: 학생 ID → 이름 (학부모 알림 본문에 사용, 선택)
+
+        Returns:
+            List[Dict]: NotificationService.bulk_create_notifications 입력 형식
+        """
+        if not attendances:
+            return []
+
+        student_names = student_names or {}
+        status_texts = {
+            AttendanceStatus.PRESENT: "출석",
+            AttendanceStatus.LATE: "지각",
+            AttendanceStatus.EARLY_LEAVE: "조퇴",
+            AttendanceStatus.ABSENT: "결석",
+        }
+        schedule_time = schedule.start_at.strftime("%m월 %d일 %H:%M") if schedule.start_at else ""
+        schedule_label = f"{schedule.title} ({schedule_time})"
+
+        # 학생/학부모 멤버 조회 (쿼리 1회)
+        members = db.query(GroupMember.user_id, GroupMember.role, GroupMember.student_id).filter(
+            GroupMember.group_id == group.id,
+            GroupMember.role.in_([GroupMemberRole.STUDENT, GroupMemberRole.PARENT]),
+            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
+        ).all()
+        group_student_ids = [user_id for user_id, role, _ in members if role == GroupMemberRole.STUDENT]
+        only_student_id = group_student_ids[0] if len(group_student_ids) == 1 else None
+
+        attendance_by_student = {attendance.student_id: attendance for attendance in attendances}
+
+        # 수신자 → 해당 수신자가 받아야 할 출결 목록
+        recipients: Dict[str, List[Attendance]] = {
+            student_id: [attendance] for student_id, attendance in attendance_by_student.items()
+        }
+        for user_id, role, child_id in members:
+            if role != GroupMemberRole.PARENT:
+                continue
+            child_id = child_id or only_student_id
+            if child_id in attendance_by_student:
+                recipients.setdefault(user_id, []).append(attendance_by_student[child_id])
+
+        notifications = []
+        for user_id, items in recipients.items():
+            if len(items) == 1:
+                attendance = items[0]
+                status_text = status_texts.get(attendance.status, str(attendance.status))
+                name = student_names.get(attendance.student_id)
+                is_self = user_id == attendance.student_id
+                notifications.append({
+                    "user_id": user_id,
+                    "notification_type": NotificationType.ATTENDANCE_CHANGED,
+                    "title": f"✅ 출결 기록 - {status_text}",
+                    "message": schedule_label if is_self or not name else f"{name} · {schedule_label}",
+                    "priority": NotificationPriority.NORMAL,
+                    "related_resource_type": "attendance",
+                    "related_resource_id": attendance.id,
+                })
+            else:
+                # 같은 그룹에 자녀가 여럿인 학부모: 일정당 1건으로 요약
+                summary = ", ".join(
+                    f"{student_names.get(a.student_id, '자녀')} {status_texts.get(a.status, str(a.status))}"
+                    for a in items
+                )
+                notifications.append({
+                    "user_id": user_id,
+                    "notification_type": NotificationType.ATTENDANCE_CHANGED,
+                    "title": "✅ 출결 기록",
+                    "message": f"{schedule_label} - {summary}",
+                    "priority": NotificationPriority.NORMAL,
+                    "related_resource_type": "schedule",
+                    "related_resource_id": schedule.id,
+                })
+
+        return notifications
+
+    @staticmethod
+    def _bulk_upsert_attendances(
+        db: Session,
+        rows: List[dict],
+        existing: Dict[str, Tuple[str, AttendanceStatus]],
+    ) -> None:
+        """
+        출결 일괄 upsert (UNIQUE(schedule_id, student_id) 기준)
+
+        PostgreSQL/SQLite는 INSERT ... ON CONFLICT DO UPDATE 1회로 처리하고,
+        그 외 DB는 미리 조회한 기존 출결 기준으로 bulk INSERT/UPDATE로 나누어 처리합니다.
+        덮어쓸 때 최초 기록 시각(recorded_at)과 ID는 유지합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            rows: Attendance 컬럼 값 목록 (id, recorded_at 포함)
+            existing: 학생 ID → (기존 출결 ID, 기존 상태)
+        """
+        dialect = db.get_bind().dialect.name
+
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+            stmt = dialect_insert(Attendance).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Attendance.schedule_id, Attendance.student_id],
+                set_={
+                    "status": stmt.excluded.status,
+                    "late_minutes": stmt.excluded.late_minutes,
+                    "memo": stmt.excluded.memo,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            db.execute(stmt)
+            return
+
+        existing_ids = {student_id: attendance_id for student_id, (attendance_id, _) in existing.items()}
+        new_rows = [row for row in rows if row["student_id"] not in existing_ids]
+        update_rows = [
+            {
+                "id": existing_ids[row["student_id"]],
+                "status": row["status"],
+                "late_minutes": row["late_minutes"],
+                "memo": row["memo"],
+                "updated_at": row["updated_at"],
+            }
+            for row in rows if row["student_id"] in existing_ids
+        ]
+
+        if new_rows:
+            db.execute(insert(Attendance), new_rows)
+        if update_rows:
+            db.execute(update(Attendance), update_rows)
+
     @staticmethod
     def get_attendance(
         db: Session,
@@ -458,8 +582,14 @@ class AttendanceService:
         # 현재는 MVP 단계로 미구현
 
         # 필드 업데이트
+        old_status = attendance.status
         if payload.status is not None:
-            attendance.status = payload.status
+            attendance.status = AttendanceStatus(payload.status)
+            # 월간 집계 증감 (같은 트랜잭션)
+            if attendance.status != old_status:
+                AttendanceRollupService.apply_deltas(
+                    db, schedule, {attendance.student_id: {old_status: -1, attendance.status: 1}}
+                )
         if payload.late_minutes is not None:
             attendance.late_minutes = payload.late_minutes
         if payload.notes is not None:
@@ -467,6 +597,7 @@ class AttendanceService:
 
         db.commit()
         db.refresh(attendance)
+        AttendanceAnalyticsService.invalidate(group.id, [attendance.student_id], schedule.start_at.year)
 
         # F-008: 출결 수정 알림 발송
         try:
@@ -542,13 +673,18 @@ class AttendanceService:
         # 일정 및 그룹 확인
         schedule, group = AttendanceService._check_schedule_access(db, user, schedule_id)
 
-        # 출결 조회
-        attendances = db.query(Attendance).filter(
+        # 출결 조회 (학생 이름 함께)
+        rows = db.query(Attendance, User.name).outerjoin(
+            User, User.id == Attendance.student_id
+        ).filter(
             Attendance.schedule_id == schedule_id
         ).order_by(Attendance.recorded_at.desc()).all()
 
         # 응답 변환
-        items = [AttendanceService._to_attendance_out(db, att) for att in attendances]
+        items = [
+            AttendanceService._to_attendance_out(db, attendance, student_name=student_name)
+            for attendance, student_name in rows
+        ]
 
         return AttendanceListResponse(
             items=items,
@@ -563,9 +699,11 @@ class AttendanceService:
         group_id: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
     ) -> AttendanceListResponse:
         """
-        학생별 출결 목록 조회
+        학생별 출결 목록 조회 (커서 페이지네이션, 최신순)
 
         Args:
             db: 데이터베이스 세션
@@ -574,54 +712,79 @@ class AttendanceService:
             group_id: 그룹 ID (선택)
             start_date: 시작 날짜 (YYYY-MM-DD, 선택)
             end_date: 종료 날짜 (YYYY-MM-DD, 선택)
+            cursor: 이전 응답의 next_cursor (선택)
+            limit: 페이지 크기
 
         Returns:
-            AttendanceListResponse: 출결 목록
+            AttendanceListResponse: 출결 목록 (items, total, next_cursor, has_more)
         """
-        # 권한 확인: 자신의 출결이거나, 같은 그룹 멤버
-        # 학생/학부모는 자신의 출결만 조회 가능
-        # 선생님은 자신이 관리하는 그룹의 학생 출결 조회 가능
-
-        # 쿼리 시작
-        query = db.query(Attendance).filter(Attendance.student_id == student_id)
-
-        # 그룹 필터
+        # 권한 확인: 같은 그룹 멤버의 출결만 조회 가능
+        # - group_id 지정 시: 해당 그룹 멤버십 확인
+        # - 미지정 시: 현재 사용자가 속한 그룹의 일정으로 한정 (서브쿼리)
         if group_id:
-            # 그룹 멤버십 확인
-            membership = db.query(GroupMember).filter(
-                GroupMember.group_id == group_id,
-                GroupMember.user_id == user.id,
-                GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-            ).first()
+            AuthorizationService.require_member(db, user, group_id)
 
-            if not membership:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail={"code": "NOT_GROUP_MEMBER", "message": "이 그룹의 멤버가 아닙니다."}
+            group_filter = Schedule.group_id == group_id
+        else:
+            group_filter = Schedule.group_id.in_(
+                select(GroupMember.group_id).where(
+                    GroupMember.user_id == user.id,
+                    GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
                 )
+            )
 
-            # 해당 그룹의 일정만
-            schedule_ids = [s.id for s in db.query(Schedule.id).filter(Schedule.group_id == group_id).all()]
-            query = query.filter(Attendance.schedule_id.in_(schedule_ids))
+        # (student_id, recorded_at) 인덱스로 범위 조회, 일정은 서브쿼리로 그룹 한정
+        filters = [
+            Attendance.student_id == student_id,
+            Attendance.schedule_id.in_(select(Schedule.id).where(group_filter)),
+        ]
 
         # 날짜 필터
         if start_date:
             from_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            query = query.filter(Attendance.recorded_at >= from_dt)
+            filters.append(Attendance.recorded_at >= from_dt)
 
         if end_date:
             to_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
-            query = query.filter(Attendance.recorded_at < to_dt)
+            filters.append(Attendance.recorded_at < to_dt)
 
-        # 조회
-        attendances = query.order_by(Attendance.recorded_at.desc()).all()
+        # 전체 개수 (커서와 무관)
+        total = db.query(func.count(Attendance.id)).filter(*filters).scalar()
+
+        # 커서 이후 항목만 (recorded_at DESC, id DESC)
+        if cursor:
+            cursor_recorded_at, cursor_id = decode_cursor(cursor, datetime, str)
+            filters.append(or_(
+                Attendance.recorded_at < cursor_recorded_at,
+                and_(Attendance.recorded_at == cursor_recorded_at, Attendance.id < cursor_id),
+            ))
+
+        # 조회 (학생 이름 함께, limit + 1로 다음 페이지 여부 확인)
+        rows = db.query(Attendance, User.name).outerjoin(
+            User, User.id == Attendance.student_id
+        ).filter(*filters).order_by(
+            Attendance.recorded_at.desc(), Attendance.id.desc()
+        ).limit(limit + 1).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
 
         # 응답 변환
-        items = [AttendanceService._to_attendance_out(db, att) for att in attendances]
+        items = [
+            AttendanceService._to_attendance_out(db, attendance, student_name=student_name)
+            for attendance, student_name in rows
+        ]
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1][0]
+            next_cursor = encode_cursor(last.recorded_at, last.id)
 
         return AttendanceListResponse(
             items=items,
-            total=len(items)
+            total=total,
+            next_cursor=next_cursor,
+            has_more=has_more,
         )
 
     @staticmethod
@@ -637,6 +800,10 @@ class AttendanceService:
         출결 통계 조회
         API 명세서 6.4.3 기반
 
+        집계 기준 (월간 집계 테이블과 동일): 수업 시작일(Schedule.start_at)이 기간에 속하고
+        취소(CANCELED)되지 않은 일정의 출결. 통계와 최근 기록 모두 같은 기준을 사용하므로
+        월 단위 범위(집계 테이블)와 임의 범위(원본 출결)의 결과가 일치합니다.
+
         Args:
             db: 데이터베이스 세션
             user: 현재 사용자
@@ -649,17 +816,7 @@ class AttendanceService:
             AttendanceStatsResponse: 출결 통계
         """
         # 그룹 멤버십 확인
-        membership = db.query(GroupMember).filter(
-            GroupMember.group_id == group_id,
-            GroupMember.user_id == user.id,
-            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-        ).first()
-
-        if not membership:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={"code": "NOT_GROUP_MEMBER", "message": "이 그룹의 멤버가 아닙니다."}
-            )
+        AuthorizationService.require_member(db, user, group_id)
 
         # 날짜 범위 설정 (기본값: 당월)
         if not start_date:
@@ -667,33 +824,42 @@ class AttendanceService:
         if not end_date:
             end_date = datetime.utcnow().strftime("%Y-%m-%d")
 
-        # 해당 그룹의 일정 ID 목록
-        schedule_ids = [s.id for s in db.query(Schedule.id).filter(Schedule.group_id == group_id).all()]
-
-        # 출결 쿼리
-        query = db.query(Attendance).filter(Attendance.schedule_id.in_(schedule_ids))
-
-        if student_id:
-            query = query.filter(Attendance.student_id == student_id)
-
-        # 날짜 필터
+        # 출결 필터: 일정 조인으로 그룹/기간 한정 (수업 시작일 기준, 취소된 일정 제외)
         from_dt = datetime.strptime(start_date, "%Y-%m-%d")
         to_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
-        query = query.filter(
-            and_(
-                Attendance.recorded_at >= from_dt,
-                Attendance.recorded_at < to_dt
-            )
-        )
-
-        attendances = query.all()
+        filters = [
+            Schedule.group_id == group_id,
+            Schedule.start_at >= from_dt,
+            Schedule.start_at < to_dt,
+            Schedule.status != ScheduleStatus.CANCELED,
+        ]
+        if student_id:
+            filters.append(Attendance.student_id == student_id)
 
         # 통계 계산
-        total_sessions = len(attendances)
-        present_count = len([a for a in attendances if a.status == AttendanceStatus.PRESENT])
-        late_count = len([a for a in attendances if a.status == AttendanceStatus.LATE])
-        early_leave_count = len([a for a in attendances if a.status == AttendanceStatus.EARLY_LEAVE])
-        absent_count = len([a for a in attendances if a.status == AttendanceStatus.ABSENT])
+        # 월 단위 범위(기본값 포함)는 월간 집계 테이블에서, 그 외는 원본 출결을 쿼리 1회로 집계
+        month_span = AttendanceRollupService.whole_month_span(from_dt.date(), (to_dt - timedelta(days=1)).date())
+        if month_span:
+            counts = AttendanceRollupService.get_counts(db, group_id, *month_span, student_id=student_id)
+            present_count = counts[AttendanceStatus.PRESENT]
+            late_count = counts[AttendanceStatus.LATE]
+            early_leave_count = counts[AttendanceStatus.EARLY_LEAVE]
+            absent_count = counts[AttendanceStatus.ABSENT]
+            total_sessions = present_count + late_count + early_leave_count + absent_count
+        else:
+            # COUNT(CASE ...)는 NULL을 세지 않음
+            def count_status(attendance_status: AttendanceStatus):
+                return func.count(case((Attendance.status == attendance_status, 1)))
+
+            total_sessions, present_count, late_count, early_leave_count, absent_count = db.query(
+                func.count(Attendance.id),
+                count_status(AttendanceStatus.PRESENT),
+                count_status(AttendanceStatus.LATE),
+                count_status(AttendanceStatus.EARLY_LEAVE),
+                count_status(AttendanceStatus.ABSENT),
+            ).join(
+                Schedule, Schedule.id == Attendance.schedule_id
+            ).filter(*filters).one()
 
         # 출석률 계산: (출석 + 지각 + 조퇴) / 전체 * 100
         # F-004 비즈니스 규칙: 결석만 제외
@@ -711,20 +877,27 @@ class AttendanceService:
             attendance_rate=round(attendance_rate, 1)
         )
 
-        # 최근 기록 (최대 10개)
-        recent_attendances = sorted(attendances, key=lambda a: a.recorded_at, reverse=True)[:10]
-        recent_records = []
-        for att in recent_attendances:
-            schedule = db.query(Schedule).filter(Schedule.id == att.schedule_id).first()
-            if schedule:
-                recent_records.append(
-                    RecentAttendanceRecord(
-                        schedule_id=att.schedule_id,
-                        date=schedule.start_at.strftime("%Y-%m-%d"),
-                        status=att.status.value,
-                        notes=att.memo
-                    )
-                )
+        # 최근 기록 (최대 10개, 일정 조인 쿼리 1회)
+        recent_rows = db.query(
+            Attendance.schedule_id,
+            Attendance.status,
+            Attendance.memo,
+            Schedule.start_at,
+        ).join(
+            Schedule, Schedule.id == Attendance.schedule_id
+        ).filter(*filters).order_by(
+            Schedule.start_at.desc(), Attendance.recorded_at.desc()
+        ).limit(AttendanceService.RECENT_RECORDS_LIMIT).all()
+
+        recent_records = [
+            RecentAttendanceRecord(
+                schedule_id=row.schedule_id,
+                date=row.start_at.strftime("%Y-%m-%d"),
+                status=row.status.value,
+                notes=row.memo
+            )
+            for row in recent_rows
+        ]
 
         # 학생 정보 (특정 학생 통계일 경우)
         student_info = None
@@ -741,22 +914,30 @@ class AttendanceService:
         )
 
     @staticmethod
-    def _to_attendance_out(db: Session, attendance: Attendance) -> AttendanceOut:
+    def _to_attendance_out(
+        db: Session,
+        attendance: Attendance,
+        student_name: Optional[str] = None,
+    ) -> AttendanceOut:
         """
         Attendance 모델을 AttendanceOut 스키마로 변환
 
         Args:
             db: 데이터베이스 세션
             attendance: Attendance 모델
+            student_name: 미리 조회한 학생 이름 (있으면 학생 조회 생략)
 
         Returns:
             AttendanceOut: 응답 스키마
         """
         # 학생 정보 가져오기
-        student = db.query(User).filter(User.id == attendance.student_id).first()
         student_info = None
-        if student:
-            student_info = StudentInfo(user_id=student.id, name=student.name)
+        if student_name is not None:
+            student_info = StudentInfo(user_id=attendance.student_id, name=student_name)
+        else:
+            student = db.query(User).filter(User.id == attendance.student_id).first()
+            if student:
+                student_info = StudentInfo(user_id=student.id, name=student.name)
 
         return AttendanceOut(
             attendance_id=attendance.id,
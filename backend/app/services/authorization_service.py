@@ -0,0 +1,181 @@
+"""
+Authorization Service - 그룹 멤버십 기반 권한 확인
+요청 단위 권한 컨텍스트 (사용자의 승인된 멤버십/역할)
+
+한 화면(요청)에서 여러 서비스가 같은 GroupMember 행을 반복 조회하지 않도록
+사용자의 승인된 멤버십 전체를 쿼리 1회로 읽어 두고 모든 권한 확인이 이를 참조합니다.
+
+- 요청 범위: DB 세션(db.info)에 저장 (get_db가 요청마다 세션을 새로 만듦)
+- 요청 간: 짧은 TTL 캐시 (AUTHZ_CACHE_TTL_SECONDS, 워커 프로세스 단위)
+- 멤버십이 바뀌는 쓰기 경로(그룹 생성/삭제, 그룹 가입)에서 명시적으로 무효화하고,
+  다른 워커의 캐시는 TTL로 최대 지연 시간을 제한합니다.
+
+Usage:
+    role = AuthorizationService.get_role(db, user, group_id)
+    if role != GroupMemberRole.TEACHER: ...
+"""
+
+from typing import Optional, Dict, List, Tuple, Any
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.models.group import Group, GroupMember, GroupMemberRole, GroupMemberInviteStatus
+from app.models.user import User
+
+# db.info에 요청 범위 컨텍스트를 저장하는 키
+SESSION_INFO_KEY = "authz_contexts"
+
+
+class AuthorizationContext:
+    """
+    사용자 1명의 승인된 그룹 멤버십 스냅샷 (읽기 전용)
+
+    memberships: {group_id: (role, student_id)}
+    student_id는 학부모 멤버의 연결된 자녀 (그 외 역할은 None)
+    """
+
+    __slots__ = ("user_id", "memberships")
+
+    def __init__(self, user_id: str, memberships: Dict[str, Tuple[GroupMemberRole, Optional[str]]]):
+        self.user_id = user_id
+        self.memberships = memberships
+
+    @property
+    def group_ids(self) -> List[str]:
+        return list(self.memberships)
+
+    def is_member(self, group_id: str) -> bool:
+        return group_id in self.memberships
+
+    def role(self, group_id: str) -> Optional[GroupMemberRole]:
+        """그룹 내 역할 (멤버가 아니면 None)"""
+        membership = self.memberships.get(group_id)
+        return membership[0] if membership else None
+
+    def linked_student_id(self, group_id: str) -> Optional[str]:
+        """학부모 멤버의 연결된 자녀 ID"""
+        membership = self.memberships.get(group_id)
+        return membership[1] if membership else None
+
+
+class AuthorizationService:
+    """
+    권한 컨텍스트 서비스 레이어
+    """
+
+    _cache = TTLCache(
+        maxsize=settings.AUTHZ_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.AUTHZ_CACHE_TTL_SECONDS,
+    )
+
+    # ==========================
+    # Context
+    # ==========================
+
+    @staticmethod
+    def get_context(db: Session, user: User) -> AuthorizationContext:
+        """
+        사용자의 권한 컨텍스트 (요청 내 재사용 → 요청 간 캐시 → DB 조회 순)
+
+        Args:
+            db: 데이터베이스 세션 (요청 범위)
+            user: 현재 사용자
+
+        Returns:
+            AuthorizationContext: 승인된 멤버십 스냅샷
+        """
+        contexts = db.info.setdefault(SESSION_INFO_KEY, {})
+        context = contexts.get(user.id)
+        if context is not None:
+            return context
+
+        context = AuthorizationService._cache.get(user.id)
+        if context is None:
+            rows = db.query(
+                GroupMember.group_id, GroupMember.role, GroupMember.student_id,
+            ).filter(
+                GroupMember.user_id == user.id,
+                GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
+            ).all()
+            context = AuthorizationContext(
+                user.id,
+                {group_id: (role, student_id) for group_id, role, student_id in rows},
+            )
+            AuthorizationService._cache.set(user.id, context)
+
+        contexts[user.id] = context
+        return context
+
+    @staticmethod
+    def get_role(db: Session, user: User, group_id: str) -> Optional[GroupMemberRole]:
+        """그룹 내 역할 (멤버가 아니면 None)"""
+        return AuthorizationService.get_context(db, user).role(group_id)
+
+    @staticmethod
+    def is_member(db: Session, user: User, group_id: str) -> bool:
+        return AuthorizationService.get_context(db, user).is_member(group_id)
+
+    @staticmethod
+    def require_member(db: Session, user: User, group_id: str) -> AuthorizationContext:
+        """
+        그룹 멤버 확인 (그룹 존재 여부는 확인하지 않음)
+
+        Raises:
+            HTTPException 403: 그룹 멤버가 아님
+        """
+        context = AuthorizationService.get_context(db, user)
+        if not context.is_member(group_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={"code": "NOT_GROUP_MEMBER", "message": "이 그룹의 멤버가 아닙니다."}
+            )
+        return context
+
+    @staticmethod
+    def get_group(db: Session, group_id: str) -> Group:
+        """
+        그룹 조회 (세션 identity map 재사용, 같은 요청에서 반복 조회 시 쿼리 없음)
+
+        Raises:
+            HTTPException 404: 그룹이 없음
+        """
+        group = db.get(Group, group_id)
+        if not group:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"code": "GROUP_NOT_FOUND", "message": "그룹을 찾을 수 없습니다."}
+            )
+        return group
+
+    # ==========================
+    # Invalidation
+    # ==========================
+
+    @staticmethod
+    def invalidate_user(user_id: str, db: Optional[Session] = None) -> None:
+        """
+        사용자 멤버십 변경 시 캐시 무효화 (그룹 가입/탈퇴/역할 변경)
+
+        Args:
+            user_id: 사용자 ID
+            db: 같은 요청에서 이후 권한 확인이 이어지면 전달 (요청 범위 컨텍스트도 제거)
+        """
+        AuthorizationService._cache.delete(user_id)
+        if db is not None:
+            db.info.get(SESSION_INFO_KEY, {}).pop(user_id, None)
+
+    @staticmethod
+    def invalidate_group(group_id: str, db: Optional[Session] = None) -> None:
+        """그룹 삭제 등으로 그룹 전체 멤버십이 바뀐 경우 해당 그룹을 포함한 컨텍스트 무효화"""
+        AuthorizationService._cache.delete_where(lambda _, context: context.is_member(group_id))
+        if db is not None:
+            contexts = db.info.get(SESSION_INFO_KEY, {})
+            for user_id in [uid for uid, context in contexts.items() if context.is_member(group_id)]:
+                del contexts[user_id]
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """요청 간 캐시 통계 (모니터링용)"""
+        return AuthorizationService._cache.stats()
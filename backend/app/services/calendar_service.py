@@ -0,0 +1,392 @@
+"""
+Calendar Feed Service - F-003 수업 일정 캘린더 구독
+사용자별 iCalendar(.ics) 피드 생성, 캐싱, 무효화
+
+캘린더 앱은 구독 피드를 수 분 간격으로 폴링하므로:
+- 피드 본문은 토큰별로 캐시하고 (캐시 적중 시 DB 조회 없음)
+- 캐시 미스 시 일정을 DB에서 스트리밍하며 바로 응답으로 내보내고
+- ETag/Last-Modified로 변경이 없으면 304를 반환합니다.
+"""
+
+import hashlib
+import secrets
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Dict, Any, Iterator, List
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from fastapi import HTTPException, status
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.models.schedule import Schedule, ScheduleStatus
+from app.models.group import Group, GroupMember, GroupMemberInviteStatus
+from app.models.user import User
+
+
+class CalendarFeedService:
+    """
+    캘린더 피드 서비스 레이어
+    """
+
+    # Constants
+    MEDIA_TYPE = "text/calendar; charset=utf-8"
+    STREAM_BATCH_SIZE = 200  # DB에서 한 번에 가져올 일정 수 (yield_per)
+    FLUSH_EVERY_EVENTS = 100  # 응답으로 내보낼 이벤트 묶음 크기
+
+    # 토큰 → 피드 캐시 (body, etag, last_modified, user_id, group_ids)
+    _cache = TTLCache(
+        maxsize=settings.CALENDAR_FEED_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.CALENDAR_FEED_CACHE_TTL_SECONDS,
+    )
+
+    # 무효화 세대: 무효화마다 증가. 피드 계산 중 무효화가 있었으면 결과를 캐시에 저장하지 않음
+    _generation = 0
+    _generation_lock = threading.Lock()
+
+    # ==========================
+    # Token Management
+    # ==========================
+
+    @staticmethod
+    def get_or_create_feed_token(db: Session, user: User) -> str:
+        """
+        구독 토큰 조회 (없으면 발급)
+
+        Args:
+            db: 데이터베이스 세션
+            user: 현재 사용자
+
+        Returns:
+            str: 캘린더 피드 토큰
+        """
+        if not user.calendar_feed_token:
+            user.calendar_feed_token = secrets.token_urlsafe(32)
+            db.commit()
+            db.refresh(user)
+
+        return user.calendar_feed_token
+
+    @staticmethod
+    def rotate_feed_token(db: Session, user: User) -> str:
+        """
+        구독 토큰 재발급 (기존 구독 URL 무효화)
+
+        Args:
+            db: 데이터베이스 세션
+            user: 현재 사용자
+
+        Returns:
+            str: 새 캘린더 피드 토큰
+        """
+        CalendarFeedService.invalidate_user(user.id)
+
+        user.calendar_feed_token = secrets.token_urlsafe(32)
+        db.commit()
+        db.refresh(user)
+
+        return user.calendar_feed_token
+
+    # ==========================
+    # Cache
+    # ==========================
+
+    @staticmethod
+    def get_cached_feed(token: str) -> Optional[Dict[str, Any]]:
+        """캐시된 피드 조회 (DB 조회 없음)"""
+        return CalendarFeedService._cache.get(token)
+
+    @staticmethod
+    def invalidate_group(group_id: str) -> None:
+        """그룹 일정 변경 시 해당 그룹을 포함하는 모든 피드 무효화"""
+        CalendarFeedService._bump_generation()
+        CalendarFeedService._cache.delete_where(
+            lambda _token, feed: group_id in feed["group_ids"]
+        )
+
+    @staticmethod
+    def invalidate_user(user_id: str) -> None:
+        """사용자의 그룹 구성 변경/토큰 재발급 시 해당 사용자 피드 무효화"""
+        CalendarFeedService._bump_generation()
+        CalendarFeedService._cache.delete_where(
+            lambda _token, feed: feed["user_id"] == user_id
+        )
+
+    @staticmethod
+    def _bump_generation() -> None:
+        """무효화 세대 증가 (캐시 삭제보다 먼저 호출)"""
+        with CalendarFeedService._generation_lock:
+            CalendarFeedService._generation += 1
+
+    @staticmethod
+    def _store_if_current(token: str, feed: Dict[str, Any]) -> bool:
+        """
+        피드 계산 시작 후 무효화가 없었을 때만 캐시에 저장
+
+        세대 비교와 저장을 같은 락 안에서 하므로, 저장 직후의 무효화는 항상 이 항목을 지웁니다.
+
+        Returns:
+            bool: 저장 여부
+        """
+        with CalendarFeedService._generation_lock:
+            if feed["generation"] != CalendarFeedService._generation:
+                return False
+            CalendarFeedService._cache.set(token, feed)
+            return True
+
+    # ==========================
+    # Conditional Request
+    # ==========================
+
+    @staticmethod
+    def build_headers(feed: Dict[str, Any]) -> Dict[str, str]:
+        """ETag/Last-Modified/Cache-Control 헤더 생성"""
+        return {
+            "ETag": feed["etag"],
+            "Last-Modified": format_datetime(feed["last_modified"], usegmt=True),
+            "Cache-Control": "private, max-age=0, must-revalidate",
+        }
+
+    @staticmethod
+    def is_not_modified(
+        feed: Dict[str, Any],
+        if_none_match: Optional[str],
+        if_modified_since: Optional[str],
+    ) -> bool:
+        """
+        조건부 요청 판별 (RFC 7232: If-None-Match 우선)
+
+        Returns:
+            bool: True면 304 Not Modified 응답 가능
+        """
+        if if_none_match:
+            candidates = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in candidates or feed["etag"] in candidates
+
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            # HTTP 날짜는 초 단위이므로 마이크로초는 버리고 비교
+            return feed["last_modified"].replace(microsecond=0) <= since
+
+        return False
+
+    # ==========================
+    # Feed Generation
+    # ==========================
+
+    @staticmethod
+    def prepare_feed(db: Session, token: str) -> Dict[str, Any]:
+        """
+        캐시 미스 시 피드 메타데이터 계산 (본문 생성 전)
+
+        사용자/그룹 조회 + 집계 쿼리 1회로 ETag를 계산하므로,
+        (일정 SUMMARY에 그룹 이름이 들어가므로 그룹 수정 시각도 함께 집계)
+        변경이 없으면 본문을 만들지 않고 304로 응답할 수 있습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            token: 캘린더 피드 토큰
+
+        Returns:
+            Dict: user_id, timezone, group_ids, window_start, etag, last_modified, generation
+
+        Raises:
+            HTTPException 404: 유효하지 않은 토큰
+        """
+        # DB 조회 전에 세대를 기록 (조회 이후의 무효화를 stream_feed에서 감지)
+        generation = CalendarFeedService._generation
+
+        user = db.query(User).filter(User.calendar_feed_token == token).first()
+        if not user or not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"code": "CALENDAR_FEED_NOT_FOUND", "message": "캘린더 구독 정보를 찾을 수 없습니다."}
+            )
+
+        group_ids = sorted(
+            row[0] for row in db.query(GroupMember.group_id).filter(
+                GroupMember.user_id == user.id,
+                GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
+            ).all()
+        )
+
+        window_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(
+            days=settings.CALENDAR_FEED_PAST_DAYS
+        )
+
+        groups_updated = db.query(func.max(Group.updated_at)).filter(
+            Group.id.in_(group_ids)
+        ).scalar_subquery()
+
+        event_count, last_updated, group_last_updated = db.query(
+            func.count(Schedule.id),
+            func.max(Schedule.updated_at),
+            groups_updated,
+        ).filter(
+            Schedule.group_id.in_(group_ids),
+            Schedule.start_at >= window_start,
+        ).one()
+
+        version = ":".join([
+            user.id,
+            ",".join(group_ids),
+            str(event_count),
+            last_updated.isoformat() if last_updated else "",
+            group_last_updated.isoformat() if group_last_updated else "",
+            window_start.date().isoformat(),
+        ])
+        etag = '"' + hashlib.sha1(version.encode("utf-8")).hexdigest() + '"'
+
+        last_modified = max(
+            (value for value in (last_updated, group_last_updated) if value),
+            default=user.created_at or datetime.utcnow(),
+        )
+
+        return {
+            "user_id": user.id,
+            "timezone": user.timezone,
+            "group_ids": group_ids,
+            "window_start": window_start,
+            "etag": etag,
+            "last_modified": last_modified.replace(tzinfo=timezone.utc),
+            "generation": generation,
+        }
+
+    @staticmethod
+    def stream_feed(db: Session, token: str, feed: Dict[str, Any]) -> Iterator[bytes]:
+        """
+        iCalendar 본문 스트리밍 생성
+
+        일정을 yield_per로 나누어 읽으며 이벤트 묶음 단위로 내보내고,
+        끝까지 전송되면 완성된 본문을 캐시에 저장합니다.
+        (prepare_feed() 이후 무효화가 있었으면 오래된 본문이므로 저장하지 않음)
+
+        Args:
+            db: 데이터베이스 세션
+            token: 캘린더 피드 토큰 (캐시 키)
+            feed: prepare_feed()의 결과
+
+        Yields:
+            bytes: iCalendar 본문 조각
+        """
+        parts: List[bytes] = []
+
+        def flush(lines: List[str]) -> bytes:
+            chunk = "".join(_fold(line) + "\r\n" for line in lines).encode("utf-8")
+            parts.append(chunk)
+            return chunk
+
+        yield flush([
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:-//WeTee//Schedule Feed//KO",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            "X-WR-CALNAME:WeTee 수업 일정",
+            f"X-WR-TIMEZONE:{feed['timezone']}",
+            "X-PUBLISHED-TTL:PT15M",
+        ])
+
+        rows = db.query(
+            Schedule.id,
+            Schedule.title,
+            Schedule.start_at,
+            Schedule.end_at,
+            Schedule.status,
+            Schedule.location,
+            Schedule.memo,
+            Schedule.updated_at,
+            Group.name,
+        ).join(
+            Group, Group.id == Schedule.group_id
+        ).filter(
+            Schedule.group_id.in_(feed["group_ids"]),
+            Schedule.start_at >= feed["window_start"],
+        ).order_by(Schedule.start_at).yield_per(CalendarFeedService.STREAM_BATCH_SIZE)
+
+        pending: List[str] = []
+        pending_events = 0
+        for row in rows:
+            pending.extend(CalendarFeedService._event_lines(row))
+            pending_events += 1
+            if pending_events >= CalendarFeedService.FLUSH_EVERY_EVENTS:
+                yield flush(pending)
+                pending = []
+                pending_events = 0
+
+        pending.append("END:VCALENDAR")
+        yield flush(pending)
+
+        CalendarFeedService._store_if_current(token, dict(feed, body=b"".join(parts)))
+
+    @staticmethod
+    def _event_lines(row) -> List[str]:
+        """
+        일정 1건을 VEVENT 라인 목록으로 변환
+
+        일정 시각은 DB에 저장된 그대로(로컬 시각) floating time으로 내보냅니다.
+        """
+        schedule_id, title, start_at, end_at, schedule_status, location, memo, updated_at, group_name = row
+
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{schedule_id}@wetee",
+            f"DTSTAMP:{(updated_at or datetime.utcnow()).strftime('%Y%m%dT%H%M%SZ')}",
+            f"DTSTART:{start_at.strftime('%Y%m%dT%H%M%S')}",
+            f"DTEND:{end_at.strftime('%Y%m%dT%H%M%S')}",
+            f"SUMMARY:{_escape_text(f'[{group_name}] {title}')}",
+            "STATUS:CANCELLED" if schedule_status == ScheduleStatus.CANCELED else "STATUS:CONFIRMED",
+        ]
+        if location:
+            lines.append(f"LOCATION:{_escape_text(location)}")
+        if memo:
+            lines.append(f"DESCRIPTION:{_escape_text(memo)}")
+        lines.append("END:VEVENT")
+
+        return lines
+
+
+# ==========================
+# iCalendar Formatting Helpers (RFC 5545)
+# ==========================
+
+def _escape_text(value: str) -> str:
+    """TEXT 값 이스케이프 (백슬래시, 세미콜론, 콤마, 줄바꿈)"""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str, limit: int = 75) -> str:
+    """
+    75옥텟 단위 라인 폴딩
+
+    한글 등 멀티바이트 문자가 잘리지 않도록 문자 단위로 누적합니다.
+    """
+    if len(line.encode("utf-8")) <= limit:
+        return line
+
+    segments = []
+    current = ""
+    current_size = 0
+    for char in line:
+        size = len(char.encode("utf-8"))
+        # 두 번째 줄부터는 선행 공백 1옥텟 포함
+        max_size = limit if not segments else limit - 1
+        if current_size + size > max_size:
+            segments.append(current)
+            current = ""
+            current_size = 0
+        current += char
+        current_size += size
+    segments.append(current)
+
+    return "\r\n ".join(segments)
@@ -7,7 +7,7 @@ import smtplib
 import logging
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -247,6 +247,17 @@ class EmailTemplate:
             """,
         },
 
+        # 주간 리포트
+        "WEEKLY_PARENT_REPORT": {
+            "subject": "[WeTee] 📊 {title}",
+            "content": """
+                <h2>{title}</h2>
+                <p>{message}</p>
+                {report_body}
+                {action_button}
+            """,
+        },
+
         # 시스템 공지
         "SYSTEM_NOTICE": {
             "subject": "[WeTee] 📢 {title}",
@@ -304,6 +315,7 @@ class EmailTemplate:
             "scheduled_time": "",
             "amount": "",
             "due_date": "",
+            "report_body": "",
         }
 
         # 추가 데이터 병합
@@ -320,7 +332,7 @@ class EmailTemplate:
         )
 
         # 제목 렌더링
-        subject = template["subject"].format(title=title, **template_vars)
+        subject = template["subject"].format(**template_vars)
 
         return {
             "subject": subject,
@@ -339,6 +351,24 @@ class EmailService:
         self.config = config or self._load_config_from_env()
         self._connection: Optional[smtplib.SMTP] = None
 
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        html_body: str,
+        text_body: Optional[str] = None,
+    ) -> MIMEMultipart:
+        """MIME 메시지 생성 (텍스트 버전은 HTML을 지원하지 않는 클라이언트용)"""
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = f"{self.config.from_name} <{self.config.from_email}>"
+        msg["To"] = to_email
+
+        if text_body:
+            msg.attach(MIMEText(text_body, "plain", "utf-8"))
+        msg.attach(MIMEText(html_body, "html", "utf-8"))
+        return msg
+
     def _load_config_from_env(self) -> EmailConfig:
         """환경변수에서 이메일 설정 로드"""
         import os
@@ -387,20 +417,7 @@ class EmailService:
             return False
 
         try:
-            # MIME 메시지 생성
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = f"{self.config.from_name} <{self.config.from_email}>"
-            msg["To"] = to_email
-
-            # 텍스트 버전 (HTML을 지원하지 않는 클라이언트용)
-            if text_body:
-                text_part = MIMEText(text_body, "plain", "utf-8")
-                msg.attach(text_part)
-
-            # HTML 버전
-            html_part = MIMEText(html_body, "html", "utf-8")
-            msg.attach(html_part)
+            msg = self._build_message(to_email, subject, html_body, text_body)
 
             # SMTP 연결 및 발송
             with smtplib.SMTP(self.config.smtp_host, self.config.smtp_port) as server:
@@ -426,6 +443,61 @@ class EmailService:
             logger.error(f"Failed to send email: {e}")
             return False
 
+    def send_bulk(
+        self,
+        messages: Iterable[Dict[str, str]],
+        batch_size: int = 100,
+    ) -> Dict[str, int]:
+        """
+        이메일 일괄 발송 (SMTP 연결 1회당 batch_size통)
+
+        메일마다 연결/TLS/로그인을 반복하지 않고, 한 연결로 여러 통을 보낸 뒤
+        batch_size마다 다시 연결합니다. (서버의 연결당 메일 수 제한 대비)
+
+        Args:
+            messages: {"to_email", "subject", "html_body", "text_body"(선택)} 목록
+            batch_size: 연결 1회당 발송 수
+
+        Returns:
+            Dict: sent, failed, skipped(서비스 비활성화) 건수
+        """
+        messages = list(messages)
+        result = {"sent": 0, "failed": 0, "skipped": 0}
+        if not self.is_enabled():
+            logger.warning("Email service is disabled. Skipping bulk email send.")
+            result["skipped"] = len(messages)
+            return result
+
+        for start in range(0, len(messages), batch_size):
+            batch = messages[start:start + batch_size]
+            done = 0  # 이 배치에서 결과가 확정된 메일 수
+            try:
+                with smtplib.SMTP(self.config.smtp_host, self.config.smtp_port) as server:
+                    if self.config.use_tls:
+                        server.starttls()
+                    server.login(self.config.smtp_user, self.config.smtp_password)
+
+                    for message in batch:
+                        try:
+                            server.send_message(self._build_message(
+                                message["to_email"],
+                                message["subject"],
+                                message["html_body"],
+                                message.get("text_body"),
+                            ))
+                            result["sent"] += 1
+                        except smtplib.SMTPRecipientsRefused as e:
+                            logger.error(f"Recipients refused: {e}")
+                            result["failed"] += 1
+                        done += 1
+            except Exception as e:
+                # 연결/인증 실패 또는 연결 중단: 이 배치의 나머지는 실패 처리 후 다음 배치 진행
+                logger.error(f"Failed to send bulk email batch: {e}")
+                result["failed"] += len(batch) - done
+
+        logger.info(f"Bulk email finished: sent={result['sent']} failed={result['failed']}")
+        return result
+
     def send_notification_email(
         self,
         to_email: str,
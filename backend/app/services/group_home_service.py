@@ -0,0 +1,274 @@
+"""
+Group Home Service - 그룹 홈 화면 통합 조회
+그룹 상세, 다가오는 일정, 교재 진도, 이번 달 출결, 미결 청구서를 한 번의 요청으로 조회
+
+모바일 그룹 화면이 그룹 상세/일정/교재/출결 통계/청구서 API를 따로 호출하면
+요청마다 인증과 멤버십 확인이 반복되므로, 권한 확인은 한 번만 하고
+각 섹션은 고정된 수의 쿼리(섹션당 1회)로 조회합니다.
+
+- 섹션 조회는 서로 독립이므로 DB가 동시 연결을 지원하면(SQLite 제외)
+  공유 스레드 풀에서 섹션별 세션으로 동시에 실행 (GROUP_HOME_PARALLEL_QUERIES)
+- 동시 실행 전에 요청 세션의 커넥션을 반납하고, 스레드 수는 커넥션 풀 크기의 절반 이하로 제한
+  (요청 스레드가 커넥션을 쥔 채 섹션을 기다리면 동시 요청이 풀을 모두 점유해 섹션이 커넥션을 못 얻음)
+- 비교 벤치마크: scripts/benchmark_group_home.py
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
+from typing import Optional, List, Dict, Any, Callable, Tuple
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.config import settings
+from app.models.group import GroupMember, GroupMemberRole, GroupMemberInviteStatus
+from app.models.schedule import Schedule, ScheduleStatus
+from app.models.textbook import Textbook
+from app.models.attendance import AttendanceStatus
+from app.models.invoice import Invoice, InvoiceStatus
+from app.models.user import User
+from app.schemas.group import GroupHomeResponse, GroupHomeAttendance, GroupMemberOut
+from app.schemas.schedule import ScheduleOut
+from app.schemas.textbook import TextbookOut
+from app.schemas.attendance import AttendanceStats
+from app.schemas.invoice import InvoiceBasicInfo, StudentInfo, BillingPeriod
+from app.services.authorization_service import AuthorizationService
+from app.services.group_service import GroupService
+from app.services.schedule_service import ScheduleService
+from app.services.textbook_service import TextbookService
+from app.services.attendance_rollup_service import AttendanceRollupService
+
+# 미결 청구서 (발송 후 완납/취소 전)
+OPEN_INVOICE_STATUSES = (InvoiceStatus.SENT, InvoiceStatus.PARTIALLY_PAID, InvoiceStatus.OVERDUE)
+
+
+class GroupHomeService:
+    """
+    그룹 홈 화면 서비스 레이어
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    # ==========================
+    # Home
+    # ==========================
+
+    @staticmethod
+    def get_group_home(
+        db: Session,
+        user: User,
+        group_id: str,
+        schedule_limit: int = 5,
+    ) -> GroupHomeResponse:
+        """
+        그룹 홈 화면 데이터 조회
+
+        - 학생: 본인 출결/청구서, 학부모: 연결된 자녀의 출결/청구서
+        - 선생님: 그룹 전체 출결, 그룹 소유자면 그룹 전체 미결 청구서
+
+        Args:
+            db: 데이터베이스 세션
+            user: 현재 사용자
+            group_id: 그룹 ID
+            schedule_limit: 다가오는 일정 개수
+
+        Returns:
+            GroupHomeResponse: 그룹 홈 화면 데이터
+
+        Raises:
+            HTTPException: 그룹이 없거나 멤버가 아닌 경우
+        """
+        group = AuthorizationService.get_group(db, group_id)
+        context = AuthorizationService.require_member(db, user, group_id)
+        role = context.role(group_id)
+
+        # 역할별 조회 대상 학생 (None이면 그룹 전체)
+        if role == GroupMemberRole.STUDENT:
+            student_id = user.id
+        elif role == GroupMemberRole.PARENT:
+            student_id = context.linked_student_id(group_id)
+        else:
+            student_id = None
+
+        can_view_invoices = group.owner_id == user.id or student_id is not None
+        today = datetime.utcnow().date()
+
+        sections: Dict[str, Tuple[Callable[..., Any], tuple]] = {
+            "members": (GroupHomeService._load_members, (group_id,)),
+            "schedules": (GroupHomeService._load_upcoming_schedules, (group_id, schedule_limit)),
+            "textbooks": (GroupHomeService._load_textbooks, (group_id,)),
+            "attendance": (GroupHomeService._load_month_attendance, (group_id, student_id, today)),
+        }
+        if can_view_invoices:
+            sections["invoices"] = (GroupHomeService._load_open_invoices, (group_id, student_id))
+
+        # 동시 실행 시 요청 세션을 커밋하므로 그룹 정보는 먼저 변환
+        group_out = GroupService._to_group_out(group)
+        results = GroupHomeService._run_sections(db, sections)
+
+        group_out.members = results["members"]
+        group_out.member_count = len(results["members"])
+
+        return GroupHomeResponse(
+            group=group_out,
+            my_role=role.value,
+            upcoming_schedules=results["schedules"],
+            textbooks=results["textbooks"],
+            attendance=results["attendance"],
+            open_invoices=results.get("invoices", []),
+        )
+
+    # ==========================
+    # Section Execution
+    # ==========================
+
+    @staticmethod
+    def _query_workers() -> int:
+        """섹션 동시 조회 스레드 수 (GROUP_HOME_QUERY_WORKERS, 최대 커넥션 수의 절반 이하)"""
+        max_connections = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+        return max(1, min(settings.GROUP_HOME_QUERY_WORKERS, max_connections // 2))
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        """섹션 동시 조회용 공유 스레드 풀 (첫 사용 시 생성)"""
+        with GroupHomeService._executor_lock:
+            if GroupHomeService._executor is None:
+                GroupHomeService._executor = ThreadPoolExecutor(
+                    max_workers=GroupHomeService._query_workers(),
+                    thread_name_prefix="group-home",
+                )
+            return GroupHomeService._executor
+
+    @staticmethod
+    def _can_run_in_parallel(bind) -> bool:
+        """섹션 동시 조회 가능 여부 (설정이 켜져 있고 SQLite가 아닐 때)"""
+        return settings.GROUP_HOME_PARALLEL_QUERIES and bind.dialect.name != "sqlite"
+
+    @staticmethod
+    def _run_sections(db: Session, sections: Dict[str, Tuple[Callable[..., Any], tuple]]) -> Dict[str, Any]:
+        """
+        섹션 조회 실행
+
+        SQLite는 연결 간 동시 읽기 이점이 없고 요청 세션의 트랜잭션과 잠금이 겹칠 수 있으므로
+        요청 세션에서 순서대로 실행합니다. 그 외 DB는 섹션별로 같은 엔진의 새 세션을 열어 동시에 실행합니다.
+
+        동시 실행 전에 요청 세션을 커밋해 커넥션을 풀에 반납합니다. 요청 스레드가 커넥션을 쥔 채
+        섹션 결과를 기다리지 않으므로, 동시 요청이 많아도 섹션 세션이 커넥션을 기다리다 실패하지 않습니다.
+        """
+        bind = db.get_bind()
+        if not GroupHomeService._can_run_in_parallel(bind):
+            return {name: func(db, *args) for name, (func, args) in sections.items()}
+
+        db.commit()
+
+        def run(func, args):
+            section_db = Session(bind=bind, autoflush=False)
+            try:
+                return func(section_db, *args)
+            finally:
+                section_db.close()
+
+        executor = GroupHomeService._get_executor()
+        futures = {name: executor.submit(run, func, args) for name, (func, args) in sections.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    # ==========================
+    # Sections (세션을 인자로 받아 쿼리 1회씩 실행)
+    # ==========================
+
+    @staticmethod
+    def _load_members(db: Session, group_id: str) -> List[GroupMemberOut]:
+        """승인된 멤버 목록"""
+        members = db.query(GroupMember).filter(
+            GroupMember.group_id == group_id,
+            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
+        ).order_by(GroupMember.joined_at).all()
+        return [GroupService._to_group_member_out(member) for member in members]
+
+    @staticmethod
+    def _load_upcoming_schedules(db: Session, group_id: str, limit: int) -> List[ScheduleOut]:
+        """다가오는 예정 일정 (변경된 일정 포함, 수업 기록 함께 로드)"""
+        schedules = db.query(Schedule).options(
+            joinedload(Schedule.lesson_record)
+        ).filter(
+            Schedule.group_id == group_id,
+            Schedule.status.in_([ScheduleStatus.SCHEDULED, ScheduleStatus.RESCHEDULED]),
+            Schedule.start_at >= datetime.utcnow(),
+        ).order_by(Schedule.start_at).limit(limit).all()
+        return [ScheduleService._to_schedule_out(db, schedule) for schedule in schedules]
+
+    @staticmethod
+    def _load_textbooks(db: Session, group_id: str) -> List[TextbookOut]:
+        """활성 교재 (진도는 교재의 집계 컬럼 사용)"""
+        textbooks = db.query(Textbook).filter(
+            Textbook.group_id == group_id,
+            Textbook.is_active == True,
+        ).order_by(Textbook.created_at.desc()).all()
+        return [TextbookService._build_textbook_out(db, textbook) for textbook in textbooks]
+
+    @staticmethod
+    def _load_month_attendance(
+        db: Session,
+        group_id: str,
+        student_id: Optional[str],
+        today: date,
+    ) -> GroupHomeAttendance:
+        """이번 달 출결 요약 (월간 집계 테이블)"""
+        month = (today.year, today.month)
+        counts = AttendanceRollupService.get_counts(db, group_id, month, month, student_id=student_id)
+
+        present = counts[AttendanceStatus.PRESENT]
+        late = counts[AttendanceStatus.LATE]
+        early_leave = counts[AttendanceStatus.EARLY_LEAVE]
+        absent = counts[AttendanceStatus.ABSENT]
+        total = present + late + early_leave + absent
+
+        # F-004 비즈니스 규칙: 결석만 제외
+        attendance_rate = (present + late + early_leave) / total * 100 if total else 0.0
+
+        return GroupHomeAttendance(
+            period_start=today.replace(day=1).isoformat(),
+            period_end=today.isoformat(),
+            student_id=student_id,
+            stats=AttendanceStats(
+                total_sessions=total,
+                present=present,
+                late=late,
+                early_leave=early_leave,
+                absent=absent,
+                attendance_rate=round(attendance_rate, 1),
+            ),
+        )
+
+    @staticmethod
+    def _load_open_invoices(db: Session, group_id: str, student_id: Optional[str]) -> List[InvoiceBasicInfo]:
+        """미결 청구서 (학생 이름 조인, 지불 기한순)"""
+        query = db.query(Invoice, User.name).outerjoin(
+            User, User.id == Invoice.student_id
+        ).filter(
+            Invoice.group_id == group_id,
+            Invoice.status.in_(OPEN_INVOICE_STATUSES),
+        )
+        if student_id:
+            query = query.filter(Invoice.student_id == student_id)
+
+        rows = query.order_by(Invoice.due_date.asc(), Invoice.created_at.desc()).all()
+        return [
+            InvoiceBasicInfo(
+                invoice_id=invoice.id,
+                invoice_number=invoice.invoice_number,
+                student=StudentInfo(user_id=invoice.student_id, name=student_name or "Unknown"),
+                billing_period=BillingPeriod(
+                    start_date=invoice.billing_period_start,
+                    end_date=invoice.billing_period_end,
+                ),
+                status=invoice.status.value,
+                amount_due=invoice.amount_due,
+                amount_paid=invoice.amount_paid,
+                due_date=invoice.due_date,
+                created_at=invoice.created_at,
+                sent_at=invoice.sent_at,
+            )
+            for invoice, student_name in rows
+        ]
@@ -6,10 +6,12 @@ Group Service - F-002 과외 그룹 생성 및 매칭 비즈니스 로직
 from datetime import datetime, timedelta
 from typing import Optional, Tuple, List
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, desc, or_
-import random
+from sqlalchemy import func, desc, or_, and_, select, update, case
+from sqlalchemy.exc import IntegrityError
+import secrets
 import string
 
+from app.core.pagination import encode_cursor, decode_cursor
 from app.models.group import Group, GroupMember, InviteCode, GroupStatus, GroupMemberRole, GroupMemberInviteStatus
 from app.models.user import User
 from app.schemas.group import (
@@ -22,6 +24,8 @@ from app.schemas.group import (
     InviteCodeCreate,
     InviteCodeOut,
 )
+from app.services.calendar_service import CalendarFeedService
+from app.services.authorization_service import AuthorizationService
 
 
 class GroupService:
@@ -37,46 +41,75 @@ class GroupService:
         size: int = 20,
         role_filter: Optional[str] = None,
         status_filter: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> GroupListResponse:
         """
         현재 로그인한 사용자가 속한 그룹 목록 조회 (페이지네이션)
 
+        그룹과 멤버 수를 한 번의 쿼리로 조회합니다 (그룹별 멤버 수는 GROUP BY 서브쿼리).
+        cursor가 있으면 page 대신 커서(created_at, id) 이후 항목을 조회합니다.
+
         Args:
             db: 데이터베이스 세션
             user: 현재 로그인한 사용자
-            page: 페이지 번호 (1부터 시작)
+            page: 페이지 번호 (1부터 시작, cursor가 없을 때만 사용)
             size: 페이지 크기
             role_filter: 역할 필터 (TEACHER/STUDENT/PARENT) - optional
             status_filter: 상태 필터 (ACTIVE/INACTIVE/ARCHIVED) - optional
+            cursor: 이전 응답의 next_cursor - optional
 
         Returns:
-            GroupListResponse: 그룹 목록, 페이지네이션 정보
+            GroupListResponse: 그룹 목록, 페이지네이션 정보, next_cursor
         """
-        # 사용자가 멤버인 그룹 ID 목록 조회
-        member_query = db.query(GroupMember.group_id).filter(
+        # 사용자가 멤버인 그룹 (서브쿼리, ID 목록을 따로 가져오지 않음)
+        my_groups = select(GroupMember.group_id).where(
             GroupMember.user_id == user.id,
             GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
         )
 
         # 역할 필터 적용
         if role_filter:
-            member_query = member_query.filter(GroupMember.role == role_filter)
-
-        group_ids = [row[0] for row in member_query.all()]
+            my_groups = my_groups.where(GroupMember.role == role_filter)
 
-        # 그룹 조회
-        query = db.query(Group).filter(Group.id.in_(group_ids))
+        filters = [Group.id.in_(my_groups)]
 
         # 상태 필터 적용
         if status_filter:
-            query = query.filter(Group.status == status_filter)
+            filters.append(Group.status == status_filter)
 
         # 전체 개수 계산
-        total = query.count()
+        total = db.query(func.count(Group.id)).filter(*filters).scalar()
 
-        # 페이지네이션
-        offset = (page - 1) * size
-        groups = query.order_by(desc(Group.created_at)).offset(offset).limit(size).all()
+        # 내 그룹별 승인된 멤버 수
+        member_counts = (
+            select(GroupMember.group_id, func.count(GroupMember.id).label("member_count"))
+            .where(
+                GroupMember.group_id.in_(my_groups),
+                GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
+            )
+            .group_by(GroupMember.group_id)
+            .subquery()
+        )
+
+        query = db.query(
+            Group, func.coalesce(member_counts.c.member_count, 0)
+        ).outerjoin(
+            member_counts, member_counts.c.group_id == Group.id
+        ).filter(*filters).order_by(desc(Group.created_at), desc(Group.id))
+
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor, datetime, str)
+            query = query.filter(or_(
+                Group.created_at < cursor_created_at,
+                and_(Group.created_at == cursor_created_at, Group.id < cursor_id),
+            ))
+        else:
+            query = query.offset((page - 1) * size)
+
+        # limit + 1로 다음 페이지 여부 확인
+        rows = query.limit(size + 1).all()
+        has_more = len(rows) > size
+        rows = rows[:size]
 
         # 페이지네이션 정보
         total_pages = (total + size - 1) // size  # 올림 계산
@@ -85,29 +118,27 @@ class GroupService:
             page=page,
             size=size,
             total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1,
+            has_next=has_more,
+            has_prev=page > 1 or bool(cursor),
         )
 
         # 응답 변환 (멤버 수 포함)
         group_items = []
-        for group in groups:
-            member_count = (
-                db.query(func.count(GroupMember.id))
-                .filter(
-                    GroupMember.group_id == group.id,
-                    GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-                )
-                .scalar()
-            )
-
+        for group, member_count in rows:
             group_out = GroupService._to_group_out(group)
             group_out.member_count = member_count
             group_items.append(group_out)
 
+        next_cursor = None
+        if has_more:
+            last = rows[-1][0]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
         return GroupListResponse(
             items=group_items,
             pagination=pagination,
+            next_cursor=next_cursor,
+            has_more=has_more,
         )
 
     @staticmethod
@@ -153,6 +184,8 @@ class GroupService:
         db.add(owner_member)
         db.commit()
         db.refresh(new_group)
+        AuthorizationService.invalidate_user(owner.id, db)
+        CalendarFeedService.invalidate_user(owner.id)
 
         return GroupService._to_group_out(new_group)
 
@@ -175,22 +208,12 @@ class GroupService:
             None: 그룹이 없거나 권한 없음
         """
         # 그룹 조회
-        group = db.query(Group).filter(Group.id == group_id).first()
+        group = db.get(Group, group_id)
         if not group:
             return None
 
-        # 사용자가 해당 그룹의 멤버인지 확인
-        is_member = (
-            db.query(GroupMember)
-            .filter(
-                GroupMember.group_id == group_id,
-                GroupMember.user_id == user.id,
-                GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-            )
-            .first()
-        )
-
-        if not is_member:
+        # 사용자가 해당 그룹의 멤버인지 확인 (요청 단위 권한 컨텍스트)
+        if not AuthorizationService.is_member(db, user, group_id):
             return None
 
         # 멤버 목록 조회 (N+1 최적화: user 정보 함께 로드)
@@ -248,6 +271,8 @@ class GroupService:
 
         db.commit()
         db.refresh(group)
+        # 피드 일정 SUMMARY에 그룹 이름이 들어가므로 그룹 피드 무효화
+        CalendarFeedService.invalidate_group(group_id)
 
         return GroupService._to_group_out(group)
 
@@ -280,6 +305,8 @@ class GroupService:
         # 그룹 삭제 (cascade로 멤버도 자동 삭제)
         db.delete(group)
         db.commit()
+        CalendarFeedService.invalidate_group(group_id)
+        AuthorizationService.invalidate_group(group_id, db)
 
         return True
 
@@ -325,6 +352,7 @@ class GroupService:
             user_id=member.user_id,
             role=member.role.value,
             invite_status=member.invite_status.value,
+            student_id=member.student_id,
             joined_at=member.joined_at.isoformat() + "Z" if member.joined_at else None,
         )
 
@@ -332,28 +360,69 @@ class GroupService:
     # Invite Code Management - F-002
     # ==========================
 
+    # 초대 코드 문자 집합 (F-002: 6자리 알파벳 대문자 + 숫자)
+    INVITE_CODE_CHARS = string.ascii_uppercase + string.digits
+    INVITE_CODE_LENGTH = 6
+    INVITE_CODE_CANDIDATES = 8  # 한 번에 생성해 중복 확인하는 후보 수
+    INVITE_CODE_INSERT_ATTEMPTS = 3  # 동시 생성으로 UNIQUE 충돌 시 재시도 횟수
+
     @staticmethod
-    def _generate_unique_code(db: Session, max_attempts: int = 3) -> Optional[str]:
+    def _generate_unique_code(db: Session) -> Optional[str]:
         """
         고유한 6자리 코드 생성
         F-002 비즈니스 규칙: 6자리 알파벳 대문자 + 숫자
 
+        후보 여러 개를 secrets로 만들어 쿼리 1회로 기존 코드와 대조합니다.
+        (36^6 ≈ 21억 가지이므로 후보가 모두 사용 중일 확률은 사실상 0)
+        확인 후 다른 요청이 같은 코드를 먼저 저장하는 경우는 code UNIQUE 제약으로 막고
+        create_invite_code에서 재시도합니다.
+
         Args:
             db: 데이터베이스 세션
-            max_attempts: 최대 재시도 횟수
 
         Returns:
             str: 생성된 코드
             None: 생성 실패
         """
-        chars = string.ascii_uppercase + string.digits  # A-Z + 0-9
-        for _ in range(max_attempts):
-            code = ''.join(random.choices(chars, k=6))
-            # 중복 확인
-            existing = db.query(InviteCode).filter(InviteCode.code == code).first()
-            if not existing:
-                return code
-        return None
+        candidates = {
+            ''.join(secrets.choice(GroupService.INVITE_CODE_CHARS) for _ in range(GroupService.INVITE_CODE_LENGTH))
+            for _ in range(GroupService.INVITE_CODE_CANDIDATES)
+        }
+        taken = {
+            row[0] for row in db.query(InviteCode.code).filter(InviteCode.code.in_(candidates)).all()
+        }
+        return next(iter(candidates - taken), None)
+
+    @staticmethod
+    def redeem_invite_code(db: Session, invite_code_id: str) -> bool:
+        """
+        초대 코드 사용 횟수 1 증가 (조건부 원자적 UPDATE, 커밋하지 않음)
+
+        UPDATE invite_codes SET used_count = used_count + 1, is_active = ...
+        WHERE id = :id AND is_active AND used_count < max_uses AND expires_at > now
+
+        조건 확인과 증가가 한 문장이므로 동시 요청이 몇 개든 max_uses를 넘지 않습니다.
+        (PostgreSQL은 행 잠금, SQLite는 DB 쓰기 잠금으로 직렬화)
+        최대 사용 횟수에 도달하면 같은 문장에서 비활성화합니다.
+
+        Returns:
+            bool: 사용 처리 성공 여부 (False면 만료/소진/비활성 코드)
+        """
+        result = db.execute(
+            update(InviteCode)
+            .where(
+                InviteCode.id == invite_code_id,
+                InviteCode.is_active == True,
+                InviteCode.used_count < InviteCode.max_uses,
+                InviteCode.expires_at > datetime.utcnow(),
+            )
+            .values(
+                used_count=InviteCode.used_count + 1,
+                is_active=case((InviteCode.used_count + 1 >= InviteCode.max_uses, False), else_=True),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
 
     @staticmethod
     def create_invite_code(
@@ -399,28 +468,52 @@ class GroupService:
         if pending_count >= 10:  # F-002: 그룹당 최대 10개 대기 중 초대
             return None
 
-        # 코드 생성
-        code = GroupService._generate_unique_code(db)
-        if not code:
-            return None
+        # 학부모 초대의 자녀 연결: 같은 그룹의 학생만 가능
+        student_id = None
+        if invite_code_create.target_role == GroupMemberRole.PARENT.value and invite_code_create.student_id:
+            student_member = db.query(GroupMember.id).filter(
+                GroupMember.group_id == group_id,
+                GroupMember.user_id == invite_code_create.student_id,
+                GroupMember.role == GroupMemberRole.STUDENT,
+                GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
+            ).first()
+            if not student_member:
+                return None
+            student_id = invite_code_create.student_id
 
         # expires_in_days 처리 (기본값 7일)
         expires_in_days = invite_code_create.expires_in_days or 7
         expires_at = datetime.utcnow() + timedelta(days=expires_in_days)
 
-        # 초대 코드 생성
-        new_invite_code = InviteCode(
-            code=code,
-            group_id=group_id,
-            created_by=creator.id,
-            target_role=invite_code_create.target_role,
-            max_uses=invite_code_create.max_uses or 1,
-            used_count=0,
-            expires_at=expires_at,
-            is_active=True,
-        )
+        # 코드 생성 + 저장 (동시 생성으로 코드가 겹치면 SAVEPOINT 롤백 후 재시도)
+        new_invite_code = None
+        for _ in range(GroupService.INVITE_CODE_INSERT_ATTEMPTS):
+            code = GroupService._generate_unique_code(db)
+            if not code:
+                continue
+
+            candidate = InviteCode(
+                code=code,
+                group_id=group_id,
+                created_by=creator.id,
+                target_role=invite_code_create.target_role,
+                student_id=student_id,
+                max_uses=invite_code_create.max_uses or 1,
+                used_count=0,
+                expires_at=expires_at,
+                is_active=True,
+            )
+            try:
+                with db.begin_nested():
+                    db.add(candidate)
+            except IntegrityError:
+                continue
+            new_invite_code = candidate
+            break
+
+        if new_invite_code is None:
+            return None
 
-        db.add(new_invite_code)
         db.commit()
         db.refresh(new_invite_code)
 
@@ -476,7 +569,7 @@ class GroupService:
         - 코드의 유효성 확인 (존재, 미만료, 사용 가능)
         - 사용자의 역할과 코드의 target_role 일치 확인
         - 그룹 멤버로 자동 추가
-        - 사용 횟수 증가
+        - 사용 횟수 증가 (조건부 원자적 UPDATE, 동시 요청에도 max_uses 초과 불가)
         - 최대 사용 횟수 도달 시 비활성화
 
         Args:
@@ -493,12 +586,9 @@ class GroupService:
         if not invite_code:
             return None, None, "초대 코드를 확인해주세요"
 
-        # 코드 유효성 확인
+        # 코드 유효성 확인 (빠른 실패용, 최종 판정은 redeem_invite_code의 조건부 UPDATE)
         if not invite_code.is_available():
-            if invite_code.is_expired():
-                return None, None, "초대 코드가 만료되었습니다. 선생님께 새 코드를 요청해주세요"
-            else:
-                return None, None, "이미 사용된 초대 코드입니다. 선생님께 새 코드를 요청해주세요"
+            return None, None, GroupService._unavailable_code_message(invite_code)
 
         # 사용자 역할과 코드 역할 일치 확인 (대소문자 무시)
         if user.role.value.upper() != invite_code.target_role.value.upper():
@@ -509,8 +599,8 @@ class GroupService:
         if not group:
             return None, None, "그룹을 찾을 수 없습니다"
 
-        # 이미 같은 그룹의 멤버인지 확인
-        existing_member = db.query(GroupMember).filter(
+        # 이미 같은 그룹의 멤버인지 확인 (동시 요청은 UNIQUE(group_id, user_id)로 차단)
+        existing_member = db.query(GroupMember.id).filter(
             GroupMember.group_id == group.id,
             GroupMember.user_id == user.id,
         ).first()
@@ -518,24 +608,41 @@ class GroupService:
         if existing_member:
             return None, None, "이미 이 그룹에 참여하고 있습니다"
 
-        # 그룹 멤버 추가
+        # 초대 코드 사용 처리 (원자적 UPDATE, 남은 사용 횟수가 없으면 실패)
+        if not GroupService.redeem_invite_code(db, invite_code.id):
+            db.rollback()
+            db.refresh(invite_code)
+            return None, None, GroupService._unavailable_code_message(invite_code)
+
+        # 그룹 멤버 추가 (같은 트랜잭션, 실패 시 사용 횟수 증가도 함께 롤백)
         new_member = GroupMember(
             group_id=group.id,
             user_id=user.id,
             role=invite_code.target_role,
+            student_id=invite_code.student_id,
             invite_status=GroupMemberInviteStatus.ACCEPTED,
         )
-
         db.add(new_member)
 
-        # 초대 코드 사용 횟수 증가
-        invite_code.increment_usage()
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return None, None, "이미 이 그룹에 참여하고 있습니다"
 
-        db.commit()
         db.refresh(new_member)
+        CalendarFeedService.invalidate_user(user.id)
+        AuthorizationService.invalidate_user(user.id, db)
 
         return group, new_member, None
 
+    @staticmethod
+    def _unavailable_code_message(invite_code: InviteCode) -> str:
+        """사용할 수 없는 초대 코드의 안내 메시지"""
+        if invite_code.is_expired():
+            return "초대 코드가 만료되었습니다. 선생님께 새 코드를 요청해주세요"
+        return "이미 사용된 초대 코드입니다. 선생님께 새 코드를 요청해주세요"
+
     @staticmethod
     def _to_invite_code_out(invite_code: InviteCode) -> InviteCodeOut:
         """
@@ -552,6 +659,7 @@ class GroupService:
             code=invite_code.code,
             group_id=invite_code.group_id,
             target_role=invite_code.target_role.value,  # role → target_role
+            student_id=invite_code.student_id,
             created_by=invite_code.created_by,
             expires_at=invite_code.expires_at.isoformat() + "Z" if invite_code.expires_at else None,
             max_uses=invite_code.max_uses,
@@ -0,0 +1,305 @@
+"""
+Lesson Search Service - F-005 수업 기록 전문 검색
+수업 내용/숙제/학생 피드백 검색, 검색 색인 동기화
+
+- 색인: lesson_search_documents (글자 2-gram 토큰, app/core/text_search.py)
+  - SQLite: FTS5 (lesson_search_fts, bm25 순위)
+  - PostgreSQL: tsvector 생성 컬럼 + GIN 인덱스 (ts_rank_cd 순위)
+  - 그 외 DB: LIKE 검색 (순위 없음, 최신 수업순)
+- 수업 기록 생성/수정/삭제 시 호출자의 트랜잭션 안에서 색인 갱신
+- 백필/재색인: scripts/rebuild_lesson_search_index.py
+"""
+
+import math
+from datetime import datetime
+from typing import Optional, Iterable
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, and_, literal, literal_column, table, column, select, insert, delete, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from fastapi import HTTPException, status
+
+from app.core.text_search import ngram_document, fts5_query, tsquery, query_terms, snippet
+from app.models.lesson import LessonRecord, LessonSearchDocument
+from app.models.schedule import Schedule
+from app.models.group import Group, GroupMember, GroupMemberInviteStatus
+from app.models.user import User
+from app.schemas.lesson import LessonSearchHit, LessonSearchResponse, PaginationInfo
+from app.services.authorization_service import AuthorizationService
+
+
+# SQLite FTS5 가상 테이블 (rowid = lesson_search_documents.id)
+lesson_search_fts = table("lesson_search_fts", column("rowid"))
+
+# 필드별 가중치 (내용 > 숙제 > 피드백)
+FTS5_WEIGHTS = (3.0, 1.5, 1.0)
+
+REBUILD_BATCH_SIZE = 500
+
+
+class LessonSearchService:
+    """
+    수업 기록 검색 서비스 레이어
+    """
+
+    # ==========================
+    # Index Sync
+    # ==========================
+
+    @staticmethod
+    def _document_values(lesson_record: LessonRecord) -> dict:
+        """수업 기록 → 검색 문서 컬럼 값"""
+        return {
+            "lesson_record_id": lesson_record.id,
+            "group_id": lesson_record.group_id,
+            "content_tokens": ngram_document(lesson_record.content),
+            "homework_tokens": ngram_document(lesson_record.homework),
+            "feedback_tokens": ngram_document(lesson_record.student_feedback),
+        }
+
+    @staticmethod
+    def index_record(db: Session, lesson_record: LessonRecord) -> None:
+        """
+        수업 기록 1건 색인/재색인 (DB 방언별 UPSERT, 커밋하지 않음)
+
+        Args:
+            db: 데이터베이스 세션 (호출자의 트랜잭션, lesson_record는 flush된 상태)
+            lesson_record: 수업 기록
+        """
+        values = LessonSearchService._document_values(lesson_record)
+
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+            stmt = dialect_insert(LessonSearchDocument).values(**values)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=["lesson_record_id"],
+                set_={
+                    "content_tokens": stmt.excluded.content_tokens,
+                    "homework_tokens": stmt.excluded.homework_tokens,
+                    "feedback_tokens": stmt.excluded.feedback_tokens,
+                    "updated_at": datetime.utcnow(),
+                },
+            ))
+            return
+
+        document = db.query(LessonSearchDocument).filter(
+            LessonSearchDocument.lesson_record_id == lesson_record.id
+        ).first()
+        if document:
+            for key, value in values.items():
+                setattr(document, key, value)
+        else:
+            db.add(LessonSearchDocument(**values))
+
+    @staticmethod
+    def remove_records(db: Session, lesson_record_ids: Iterable[str]) -> None:
+        """수업 기록 삭제 전 색인 제거 (SQLite는 FK CASCADE가 꺼져 있을 수 있으므로 명시적으로 삭제)"""
+        lesson_record_ids = list(lesson_record_ids)
+        if not lesson_record_ids:
+            return
+        db.execute(
+            delete(LessonSearchDocument)
+            .where(LessonSearchDocument.lesson_record_id.in_(lesson_record_ids))
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def remove_schedule(db: Session, schedule_id: str) -> None:
+        """일정 삭제 전 해당 일정의 수업 기록 색인 제거"""
+        db.execute(
+            delete(LessonSearchDocument)
+            .where(LessonSearchDocument.lesson_record_id.in_(
+                select(LessonRecord.id).where(LessonRecord.schedule_id == schedule_id)
+            ))
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def rebuild(db: Session, group_id: Optional[str] = None) -> int:
+        """
+        원본 수업 기록으로부터 색인 재생성 (커밋하지 않음)
+
+        Args:
+            db: 데이터베이스 세션
+            group_id: 그룹 ID (없으면 전체)
+
+        Returns:
+            int: 색인된 수업 기록 수
+        """
+        criteria = [LessonSearchDocument.group_id == group_id] if group_id else []
+        db.execute(delete(LessonSearchDocument).where(*criteria).execution_options(synchronize_session=False))
+
+        query = db.query(
+            LessonRecord.id,
+            LessonRecord.group_id,
+            LessonRecord.content,
+            LessonRecord.homework,
+            LessonRecord.student_feedback,
+        )
+        if group_id:
+            query = query.filter(LessonRecord.group_id == group_id)
+
+        indexed = 0
+        batch = []
+        for row in query.yield_per(REBUILD_BATCH_SIZE):
+            batch.append(LessonSearchService._document_values(row))
+            if len(batch) >= REBUILD_BATCH_SIZE:
+                db.execute(insert(LessonSearchDocument), batch)
+                indexed += len(batch)
+                batch = []
+        if batch:
+            db.execute(insert(LessonSearchDocument), batch)
+            indexed += len(batch)
+
+        # FTS5 세그먼트 병합 (대량 재색인 후 검색 성능 유지)
+        if db.get_bind().dialect.name == "sqlite":
+            db.execute(text("INSERT INTO lesson_search_fts(lesson_search_fts) VALUES ('optimize')"))
+
+        return indexed
+
+    # ==========================
+    # Search
+    # ==========================
+
+    @staticmethod
+    def search(
+        db: Session,
+        user: User,
+        query: str,
+        group_id: Optional[str] = None,
+        page: int = 1,
+        size: int = 20,
+    ) -> LessonSearchResponse:
+        """
+        수업 기록 전문 검색
+
+        내가 속한(승인된) 그룹의 수업 기록만 검색하며, 관련도순으로 정렬합니다.
+        검색어는 단어별로 부분 일치하며 모든 단어가 포함된 기록만 반환합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            user: 현재 사용자
+            query: 검색어
+            group_id: 그룹 ID (없으면 내가 속한 모든 그룹)
+            page: 페이지 번호 (1부터)
+            size: 페이지 크기
+
+        Returns:
+            LessonSearchResponse: 검색 결과 및 페이지네이션 정보
+
+        Raises:
+            HTTPException: 검색어가 비어 있음, 그룹 멤버가 아님
+        """
+        terms = query_terms(query)
+        if not terms:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"code": "INVALID_SEARCH_QUERY", "message": "검색어를 입력해주세요."}
+            )
+
+        my_groups = select(GroupMember.group_id).where(
+            GroupMember.user_id == user.id,
+            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
+        )
+        if group_id:
+            AuthorizationService.require_member(db, user, group_id)
+
+        columns = (
+            LessonRecord.id,
+            LessonRecord.group_id,
+            LessonRecord.schedule_id,
+            LessonRecord.content,
+            LessonRecord.homework,
+            LessonRecord.student_feedback,
+            LessonRecord.created_at,
+            Group.name.label("group_name"),
+            Schedule.title.label("schedule_title"),
+            Schedule.start_at,
+        )
+
+        dialect = db.get_bind().dialect.name
+        if dialect == "sqlite":
+            rank = func.bm25(literal_column("lesson_search_fts"), *FTS5_WEIGHTS)
+            base = db.query(*columns, rank.label("rank")).select_from(LessonSearchDocument).join(
+                lesson_search_fts, lesson_search_fts.c.rowid == LessonSearchDocument.id
+            ).join(
+                LessonRecord, LessonRecord.id == LessonSearchDocument.lesson_record_id
+            ).filter(
+                literal_column("lesson_search_fts").op("MATCH")(fts5_query(query)),
+                LessonSearchDocument.group_id == group_id if group_id else LessonSearchDocument.group_id.in_(my_groups),
+            )
+            order = [rank.asc()]  # bm25는 낮을수록 관련도 높음
+        elif dialect == "postgresql":
+            vector = literal_column("lesson_search_documents.search_vector")
+            ts_query = func.to_tsquery("simple", tsquery(query))
+            rank = func.ts_rank_cd(vector, ts_query)
+            base = db.query(*columns, rank.label("rank")).select_from(LessonSearchDocument).join(
+                LessonRecord, LessonRecord.id == LessonSearchDocument.lesson_record_id
+            ).filter(
+                vector.op("@@")(ts_query),
+                LessonSearchDocument.group_id == group_id if group_id else LessonSearchDocument.group_id.in_(my_groups),
+            )
+            order = [rank.desc()]
+        else:
+            base = db.query(*columns, literal(0.0).label("rank")).filter(
+                LessonRecord.group_id == group_id if group_id else LessonRecord.group_id.in_(my_groups),
+                and_(*[
+                    or_(
+                        LessonRecord.content.ilike(f"%{term}%"),
+                        LessonRecord.homework.ilike(f"%{term}%"),
+                        LessonRecord.student_feedback.ilike(f"%{term}%"),
+                    )
+                    for term in terms
+                ]),
+            )
+            order = []
+
+        base = base.join(
+            Schedule, Schedule.id == LessonRecord.schedule_id
+        ).join(
+            Group, Group.id == LessonRecord.group_id
+        )
+
+        total = base.with_entities(func.count(LessonRecord.id)).scalar()
+        rows = base.order_by(
+            *order, Schedule.start_at.desc(), LessonRecord.id
+        ).offset((page - 1) * size).limit(size).all()
+
+        items = []
+        for row in rows:
+            # 원문에서 검색어가 처음 나오는 필드로 미리보기 생성
+            matched_text = next(
+                (
+                    field for field in (row.content, row.homework, row.student_feedback)
+                    if field and any(term in field.lower() for term in terms)
+                ),
+                row.content,
+            )
+            items.append(LessonSearchHit(
+                lesson_record_id=row.id,
+                group_id=row.group_id,
+                group_name=row.group_name,
+                schedule_id=row.schedule_id,
+                schedule_title=row.schedule_title,
+                schedule_date=row.start_at.date().isoformat() if row.start_at else None,
+                snippet=snippet(matched_text, query),
+                homework=row.homework,
+                score=round(abs(float(row.rank or 0.0)), 6),
+                created_at=row.created_at.isoformat() if row.created_at else None,
+            ))
+
+        total_pages = math.ceil(total / size) if total else 0
+        return LessonSearchResponse(
+            query=query,
+            items=items,
+            pagination=PaginationInfo(
+                total=total,
+                page=page,
+                size=size,
+                total_pages=total_pages,
+                has_next=page < total_pages,
+                has_prev=page > 1,
+            ),
+        )
@@ -5,11 +5,13 @@ Lesson Record Service - F-005 수업 기록 및 진도 관리 비즈니스 로
 
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload, contains_eager
 from sqlalchemy import func, desc, and_, or_
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
+from app.core.pagination import encode_cursor, decode_cursor
+
 from app.models.lesson import LessonRecord, ProgressRecord
 from app.models.textbook import Textbook
 from app.models.schedule import Schedule
@@ -22,8 +24,13 @@ from app.schemas.lesson import (
     LessonRecordOut,
     ProgressRecordOut,
     ProgressSummary,
+    LessonTimelineResponse,
 )
 from app.services.notification_service import NotificationService
+from app.services.textbook_service import TextbookService
+from app.services.lesson_search_service import LessonSearchService
+from app.services.read_receipt_service import ReadReceiptService, PARENT_VIEWED, STUDENT_VIEWED
+from app.services.authorization_service import AuthorizationService
 
 
 class LessonService:
@@ -59,25 +66,10 @@ class LessonService:
                 detail={"code": "SCHEDULE_NOT_FOUND", "message": "일정을 찾을 수 없습니다."}
             )
 
-        group = db.query(Group).filter(Group.id == schedule.group_id).first()
-        if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"code": "GROUP_NOT_FOUND", "message": "그룹을 찾을 수 없습니다."}
-            )
-
-        # 멤버십 확인
-        membership = db.query(GroupMember).filter(
-            GroupMember.group_id == group.id,
-            GroupMember.user_id == user.id,
-            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-        ).first()
+        group = AuthorizationService.get_group(db, schedule.group_id)
 
-        if not membership:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={"code": "NOT_GROUP_MEMBER", "message": "이 그룹의 멤버가 아닙니다."}
-            )
+        # 멤버십 확인 (요청 단위 권한 컨텍스트)
+        AuthorizationService.require_member(db, user, group.id)
 
         return schedule, group
 
@@ -89,14 +81,7 @@ class LessonService:
         Raises:
             HTTPException: 선생님이 아닌 경우
         """
-        membership = db.query(GroupMember).filter(
-            GroupMember.group_id == group.id,
-            GroupMember.user_id == user.id,
-            GroupMember.role == GroupMemberRole.TEACHER,
-            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-        ).first()
-
-        if not membership:
+        if AuthorizationService.get_role(db, user, group.id) != GroupMemberRole.TEACHER:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail={"code": "TEACHER_ONLY", "message": "선생님만 수행할 수 있습니다."}
@@ -177,6 +162,7 @@ class LessonService:
 
         db.add(lesson_record)
         db.flush()  # lesson_record.id 생성
+        LessonSearchService.index_record(db, lesson_record)  # 검색 색인 (같은 트랜잭션)
 
         # 7. ProgressRecord 생성 (진도 기록이 있는 경우)
         if payload.progress_records:
@@ -189,6 +175,10 @@ class LessonService:
                 )
                 db.add(progress_record)
 
+            # 교재 진도 집계 갱신 (같은 트랜잭션)
+            db.flush()
+            TextbookService.refresh_progress(db, [pr.textbook_id for pr in payload.progress_records])
+
         try:
             db.commit()
             # N+1 최적화: progress_records와 textbook을 함께 로드하여 refresh
@@ -278,28 +268,91 @@ class LessonService:
             )
 
         # 그룹 멤버십 확인
-        group = db.query(Group).filter(Group.id == lesson_record.group_id).first()
-        membership = db.query(GroupMember).filter(
-            GroupMember.group_id == group.id,
-            GroupMember.user_id == user.id,
-            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-        ).first()
+        context = AuthorizationService.require_member(db, user, lesson_record.group_id)
 
-        if not membership:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={"code": "NOT_GROUP_MEMBER", "message": "이 그룹의 멤버가 아닙니다."}
-            )
+        result = LessonService._build_lesson_record_out(db, lesson_record)
 
-        # 읽음 상태 업데이트 (학부모/학생인 경우)
-        if membership.role == GroupMemberRole.PARENT and not lesson_record.parent_viewed_at:
-            lesson_record.parent_viewed_at = datetime.utcnow()
-            db.commit()
-        elif membership.role == GroupMemberRole.STUDENT and not lesson_record.student_viewed_at:
-            lesson_record.student_viewed_at = datetime.utcnow()
-            db.commit()
+        # 읽음 상태 업데이트 (학부모/학생인 경우, 처음 열람한 시각만)
+        # 버퍼에 모았다가 백그라운드에서 일괄 기록 (워커가 없으면 즉시 커밋)
+        viewed_column = {
+            GroupMemberRole.PARENT: PARENT_VIEWED,
+            GroupMemberRole.STUDENT: STUDENT_VIEWED,
+        }.get(context.role(lesson_record.group_id))
 
-        return LessonService._build_lesson_record_out(db, lesson_record)
+        if viewed_column and not getattr(lesson_record, viewed_column):
+            viewed_at = ReadReceiptService.pending(lesson_record.id, viewed_column) or datetime.utcnow()
+            if not ReadReceiptService.record(lesson_record.id, viewed_column, viewed_at):
+                ReadReceiptService.apply(db, {(lesson_record.id, viewed_column): viewed_at})
+                db.commit()
+            setattr(result, viewed_column, viewed_at.isoformat())
+
+        return result
+
+    @staticmethod
+    def get_group_timeline(
+        db: Session,
+        user: User,
+        group_id: str,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+    ) -> LessonTimelineResponse:
+        """
+        그룹 수업 기록 타임라인 (수업 날짜 최신순, 커서 페이지네이션)
+
+        진도 기록/교재, 작성 선생님, 일정을 eager loading으로 함께 읽으므로
+        페이지 크기와 관계없이 쿼리 수가 일정합니다. (멤버십 1 + 목록 1 + 진도 기록 1)
+        목록 조회는 읽음 상태를 갱신하지 않습니다. (상세 조회 시에만 갱신)
+
+        Args:
+            db: 데이터베이스 세션
+            user: 현재 사용자
+            group_id: 그룹 ID
+            cursor: 이전 응답의 next_cursor (없으면 첫 페이지)
+            limit: 페이지 크기
+
+        Returns:
+            LessonTimelineResponse: 수업 기록 목록, 다음 페이지 커서
+
+        Raises:
+            HTTPException: 그룹 멤버가 아님, 잘못된 커서
+        """
+        AuthorizationService.require_member(db, user, group_id)
+
+        filters = [LessonRecord.group_id == group_id]
+
+        # 커서 이후 항목만 (schedule.start_at DESC, id DESC)
+        if cursor:
+            cursor_start_at, cursor_id = decode_cursor(cursor, datetime, str)
+            filters.append(or_(
+                Schedule.start_at < cursor_start_at,
+                and_(Schedule.start_at == cursor_start_at, LessonRecord.id < cursor_id),
+            ))
+
+        # 일정은 정렬/커서에 쓰는 조인을 그대로 채우고(contains_eager), 선생님은 joinedload,
+        # 진도 기록은 LIMIT과 행 중복을 피하도록 selectinload (교재는 그 쿼리에 조인)
+        lesson_records = db.query(LessonRecord).join(
+            Schedule, LessonRecord.schedule_id == Schedule.id
+        ).options(
+            contains_eager(LessonRecord.schedule),
+            joinedload(LessonRecord.teacher),
+            selectinload(LessonRecord.progress_records).joinedload(ProgressRecord.textbook),
+        ).filter(*filters).order_by(
+            Schedule.start_at.desc(), LessonRecord.id.desc()
+        ).limit(limit + 1).all()
+
+        has_more = len(lesson_records) > limit
+        lesson_records = lesson_records[:limit]
+
+        next_cursor = None
+        if has_more:
+            last = lesson_records[-1]
+            next_cursor = encode_cursor(last.schedule.start_at, last.id)
+
+        return LessonTimelineResponse(
+            items=[LessonService._build_lesson_record_out(db, lr) for lr in lesson_records],
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
 
     @staticmethod
     def update_lesson_record(
@@ -364,6 +417,7 @@ class LessonService:
             lesson_record.homework = payload.homework
 
         lesson_record.updated_at = datetime.utcnow()
+        LessonSearchService.index_record(db, lesson_record)  # 검색 색인 갱신 (같은 트랜잭션)
 
         try:
             db.commit()
@@ -423,8 +477,18 @@ class LessonService:
                 }
             )
 
+        # 진도 기록이 함께 삭제되므로 영향받는 교재를 미리 조회
+        textbook_ids = [
+            row[0] for row in db.query(ProgressRecord.textbook_id).filter(
+                ProgressRecord.lesson_record_id == lesson_record.id
+            ).distinct().all()
+        ]
+
         try:
+            LessonSearchService.remove_records(db, [lesson_record.id])
             db.delete(lesson_record)
+            db.flush()
+            TextbookService.refresh_progress(db, textbook_ids)
             db.commit()
         except IntegrityError:
             db.rollback()
@@ -476,12 +540,12 @@ class LessonService:
                 created_at=pr.created_at.isoformat() if pr.created_at else None,
             ))
 
-        # 선생님 이름 조회
-        teacher = db.query(User).filter(User.id == lesson_record.created_by).first()
+        # 선생님/일정: eager loading되어 있으면 추가 쿼리 없음
+        # (다대일 관계이므로 세션에 이미 있는 객체는 identity map에서 바로 사용)
+        teacher = lesson_record.teacher
         teacher_name = teacher.name if teacher else None
 
-        # 일정 정보 조회
-        schedule = db.query(Schedule).filter(Schedule.id == lesson_record.schedule_id).first()
+        schedule = lesson_record.schedule
 
         return LessonRecordOut(
             lesson_record_id=lesson_record.id,
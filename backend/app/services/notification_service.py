@@ -7,7 +7,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, desc, case
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, and_, or_, desc, case, insert, select, update
 
 from app.models.notification import (
     Notification,
@@ -410,22 +411,7 @@ class NotificationService:
         """
         # 카테고리 자동 결정 (type으로부터)
         if category is None:
-            type_to_category_map = {
-                NotificationType.SCHEDULE_REMINDER: NotificationCategory.SCHEDULE,
-                NotificationType.SCHEDULE_CHANGED: NotificationCategory.SCHEDULE,
-                NotificationType.SCHEDULE_CANCELLED: NotificationCategory.SCHEDULE,
-                NotificationType.ATTENDANCE_CHANGED: NotificationCategory.ATTENDANCE,
-                NotificationType.LESSON_RECORD_CREATED: NotificationCategory.LESSON,
-                NotificationType.HOMEWORK_ASSIGNED: NotificationCategory.LESSON,
-                NotificationType.MAKEUP_CLASS_AVAILABLE: NotificationCategory.SCHEDULE,
-                NotificationType.MAKEUP_CLASS_REQUESTED: NotificationCategory.SCHEDULE,
-                NotificationType.BILLING_ISSUED: NotificationCategory.PAYMENT,
-                NotificationType.PAYMENT_CONFIRMED: NotificationCategory.PAYMENT,
-                NotificationType.PAYMENT_FAILED: NotificationCategory.PAYMENT,
-                NotificationType.GROUP_INVITE: NotificationCategory.GROUP,
-                NotificationType.SYSTEM_NOTICE: NotificationCategory.SYSTEM,
-            }
-            category = type_to_category_map.get(notification_type, NotificationCategory.SYSTEM)
+            category = NotificationService._resolve_category(notification_type)
 
         # 알림 객체 생성
         notification = Notification(
@@ -500,6 +486,83 @@ class NotificationService:
 
         return notifications
 
+    @staticmethod
+    def bulk_create_notifications(
+        db: Session,
+        notifications: List[Dict[str, Any]],
+        commit: bool = True,
+    ) -> int:
+        """
+        알림 일괄 생성 (단일 INSERT, 단일 커밋)
+
+        수신자마다 create_notification을 호출하면 알림 1건당 커밋 1회가 발생하므로,
+        일괄 변경(일정 일괄 취소, 배치 출결 등)에서는 이 메서드로 한 번에 저장합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            notifications: 알림 목록. 각 항목 키:
+                user_id, notification_type, title, message (필수)
+                priority, category, related_resource_type, related_resource_id, is_required (선택)
+            commit: True면 저장 후 커밋, False면 호출자의 트랜잭션에 포함
+
+        Returns:
+            int: 생성된 알림 수
+        """
+        if not notifications:
+            return 0
+
+        rows = []
+        for item in notifications:
+            notification_type = item["notification_type"]
+            rows.append({
+                "user_id": item["user_id"],
+                "type": notification_type,
+                "category": item.get("category") or NotificationService._resolve_category(notification_type),
+                "title": item["title"],
+                "message": item["message"],
+                "priority": item.get("priority", NotificationPriority.NORMAL),
+                "channel": NotificationChannel.IN_APP,
+                "delivery_status": NotificationDeliveryStatus.SENT,
+                "is_read": False,
+                "is_required": item.get("is_required", False),
+                "related_resource_type": item.get("related_resource_type"),
+                "related_resource_id": item.get("related_resource_id"),
+            })
+
+        db.execute(insert(Notification), rows)
+        if commit:
+            db.commit()
+
+        return len(rows)
+
+    @staticmethod
+    def _resolve_category(notification_type: NotificationType) -> NotificationCategory:
+        """
+        알림 타입으로부터 카테고리 결정
+
+        Args:
+            notification_type: 알림 타입
+
+        Returns:
+            NotificationCategory: 카테고리 (매핑 없으면 SYSTEM)
+        """
+        type_to_category_map = {
+            NotificationType.SCHEDULE_REMINDER: NotificationCategory.SCHEDULE,
+            NotificationType.SCHEDULE_CHANGED: NotificationCategory.SCHEDULE,
+            NotificationType.SCHEDULE_CANCELLED: NotificationCategory.SCHEDULE,
+            NotificationType.ATTENDANCE_CHANGED: NotificationCategory.ATTENDANCE,
+            NotificationType.LESSON_RECORD_CREATED: NotificationCategory.LESSON,
+            NotificationType.HOMEWORK_ASSIGNED: NotificationCategory.LESSON,
+            NotificationType.MAKEUP_CLASS_AVAILABLE: NotificationCategory.SCHEDULE,
+            NotificationType.MAKEUP_CLASS_REQUESTED: NotificationCategory.SCHEDULE,
+            NotificationType.BILLING_ISSUED: NotificationCategory.PAYMENT,
+            NotificationType.PAYMENT_CONFIRMED: NotificationCategory.PAYMENT,
+            NotificationType.PAYMENT_FAILED: NotificationCategory.PAYMENT,
+            NotificationType.GROUP_INVITE: NotificationCategory.GROUP,
+            NotificationType.SYSTEM_NOTICE: NotificationCategory.SYSTEM,
+        }
+        return type_to_category_map.get(notification_type, NotificationCategory.SYSTEM)
+
     @staticmethod
     def _to_notification_out(notification: Notification) -> NotificationOut:
         """
@@ -943,3 +1006,143 @@ class NotificationService:
 
         logger.info(f"Cleaned up {deleted_count} old notifications")
         return deleted_count
+
+    # ========== 비동기 버전 (AsyncSession, ASYNC_DB_ENABLED 핫패스) ==========
+
+    @staticmethod
+    def _list_filters(user_id: str, category: Optional[str], status: Optional[str]) -> list:
+        """알림 목록 필터 조건 (카테고리/읽음 상태)"""
+        filters = [Notification.user_id == user_id]
+        if category and category != "all":
+            filters.append(Notification.category == category)
+        if status and status != "all":
+            filters.append(Notification.is_read == (status == "read"))
+        return filters
+
+    @staticmethod
+    async def get_notifications_async(
+        db: AsyncSession,
+        user_id: str,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        page: int = 1,
+        size: int = 20,
+    ) -> NotificationListResponse:
+        """
+        알림 목록 조회 (get_notifications의 비동기 버전)
+
+        Args:
+            db: 비동기 데이터베이스 세션
+            user_id: 사용자 ID
+            category: 카테고리 필터 (선택)
+            status: 상태 필터 ('all', 'read', 'unread')
+            page: 페이지 번호 (1부터 시작)
+            size: 페이지 크기
+
+        Returns:
+            NotificationListResponse: 알림 목록, 페이지네이션, 읽지 않은 개수
+        """
+        filters = NotificationService._list_filters(user_id, category, status)
+
+        total = (await db.execute(
+            select(func.count(Notification.id)).where(*filters)
+        )).scalar_one()
+
+        offset = (page - 1) * size
+        items = (await db.execute(
+            select(Notification).where(*filters)
+            .order_by(desc(Notification.created_at)).offset(offset).limit(size)
+        )).scalars().all()
+
+        unread_count = (await db.execute(
+            select(func.count(Notification.id)).where(
+                Notification.user_id == user_id,
+                Notification.is_read == False,
+            )
+        )).scalar_one()
+
+        total_pages = (total + size - 1) // size
+        return NotificationListResponse(
+            items=[NotificationService._to_notification_out(item) for item in items],
+            pagination=PaginationInfo(
+                total=total,
+                page=page,
+                size=size,
+                total_pages=total_pages,
+                has_next=page < total_pages,
+                has_prev=page > 1,
+            ),
+            unread_count=unread_count,
+        )
+
+    @staticmethod
+    async def get_summary_async(db: AsyncSession, user_id: str) -> NotificationSummary:
+        """
+        알림 요약 정보 조회 (get_summary의 비동기 버전)
+
+        전체 읽지 않은 개수는 카테고리별 개수의 합으로 계산 (쿼리 2회)
+
+        Args:
+            db: 비동기 데이터베이스 세션
+            user_id: 사용자 ID
+
+        Returns:
+            NotificationSummary: 읽지 않은 개수, 카테고리별 카운트, 최신 알림
+        """
+        category_counts = (await db.execute(
+            select(Notification.category, func.count(Notification.id))
+            .where(Notification.user_id == user_id, Notification.is_read == False)
+            .group_by(Notification.category)
+        )).all()
+
+        by_category = NotificationCategoryCounts()
+        for category, count in category_counts:
+            setattr(by_category, category.value, count)
+
+        latest = (await db.execute(
+            select(Notification)
+            .where(Notification.user_id == user_id)
+            .order_by(desc(Notification.created_at))
+            .limit(1)
+        )).scalars().first()
+
+        return NotificationSummary(
+            total_unread=sum(count for _, count in category_counts),
+            by_category=by_category,
+            latest_notification=NotificationService._to_notification_out(latest) if latest else None,
+        )
+
+    @staticmethod
+    async def mark_as_read_async(db: AsyncSession, user_id: str, notification_id: str) -> bool:
+        """
+        알림 읽음 처리 (mark_as_read의 비동기 버전, 조건부 UPDATE 1회)
+
+        Returns:
+            bool: 성공 여부 (알림이 없으면 False, 이미 읽은 알림은 True)
+        """
+        result = await db.execute(
+            update(Notification)
+            .where(
+                Notification.id == notification_id,
+                Notification.user_id == user_id,
+                Notification.is_read == False,
+            )
+            .values(
+                is_read=True,
+                read_at=datetime.utcnow(),
+                delivery_status=NotificationDeliveryStatus.READ,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        if result.rowcount:
+            return True
+
+        # 이미 읽은 알림인지 확인
+        exists_id = (await db.execute(
+            select(Notification.id).where(
+                Notification.id == notification_id,
+                Notification.user_id == user_id,
+            )
+        )).scalar()
+        return exists_id is not None
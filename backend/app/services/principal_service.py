@@ -0,0 +1,178 @@
+"""
+Principal Service - 인증된 사용자(principal) 캐시
+get_current_user가 요청마다 users 테이블을 조회하지 않도록 최소 사용자 스냅샷을 캐시
+
+- 프로세스 내 LRU + TTL 캐시 (AUTH_PRINCIPAL_CACHE_TTL_SECONDS)
+- REDIS_URL이 설정되면 워커 간 공유 저장소를 2차 캐시로 사용
+- 프로필/비밀번호/이메일 인증 등 사용자 정보가 바뀌는 쓰기 경로에서 invalidate_user 호출
+- 무효화가 닿지 않는 다른 워커의 프로세스 내 캐시는 TTL로 최대 지연 시간을 제한
+  (계정 비활성화는 TTL 이내에 모든 워커에 반영)
+
+스냅샷에는 비밀번호 해시, 캘린더 피드 토큰 같은 비밀 값을 담지 않습니다.
+캐시에서 복원한 User는 세션에 로드된 상태로 연결되므로, 스냅샷에 없는 컬럼은 접근 시 지연 로딩되고
+수정 사항은 평소처럼 flush/commit 됩니다.
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.shared_store import get_shared_store
+from app.models.user import User, UserRole
+
+logger = logging.getLogger(__name__)
+
+# 공유 저장소 키 접두사
+SHARED_KEY_PREFIX = "principal:"
+
+# 스냅샷에 담는 컬럼 (비밀 값, 자주 바뀌는 last_login_at 제외)
+SNAPSHOT_FIELDS = (
+    "email", "name", "phone", "profile_image_url",
+    "is_active", "is_email_verified", "language", "timezone",
+)
+SNAPSHOT_DATETIME_FIELDS = ("email_verified_at", "created_at", "updated_at")
+
+
+class PrincipalService:
+    """
+    인증 사용자 캐시 서비스 레이어
+    """
+
+    _cache = TTLCache(
+        maxsize=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+    )
+
+    # ==========================
+    # Lookup
+    # ==========================
+
+    @staticmethod
+    def get_user(db: Session, user_id: str) -> Optional[User]:
+        """
+        사용자 조회 (프로세스 내 캐시 → 공유 저장소 → DB 순)
+
+        Args:
+            db: 데이터베이스 세션 (요청 범위)
+            user_id: 토큰의 사용자 ID
+
+        Returns:
+            Optional[User]: 세션에 연결된 사용자 (없으면 None)
+        """
+        if settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS <= 0:
+            return db.query(User).filter(User.id == user_id).first()
+
+        # 같은 세션에서 이미 로드된 경우 그대로 사용
+        existing = db.identity_map.get(identity_key(User, user_id))
+        if existing is not None:
+            return existing
+
+        snapshot = PrincipalService._cache.get(user_id)
+        if snapshot is None:
+            snapshot = PrincipalService._get_shared(user_id)
+            if snapshot is not None:
+                PrincipalService._cache.set(user_id, snapshot)
+
+        if snapshot is not None:
+            return PrincipalService._attach(db, snapshot)
+
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is not None:
+            snapshot = PrincipalService._to_snapshot(user)
+            PrincipalService._cache.set(user_id, snapshot)
+            PrincipalService._set_shared(user_id, snapshot)
+        return user
+
+    # ==========================
+    # Invalidation
+    # ==========================
+
+    @staticmethod
+    def invalidate_user(user_id: str) -> None:
+        """
+        사용자 정보 변경 시 캐시 무효화 (프로필/비밀번호 변경, 이메일 인증, 계정 비활성화)
+
+        커밋 이후에 호출해야 다른 요청이 변경 전 행으로 캐시를 다시 채우지 않습니다.
+        """
+        PrincipalService._cache.delete(user_id)
+        store = get_shared_store()
+        if store is None:
+            return
+        try:
+            store.delete(SHARED_KEY_PREFIX + user_id)
+        except Exception as e:
+            logger.warning("Principal cache shared delete failed for %s: %s", user_id, e)
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """프로세스 내 캐시 통계 (모니터링용)"""
+        return PrincipalService._cache.stats()
+
+    # ==========================
+    # Snapshot
+    # ==========================
+
+    @staticmethod
+    def _to_snapshot(user: User) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 최소 사용자 스냅샷"""
+        snapshot = {"id": user.id, "role": user.role.value}
+        for field in SNAPSHOT_FIELDS:
+            snapshot[field] = getattr(user, field)
+        for field in SNAPSHOT_DATETIME_FIELDS:
+            value = getattr(user, field)
+            snapshot[field] = value.isoformat() if value else None
+        return snapshot
+
+    @staticmethod
+    def _attach(db: Session, snapshot: Dict[str, Any]) -> User:
+        """
+        스냅샷으로 User를 만들어 세션에 로드된 상태로 연결 (쿼리 없음)
+
+        스냅샷에 없는 컬럼은 만료 상태가 되어 처음 접근할 때 한 번 로드됩니다.
+        """
+        values = {field: snapshot[field] for field in SNAPSHOT_FIELDS}
+        for field in SNAPSHOT_DATETIME_FIELDS:
+            value = snapshot[field]
+            values[field] = datetime.fromisoformat(value) if value else None
+
+        user = User(id=snapshot["id"], role=UserRole(snapshot["role"]), **values)
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
+    # ==========================
+    # Shared Store
+    # ==========================
+
+    @staticmethod
+    def _get_shared(user_id: str) -> Optional[Dict[str, Any]]:
+        """공유 저장소 조회 (미설정/장애 시 None → DB 조회로 대체)"""
+        store = get_shared_store()
+        if store is None:
+            return None
+        try:
+            payload = store.get(SHARED_KEY_PREFIX + user_id)
+        except Exception as e:
+            logger.warning("Principal cache shared get failed for %s: %s", user_id, e)
+            return None
+        return json.loads(payload) if payload else None
+
+    @staticmethod
+    def _set_shared(user_id: str, snapshot: Dict[str, Any]) -> None:
+        store = get_shared_store()
+        if store is None:
+            return
+        try:
+            store.set(
+                SHARED_KEY_PREFIX + user_id,
+                json.dumps(snapshot),
+                ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+            )
+        except Exception as e:
+            logger.warning("Principal cache shared set failed for %s: %s", user_id, e)
@@ -8,6 +8,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.models.user import User
 from app.models.settings import Settings
@@ -17,7 +18,8 @@ from app.schemas.profile import (
     NotificationSettingsOut,
     NotificationSettingsUpdate,
 )
-from app.core.security import hash_password, verify_password
+from app.core.security import hash_password_async, verify_password_async
+from app.services.principal_service import PrincipalService
 
 
 class ProfileService:
@@ -90,6 +92,7 @@ class ProfileService:
 
             user.updated_at = datetime.utcnow()
             db.commit()
+            PrincipalService.invalidate_user(user.id)
             db.refresh(user)
 
             return ProfileService.get_user_profile(db, user)
@@ -120,6 +123,7 @@ class ProfileService:
         user.profile_image_url = image_url
         user.updated_at = datetime.utcnow()
         db.commit()
+        PrincipalService.invalidate_user(user.id)
         db.refresh(user)
 
         return user.profile_image_url
@@ -254,13 +258,15 @@ class ProfileService:
             )
 
     @staticmethod
-    def change_password(
+    async def change_password_async(
         db: Session, user: User, current_password: str, new_password: str
     ) -> bool:
         """
         비밀번호 변경
         POST /api/v1/users/me/change-password
 
+        bcrypt 검증/해싱은 전용 해시 풀에서 await하고, DB 조회/저장만 요청 스레드 풀에서 실행합니다.
+
         Args:
             db: 데이터베이스 세션
             user: 현재 로그인한 사용자
@@ -273,23 +279,33 @@ class ProfileService:
         Raises:
             HTTPException: 현재 비밀번호 불일치 또는 동일한 비밀번호 사용 시
         """
+        # principal 캐시로 연결된 사용자는 password_hash를 지연 로드하므로 스레드 풀에서 읽음
+        password_hash = await run_in_threadpool(lambda: user.password_hash)
+
         # 현재 비밀번호 확인
-        if not verify_password(current_password, user.password_hash):
+        if not await verify_password_async(current_password, password_hash):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="현재 비밀번호가 일치하지 않습니다",
             )
 
         # 새 비밀번호가 현재 비밀번호와 동일한지 확인
-        if verify_password(new_password, user.password_hash):
+        if await verify_password_async(new_password, password_hash):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="현재 비밀번호와 다른 비밀번호를 입력해주세요",
             )
 
         # 비밀번호 업데이트
-        user.password_hash = hash_password(new_password)
-        user.updated_at = datetime.utcnow()
-        db.commit()
+        new_password_hash = await hash_password_async(new_password)
+        await run_in_threadpool(ProfileService._save_password, db, user, new_password_hash)
 
         return True
+
+    @staticmethod
+    def _save_password(db: Session, user: User, password_hash: str) -> None:
+        """새 비밀번호 해시 저장 (커밋 후 principal 캐시 무효화)"""
+        user.password_hash = password_hash
+        user.updated_at = datetime.utcnow()
+        db.commit()
+        PrincipalService.invalidate_user(user.id)
@@ -0,0 +1,217 @@
+"""
+Read Receipt Service - F-005 수업 기록 읽음 상태 지연 기록 (write-behind)
+학부모/학생이 수업 기록을 처음 열람한 시각(parent_viewed_at/student_viewed_at)
+
+상세 조회(GET)마다 커밋하지 않고 메모리 버퍼에 모았다가 백그라운드 워커가
+주기(LESSON_READ_RECEIPT_FLUSH_INTERVAL_SECONDS) 또는 버퍼 크기
+(LESSON_READ_RECEIPT_FLUSH_THRESHOLD) 도달 시 컬럼별 UPDATE 1회로 기록합니다.
+
+- 같은 기록을 여러 번 열어도 가장 이른 열람 시각만 유지
+- 이미 기록된 열람 시각은 덮어쓰지 않음 (WHERE ... IS NULL)
+- shutdown 시 남은 버퍼를 모두 기록
+- 워커가 실행 중이 아니면(비활성화/스크립트/테스트) record()가 False를 반환하고
+  호출자가 즉시 기록
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Optional, Dict, Tuple, Any
+from sqlalchemy.orm import Session
+from sqlalchemy import update, case
+
+from app.config import settings
+from app.core.background import PeriodicWorker
+from app.database import SessionLocal
+from app.models.lesson import LessonRecord
+
+logger = logging.getLogger(__name__)
+
+# 열람 역할 → 읽음 시각 컬럼
+PARENT_VIEWED = "parent_viewed_at"
+STUDENT_VIEWED = "student_viewed_at"
+VIEWED_COLUMNS = (PARENT_VIEWED, STUDENT_VIEWED)
+
+UPDATE_CHUNK_SIZE = 500  # UPDATE 1회당 최대 행 수 (CASE 식 크기 제한)
+
+ReceiptKey = Tuple[str, str]  # (lesson_record_id, column)
+
+
+class ReadReceiptService:
+    """
+    수업 기록 읽음 상태 버퍼 서비스 레이어
+    """
+
+    _lock = threading.Lock()
+    _buffer: Dict[ReceiptKey, datetime] = {}
+    _worker: Optional[PeriodicWorker] = None
+
+    # 실행 통계 (모니터링용, 프로세스 단위)
+    _stats: Dict[str, Any] = {
+        "buffered_total": 0,
+        "flushes": 0,
+        "flushed_rows": 0,
+        "failed_flushes": 0,
+        "last_flush": None,
+    }
+
+    # ==========================
+    # Lifecycle
+    # ==========================
+
+    @staticmethod
+    def start() -> None:
+        """백그라운드 flush 워커 시작 (startup 이벤트)"""
+        if ReadReceiptService._worker is None:
+            ReadReceiptService._worker = PeriodicWorker(
+                name="lesson-read-receipts",
+                interval_seconds=settings.LESSON_READ_RECEIPT_FLUSH_INTERVAL_SECONDS,
+                func=ReadReceiptService.flush,
+            )
+        ReadReceiptService._worker.start()
+
+    @staticmethod
+    def shutdown() -> None:
+        """워커 중지 후 남은 버퍼 기록 (shutdown 이벤트)"""
+        if ReadReceiptService._worker is not None:
+            ReadReceiptService._worker.stop()
+        try:
+            ReadReceiptService.flush()
+        except Exception:
+            logger.exception("Failed to flush lesson read receipts on shutdown")
+
+    @staticmethod
+    def is_running() -> bool:
+        worker = ReadReceiptService._worker
+        return worker is not None and worker.is_running
+
+    # ==========================
+    # Buffer
+    # ==========================
+
+    @staticmethod
+    def record(lesson_record_id: str, column: str, viewed_at: datetime) -> bool:
+        """
+        열람 시각을 버퍼에 추가 (커밋 없음)
+
+        Args:
+            lesson_record_id: 수업 기록 ID
+            column: PARENT_VIEWED 또는 STUDENT_VIEWED
+            viewed_at: 열람 시각
+
+        Returns:
+            bool: 버퍼에 추가했으면 True, 워커가 없어 호출자가 직접 기록해야 하면 False
+        """
+        if not ReadReceiptService.is_running():
+            return False
+
+        key = (lesson_record_id, column)
+        with ReadReceiptService._lock:
+            buffered = ReadReceiptService._buffer.get(key)
+            if buffered is None or viewed_at < buffered:
+                ReadReceiptService._buffer[key] = viewed_at
+            if buffered is None:
+                ReadReceiptService._stats["buffered_total"] += 1
+            size = len(ReadReceiptService._buffer)
+
+        if size >= settings.LESSON_READ_RECEIPT_FLUSH_THRESHOLD:
+            ReadReceiptService._worker.wake()
+        return True
+
+    @staticmethod
+    def pending(lesson_record_id: str, column: str) -> Optional[datetime]:
+        """아직 기록되지 않은 열람 시각 (중복 열람 시 응답에 같은 시각 표시)"""
+        with ReadReceiptService._lock:
+            return ReadReceiptService._buffer.get((lesson_record_id, column))
+
+    # ==========================
+    # Flush
+    # ==========================
+
+    @staticmethod
+    def flush() -> int:
+        """
+        버퍼를 비우고 독립 세션으로 기록 (워커/shutdown용)
+
+        실패하면 꺼낸 항목을 버퍼에 되돌려 다음 주기에 재시도합니다.
+
+        Returns:
+            int: 갱신된 행 수
+        """
+        with ReadReceiptService._lock:
+            if not ReadReceiptService._buffer:
+                return 0
+            entries = ReadReceiptService._buffer
+            ReadReceiptService._buffer = {}
+
+        db = SessionLocal()
+        try:
+            updated = ReadReceiptService.apply(db, entries)
+            db.commit()
+        except Exception:
+            db.rollback()
+            with ReadReceiptService._lock:
+                for key, viewed_at in entries.items():
+                    buffered = ReadReceiptService._buffer.get(key)
+                    if buffered is None or viewed_at < buffered:
+                        ReadReceiptService._buffer[key] = viewed_at
+                ReadReceiptService._stats["failed_flushes"] += 1
+            raise
+        finally:
+            db.close()
+
+        with ReadReceiptService._lock:
+            stats = ReadReceiptService._stats
+            stats["flushes"] += 1
+            stats["flushed_rows"] += updated
+            stats["last_flush"] = {
+                "entries": len(entries),
+                "updated": updated,
+                "finished_at": datetime.utcnow().isoformat(),
+            }
+
+        logger.info("Lesson read receipts flushed: entries=%s updated=%s", len(entries), updated)
+        return updated
+
+    @staticmethod
+    def apply(db: Session, entries: Dict[ReceiptKey, datetime]) -> int:
+        """
+        열람 시각 일괄 기록 (컬럼별 CASE UPDATE, 커밋하지 않음)
+
+        UPDATE lesson_records SET parent_viewed_at = CASE id WHEN ... END
+        WHERE id IN (...) AND parent_viewed_at IS NULL
+
+        Returns:
+            int: 갱신된 행 수
+        """
+        updated = 0
+        for column in VIEWED_COLUMNS:
+            per_record = {
+                lesson_record_id: viewed_at
+                for (lesson_record_id, entry_column), viewed_at in entries.items()
+                if entry_column == column
+            }
+            record_ids = sorted(per_record)
+            target = getattr(LessonRecord, column)
+
+            for start in range(0, len(record_ids), UPDATE_CHUNK_SIZE):
+                chunk = record_ids[start:start + UPDATE_CHUNK_SIZE]
+                result = db.execute(
+                    update(LessonRecord)
+                    .where(LessonRecord.id.in_(chunk), target.is_(None))
+                    .values({
+                        column: case({rid: per_record[rid] for rid in chunk}, value=LessonRecord.id),
+                        # 읽음 표시는 수업 기록 수정이 아니므로 updated_at 유지
+                        "updated_at": LessonRecord.updated_at,
+                    })
+                    .execution_options(synchronize_session=False)
+                )
+                updated += result.rowcount
+
+        return updated
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """누적 통계 + 현재 버퍼 크기"""
+        with ReadReceiptService._lock:
+            return dict(ReadReceiptService._stats, pending=len(ReadReceiptService._buffer))
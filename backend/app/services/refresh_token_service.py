@@ -0,0 +1,348 @@
+"""
+Refresh Token Service - F-001 토큰 갱신(rotation) 및 폐기
+Refresh Token을 jti 단위로 기록하고 계열(family) 단위로 교체/재사용 감지/폐기
+
+- 발급: 로그인/회원가입마다 새 계열, 갱신 시 같은 계열의 새 jti
+- 갱신: 조건부 UPDATE 1회로 "미사용·미폐기" 확인과 사용 처리를 동시에 수행 (별도 SELECT 없음)
+- 재사용 감지: 이미 교체된 jti가 다시 오면 계열 전체 폐기 (동시 갱신은 유예 시간 내 허용)
+- 폐기된 계열: Bloom 필터 + LRU로 기억해 재전송된 토큰을 DB 조회 없이 거절
+  (필터는 "없음"을 잠금 없이 판정하고, "있음"은 LRU로 확인 / 최종 판단은 항상 DB의 조건부 UPDATE)
+- 정리: 만료된 토큰 행은 배치 DELETE (REFRESH_TOKEN_PURGE_*)
+"""
+
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, update, delete
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.bloom import BloomFilter
+from app.core.cache import TTLCache
+from app.core.security import create_refresh_token
+from app.database import SessionLocal
+from app.models.refresh_token import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshTokenService:
+    """
+    Refresh Token 계열 서비스 레이어
+    """
+
+    # 폐기된 계열 ID (프로세스 단위)
+    _revoked_filter = BloomFilter(
+        capacity=settings.REFRESH_TOKEN_REVOKED_CACHE_MAX_ENTRIES,
+        error_rate=0.01,
+    )
+    _revoked_recent = TTLCache(
+        maxsize=settings.REFRESH_TOKEN_REVOKED_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400,
+    )
+
+    # 실행 통계 (모니터링용, 프로세스 단위)
+    _stats_lock = threading.Lock()
+    _stats: Dict[str, Any] = {
+        "rotations": 0,
+        "reuse_detected": 0,
+        "rejected_from_memory": 0,
+        "purge_runs": 0,
+        "total_purged": 0,
+    }
+
+    # ==========================
+    # Issue / Rotate
+    # ==========================
+
+    @staticmethod
+    def issue(
+        db: Session,
+        user_id: str,
+        family_id: Optional[str] = None,
+        parent_jti: Optional[str] = None,
+    ) -> str:
+        """
+        Refresh Token 발급 (행 추가만 하고 커밋은 호출자가 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            family_id: 갱신 시 기존 계열 ID (None이면 새 계열 = 새 로그인 세션)
+            parent_jti: 갱신 시 교체되는 이전 토큰 jti
+
+        Returns:
+            str: 인코딩된 Refresh Token (jti, fid 클레임 포함)
+        """
+        now = datetime.utcnow()
+        expires_delta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        jti = str(uuid.uuid4())
+        family_id = family_id or str(uuid.uuid4())
+
+        db.add(RefreshToken(
+            jti=jti,
+            family_id=family_id,
+            user_id=user_id,
+            parent_jti=parent_jti,
+            created_at=now,
+            expires_at=now + expires_delta,
+        ))
+        return create_refresh_token(
+            data={"sub": user_id, "jti": jti, "fid": family_id},
+            expires_delta=expires_delta,
+        )
+
+    @staticmethod
+    def rotate(db: Session, payload: Dict[str, Any]) -> str:
+        """
+        Refresh Token 교체 (사용한 토큰은 사용 처리, 같은 계열로 새 토큰 발급 후 커밋)
+
+        Args:
+            db: 데이터베이스 세션
+            payload: 검증된 Refresh Token 클레임 (sub, jti, fid)
+
+        Returns:
+            str: 새 Refresh Token
+
+        Raises:
+            HTTPException 401: 폐기된 계열이거나 이미 사용된 토큰 (재사용 감지 시 계열 전체 폐기)
+        """
+        user_id = payload["sub"]
+        jti = payload.get("jti")
+        family_id = payload.get("fid")
+
+        # 서버 기록 도입 전에 발급된 토큰: 새 계열로 전환 (기존 토큰은 만료까지 재사용 감지 불가)
+        if not jti or not family_id:
+            token = RefreshTokenService.issue(db, user_id)
+            db.commit()
+            return token
+
+        # 1. 이미 폐기된 계열 → DB 조회 없이 거절
+        if RefreshTokenService.is_revoked_in_memory(family_id):
+            RefreshTokenService._count("rejected_from_memory")
+            raise RefreshTokenService._rejected()
+
+        # 2. 미사용·미폐기 토큰만 사용 처리 (확인과 처리를 UPDATE 1회로)
+        now = datetime.utcnow()
+        result = db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.jti == jti,
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(used_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+        if result.rowcount != 1 and not RefreshTokenService._is_concurrent_refresh(db, jti, now):
+            # 3. 재사용(또는 폐기/정리된 토큰) → 계열 전체 폐기
+            db.rollback()
+            RefreshTokenService.revoke_family(db, family_id)
+            RefreshTokenService._count("reuse_detected")
+            logger.warning("Refresh token reuse detected: user=%s family=%s jti=%s", user_id, family_id, jti)
+            raise RefreshTokenService._rejected()
+
+        token = RefreshTokenService.issue(db, user_id, family_id=family_id, parent_jti=jti)
+        db.commit()
+        RefreshTokenService._count("rotations")
+        return token
+
+    @staticmethod
+    def _is_concurrent_refresh(db: Session, jti: str, now: datetime) -> bool:
+        """
+        방금 교체된 토큰의 재요청인지 확인 (여러 탭의 동시 갱신)
+
+        REFRESH_TOKEN_REUSE_GRACE_SECONDS 이내의 재사용은 탈취로 보지 않고 같은 계열로 새 토큰을 발급합니다.
+        """
+        grace = settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS
+        if grace <= 0:
+            return False
+        used_at = db.execute(
+            select(RefreshToken.used_at).where(
+                RefreshToken.jti == jti,
+                RefreshToken.revoked_at.is_(None),
+            )
+        ).scalar()
+        return used_at is not None and now - used_at <= timedelta(seconds=grace)
+
+    @staticmethod
+    def _rejected() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "code": "AUTH005",
+                "message": "이미 사용되었거나 폐기된 Refresh Token입니다. 다시 로그인해주세요.",
+            },
+        )
+
+    # ==========================
+    # Revoke
+    # ==========================
+
+    @staticmethod
+    def revoke_family(db: Session, family_id: str) -> int:
+        """
+        토큰 계열 폐기 (로그아웃, 재사용 감지) 후 커밋
+
+        Returns:
+            int: 폐기된 토큰 행 수
+        """
+        result = db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        RefreshTokenService._remember_revoked(family_id)
+        return result.rowcount
+
+    @staticmethod
+    def revoke_user(db: Session, user_id: str) -> int:
+        """
+        사용자의 모든 토큰 계열 폐기 (비밀번호 재설정) 후 커밋
+
+        Returns:
+            int: 폐기된 계열 수
+        """
+        family_ids = db.execute(
+            select(RefreshToken.family_id).where(
+                RefreshToken.user_id == user_id,
+                RefreshToken.revoked_at.is_(None),
+            ).distinct()
+        ).scalars().all()
+        if not family_ids:
+            return 0
+
+        db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        for family_id in family_ids:
+            RefreshTokenService._remember_revoked(family_id)
+        return len(family_ids)
+
+    @staticmethod
+    def is_revoked_in_memory(family_id: str) -> bool:
+        """
+        이 프로세스가 폐기를 알고 있는 계열인지 (False여도 DB 상태는 폐기일 수 있음)
+
+        대부분의 계열은 폐기되지 않았으므로 Bloom 필터에서 잠금 없이 바로 False로 끝나고,
+        필터가 "있음"이라고 할 때만 LRU로 오판 여부를 확인합니다.
+        """
+        if family_id not in RefreshTokenService._revoked_filter:
+            return False
+        return RefreshTokenService._revoked_recent.get(family_id) is not None
+
+    @staticmethod
+    def _remember_revoked(family_id: str) -> None:
+        cls = RefreshTokenService
+        cls._revoked_recent.set(family_id, True)
+        if cls._revoked_filter.is_full:
+            # 필터는 삭제가 안 되므로 capacity 초과 시 LRU에 남은 계열로 다시 채움
+            cls._revoked_filter.reset()
+            for key in cls._revoked_recent.keys():
+                cls._revoked_filter.add(key)
+        else:
+            cls._revoked_filter.add(family_id)
+
+    # ==========================
+    # Purge
+    # ==========================
+
+    @staticmethod
+    def purge_expired(
+        db: Session,
+        now: Optional[datetime] = None,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        만료된 토큰 행 일괄 삭제 (1회 실행)
+
+        DELETE ... WHERE jti IN (SELECT jti ... LIMIT batch_size) 형태로
+        한 번에 잠그는 행 수를 제한하고 배치마다 커밋합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            now: 기준 시각 (기본: 현재 UTC)
+            batch_size: DELETE 1회당 최대 행 수 (기본: settings)
+            max_batches: 최대 배치 수 (기본: settings)
+
+        Returns:
+            Dict: 처리 결과 (purged, batches, duration_ms)
+        """
+        started = time.perf_counter()
+        now = now or datetime.utcnow()
+        batch_size = batch_size or settings.REFRESH_TOKEN_PURGE_BATCH_SIZE
+        max_batches = max_batches or settings.REFRESH_TOKEN_PURGE_MAX_BATCHES
+
+        purged = 0
+        batches = 0
+        while batches < max_batches:
+            batch_jtis = select(RefreshToken.jti).where(
+                RefreshToken.expires_at < now
+            ).limit(batch_size).correlate(None)
+            result = db.execute(
+                delete(RefreshToken)
+                .where(RefreshToken.jti.in_(batch_jtis))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+            batches += 1
+            purged += result.rowcount
+            if result.rowcount < batch_size:
+                break
+
+        result = {
+            "purged": purged,
+            "batches": batches,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        with RefreshTokenService._stats_lock:
+            RefreshTokenService._stats["purge_runs"] += 1
+            RefreshTokenService._stats["total_purged"] += purged
+        logger.info("Refresh token purge: purged=%s batches=%s duration_ms=%s",
+                    purged, batches, result["duration_ms"])
+        return result
+
+    @staticmethod
+    def run_purge_once() -> Dict[str, Any]:
+        """
+        독립 세션으로 정리 작업 1회 실행 (백그라운드 워커/스크립트용)
+        """
+        db = SessionLocal()
+        try:
+            return RefreshTokenService.purge_expired(db)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ==========================
+    # Stats
+    # ==========================
+
+    @staticmethod
+    def _count(name: str) -> None:
+        with RefreshTokenService._stats_lock:
+            RefreshTokenService._stats[name] += 1
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """누적 통계 조회"""
+        with RefreshTokenService._stats_lock:
+            stats = dict(RefreshTokenService._stats)
+        stats["revoked_in_memory"] = len(RefreshTokenService._revoked_recent)
+        return stats
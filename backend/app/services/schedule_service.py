@@ -6,22 +6,33 @@ Schedule Service - F-003 수업 일정 관리 비즈니스 로직
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, desc, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, desc, and_, or_, update, select, String
+import uuid
 from fastapi import HTTPException, status
 
 from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
 from app.models.group import Group, GroupMember, GroupMemberRole, GroupMemberInviteStatus
 from app.models.user import User
 from app.models.notification import NotificationType, NotificationPriority
+from app.models.lesson import LessonRecord, ProgressRecord
 from app.schemas.schedule import (
     CreateRegularSchedulePayload,
     CreateSchedulePayload,
     UpdateSchedulePayload,
+    BulkUpdateSchedulesPayload,
+    BulkUpdateSchedulesResponse,
     ScheduleOut,
     ScheduleListResponse,
     PaginationInfo,
 )
 from app.services.notification_service import NotificationService
+from app.services.calendar_service import CalendarFeedService
+from app.services.attendance_rollup_service import AttendanceRollupService
+from app.services.attendance_analytics_service import AttendanceAnalyticsService
+from app.services.textbook_service import TextbookService
+from app.services.lesson_search_service import LessonSearchService
+from app.services.authorization_service import AuthorizationService
 
 
 class ScheduleService:
@@ -31,6 +42,7 @@ class ScheduleService:
 
     # Constants
     MAX_SCHEDULES_PER_CREATION = 200  # 한 번에 최대 생성 가능한 일정 개수
+    MAX_SCHEDULES_PER_BULK_UPDATE = 500  # 한 번에 최대 일괄 변경 가능한 일정 개수
 
     @staticmethod
     def _check_group_access(db: Session, user: User, group_id: str, required_role: Optional[str] = None) -> Group:
@@ -49,29 +61,14 @@ class ScheduleService:
         Raises:
             HTTPException: 그룹이 없거나 권한이 없는 경우
         """
-        # 그룹 존재 확인
-        group = db.query(Group).filter(Group.id == group_id).first()
-        if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"code": "GROUP_NOT_FOUND", "message": "그룹을 찾을 수 없습니다."}
-            )
+        # 그룹 존재 확인 (세션 identity map 재사용)
+        group = AuthorizationService.get_group(db, group_id)
 
-        # 멤버십 확인
-        membership = db.query(GroupMember).filter(
-            GroupMember.group_id == group_id,
-            GroupMember.user_id == user.id,
-            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-        ).first()
-
-        if not membership:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={"code": "NOT_GROUP_MEMBER", "message": "이 그룹의 멤버가 아닙니다."}
-            )
+        # 멤버십 확인 (요청 단위 권한 컨텍스트)
+        context = AuthorizationService.require_member(db, user, group_id)
 
         # 역할 확인
-        if required_role and membership.role != required_role:
+        if required_role and context.role(group_id) != required_role:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail={"code": "INSUFFICIENT_PERMISSION", "message": f"{required_role} 권한이 필요합니다."}
@@ -121,6 +118,7 @@ class ScheduleService:
         """
         schedules = []
         recurrence = payload.recurrence
+        series_id = str(uuid.uuid4())  # 이번 생성으로 만들어지는 일정 묶음 ID
 
         # 시작 날짜 파싱
         start_date = datetime.strptime(recurrence.start_date, "%Y-%m-%d").date()
@@ -175,6 +173,7 @@ class ScheduleService:
                         "end_date": recurrence.end_date,
                         "end_count": recurrence.end_count,
                     },
+                    series_id=series_id,
                     location=payload.location,
                     memo=payload.memo,
                 )
@@ -227,13 +226,8 @@ class ScheduleService:
         Returns:
             ScheduleListResponse: 일정 목록 + 페이지네이션
         """
-        # 사용자가 속한 그룹 ID 목록
-        user_group_ids = [
-            row[0] for row in db.query(GroupMember.group_id).filter(
-                GroupMember.user_id == user.id,
-                GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-            ).all()
-        ]
+        # 사용자가 속한 그룹 ID 목록 (권한 컨텍스트)
+        user_group_ids = AuthorizationService.get_context(db, user).group_ids
 
         # F-005: N+1 문제 해결 - lesson_record, attendances를 eager load
         # 쿼리 시작
@@ -309,6 +303,7 @@ class ScheduleService:
         # DB에 저장
         db.add_all(schedules)
         db.commit()
+        CalendarFeedService.invalidate_group(group.id)
 
         # 응답 변환
         return [ScheduleService._to_schedule_out(db, schedule) for schedule in schedules]
@@ -353,6 +348,7 @@ class ScheduleService:
         db.add(schedule)
         db.commit()
         db.refresh(schedule)
+        CalendarFeedService.invalidate_group(group.id)
 
         # F-008: 일정 생성 알림 발송 (그룹 멤버에게)
         try:
@@ -496,6 +492,7 @@ class ScheduleService:
 
         db.commit()
         db.refresh(schedule)
+        CalendarFeedService.invalidate_group(schedule.group_id)
 
         # F-008: 일정 변경/취소 알림 발송
         try:
@@ -535,6 +532,199 @@ class ScheduleService:
 
         return ScheduleService._to_schedule_out(db, schedule)
 
+    @staticmethod
+    def bulk_update_schedules(
+        db: Session,
+        user: User,
+        payload: BulkUpdateSchedulesPayload
+    ) -> BulkUpdateSchedulesResponse:
+        """
+        일정 일괄 변경 (반복 일정 묶음 / 기간 단위)
+
+        - 대상 일정을 한 번에 조회한 뒤 집합 단위 UPDATE 1회로 변경
+        - 알림은 일정별이 아닌 멤버별 1건으로 묶어 같은 트랜잭션에서 일괄 INSERT
+        - 단건 수정과 동일하게 완료/취소된 일정과 24시간 이내 일정은 제외
+
+        Args:
+            db: 데이터베이스 세션
+            user: 현재 사용자 (선생님)
+            payload: 일괄 변경 요청
+
+        Returns:
+            BulkUpdateSchedulesResponse: 변경된 일정 ID 목록
+        """
+        # 권한 확인 (선생님만 가능)
+        ScheduleService._check_group_access(db, user, payload.group_id, required_role=GroupMemberRole.TEACHER)
+
+        # 작업별 필수 값 검증
+        if payload.action == "cancel" and not payload.reason:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"code": "CANCEL_REASON_REQUIRED", "message": "취소 사유를 입력해주세요."}
+            )
+        if payload.action == "shift" and not payload.shift_minutes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"code": "SHIFT_MINUTES_REQUIRED", "message": "이동할 시간을 입력해주세요."}
+            )
+        if payload.action == "change_location" and payload.location is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"code": "LOCATION_REQUIRED", "message": "변경할 장소를 입력해주세요."}
+            )
+
+        # 대상 일정 조회 (ID, 제목, 시작 시각만)
+        from_dt = datetime.strptime(payload.from_date, "%Y-%m-%d")
+        to_dt = datetime.strptime(payload.to_date, "%Y-%m-%d") + timedelta(days=1)
+        editable_after = datetime.utcnow() + timedelta(hours=24)  # 24시간 이내 수업은 변경 불가
+
+        criteria = [
+            Schedule.group_id == payload.group_id,
+            Schedule.start_at >= max(from_dt, editable_after),
+            Schedule.start_at < to_dt,
+            Schedule.status.in_([ScheduleStatus.SCHEDULED, ScheduleStatus.RESCHEDULED]),
+        ]
+        if payload.series_id:
+            criteria.append(Schedule.series_id == payload.series_id)
+
+        targets = db.query(Schedule.id, Schedule.title, Schedule.start_at).filter(
+            *criteria
+        ).order_by(Schedule.start_at).all()
+
+        if not targets:
+            return BulkUpdateSchedulesResponse(action=payload.action, updated_count=0, schedule_ids=[])
+
+        if len(targets) > ScheduleService.MAX_SCHEDULES_PER_BULK_UPDATE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": "TOO_MANY_SCHEDULES",
+                    "message": f"한 번에 최대 {ScheduleService.MAX_SCHEDULES_PER_BULK_UPDATE}개 일정까지 변경할 수 있습니다."
+                }
+            )
+
+        # 앞당긴 결과가 24시간 이내로 들어오는 경우 방지
+        if payload.action == "shift" and targets[0].start_at + timedelta(minutes=payload.shift_minutes) < editable_after:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"code": "CANNOT_EDIT_WITHIN_24H", "message": "수업 24시간 전까지만 변경할 수 있습니다."}
+            )
+
+        schedule_ids = [row.id for row in targets]
+        now = datetime.utcnow()
+
+        # 작업별 변경 값 (집합 단위 UPDATE)
+        if payload.action == "cancel":
+            values = {
+                "status": ScheduleStatus.CANCELED,
+                "cancel_reason": payload.reason,
+            }
+        elif payload.action == "shift":
+            # 단일 일정 변경(update_schedule)과 같이 시간이 바뀐 일정은 RESCHEDULED
+            values = {
+                "start_at": ScheduleService._shifted_datetime(db, Schedule.start_at, payload.shift_minutes),
+                "end_at": ScheduleService._shifted_datetime(db, Schedule.end_at, payload.shift_minutes),
+                "status": ScheduleStatus.RESCHEDULED,
+            }
+            if payload.reason:
+                values["reschedule_reason"] = payload.reason
+        else:
+            values = {"location": payload.location}
+        values["updated_at"] = now
+
+        db.execute(
+            update(Schedule)
+            .where(Schedule.id.in_(schedule_ids))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+        # F-008: 멤버별 알림 1건 (일정 수와 무관), 같은 트랜잭션에서 일괄 INSERT
+        member_ids = ScheduleService._get_group_member_ids(db, payload.group_id, exclude_user_id=user.id)
+        if member_ids:
+            notification = ScheduleService._build_bulk_notification(payload, targets)
+            NotificationService.bulk_create_notifications(
+                db=db,
+                notifications=[dict(notification, user_id=member_id) for member_id in member_ids],
+                commit=False,
+            )
+
+        db.commit()
+        CalendarFeedService.invalidate_group(payload.group_id)
+
+        return BulkUpdateSchedulesResponse(
+            action=payload.action,
+            updated_count=len(schedule_ids),
+            schedule_ids=schedule_ids,
+        )
+
+    @staticmethod
+    def _shifted_datetime(db: Session, column, minutes: int):
+        """
+        DateTime 컬럼을 분 단위로 이동하는 SQL 식 (DB 방언별)
+
+        SQLite는 interval 연산을 지원하지 않으므로 strftime() 함수를 사용합니다.
+        SQLite DateTime 컬럼은 'YYYY-MM-DD HH:MM:SS.ffffff' 문자열로 저장되고 비교도 문자열로 하므로,
+        소수 초를 버리는 datetime() 대신 같은 형식으로 만들어야 경계 값 비교에서 행이 빠지지 않습니다.
+        (분 단위 이동이므로 원래 값의 마이크로초를 그대로 이어 붙임)
+        """
+        if db.get_bind().dialect.name == "sqlite":
+            shifted = func.strftime("%Y-%m-%d %H:%M:%S", column, f"{minutes:+d} minutes", type_=String)
+            microseconds = func.coalesce(func.nullif(func.substr(column, 21, 6), ""), "000000")
+            return shifted + "." + microseconds
+        return column + timedelta(minutes=minutes)
+
+    @staticmethod
+    def _build_bulk_notification(payload: BulkUpdateSchedulesPayload, targets: list) -> dict:
+        """
+        일괄 변경 알림 내용 생성 (수신자 공통)
+
+        Args:
+            payload: 일괄 변경 요청
+            targets: 변경 대상 (id, title, start_at) 목록, start_at 오름차순
+
+        Returns:
+            dict: NotificationService.bulk_create_notifications 항목 (user_id 제외)
+        """
+        titles = {row.title for row in targets}
+        title_text = targets[0].title if len(titles) == 1 else "수업"
+        first = targets[0].start_at.strftime("%m월 %d일")
+        last = targets[-1].start_at.strftime("%m월 %d일")
+        period = first if first == last else f"{first} ~ {last}"
+        summary = f"{title_text} {len(targets)}회 ({period})"
+
+        # 단일 일정이면 해당 일정, 여러 일정이면 그룹으로 연결
+        if len(targets) == 1:
+            related = {"related_resource_type": "schedule", "related_resource_id": targets[0].id}
+        else:
+            related = {"related_resource_type": "group", "related_resource_id": payload.group_id}
+
+        if payload.action == "cancel":
+            return dict(
+                related,
+                notification_type=NotificationType.SCHEDULE_CANCELLED,
+                title="❌ 수업 일괄 취소",
+                message=f"{summary} - {payload.reason}",
+                priority=NotificationPriority.HIGH,
+                is_required=True,
+            )
+        if payload.action == "shift":
+            direction = "늦춰졌습니다" if payload.shift_minutes > 0 else "당겨졌습니다"
+            return dict(
+                related,
+                notification_type=NotificationType.SCHEDULE_CHANGED,
+                title="🔄 수업 일정 일괄 변경",
+                message=f"{summary} - {abs(payload.shift_minutes)}분 {direction}",
+                priority=NotificationPriority.HIGH,
+            )
+        return dict(
+            related,
+            notification_type=NotificationType.SCHEDULE_CHANGED,
+            title="📍 수업 장소 변경",
+            message=f"{summary} - {payload.location or '장소 미정'}(으)로 변경되었습니다",
+            priority=NotificationPriority.NORMAL,
+        )
+
     @staticmethod
     def delete_schedule(
         db: Session,
@@ -566,8 +756,27 @@ class ScheduleService:
                 detail={"code": "CANNOT_DELETE_DONE_SCHEDULE", "message": "완료된 수업은 삭제할 수 없습니다."}
             )
 
+        group_id = schedule.group_id
+        period = AttendanceRollupService.period_of(schedule.start_at)
+
+        # 수업 기록/진도 기록이 함께 삭제(CASCADE)되므로 영향받는 교재를 미리 조회
+        textbook_ids = [
+            row[0] for row in db.query(ProgressRecord.textbook_id).join(
+                LessonRecord, ProgressRecord.lesson_record_id == LessonRecord.id
+            ).filter(LessonRecord.schedule_id == schedule.id).distinct().all()
+        ]
+
+        LessonSearchService.remove_schedule(db, schedule.id)
         db.delete(schedule)
+        db.flush()
+
+        # 출결이 함께 삭제되므로 해당 월 출결 집계 재계산 (같은 트랜잭션)
+        AttendanceRollupService.rebuild(db, group_id=group_id, period=period)
+        TextbookService.refresh_progress(db, textbook_ids)
+
         db.commit()
+        CalendarFeedService.invalidate_group(group_id)
+        AttendanceAnalyticsService.invalidate_group(group_id)
 
     @staticmethod
     def _to_schedule_out(db: Session, schedule: Schedule) -> ScheduleOut:
@@ -581,8 +790,8 @@ class ScheduleService:
         Returns:
             ScheduleOut: 응답 스키마
         """
-        # Group 정보 가져오기
-        group = db.query(Group).filter(Group.id == schedule.group_id).first()
+        # Group 정보 가져오기 (세션 identity map 재사용, 같은 그룹 일정 목록에서 반복 조회 없음)
+        group = db.get(Group, schedule.group_id)
         group_name = group.name if group else None
 
         # F-005: lesson_record_id 가져오기 (N+1 문제 해결)
@@ -604,6 +813,7 @@ class ScheduleService:
             end_at=schedule.end_at.isoformat() if schedule.end_at else "",
             status=schedule.status.value,
             recurrence_rule=schedule.recurrence_rule,
+            series_id=schedule.series_id,
             location=schedule.location,
             memo=schedule.memo,
             created_at=schedule.created_at.isoformat() if schedule.created_at else "",
@@ -611,5 +821,89 @@ class ScheduleService:
             original_schedule_id=schedule.original_schedule_id,
             cancel_reason=schedule.cancel_reason,
             reschedule_reason=schedule.reschedule_reason,
+            attendance_missing=bool(schedule.attendance_missing),
             lesson_record_id=lesson_record_id,  # F-005: 수업 기록 ID 포함
         )
+
+    # ========== 비동기 버전 (AsyncSession, ASYNC_DB_ENABLED 핫패스) ==========
+
+    @staticmethod
+    async def get_schedules_async(
+        db: AsyncSession,
+        user: User,
+        group_id: Optional[str] = None,
+        schedule_type: Optional[str] = None,
+        schedule_status: Optional[str] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        page: int = 1,
+        size: int = 20,
+    ) -> ScheduleListResponse:
+        """
+        일정 목록 조회 (get_schedules의 비동기 버전)
+
+        권한 컨텍스트와 응답 변환은 동기 코드를 run_sync로 재사용합니다.
+        (관련 그룹을 미리 로드하므로 변환 중 추가 쿼리 없음)
+
+        Args:
+            db: 비동기 데이터베이스 세션
+            user: 현재 사용자
+            group_id: 그룹 ID 필터 (선택)
+            schedule_type: 일정 타입 필터 (선택)
+            schedule_status: 일정 상태 필터 (선택)
+            from_date: 시작 날짜 (YYYY-MM-DD)
+            to_date: 종료 날짜 (YYYY-MM-DD)
+            page: 페이지 번호
+            size: 페이지 크기
+
+        Returns:
+            ScheduleListResponse: 일정 목록 + 페이지네이션
+        """
+        context = await db.run_sync(AuthorizationService.get_context, user)
+
+        filters = [Schedule.group_id.in_(context.group_ids)]
+        if group_id:
+            filters.append(Schedule.group_id == group_id)
+        if schedule_type:
+            filters.append(Schedule.type == schedule_type)
+        if schedule_status:
+            filters.append(Schedule.status == schedule_status)
+        if from_date:
+            filters.append(Schedule.start_at >= datetime.strptime(from_date, "%Y-%m-%d"))
+        if to_date:
+            filters.append(Schedule.start_at < datetime.strptime(to_date, "%Y-%m-%d") + timedelta(days=1))
+
+        total = (await db.execute(
+            select(func.count(Schedule.id)).where(*filters)
+        )).scalar_one()
+
+        offset = (page - 1) * size
+        schedules = (await db.execute(
+            select(Schedule)
+            .options(joinedload(Schedule.lesson_record), joinedload(Schedule.attendances))
+            .where(*filters)
+            .order_by(Schedule.start_at)
+            .offset(offset)
+            .limit(size)
+        )).unique().scalars().all()
+
+        # 변환 시 db.get(Group)이 identity map에서 끝나도록 그룹을 한 번에 로드
+        schedule_group_ids = {schedule.group_id for schedule in schedules}
+        if schedule_group_ids:
+            await db.execute(select(Group).where(Group.id.in_(schedule_group_ids)))
+
+        total_pages = (total + size - 1) // size
+        items = await db.run_sync(
+            lambda session: [ScheduleService._to_schedule_out(session, schedule) for schedule in schedules]
+        )
+        return ScheduleListResponse(
+            items=items,
+            pagination=PaginationInfo(
+                total=total,
+                page=page,
+                size=size,
+                total_pages=total_pages,
+                has_next=page < total_pages,
+                has_prev=page > 1,
+            ),
+        )
@@ -0,0 +1,173 @@
+"""
+Schedule Sweeper Service - F-003 지난 일정 자동 완료 처리
+종료된 예정/변경 일정(SCHEDULED, RESCHEDULED)을 DONE으로 전환 (정산 F-006은 DONE 일정만 집계)
+
+- 출결 기록이 있는 종료 일정 → DONE
+- 출결 기록이 없는 종료 일정 → attendance_missing 플래그 (선생님 확인 필요)
+
+모든 변경은 배치 크기로 제한된 집합 단위 UPDATE로 수행하며,
+(status, end_at) 복합 인덱스로 대상 범위를 찾습니다.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, exists
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.schedule import Schedule, ScheduleStatus
+from app.models.attendance import Attendance
+
+logger = logging.getLogger(__name__)
+
+# 종료 후 완료 처리 대상 (변경된 일정도 진행된 수업이므로 정산 대상)
+SWEEPABLE_STATUSES = (ScheduleStatus.SCHEDULED, ScheduleStatus.RESCHEDULED)
+
+
+class ScheduleSweeperService:
+    """
+    일정 자동 완료 처리 서비스 레이어
+    """
+
+    # 실행 통계 (모니터링용, 프로세스 단위)
+    _stats_lock = threading.Lock()
+    _stats: Dict[str, Any] = {
+        "runs": 0,
+        "total_marked_done": 0,
+        "total_flagged_missing_attendance": 0,
+        "last_run": None,
+    }
+
+    @staticmethod
+    def sweep(
+        db: Session,
+        now: Optional[datetime] = None,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        지난 일정 일괄 처리 (1회 실행)
+
+        Args:
+            db: 데이터베이스 세션
+            now: 기준 시각 (기본: 현재 UTC)
+            batch_size: UPDATE 1회당 최대 행 수 (기본: settings)
+            max_batches: 작업별 최대 배치 수 (기본: settings)
+
+        Returns:
+            Dict: 처리 결과 (marked_done, flagged_missing_attendance, batches, duration_ms, cutoff)
+        """
+        started = time.perf_counter()
+        now = now or datetime.utcnow()
+        batch_size = batch_size or settings.SCHEDULE_SWEEPER_BATCH_SIZE
+        max_batches = max_batches or settings.SCHEDULE_SWEEPER_MAX_BATCHES
+        cutoff = now - timedelta(minutes=settings.SCHEDULE_SWEEPER_GRACE_MINUTES)
+
+        has_attendance = exists().where(Attendance.schedule_id == Schedule.id)
+        finished = [
+            Schedule.status.in_(SWEEPABLE_STATUSES),
+            Schedule.end_at < cutoff,
+        ]
+
+        # 1. 출결 기록이 있는 종료 일정 → DONE
+        marked_done, done_batches = ScheduleSweeperService._run_batches(
+            db,
+            criteria=finished + [has_attendance],
+            values={"status": ScheduleStatus.DONE, "attendance_missing": False, "updated_at": now},
+            batch_size=batch_size,
+            max_batches=max_batches,
+        )
+
+        # 2. 출결 기록이 없는 종료 일정 → attendance_missing 플래그
+        flagged, flag_batches = ScheduleSweeperService._run_batches(
+            db,
+            criteria=finished + [Schedule.attendance_missing == False, ~has_attendance],  # noqa: E712
+            values={"attendance_missing": True},
+            batch_size=batch_size,
+            max_batches=max_batches,
+        )
+
+        result = {
+            "marked_done": marked_done,
+            "flagged_missing_attendance": flagged,
+            "batches": done_batches + flag_batches,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "cutoff": cutoff.isoformat(),
+        }
+        ScheduleSweeperService._record_run(result)
+
+        return result
+
+    @staticmethod
+    def _run_batches(db: Session, criteria: list, values: dict, batch_size: int, max_batches: int):
+        """
+        조건에 맞는 일정을 batch_size 단위 UPDATE로 반복 처리
+
+        UPDATE schedules SET ... WHERE id IN (SELECT id ... LIMIT batch_size)
+        형태로 한 번에 잠그는 행 수를 제한하고, 배치마다 커밋합니다.
+
+        Returns:
+            Tuple[int, int]: (처리된 행 수, 실행된 배치 수)
+        """
+        processed = 0
+        batches = 0
+
+        while batches < max_batches:
+            # correlate(None): UPDATE 대상 테이블과 같은 schedules를 서브쿼리에서 독립적으로 조회
+            batch_ids = select(Schedule.id).where(*criteria).limit(batch_size).correlate(None)
+            result = db.execute(
+                update(Schedule)
+                .where(Schedule.id.in_(batch_ids))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+            batches += 1
+            processed += result.rowcount
+            if result.rowcount < batch_size:
+                break
+
+        return processed, batches
+
+    @staticmethod
+    def _record_run(result: Dict[str, Any]) -> None:
+        """실행 결과를 누적 통계에 반영하고 로그로 남김"""
+        with ScheduleSweeperService._stats_lock:
+            stats = ScheduleSweeperService._stats
+            stats["runs"] += 1
+            stats["total_marked_done"] += result["marked_done"]
+            stats["total_flagged_missing_attendance"] += result["flagged_missing_attendance"]
+            stats["last_run"] = dict(result, finished_at=datetime.utcnow().isoformat())
+
+        logger.info(
+            "Schedule sweep: marked_done=%s flagged_missing_attendance=%s batches=%s duration_ms=%s",
+            result["marked_done"],
+            result["flagged_missing_attendance"],
+            result["batches"],
+            result["duration_ms"],
+        )
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """누적 실행 통계 조회"""
+        with ScheduleSweeperService._stats_lock:
+            return dict(ScheduleSweeperService._stats)
+
+    @staticmethod
+    def run_once() -> Dict[str, Any]:
+        """
+        독립 세션으로 1회 실행 (백그라운드 워커/스크립트용)
+        """
+        db = SessionLocal()
+        try:
+            return ScheduleSweeperService.sweep(db)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
@@ -6,7 +6,7 @@ Settlement Service - F-006 수업료 정산 비즈니스 로직
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, or_, extract
+from sqlalchemy import func, desc, and_, or_, extract, case
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from calendar import monthrange
@@ -41,6 +41,7 @@ from app.schemas.invoice import (
     ReceiptResponse,  # F-006: Receipt
 )
 from app.services.notification_service import NotificationService
+from app.services.authorization_service import AuthorizationService
 
 
 class SettlementService:
@@ -70,13 +71,8 @@ class SettlementService:
         Raises:
             HTTPException: 권한이 없거나 그룹이 없는 경우
         """
-        # 그룹 존재 확인
-        group = db.query(Group).filter(Group.id == group_id).first()
-        if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"code": "GROUP_NOT_FOUND", "message": "그룹을 찾을 수 없습니다."}
-            )
+        # 그룹 존재 확인 (세션 identity map 재사용)
+        group = AuthorizationService.get_group(db, group_id)
 
         # 선생님 권한 확인 (그룹 소유자만)
         if group.owner_id != user.id:
@@ -112,31 +108,25 @@ class SettlementService:
         - 출석(PRESENT), 지각(LATE), 조퇴(EARLY_LEAVE): 1회로 계산
         - 결석(ABSENT): 0회 (카운트하지 않음)
         - 보강(MAKEUP) 수업도 포함
+        - 완료(DONE)된 일정만 청구 대상
         """
-        # 기간 내 일정 조회
-        schedules = db.query(Schedule).filter(
+        # 기간 내 완료된 일정의 해당 학생 출결을 일정과 조인해 집계 (쿼리 1회)
+        # 월간 출결 집계는 취소되지 않은 모든 일정을 세므로 정산에는 사용하지 않음
+        absent_lessons, total_lessons = db.query(
+            func.count(case((Attendance.status == AttendanceStatus.ABSENT, 1))),
+            func.count(Attendance.id),
+        ).join(
+            Schedule, Schedule.id == Attendance.schedule_id
+        ).filter(
             Schedule.group_id == group_id,
             Schedule.start_at >= datetime.combine(start_date, datetime.min.time()),
             Schedule.start_at <= datetime.combine(end_date, datetime.max.time()),
             Schedule.status == ScheduleStatus.DONE,  # 완료된 일정만
-        ).all()
-
-        attended_lessons = 0
-        absent_lessons = 0
+            Attendance.student_id == student_id,
+        ).one()
 
-        for schedule in schedules:
-            # 해당 학생의 출결 기록 조회
-            attendance = db.query(Attendance).filter(
-                Attendance.schedule_id == schedule.id,
-                Attendance.student_id == student_id,
-            ).first()
-
-            if attendance:
-                if attendance.status == AttendanceStatus.ABSENT:
-                    absent_lessons += 1
-                else:
-                    # PRESENT, LATE, EARLY_LEAVE는 모두 출석으로 간주
-                    attended_lessons += 1
+        # PRESENT, LATE, EARLY_LEAVE는 모두 출석으로 간주
+        attended_lessons = total_lessons - absent_lessons
 
         return attended_lessons, absent_lessons
 
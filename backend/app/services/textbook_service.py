@@ -4,9 +4,9 @@ Textbook Service - F-005 교재 관리 및 진도 통계 비즈니스 로직
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Iterable
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, select, update
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
@@ -25,6 +25,7 @@ from app.schemas.lesson import (
     ProgressHistoryItem,
     ProgressHistoryResponse,
 )
+from app.services.authorization_service import AuthorizationService
 
 
 class TextbookService:
@@ -32,6 +33,9 @@ class TextbookService:
     교재 서비스 레이어
     """
 
+    # Constants
+    CONTENT_PREVIEW_LENGTH = 50  # 진도 히스토리의 수업 내용 미리보기 길이
+
     @staticmethod
     def _check_group_access(db: Session, user: User, group_id: str) -> Group:
         """
@@ -48,25 +52,8 @@ class TextbookService:
         Raises:
             HTTPException: 그룹이 없거나 권한이 없는 경우
         """
-        group = db.query(Group).filter(Group.id == group_id).first()
-        if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"code": "GROUP_NOT_FOUND", "message": "그룹을 찾을 수 없습니다."}
-            )
-
-        membership = db.query(GroupMember).filter(
-            GroupMember.group_id == group.id,
-            GroupMember.user_id == user.id,
-            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-        ).first()
-
-        if not membership:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={"code": "NOT_GROUP_MEMBER", "message": "이 그룹의 멤버가 아닙니다."}
-            )
-
+        group = AuthorizationService.get_group(db, group_id)
+        AuthorizationService.require_member(db, user, group.id)
         return group
 
     @staticmethod
@@ -77,19 +64,74 @@ class TextbookService:
         Raises:
             HTTPException: 선생님이 아닌 경우
         """
-        membership = db.query(GroupMember).filter(
-            GroupMember.group_id == group.id,
-            GroupMember.user_id == user.id,
-            GroupMember.member_role == GroupMemberRole.TEACHER,
-            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
-        ).first()
-
-        if not membership:
+        if AuthorizationService.get_role(db, user, group.id) != GroupMemberRole.TEACHER:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail={"code": "TEACHER_ONLY", "message": "선생님만 수행할 수 있습니다."}
             )
 
+    # ==========================
+    # Progress Aggregates
+    # ==========================
+
+    @staticmethod
+    def refresh_progress(
+        db: Session,
+        textbook_ids: Optional[Iterable[str]] = None,
+        group_id: Optional[str] = None,
+    ) -> int:
+        """
+        교재의 비정규화 진도 집계(progress_*) 재계산 (UPDATE 1회, 커밋하지 않음)
+
+        진도 기록이 추가/삭제된 교재만 원본 진도 기록으로 다시 계산하므로
+        증감 방식과 달리 동시 요청이나 누락된 갱신이 있어도 결과가 원본과 같습니다.
+        호출 전에 변경 사항이 flush되어 있어야 합니다.
+
+        Args:
+            db: 데이터베이스 세션 (호출자의 트랜잭션)
+            textbook_ids: 교재 ID 목록 (None이면 전체 - 백필용)
+            group_id: 그룹 ID (백필 시 특정 그룹만)
+
+        Returns:
+            int: 갱신된 교재 수
+        """
+        criteria = []
+        if textbook_ids is not None:
+            textbook_ids = sorted({tid for tid in textbook_ids if tid})
+            if not textbook_ids:
+                return 0
+            criteria.append(Textbook.id.in_(textbook_ids))
+        if group_id:
+            criteria.append(Textbook.group_id == group_id)
+
+        def aggregate(expression):
+            # Textbook과 상관된 스칼라 서브쿼리 (진도 기록 ⋈ 수업 기록 ⋈ 일정)
+            return select(expression).select_from(ProgressRecord).join(
+                LessonRecord, ProgressRecord.lesson_record_id == LessonRecord.id
+            ).join(
+                Schedule, LessonRecord.schedule_id == Schedule.id
+            ).where(
+                ProgressRecord.textbook_id == Textbook.id
+            ).scalar_subquery()
+
+        result = db.execute(
+            update(Textbook)
+            .where(*criteria)
+            .values(
+                progress_current_page=aggregate(func.max(ProgressRecord.end_page)),
+                progress_lesson_count=aggregate(func.count(ProgressRecord.id)),
+                progress_pages_covered=func.coalesce(
+                    aggregate(func.sum(ProgressRecord.end_page - ProgressRecord.start_page + 1)), 0
+                ),
+                progress_first_lesson_at=aggregate(func.min(Schedule.start_at)),
+                progress_last_lesson_at=aggregate(func.max(Schedule.start_at)),
+                # 진도 집계 갱신은 교재 정보 수정이 아니므로 updated_at 유지
+                updated_at=Textbook.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     @staticmethod
     def create_textbook(
         db: Session,
@@ -175,6 +217,7 @@ class TextbookService:
 
         textbooks = query.order_by(Textbook.created_at.desc()).all()
 
+        # 현재 진도/진도율은 교재의 집계 컬럼에서 계산 (교재별 추가 쿼리 없음)
         return [TextbookService._build_textbook_out(db, tb) for tb in textbooks]
 
     @staticmethod
@@ -323,8 +366,16 @@ class TextbookService:
                 detail={"code": "TEXTBOOK_NOT_FOUND", "message": "교재를 찾을 수 없습니다."}
             )
 
-        # 진도 기록 조회
-        progress_records = db.query(ProgressRecord).join(
+        # 히스토리/차트: 진도 기록 + 수업 날짜 + 내용 미리보기를 조인 쿼리 1회로 조회
+        # (미리보기는 51자까지만 가져와 50자 초과 여부만 판단)
+        rows = db.query(
+            ProgressRecord.id,
+            ProgressRecord.lesson_record_id,
+            ProgressRecord.start_page,
+            ProgressRecord.end_page,
+            Schedule.start_at,
+            func.substr(LessonRecord.content, 1, TextbookService.CONTENT_PREVIEW_LENGTH + 1).label("content_head"),
+        ).join(
             LessonRecord, ProgressRecord.lesson_record_id == LessonRecord.id
         ).join(
             Schedule, LessonRecord.schedule_id == Schedule.id
@@ -332,45 +383,39 @@ class TextbookService:
             ProgressRecord.textbook_id == textbook_id
         ).order_by(Schedule.start_at.asc()).all()
 
-        # 진도 요약 계산
-        if progress_records:
-            current_page = max(pr.end_page for pr in progress_records)
-            total_lessons = len(progress_records)
-            total_pages_covered = sum(pr.pages_covered for pr in progress_records)
-            average_pages_per_lesson = total_pages_covered / total_lessons if total_lessons > 0 else 0.0
-
-            # 진도율 계산
-            if textbook.total_pages:
-                progress_percentage = round((current_page / textbook.total_pages) * 100, 1)
-            else:
-                progress_percentage = 0.0
-
-            # 첫/마지막 수업 날짜
-            first_lesson = db.query(Schedule).join(
-                LessonRecord, Schedule.id == LessonRecord.schedule_id
-            ).join(
-                ProgressRecord, LessonRecord.id == ProgressRecord.lesson_record_id
-            ).filter(
-                ProgressRecord.textbook_id == textbook_id
-            ).order_by(Schedule.start_at.asc()).first()
+        history = []
+        chart_labels = []
+        chart_values = []
 
-            last_lesson = db.query(Schedule).join(
-                LessonRecord, Schedule.id == LessonRecord.schedule_id
-            ).join(
-                ProgressRecord, LessonRecord.id == ProgressRecord.lesson_record_id
-            ).filter(
-                ProgressRecord.textbook_id == textbook_id
-            ).order_by(Schedule.start_at.desc()).first()
+        for row in rows:
+            content_preview = row.content_head
+            if content_preview and len(content_preview) > TextbookService.CONTENT_PREVIEW_LENGTH:
+                content_preview = content_preview[:TextbookService.CONTENT_PREVIEW_LENGTH] + "..."
+
+            history.append(ProgressHistoryItem(
+                progress_record_id=row.id,
+                lesson_record_id=row.lesson_record_id,
+                lesson_date=row.start_at.date().isoformat(),
+                start_page=row.start_page,
+                end_page=row.end_page,
+                pages_covered=row.end_page - row.start_page + 1,
+                content_preview=content_preview,
+            ))
+
+            # 차트 데이터 (날짜별 누적 진도)
+            chart_labels.append(row.start_at.strftime("%m/%d"))
+            chart_values.append(row.end_page)
 
-            first_lesson_date = first_lesson.start_at.date().isoformat() if first_lesson else None
-            last_lesson_date = last_lesson.start_at.date().isoformat() if last_lesson else None
+        # 진도 요약: 교재에 유지되는 집계 컬럼 사용 (집계 쿼리 없음)
+        current_page, progress_percentage = TextbookService._current_progress(textbook)
+        total_lessons = textbook.progress_lesson_count or 0
+        if total_lessons:
+            average_pages_per_lesson = textbook.progress_pages_covered / total_lessons
         else:
-            current_page = textbook.start_page
-            total_lessons = 0
             average_pages_per_lesson = 0.0
-            progress_percentage = 0.0
-            first_lesson_date = None
-            last_lesson_date = None
+
+        first_lesson_at = textbook.progress_first_lesson_at
+        last_lesson_at = textbook.progress_last_lesson_at
 
         summary = ProgressSummary(
             textbook_id=textbook.id,
@@ -379,46 +424,13 @@ class TextbookService:
             total_pages=textbook.total_pages,
             start_page=textbook.start_page,
             current_page=current_page,
-            progress_percentage=progress_percentage,
+            progress_percentage=progress_percentage or 0.0,
             total_lessons=total_lessons,
             average_pages_per_lesson=round(average_pages_per_lesson, 1),
-            first_lesson_date=first_lesson_date,
-            last_lesson_date=last_lesson_date,
+            first_lesson_date=first_lesson_at.date().isoformat() if first_lesson_at else None,
+            last_lesson_date=last_lesson_at.date().isoformat() if last_lesson_at else None,
         )
 
-        # 진도 히스토리 구성
-        history = []
-        for pr in progress_records:
-            lesson = db.query(LessonRecord).filter(LessonRecord.id == pr.lesson_record_id).first()
-            schedule = db.query(Schedule).filter(Schedule.id == lesson.schedule_id).first() if lesson else None
-
-            content_preview = lesson.content[:50] + "..." if lesson and len(lesson.content) > 50 else lesson.content if lesson else None
-
-            history.append(ProgressHistoryItem(
-                progress_record_id=pr.id,
-                lesson_record_id=pr.lesson_record_id,
-                lesson_date=schedule.start_at.date().isoformat() if schedule else None,
-                start_page=pr.start_page,
-                end_page=pr.end_page,
-                pages_covered=pr.pages_covered,
-                content_preview=content_preview,
-            ))
-
-        # 차트 데이터 (날짜별 누적 진도)
-        chart_labels = []
-        chart_values = []
-        cumulative_page = textbook.start_page
-
-        for pr in progress_records:
-            lesson = db.query(LessonRecord).filter(LessonRecord.id == pr.lesson_record_id).first()
-            schedule = db.query(Schedule).filter(Schedule.id == lesson.schedule_id).first() if lesson else None
-
-            if schedule:
-                label = schedule.start_at.strftime("%m/%d")
-                chart_labels.append(label)
-                cumulative_page = pr.end_page
-                chart_values.append(cumulative_page)
-
         return ProgressHistoryResponse(
             summary=summary,
             history=history,
@@ -426,6 +438,23 @@ class TextbookService:
             chart_values=chart_values if chart_values else None,
         )
 
+    @staticmethod
+    def _current_progress(textbook: Textbook):
+        """
+        현재 진도와 진도율 (비정규화 집계 컬럼 기준, 쿼리 없음)
+
+        Returns:
+            Tuple[int, Optional[float]]: (현재 페이지, 진도율 - 전체 페이지 미입력 시 None)
+        """
+        current_page = textbook.progress_current_page or textbook.start_page
+
+        if textbook.total_pages:
+            progress_percentage = round((current_page / textbook.total_pages) * 100, 1)
+        else:
+            progress_percentage = None
+
+        return current_page, progress_percentage
+
     @staticmethod
     def _build_textbook_out(db: Session, textbook: Textbook) -> TextbookOut:
         """
@@ -438,18 +467,7 @@ class TextbookService:
         Returns:
             TextbookOut: 응답 스키마
         """
-        # 현재 진도 계산 (마지막 end_page)
-        last_progress = db.query(ProgressRecord).filter(
-            ProgressRecord.textbook_id == textbook.id
-        ).order_by(ProgressRecord.created_at.desc()).first()
-
-        current_page = last_progress.end_page if last_progress else textbook.start_page
-
-        # 진도율 계산
-        if textbook.total_pages:
-            progress_percentage = round((current_page / textbook.total_pages) * 100, 1)
-        else:
-            progress_percentage = None
+        current_page, progress_percentage = TextbookService._current_progress(textbook)
 
         return TextbookOut(
             textbook_id=textbook.id,
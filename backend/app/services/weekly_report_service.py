@@ -0,0 +1,375 @@
+"""
+Weekly Report Service - 학부모 주간 학습 리포트
+자녀별 한 주간 수업 기록, 숙제, 출결, 교재 진도를 모아 이메일로 발송
+
+파이프라인 (1회 실행):
+1. collect: 대상 학부모와 그 주의 일정/수업 기록/출결/진도를 일괄 쿼리 5회로 조회
+   (그룹/가족 수와 무관하게 쿼리 수 일정, 그룹 조건은 IN 목록 대신 서브쿼리)
+2. render: 학부모별 리포트 HTML을 EmailTemplate으로 렌더링 (프로세스 풀)
+3. send: EmailService.send_bulk로 SMTP 연결을 재사용해 일괄 발송
+
+단계별 소요 시간과 건수를 metrics로 반환하고 로그로 남깁니다.
+실행: scripts/send_weekly_reports.py (cron 등에서 매주 월요일)
+"""
+
+import logging
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, date, timedelta, time as dt_time
+from html import escape
+from typing import Optional, Dict, List, Any, Tuple
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, or_, func
+
+from app.config import settings
+from app.models.user import User
+from app.models.settings import Settings
+from app.models.group import Group, GroupMember, GroupMemberRole, GroupMemberInviteStatus
+from app.models.schedule import Schedule, ScheduleStatus
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.lesson import LessonRecord, ProgressRecord
+from app.models.textbook import Textbook
+from app.services.email_service import EmailService, EmailTemplate, email_service
+
+logger = logging.getLogger(__name__)
+
+
+ATTENDANCE_LABELS = {
+    AttendanceStatus.PRESENT.value: "출석",
+    AttendanceStatus.LATE.value: "지각",
+    AttendanceStatus.EARLY_LEAVE.value: "조퇴",
+    AttendanceStatus.ABSENT.value: "결석",
+}
+
+WEEKDAY_LABELS = "월화수목금토일"
+
+CONTENT_PREVIEW_LENGTH = 200  # 리포트에 표시할 수업 내용 길이
+PARALLEL_RENDER_MIN_REPORTS = 200  # 이보다 적으면 프로세스 풀 없이 렌더링
+
+
+# ==========================
+# Rendering (프로세스 풀에서 실행되므로 모듈 수준 함수)
+# ==========================
+
+def _render_child_section(child: Dict[str, Any]) -> str:
+    """자녀 1명 x 그룹 1개 섹션 HTML"""
+    lessons_html = "".join(
+        "<li><strong>{date} {title}</strong>{attendance}<br>{content}{homework}</li>".format(
+            date=escape(lesson["date"]),
+            title=escape(lesson["title"]),
+            attendance=f" ({ATTENDANCE_LABELS.get(lesson['attendance'], '미기록')})" if lesson["attendance"] else "",
+            content=escape(lesson["content"]) if lesson["content"] else "<em>수업 기록 없음</em>",
+            homework=f"<br>📚 숙제: {escape(lesson['homework'])}" if lesson["homework"] else "",
+        )
+        for lesson in child["lessons"]
+    )
+
+    counts = child["attendance_counts"]
+    attendance_html = " · ".join(
+        f"{label} {counts[status]}회" for status, label in ATTENDANCE_LABELS.items() if counts.get(status)
+    ) or "기록 없음"
+
+    progress_html = "".join(
+        "<li>{title}: {start}~{end}쪽{current}</li>".format(
+            title=escape(item["title"]),
+            start=item["start_page"],
+            end=item["end_page"],
+            current=(
+                f" (현재 {item['current_page']}/{item['total_pages']}쪽)"
+                if item["total_pages"] and item["current_page"] else ""
+            ),
+        )
+        for item in child["progress"]
+    )
+
+    return (
+        f"<h3>{escape(child['student_name'])} · {escape(child['group_name'])}</h3>"
+        f"<p><strong>출결:</strong> {attendance_html}</p>"
+        f"<ul>{lessons_html}</ul>"
+        + (f"<p><strong>교재 진도</strong></p><ul>{progress_html}</ul>" if progress_html else "")
+    )
+
+
+def render_report(payload: Dict[str, Any]) -> Dict[str, str]:
+    """
+    학부모 1명의 주간 리포트 렌더링
+
+    Args:
+        payload: WeeklyReportService.collect()가 만든 학부모별 데이터
+
+    Returns:
+        Dict: to_email, subject, html_body (EmailService.send_bulk 입력)
+    """
+    rendered = EmailTemplate.render(
+        notification_type="WEEKLY_PARENT_REPORT",
+        title=f"{payload['week_label']} 주간 학습 리포트",
+        message=f"{escape(payload['parent_name'])}님, 지난 한 주 자녀의 수업 내용을 정리해 드립니다.",
+        extra_data={"report_body": "".join(_render_child_section(child) for child in payload["children"])},
+    )
+    return {
+        "to_email": payload["to_email"],
+        "subject": rendered["subject"],
+        "html_body": rendered["html_body"],
+    }
+
+
+class WeeklyReportService:
+    """
+    학부모 주간 리포트 서비스 레이어
+    """
+
+    # ==========================
+    # Collect
+    # ==========================
+
+    @staticmethod
+    def week_bounds(week_start: Optional[date] = None, today: Optional[date] = None) -> Tuple[datetime, datetime]:
+        """
+        리포트 대상 주간 [시작일 00:00, 7일 뒤 00:00)
+
+        Args:
+            week_start: 주 시작일 (기본: 지난주 월요일)
+            today: 기준일 (기본: 오늘, UTC)
+        """
+        if week_start is None:
+            today = today or datetime.utcnow().date()
+            week_start = today - timedelta(days=today.weekday() + 7)
+        start = datetime.combine(week_start, dt_time.min)
+        return start, start + timedelta(days=7)
+
+    @staticmethod
+    def collect(db: Session, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """
+        주간 리포트 데이터 일괄 조회 (쿼리 5회)
+
+        - 이메일 알림을 끄지 않은 활성 학부모만 대상
+        - 자녀: 학부모 멤버의 student_id (미연결이면 학생이 1명인 그룹에서 그 학생)
+        - 그 주에 수업(취소 제외)이 없는 자녀 섹션은 생략, 섹션이 없는 학부모는 제외
+
+        Returns:
+            List[Dict]: 학부모별 리포트 데이터 (프로세스 풀로 전달 가능한 기본 타입만 사용)
+        """
+        # 1. 대상 학부모 멤버십 (이메일 수신 설정 확인)
+        parent_rows = db.query(
+            GroupMember.group_id,
+            GroupMember.user_id,
+            GroupMember.student_id,
+            User.email,
+            User.name,
+        ).join(
+            User, User.id == GroupMember.user_id
+        ).outerjoin(
+            Settings, Settings.user_id == User.id
+        ).filter(
+            GroupMember.role == GroupMemberRole.PARENT,
+            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
+            User.is_active == True,
+            or_(Settings.email_enabled.is_(None), Settings.email_enabled == True),
+        ).all()
+
+        if not parent_rows:
+            return []
+
+        report_groups = select(GroupMember.group_id).where(
+            GroupMember.role == GroupMemberRole.PARENT,
+            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
+        )
+
+        # 2. 대상 그룹의 학생 + 그룹명
+        students: Dict[str, Dict[str, str]] = defaultdict(dict)
+        group_names: Dict[str, str] = {}
+        for group_id, student_id, student_name, group_name in db.query(
+            GroupMember.group_id, GroupMember.user_id, User.name, Group.name,
+        ).join(
+            User, User.id == GroupMember.user_id
+        ).join(
+            Group, Group.id == GroupMember.group_id
+        ).filter(
+            GroupMember.role == GroupMemberRole.STUDENT,
+            GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
+            GroupMember.group_id.in_(report_groups),
+        ).all():
+            students[group_id][student_id] = student_name
+            group_names[group_id] = group_name
+
+        week_filters = (
+            Schedule.group_id.in_(report_groups),
+            Schedule.start_at >= start,
+            Schedule.start_at < end,
+            Schedule.status != ScheduleStatus.CANCELED,
+        )
+
+        # 3. 주간 수업 + 수업 기록
+        lessons: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in db.query(
+            Schedule.id,
+            Schedule.group_id,
+            Schedule.title,
+            Schedule.start_at,
+            func.substr(LessonRecord.content, 1, CONTENT_PREVIEW_LENGTH).label("content"),
+            LessonRecord.homework,
+        ).outerjoin(
+            LessonRecord, LessonRecord.schedule_id == Schedule.id
+        ).filter(*week_filters).order_by(Schedule.start_at).all():
+            lessons[row.group_id].append({
+                "schedule_id": row.id,
+                "date": f"{row.start_at:%m/%d}({WEEKDAY_LABELS[row.start_at.weekday()]}) {row.start_at:%H:%M}",
+                "title": row.title,
+                "content": row.content,
+                "homework": row.homework,
+            })
+
+        # 4. 주간 출결 (일정, 학생)별 상태
+        attendance: Dict[Tuple[str, str], str] = {
+            (schedule_id, student_id): AttendanceStatus(status).value
+            for schedule_id, student_id, status in db.query(
+                Attendance.schedule_id, Attendance.student_id, Attendance.status,
+            ).join(
+                Schedule, Schedule.id == Attendance.schedule_id
+            ).filter(*week_filters).all()
+        }
+
+        # 5. 주간 교재 진도 (그룹, 교재)별 범위 + 현재 진도(비정규화 집계)
+        progress: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in db.query(
+            Schedule.group_id,
+            Textbook.title,
+            Textbook.total_pages,
+            Textbook.progress_current_page,
+            func.min(ProgressRecord.start_page).label("start_page"),
+            func.max(ProgressRecord.end_page).label("end_page"),
+        ).join(
+            LessonRecord, ProgressRecord.lesson_record_id == LessonRecord.id
+        ).join(
+            Schedule, LessonRecord.schedule_id == Schedule.id
+        ).join(
+            Textbook, ProgressRecord.textbook_id == Textbook.id
+        ).filter(*week_filters).group_by(
+            Schedule.group_id, Textbook.id, Textbook.title, Textbook.total_pages, Textbook.progress_current_page
+        ).all():
+            progress[row.group_id].append({
+                "title": row.title,
+                "start_page": row.start_page,
+                "end_page": row.end_page,
+                "current_page": row.progress_current_page,
+                "total_pages": row.total_pages,
+            })
+
+        # 학부모별로 조립 (한 학부모가 여러 그룹/자녀를 가질 수 있음)
+        week_label = f"{start:%m/%d}~{end - timedelta(days=1):%m/%d}"
+        reports: Dict[str, Dict[str, Any]] = {}
+        for group_id, parent_id, linked_student_id, email, parent_name in parent_rows:
+            group_lessons = lessons.get(group_id)
+            group_students = students.get(group_id, {})
+            if not group_lessons:
+                continue
+
+            if linked_student_id in group_students:
+                child_ids = [linked_student_id]
+            elif len(group_students) == 1:
+                child_ids = list(group_students)
+            else:
+                continue
+
+            report = reports.setdefault(parent_id, {
+                "to_email": email,
+                "parent_name": parent_name,
+                "week_label": week_label,
+                "children": [],
+            })
+            for student_id in child_ids:
+                child_lessons = [
+                    dict(lesson, attendance=attendance.get((lesson["schedule_id"], student_id)))
+                    for lesson in group_lessons
+                ]
+                counts: Dict[str, int] = defaultdict(int)
+                for lesson in child_lessons:
+                    if lesson["attendance"]:
+                        counts[lesson["attendance"]] += 1
+
+                report["children"].append({
+                    "student_name": group_students[student_id],
+                    "group_name": group_names.get(group_id, ""),
+                    "lessons": child_lessons,
+                    "attendance_counts": dict(counts),
+                    "progress": progress.get(group_id, []),
+                })
+
+        return list(reports.values())
+
+    # ==========================
+    # Render / Send
+    # ==========================
+
+    @staticmethod
+    def render_all(payloads: List[Dict[str, Any]], workers: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        리포트 렌더링 (리포트 수가 많으면 프로세스 풀, 순서 유지)
+
+        Args:
+            payloads: collect() 결과
+            workers: 프로세스 수 (기본: WEEKLY_REPORT_RENDER_WORKERS, 0이면 CPU 수)
+        """
+        if workers is None:
+            workers = settings.WEEKLY_REPORT_RENDER_WORKERS or os.cpu_count() or 1
+
+        if workers <= 1 or len(payloads) < PARALLEL_RENDER_MIN_REPORTS:
+            return [render_report(payload) for payload in payloads]
+
+        chunksize = max(1, len(payloads) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(render_report, payloads, chunksize=chunksize))
+
+    @staticmethod
+    def run(
+        db: Session,
+        week_start: Optional[date] = None,
+        send: bool = True,
+        workers: Optional[int] = None,
+        mailer: Optional[EmailService] = None,
+    ) -> Dict[str, Any]:
+        """
+        주간 리포트 1회 실행 (조회 → 렌더링 → 발송)
+
+        Args:
+            db: 데이터베이스 세션
+            week_start: 주 시작일 (기본: 지난주 월요일)
+            send: False면 렌더링까지만 (dry run)
+            workers: 렌더링 프로세스 수
+            mailer: 이메일 서비스 (기본: 전역 email_service)
+
+        Returns:
+            Dict: 단계별 소요 시간(ms)과 건수
+        """
+        start, end = WeeklyReportService.week_bounds(week_start)
+        started = time.perf_counter()
+
+        payloads = WeeklyReportService.collect(db, start, end)
+        collected = time.perf_counter()
+
+        rendered = WeeklyReportService.render_all(payloads, workers=workers)
+        rendered_at = time.perf_counter()
+
+        if send and rendered:
+            send_result = (mailer or email_service).send_bulk(
+                rendered, batch_size=settings.WEEKLY_REPORT_EMAIL_BATCH_SIZE
+            )
+        else:
+            send_result = {"sent": 0, "failed": 0, "skipped": len(rendered)}
+        finished = time.perf_counter()
+
+        metrics = {
+            "week_start": start.date().isoformat(),
+            "families": len(payloads),
+            "children": sum(len(payload["children"]) for payload in payloads),
+            "collect_ms": round((collected - started) * 1000, 1),
+            "render_ms": round((rendered_at - collected) * 1000, 1),
+            "send_ms": round((finished - rendered_at) * 1000, 1),
+            "total_ms": round((finished - started) * 1000, 1),
+            **send_result,
+        }
+        logger.info("Weekly parent reports: %s", metrics)
+        return metrics
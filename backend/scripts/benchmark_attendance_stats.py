@@ -0,0 +1,200 @@
+"""
+F-004 출결 통계 벤치마크 스크립트
+
+수년치 수업 기록이 쌓인 그룹에서 AttendanceService.get_attendance_stats의
+응답 시간과 쿼리 수를 측정합니다. 기존 방식(일정 ID 목록 IN + 행 전체 로드 +
+최근 기록별 일정 조회)과 현재 SQL 집계 방식을 같은 데이터로 비교합니다.
+
+- 개발 DB를 건드리지 않도록 임시 SQLite 파일에 데이터를 생성합니다.
+
+실행 방법:
+    cd backend
+    python scripts/benchmark_attendance_stats.py --years 3 --students 8 --iterations 20
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+import app.models  # noqa: F401  (모든 테이블 등록)
+from app.models.user import User, UserRole
+from app.models.group import Group, GroupMember, GroupMemberRole, GroupMemberInviteStatus
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.attendance import Attendance, AttendanceStatus
+from app.services.attendance_service import AttendanceService
+
+
+STATUS_CYCLE = [
+    AttendanceStatus.PRESENT,
+    AttendanceStatus.PRESENT,
+    AttendanceStatus.PRESENT,
+    AttendanceStatus.LATE,
+    AttendanceStatus.PRESENT,
+    AttendanceStatus.EARLY_LEAVE,
+    AttendanceStatus.PRESENT,
+    AttendanceStatus.ABSENT,
+]
+
+
+def seed(db, years: int, students: int, lessons_per_week: int):
+    """선생님 1명 + 학생 N명 그룹에 수년치 일정/출결 생성"""
+    now = datetime.utcnow()
+
+    teacher = User(email="bench-teacher@example.com", password_hash="x", name="벤치 선생님", role=UserRole.TEACHER)
+    db.add(teacher)
+    db.flush()
+
+    group = Group(name="벤치마크 반", subject="수학", owner_id=teacher.id)
+    db.add(group)
+    db.flush()
+
+    student_ids = []
+    db.add(GroupMember(group_id=group.id, user_id=teacher.id, role=GroupMemberRole.TEACHER,
+                       invite_status=GroupMemberInviteStatus.ACCEPTED))
+    for i in range(students):
+        student = User(email=f"bench-student-{i}@example.com", password_hash="x", name=f"학생{i}",
+                       role=UserRole.STUDENT)
+        db.add(student)
+        db.flush()
+        student_ids.append(student.id)
+        db.add(GroupMember(group_id=group.id, user_id=student.id, role=GroupMemberRole.STUDENT,
+                           invite_status=GroupMemberInviteStatus.ACCEPTED))
+    db.commit()
+
+    schedule_rows = []
+    attendance_rows = []
+    interval = timedelta(days=7 / lessons_per_week)
+    start_at = now - timedelta(days=365 * years)
+    index = 0
+    while start_at < now:
+        schedule_id = str(uuid.uuid4())
+        end_at = start_at + timedelta(hours=2)
+        schedule_rows.append({
+            "id": schedule_id,
+            "group_id": group.id,
+            "title": f"정규 수업 {index + 1}",
+            "type": ScheduleType.REGULAR,
+            "start_at": start_at,
+            "end_at": end_at,
+            "status": ScheduleStatus.DONE,
+        })
+        for j, student_id in enumerate(student_ids):
+            attendance_rows.append({
+                "id": str(uuid.uuid4()),
+                "schedule_id": schedule_id,
+                "student_id": student_id,
+                "status": STATUS_CYCLE[(index + j) % len(STATUS_CYCLE)],
+                "recorded_at": end_at + timedelta(minutes=5),
+                "updated_at": end_at + timedelta(minutes=5),
+            })
+        start_at += interval
+        index += 1
+
+    db.execute(insert(Schedule), schedule_rows)
+    db.execute(insert(Attendance), attendance_rows)
+    db.commit()
+
+    return teacher, group, student_ids, len(schedule_rows), len(attendance_rows)
+
+
+def legacy_attendance_stats(db, group_id, student_id, start_date, end_date):
+    """기존 구현 (비교용): 일정 ID IN + 전체 로드 + Python 집계 + 최근 기록별 일정 조회"""
+    schedule_ids = [s.id for s in db.query(Schedule.id).filter(Schedule.group_id == group_id).all()]
+    query = db.query(Attendance).filter(Attendance.schedule_id.in_(schedule_ids))
+    if student_id:
+        query = query.filter(Attendance.student_id == student_id)
+    from_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    to_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+    attendances = query.filter(Attendance.recorded_at >= from_dt, Attendance.recorded_at < to_dt).all()
+
+    counts = {s: len([a for a in attendances if a.status == s]) for s in AttendanceStatus}
+    recent = sorted(attendances, key=lambda a: a.recorded_at, reverse=True)[:10]
+    for att in recent:
+        db.query(Schedule).filter(Schedule.id == att.schedule_id).first()
+    return len(attendances), counts
+
+
+def measure(label, func, iterations, counter):
+    """평균 소요 시간(ms)과 1회당 쿼리 수 출력"""
+    func()  # 워밍업
+    counter["count"] = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed_ms = (time.perf_counter() - started) * 1000 / iterations
+    queries = counter["count"] / iterations
+    print(f"   {label:<42} {elapsed_ms:>9.2f} ms   {queries:>6.1f} queries")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="출결 통계 벤치마크")
+    parser.add_argument("--years", type=int, default=3, help="수업 기록 기간 (년)")
+    parser.add_argument("--students", type=int, default=8, help="그룹 학생 수")
+    parser.add_argument("--lessons-per-week", type=int, default=2, help="주당 수업 횟수")
+    parser.add_argument("--iterations", type=int, default=20, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+        counter = {"count": 0}
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def count_queries(conn, cursor, statement, params, context, executemany):
+            counter["count"] += 1
+
+        db = Session()
+        try:
+            print("🌱 Seeding benchmark data...")
+            teacher, group, student_ids, schedule_count, attendance_count = seed(
+                db, args.years, args.students, args.lessons_per_week
+            )
+            print(f"   schedules={schedule_count} attendances={attendance_count}")
+
+            today = datetime.utcnow().strftime("%Y-%m-%d")
+            month_start = datetime.utcnow().replace(day=1).strftime("%Y-%m-%d")
+            all_time = (datetime.utcnow() - timedelta(days=365 * args.years + 1)).strftime("%Y-%m-%d")
+            student_id = student_ids[0]
+
+            cases = [
+                ("group, current month", None, month_start, today),
+                ("group, full history", None, all_time, today),
+                ("student, full history", student_id, all_time, today),
+            ]
+
+            print(f"\n📊 get_attendance_stats ({args.iterations} iterations)")
+            for label, sid, start_date, end_date in cases:
+                measure(
+                    f"legacy  | {label}",
+                    lambda: legacy_attendance_stats(db, group.id, sid, start_date, end_date),
+                    args.iterations,
+                    counter,
+                )
+                measure(
+                    f"current | {label}",
+                    lambda: AttendanceService.get_attendance_stats(
+                        db, teacher, group.id, student_id=sid, start_date=start_date, end_date=end_date
+                    ),
+                    args.iterations,
+                    counter,
+                )
+        finally:
+            db.close()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+로그인 처리량 벤치마크 스크립트 (bcrypt 전용 스레드 풀 크기별)
+
+FastAPI 요청 스레드 풀(기본 40개)에서 로그인 요청이 한꺼번에 몰리는 상황을 재현해
+비밀번호 검증(verify_and_update_password)을 요청 스레드에서 직접 실행하는 경우(pool=0)와
+전용 스레드 풀 크기별로 처리량(logins/s), 응답 시간(p50/p95), 대기열 깊이를 비교합니다.
+
+- DB 없이 비밀번호 검증만 측정합니다. (로그인 1회의 대부분을 차지하는 작업)
+- 동시 해싱 수가 CPU 코어 수를 넘으면 처리량은 늘지 않고 응답 시간만 늘어나는 것을 확인할 수 있습니다.
+
+실행 방법:
+    cd backend
+    python scripts/benchmark_login_throughput.py --rounds 12 --logins 200 --pool-sizes 0,1,2,4,8
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from passlib.context import CryptContext
+
+from app.core import security
+from app.core.hash_executor import HashExecutor
+
+
+def run_burst(logins: int, request_threads: int, stored_hash: str, pool_size: int):
+    """요청 스레드 풀에서 로그인 N건을 동시에 처리하고 (처리량, 응답 시간 목록, 풀 통계) 반환"""
+    if pool_size > 0:
+        hasher = HashExecutor(max_workers=pool_size, name=f"bench-hash-{pool_size}")
+        security.password_hasher = hasher
+
+        def login():
+            started = time.perf_counter()
+            verified, _ = security.verify_and_update_password("password123", stored_hash)
+            assert verified
+            return time.perf_counter() - started
+    else:
+        hasher = None
+
+        def login():
+            started = time.perf_counter()
+            verified, _ = security.pwd_context.verify_and_update(b"password123", stored_hash)
+            assert verified
+            return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=request_threads) as requests:
+        latencies = list(requests.map(lambda _: login(), range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stats = hasher.stats() if hasher else None
+    if hasher:
+        hasher.shutdown()
+    return logins / elapsed, latencies, stats
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 처리량 벤치마크 (bcrypt 스레드 풀 크기별)")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt 비용 (BCRYPT_ROUNDS)")
+    parser.add_argument("--logins", type=int, default=200, help="동시에 몰리는 로그인 수")
+    parser.add_argument("--request-threads", type=int, default=40, help="요청 스레드 수 (FastAPI 기본 40)")
+    parser.add_argument("--pool-sizes", default="0,1,2,4,8", help="비교할 전용 풀 크기 (0 = 요청 스레드에서 직접 실행)")
+    args = parser.parse_args()
+
+    context = CryptContext(
+        schemes=["bcrypt"],
+        bcrypt__default_rounds=args.rounds,
+        bcrypt__min_rounds=args.rounds,
+        bcrypt__max_rounds=args.rounds,
+    )
+    security.pwd_context = context
+    stored_hash = context.hash(b"password123")
+
+    print(f"🔐 bcrypt rounds={args.rounds}, logins={args.logins}, request threads={args.request_threads}, "
+          f"CPU cores={os.cpu_count()}")
+    print(f"{'pool':>6} {'logins/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'max queue':>10} {'avg wait ms':>12}")
+
+    for pool_size in [int(size) for size in args.pool_sizes.split(",")]:
+        throughput, latencies, stats = run_burst(args.logins, args.request_threads, stored_hash, pool_size)
+        print(
+            f"{pool_size or 'inline':>6} {throughput:>10.1f} "
+            f"{statistics.median(latencies) * 1000:>9.1f} {percentile(latencies, 0.95) * 1000:>9.1f} "
+            f"{stats['max_queue_depth'] if stats else '-':>10} {stats['avg_wait_ms'] if stats else '-':>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
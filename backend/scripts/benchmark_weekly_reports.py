@@ -0,0 +1,191 @@
+"""
+학부모 주간 리포트 벤치마크 스크립트
+
+가족(선생님 1 + 학생 1 + 학부모 1, 그룹 1개) N개에 한 주치 수업 기록/출결/진도를 만들고
+WeeklyReportService의 단계별 소요 시간과 쿼리 수를 측정합니다.
+가족별로 조회하는 방식(가족당 쿼리 여러 번)과 현재 일괄 조회 방식을 비교하고,
+렌더링은 단일 프로세스와 프로세스 풀을 비교합니다. 이메일은 발송하지 않습니다.
+
+- 개발 DB를 건드리지 않도록 임시 SQLite 파일에 데이터를 생성합니다.
+
+실행 방법:
+    cd backend
+    python scripts/benchmark_weekly_reports.py --families 10000 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+import app.models  # noqa: F401  (모든 테이블 등록)
+from app.models.user import User, UserRole
+from app.models.group import Group, GroupMember, GroupMemberRole, GroupMemberInviteStatus
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.lesson import LessonRecord, ProgressRecord
+from app.models.textbook import Textbook
+from app.services.weekly_report_service import WeeklyReportService, render_report
+
+
+SEED_BATCH_SIZE = 2000
+
+
+def seed(db, families: int, week_start: datetime):
+    """가족 N개 생성 (가족당 주 2회 수업, 수업 기록/출결/진도 포함)"""
+    rows = {model: [] for model in (User, Group, GroupMember, Schedule, LessonRecord, Attendance, Textbook, ProgressRecord)}
+
+    def new_id():
+        return str(uuid.uuid4())
+
+    for i in range(families):
+        teacher_id, student_id, parent_id, group_id, textbook_id = (new_id() for _ in range(5))
+        rows[User] += [
+            {"id": teacher_id, "email": f"t{i}@example.com", "password_hash": "x", "name": f"선생님{i}",
+             "role": UserRole.TEACHER},
+            {"id": student_id, "email": f"s{i}@example.com", "password_hash": "x", "name": f"학생{i}",
+             "role": UserRole.STUDENT},
+            {"id": parent_id, "email": f"p{i}@example.com", "password_hash": "x", "name": f"학부모{i}",
+             "role": UserRole.PARENT},
+        ]
+        rows[Group].append({"id": group_id, "name": f"반{i}", "subject": "수학", "owner_id": teacher_id})
+        for user_id, role, linked in (
+            (teacher_id, GroupMemberRole.TEACHER, None),
+            (student_id, GroupMemberRole.STUDENT, None),
+            (parent_id, GroupMemberRole.PARENT, student_id),
+        ):
+            rows[GroupMember].append({
+                "id": new_id(), "group_id": group_id, "user_id": user_id, "role": role,
+                "invite_status": GroupMemberInviteStatus.ACCEPTED, "student_id": linked,
+            })
+        rows[Textbook].append({"id": textbook_id, "group_id": group_id, "title": "수학의 정석", "total_pages": 300,
+                               "progress_current_page": 40})
+
+        for lesson in range(2):
+            schedule_id, lesson_record_id = new_id(), new_id()
+            start_at = week_start + timedelta(days=lesson * 3, hours=16)
+            rows[Schedule].append({
+                "id": schedule_id, "group_id": group_id, "title": f"정규 수업 {lesson + 1}",
+                "type": ScheduleType.REGULAR, "start_at": start_at, "end_at": start_at + timedelta(hours=2),
+                "status": ScheduleStatus.DONE,
+            })
+            rows[LessonRecord].append({
+                "id": lesson_record_id, "schedule_id": schedule_id, "group_id": group_id,
+                "content": "이차방정식의 판별식과 근의 공식을 학습했습니다. " * 5,
+                "homework": "교재 30~35쪽 풀기", "created_by": teacher_id,
+            })
+            rows[Attendance].append({
+                "id": new_id(), "schedule_id": schedule_id, "student_id": student_id,
+                "status": AttendanceStatus.LATE if lesson else AttendanceStatus.PRESENT,
+                "recorded_at": start_at, "updated_at": start_at,
+            })
+            rows[ProgressRecord].append({
+                "id": new_id(), "lesson_record_id": lesson_record_id, "textbook_id": textbook_id,
+                "start_page": 30 + lesson * 5, "end_page": 35 + lesson * 5,
+            })
+
+    for model, model_rows in rows.items():
+        for start in range(0, len(model_rows), SEED_BATCH_SIZE):
+            db.execute(insert(model), model_rows[start:start + SEED_BATCH_SIZE])
+    db.commit()
+
+
+def legacy_collect(db, start, end):
+    """가족별 조회 방식 (비교용): 학부모 멤버십마다 자녀/일정/수업 기록/출결/진도를 따로 조회"""
+    payloads = []
+    parents = db.query(GroupMember).filter(
+        GroupMember.role == GroupMemberRole.PARENT,
+        GroupMember.invite_status == GroupMemberInviteStatus.ACCEPTED,
+    ).all()
+    for member in parents:
+        parent = db.query(User).filter(User.id == member.user_id).first()
+        student = db.query(User).filter(User.id == member.student_id).first()
+        group = db.query(Group).filter(Group.id == member.group_id).first()
+        schedules = db.query(Schedule).filter(
+            Schedule.group_id == member.group_id, Schedule.start_at >= start, Schedule.start_at < end,
+        ).order_by(Schedule.start_at).all()
+        lessons = []
+        for schedule in schedules:
+            record = db.query(LessonRecord).filter(LessonRecord.schedule_id == schedule.id).first()
+            attendance = db.query(Attendance).filter(
+                Attendance.schedule_id == schedule.id, Attendance.student_id == student.id
+            ).first()
+            if record:
+                db.query(ProgressRecord).filter(ProgressRecord.lesson_record_id == record.id).all()
+            lessons.append((schedule, record, attendance))
+        payloads.append((parent, student, group, lessons))
+    return payloads
+
+
+def measure(label, func, counter):
+    """소요 시간(ms)과 쿼리 수 출력, 결과 반환"""
+    counter["count"] = 0
+    started = time.perf_counter()
+    result = func()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"   {label:<42} {elapsed_ms:>10.1f} ms   {counter['count']:>7} queries")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="학부모 주간 리포트 벤치마크")
+    parser.add_argument("--families", type=int, default=10000, help="가족(학부모) 수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="렌더링 프로세스 수")
+    parser.add_argument("--skip-legacy", action="store_true", help="가족별 조회 방식 측정 생략")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+        counter = {"count": 0}
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def count_queries(conn, cursor, statement, params, context, executemany):
+            counter["count"] += 1
+
+        db = Session()
+        try:
+            start, end = WeeklyReportService.week_bounds()
+            print(f"🌱 Seeding {args.families} families (week of {start.date()})...")
+            seed(db, args.families, start)
+
+            print("\n📊 collect")
+            if not args.skip_legacy:
+                measure("legacy  | per-family queries", lambda: legacy_collect(db, start, end), counter)
+                db.expire_all()
+            payloads = measure("current | bulk queries", lambda: WeeklyReportService.collect(db, start, end), counter)
+            print(f"   families={len(payloads)} children={sum(len(p['children']) for p in payloads)}")
+
+            print("\n📊 render")
+            measure("single process", lambda: [render_report(p) for p in payloads], counter)
+            measure(
+                f"process pool ({args.workers} workers)",
+                lambda: WeeklyReportService.render_all(payloads, workers=args.workers),
+                counter,
+            )
+
+            print("\n📊 run (dry run, no email)")
+            metrics = WeeklyReportService.run(db, week_start=start.date(), send=False, workers=args.workers)
+            print(
+                f"   collect {metrics['collect_ms']}ms · render {metrics['render_ms']}ms · "
+                f"total {metrics['total_ms']}ms"
+            )
+        finally:
+            db.close()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+만료된 Refresh Token 정리 스크립트 (cron 등 외부 스케줄러용)
+
+API 서버의 백그라운드 워커(REFRESH_TOKEN_PURGE_ENABLED)를 끄고
+외부에서 주기 실행하고 싶을 때 사용합니다.
+
+Usage:
+    python scripts/purge_refresh_tokens.py
+"""
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services.refresh_token_service import RefreshTokenService
+
+
+def main():
+    result = RefreshTokenService.run_purge_once()
+    print("🧹 Refresh token purge finished")
+    print(f"   🗑️  Purged: {result['purged']}")
+    print(f"   📦 Batches: {result['batches']}")
+    print(f"   ⏱️  Duration: {result['duration_ms']}ms")
+
+
+if __name__ == "__main__":
+    main()
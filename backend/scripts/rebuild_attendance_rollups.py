@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+F-004 출결 월간 집계 재계산/검증 스크립트
+
+attendance_monthly_rollups 테이블을 원본 출결(attendances)로부터 다시 만들고,
+재계산 후 원본과 일치하는지 검증합니다.
+
+- 집계 테이블 도입 시 기존 데이터 백필
+- 운영 중 집계 불일치 점검 (--verify-only)
+
+Usage:
+    python scripts/rebuild_attendance_rollups.py                  # 전체 재계산 + 검증
+    python scripts/rebuild_attendance_rollups.py --group-id <ID>  # 특정 그룹만
+    python scripts/rebuild_attendance_rollups.py --verify-only    # 검증만 (불일치 시 exit 1)
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal, init_db
+from app.services.attendance_rollup_service import AttendanceRollupService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="출결 월간 집계 재계산/검증")
+    parser.add_argument("--group-id", help="특정 그룹만 처리")
+    parser.add_argument("--verify-only", action="store_true", help="재계산 없이 검증만 수행")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        if not args.verify_only:
+            rows = AttendanceRollupService.rebuild(db, group_id=args.group_id)
+            db.commit()
+            print(f"🔄 Rebuilt attendance rollups: {rows} rows")
+
+        mismatches = AttendanceRollupService.verify(db, group_id=args.group_id)
+        if mismatches:
+            print(f"❌ {len(mismatches)} rollup rows differ from raw attendance:")
+            for item in mismatches[:20]:
+                group_id, student_id, year, month = item["key"]
+                print(f"   {group_id} / {student_id} / {year}-{month:02d}: "
+                      f"expected={item['expected']} actual={item['actual']}")
+            sys.exit(1)
+
+        print("✅ Attendance rollups match raw attendance")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
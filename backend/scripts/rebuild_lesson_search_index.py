@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+F-005 수업 기록 검색 색인 재생성 스크립트
+
+lesson_search_documents (SQLite FTS5 / PostgreSQL tsvector) 색인을
+원본 수업 기록(lesson_records)으로부터 다시 만듭니다.
+
+- 검색 기능 도입 시 기존 수업 기록 백필
+- 토큰화 규칙(app/core/text_search.py) 변경 후 재색인
+
+Usage:
+    python scripts/rebuild_lesson_search_index.py                  # 전체 재색인
+    python scripts/rebuild_lesson_search_index.py --group-id <ID>  # 특정 그룹만
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal, init_db
+from app.services.lesson_search_service import LessonSearchService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수업 기록 검색 색인 재생성")
+    parser.add_argument("--group-id", help="특정 그룹만 처리")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        indexed = LessonSearchService.rebuild(db, group_id=args.group_id)
+        db.commit()
+        print(f"🔎 Rebuilt lesson search index: {indexed} lesson records")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
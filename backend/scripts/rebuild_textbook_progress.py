@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+F-005 교재 진도 집계 재계산 스크립트
+
+textbooks 테이블의 비정규화 진도 집계(progress_* 컬럼)를 원본 진도 기록
+(progress_records)으로부터 다시 계산합니다.
+
+- 집계 컬럼 도입 시 기존 데이터 백필
+- 운영 중 집계 불일치 복구
+
+Usage:
+    python scripts/rebuild_textbook_progress.py                  # 전체 교재
+    python scripts/rebuild_textbook_progress.py --group-id <ID>  # 특정 그룹만
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal, init_db
+from app.services.textbook_service import TextbookService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="교재 진도 집계 재계산")
+    parser.add_argument("--group-id", help="특정 그룹만 처리")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        rows = TextbookService.refresh_progress(db, group_id=args.group_id)
+        db.commit()
+        print(f"🔄 Rebuilt textbook progress aggregates: {rows} textbooks")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
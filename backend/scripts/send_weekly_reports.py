@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+학부모 주간 학습 리포트 발송 스크립트 (cron 등 외부 스케줄러용)
+
+매주 월요일 실행하면 지난주(월~일) 수업 기록/숙제/출결/교재 진도를
+학부모별 리포트로 렌더링해 이메일로 발송합니다.
+
+Usage:
+    python scripts/send_weekly_reports.py
+    python scripts/send_weekly_reports.py --week-start 2025-03-03 --dry-run
+    python scripts/send_weekly_reports.py --workers 4
+"""
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal, init_db
+from app.services.weekly_report_service import WeeklyReportService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="학부모 주간 리포트 발송")
+    parser.add_argument("--week-start", help="주 시작일 YYYY-MM-DD (기본: 지난주 월요일)")
+    parser.add_argument("--dry-run", action="store_true", help="렌더링까지만 하고 발송하지 않음")
+    parser.add_argument("--workers", type=int, default=None, help="렌더링 프로세스 수 (기본: 설정값)")
+    args = parser.parse_args()
+
+    week_start = datetime.strptime(args.week_start, "%Y-%m-%d").date() if args.week_start else None
+
+    init_db()
+    db = SessionLocal()
+    try:
+        metrics = WeeklyReportService.run(db, week_start=week_start, send=not args.dry_run, workers=args.workers)
+    finally:
+        db.close()
+
+    print(f"📬 Weekly parent reports ({metrics['week_start']}){' [dry run]' if args.dry_run else ''}")
+    print(f"   👪 Families: {metrics['families']}  Children: {metrics['children']}")
+    print(f"   ✅ Sent: {metrics['sent']}  ❌ Failed: {metrics['failed']}  ⏭️  Skipped: {metrics['skipped']}")
+    print(
+        f"   ⏱️  collect {metrics['collect_ms']}ms · render {metrics['render_ms']}ms · "
+        f"send {metrics['send_ms']}ms · total {metrics['total_ms']}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+지난 일정 자동 완료 처리 스크립트 (cron 등 외부 스케줄러용)
+
+API 서버의 백그라운드 워커(SCHEDULE_SWEEPER_ENABLED)를 끄고
+외부에서 주기 실행하고 싶을 때 사용합니다.
+
+Usage:
+    python scripts/sweep_schedules.py
+"""
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services.schedule_sweeper_service import ScheduleSweeperService
+
+
+def main():
+    result = ScheduleSweeperService.run_once()
+    print("🧹 Schedule sweep finished")
+    print(f"   ✅ Marked DONE: {result['marked_done']}")
+    print(f"   ⚠️  Missing attendance flagged: {result['flagged_missing_attendance']}")
+    print(f"   📦 Batches: {result['batches']}")
+    print(f"   ⏱️  Duration: {result['duration_ms']}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,11 @@ Key Fixtures:
 
 import sys
 import os
-from typing import Generator, Dict
+from contextlib import contextmanager
+from typing import Generator, Dict, List, Optional
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
@@ -37,10 +38,16 @@ os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 os.environ.setdefault("PROJECT_NAME", "WeTee Test")
 os.environ.setdefault("API_VERSION", "v1")
 os.environ.setdefault("BCRYPT_ROUNDS", "4")  # Lower rounds for faster tests
+os.environ.setdefault("SCHEDULE_SWEEPER_ENABLED", "False")  # 테스트 중 백그라운드 워커 비활성화
+os.environ.setdefault("LESSON_READ_RECEIPT_BUFFER_ENABLED", "False")  # 읽음 상태 즉시 기록
+os.environ.setdefault("REFRESH_TOKEN_PURGE_ENABLED", "False")  # 테스트 중 백그라운드 워커 비활성화
+os.environ.setdefault("AUTHZ_CACHE_TTL_SECONDS", "0")  # 테스트 간 멤버십 캐시 공유 방지
+os.environ.setdefault("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "0")  # 테스트 간 사용자 캐시 공유 방지
 
 from app.main import app
 from app.database import Base, get_db
 from app.models.user import User, UserRole
+from app.models.group import Group, GroupMember, GroupMemberRole, GroupMemberInviteStatus
 from app.core.security import hash_password, create_access_token
 
 
@@ -124,6 +131,57 @@ def client(db_session) -> Generator[TestClient, None, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="function")
+def count_queries(db_engine):
+    """
+    Count SQL statements executed on the test engine.
+
+    요청 하나를 재현할 때는 새 세션(sessionmaker(bind=db_engine))에서 실행해야
+    db_session의 identity map/요청 범위 캐시가 쿼리 수에 영향을 주지 않습니다.
+
+    Usage:
+        with count_queries() as statements:
+            Service.do_something(db, ...)
+        assert len(statements) == 3
+    """
+    @contextmanager
+    def counting() -> Generator[List[str], None, None]:
+        statements: List[str] = []
+
+        def on_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", on_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db_engine, "before_cursor_execute", on_execute)
+
+    return counting
+
+
+@pytest.fixture(scope="function")
+def new_session(db_engine):
+    """
+    Open extra sessions on the test engine (요청마다 새 세션을 쓰는 get_db 재현).
+
+    Usage:
+        db = new_session()
+    """
+    Session_ = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    sessions = []
+
+    def factory() -> Session:
+        session = Session_()
+        sessions.append(session)
+        return session
+
+    yield factory
+
+    for session in sessions:
+        session.close()
+
+
 # ============================================================================
 # User Fixtures
 # ============================================================================
@@ -197,6 +255,70 @@ def test_parent(db_session) -> User:
     return user
 
 
+@pytest.fixture(scope="function")
+def make_user(db_session):
+    """
+    Create extra users.
+
+    Usage:
+        student2 = make_user("student2@test.com", UserRole.STUDENT)
+    """
+    def factory(email: str, role: UserRole, name: Optional[str] = None) -> User:
+        user = User(
+            email=email,
+            password_hash="x",
+            name=name or email.split("@")[0],
+            role=role,
+            is_active=True,
+            is_email_verified=True,
+        )
+        db_session.add(user)
+        db_session.commit()
+        return user
+
+    return factory
+
+
+@pytest.fixture(scope="function")
+def make_group(db_session):
+    """
+    Create a group owned by a teacher with accepted members.
+
+    Usage:
+        group = make_group(test_teacher, students=[test_student], parents=[(test_parent, test_student)])
+    """
+    def factory(teacher: User, students=(), parents=(), name: str = "테스트 반") -> Group:
+        group = Group(name=name, subject="수학", owner_id=teacher.id, lesson_fee=50000)
+        db_session.add(group)
+        db_session.flush()
+        members = [GroupMember(group_id=group.id, user_id=teacher.id, role=GroupMemberRole.TEACHER,
+                               invite_status=GroupMemberInviteStatus.ACCEPTED)]
+        members += [GroupMember(group_id=group.id, user_id=student.id, role=GroupMemberRole.STUDENT,
+                                invite_status=GroupMemberInviteStatus.ACCEPTED) for student in students]
+        members += [GroupMember(group_id=group.id, user_id=parent.id, role=GroupMemberRole.PARENT,
+                                student_id=student.id, invite_status=GroupMemberInviteStatus.ACCEPTED)
+                    for parent, student in parents]
+        db_session.add_all(members)
+        db_session.commit()
+        return group
+
+    return factory
+
+
+@pytest.fixture(scope="function")
+def auth_headers_for():
+    """
+    Generate authentication headers for any user (make_user로 만든 사용자 등).
+
+    Usage:
+        client.get(url, headers=auth_headers_for(user))
+    """
+    def factory(user: User) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {create_access_token(data={'sub': user.id})}"}
+
+    return factory
+
+
 # ============================================================================
 # Authentication Fixtures
 # ============================================================================
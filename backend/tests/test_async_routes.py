@@ -0,0 +1,176 @@
+"""
+비동기 라우트 테스트 (ASYNC_DB_ENABLED: aiosqlite 세션에서 동기 라우트와 같은 응답)
+
+같은 SQLite 파일을 동기 엔진(기존 라우트)과 aiosqlite 엔진(비동기 라우트)으로 열어
+요청별 상태 코드/응답 본문을 비교합니다. aiosqlite가 없으면 건너뜀.
+"""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app import database
+from app.core.limiter import limiter
+from app.database import Base, create_db_engine, create_async_db_engine
+from app.main import app
+from app.models.notification import Notification, NotificationType, NotificationCategory
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.user import UserRole
+from app.routers.async_routes import router as async_router
+
+
+@pytest.fixture
+def db_engine(tmp_path):
+    """파일 SQLite (conftest의 인메모리 엔진 대체: aiosqlite 엔진이 같은 DB를 열 수 있도록)"""
+    engine = create_db_engine(f"sqlite:///{os.path.join(tmp_path, 'async.db')}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def async_client(db_engine, monkeypatch):
+    """비동기 라우트만 등록한 앱 (get_async_db는 그대로, 세션만 테스트 DB의 aiosqlite 엔진으로)"""
+    async_engine = create_async_db_engine(
+        db_engine.url.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    )
+    monkeypatch.setattr(database, "AsyncSessionLocal",
+                        async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False))
+
+    async_app = FastAPI()
+    async_app.state.limiter = limiter
+    async_app.exception_handlers.update(app.exception_handlers)
+    async_app.include_router(async_router, prefix="/api/v1")
+
+    with TestClient(async_app) as test_client:
+        yield test_client
+        test_client.portal.call(async_engine.dispose)
+
+
+def _seed_notifications(db, user):
+    """카테고리/읽음 상태가 섞인 알림 5건 (1분 간격, 최신이 마지막)"""
+    base = datetime(2026, 3, 1, 9, 0)
+    kinds = [
+        (NotificationType.SCHEDULE_CHANGED, NotificationCategory.SCHEDULE, False),
+        (NotificationType.ATTENDANCE_CHANGED, NotificationCategory.ATTENDANCE, True),
+        (NotificationType.BILLING_ISSUED, NotificationCategory.PAYMENT, False),
+        (NotificationType.LESSON_RECORD_CREATED, NotificationCategory.LESSON, False),
+        (NotificationType.SYSTEM_NOTICE, NotificationCategory.SYSTEM, True),
+    ]
+    notifications = []
+    for i, (notification_type, category, is_read) in enumerate(kinds):
+        notification = Notification(user_id=user.id, type=notification_type, category=category,
+                                    title=f"알림 {i}", message=f"{i}번째 알림입니다.", is_read=is_read,
+                                    read_at=base if is_read else None, created_at=base + timedelta(minutes=i))
+        db.add(notification)
+        notifications.append(notification)
+    db.commit()
+    return [notification.id for notification in notifications]
+
+
+def _seed_schedules(db, group):
+    base = datetime(2026, 3, 2, 15, 0)
+    statuses = [ScheduleStatus.SCHEDULED, ScheduleStatus.DONE, ScheduleStatus.RESCHEDULED, ScheduleStatus.CANCELED]
+    for i, schedule_status in enumerate(statuses * 2):
+        db.add(Schedule(group_id=group.id, title=f"수업 {i}", type=ScheduleType.REGULAR,
+                        start_at=base + timedelta(days=i), end_at=base + timedelta(days=i, hours=2),
+                        status=schedule_status))
+    db.commit()
+
+
+def _both(client, async_client, db_session, method, url, **kwargs):
+    """같은 요청을 동기/비동기 라우트에 보내고 (상태 코드, meta를 제외한 본문) 쌍 반환"""
+    responses = []
+    for test_client in (client, async_client):
+        response = test_client.request(method, url, **kwargs)
+        body = response.json() if response.content else None
+        if isinstance(body, dict):
+            body.pop("meta", None)  # 요청마다 다른 timestamp/request_id
+        responses.append((response.status_code, body))
+        # 동기 라우트 세션의 읽기 트랜잭션 종료 (다음 요청에서 비동기 쪽 변경이 보이도록)
+        db_session.close()
+    return responses
+
+
+def test_notification_routes_match_sync(client, async_client, db_session, test_student, student_auth_headers):
+    _seed_notifications(db_session, test_student)
+    requests = [
+        ("/api/v1/notifications", {}),
+        ("/api/v1/notifications", {"status": "unread", "size": 2}),
+        ("/api/v1/notifications", {"status": "unread", "size": 2, "page": 2}),
+        ("/api/v1/notifications", {"category": "payment"}),
+        ("/api/v1/notifications/summary", {}),
+    ]
+    for url, params in requests:
+        sync, async_ = _both(client, async_client, db_session, "GET", url,
+                             params=params, headers=student_auth_headers)
+        assert sync[0] == 200, sync
+        assert async_ == sync, (url, params)
+
+    # 인증 없음 / 검증 실패도 같은 코드
+    assert len({str(r) for r in _both(client, async_client, db_session, "GET", "/api/v1/notifications")}) == 1
+    sync, async_ = _both(client, async_client, db_session, "GET", "/api/v1/notifications",
+                         params={"size": 0}, headers=student_auth_headers)
+    assert sync[0] == 400
+    assert async_ == sync
+
+
+def test_mark_as_read_matches_sync(client, async_client, db_session, test_student, student_auth_headers,
+                                   teacher_auth_headers):
+    notification_ids = _seed_notifications(db_session, test_student)
+    unread = [notification_ids[0], notification_ids[2]]
+
+    # 각 라우트가 서로 다른 알림을 읽음 처리 → 같은 결과
+    for test_client, notification_id in zip((client, async_client), unread):
+        response = test_client.patch(f"/api/v1/notifications/{notification_id}/read", headers=student_auth_headers)
+        assert response.status_code == 204, response.text
+        db_session.close()
+    for notification_id in unread:
+        notification = db_session.get(Notification, notification_id)
+        assert notification.is_read and notification.read_at is not None
+    db_session.close()
+
+    sync, async_ = _both(client, async_client, db_session, "GET", "/api/v1/notifications/summary",
+                         headers=student_auth_headers)
+    assert async_ == sync
+    assert sync[1]["data"]["total_unread"] == 1
+
+    # 다시 읽음 처리(멱등) / 다른 사용자의 알림 / 없는 알림
+    for notification_id, headers in [(unread[0], student_auth_headers), (unread[1], student_auth_headers),
+                                     (notification_ids[3], teacher_auth_headers), ("missing", student_auth_headers)]:
+        sync, async_ = _both(client, async_client, db_session, "PATCH",
+                             f"/api/v1/notifications/{notification_id}/read", headers=headers)
+        assert async_ == sync, notification_id
+
+
+def test_schedule_list_matches_sync(client, async_client, db_session, test_teacher, test_student, make_user,
+                                    make_group, teacher_auth_headers, student_auth_headers, auth_headers_for):
+    group = make_group(test_teacher, students=[test_student])
+    other = make_group(test_teacher, name="다른 반")
+    _seed_schedules(db_session, group)
+    _seed_schedules(db_session, other)
+    outsider = make_user("outsider@test.com", UserRole.STUDENT)
+
+    requests = [
+        (teacher_auth_headers, {}),
+        (teacher_auth_headers, {"group_id": group.id, "size": 3, "page": 2}),
+        (teacher_auth_headers, {"status": "RESCHEDULED"}),
+        (teacher_auth_headers, {"type": "REGULAR", "from_date": "2026-03-03", "to_date": "2026-03-05"}),
+        (student_auth_headers, {}),
+        (student_auth_headers, {"group_id": other.id}),
+        (auth_headers_for(outsider), {}),
+    ]
+    for headers, params in requests:
+        sync, async_ = _both(client, async_client, db_session, "GET", "/api/v1/schedules",
+                             params=params, headers=headers)
+        assert async_ == sync, params
+
+    sync, _ = _both(client, async_client, db_session, "GET", "/api/v1/schedules", headers=teacher_auth_headers)
+    assert sync[1]["data"]["pagination"]["total"] == 16
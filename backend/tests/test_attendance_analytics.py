@@ -0,0 +1,44 @@
+"""
+AttendanceAnalyticsService 벡터 연산 단위 테스트
+"""
+
+import numpy as np
+
+from app.services.attendance_analytics_service import AttendanceAnalyticsService, PRESENT, LATE, ABSENT
+
+
+def test_streaks_current_and_longest():
+    codes = np.array([PRESENT, PRESENT, ABSENT, PRESENT, LATE, PRESENT, PRESENT], dtype=np.int8)
+    streaks = AttendanceAnalyticsService._streaks(codes)
+
+    assert streaks.current == 4
+    assert streaks.longest == 4
+    assert streaks.current_on_time == 2
+    assert streaks.longest_on_time == 2
+
+
+def test_streaks_empty_year():
+    streaks = AttendanceAnalyticsService._streaks(np.array([], dtype=np.int8))
+    assert (streaks.current, streaks.longest) == (0, 0)
+
+
+def test_heatmap_starts_on_monday_and_keeps_worst_level_per_day():
+    dates = np.array(["2025-01-01", "2025-01-01", "2025-01-03"], dtype="datetime64[D]")
+    codes = np.array([PRESENT, ABSENT, LATE], dtype=np.int8)
+
+    start, grid = AttendanceAnalyticsService._heatmap(2025, dates, codes)
+
+    assert start == "2024-12-30"  # 2025-01-01은 수요일
+    assert grid[0] == [0, 0, 1, 0, 2, 0, 0]
+    assert all(len(week) == 7 for week in grid)
+
+
+def test_monthly_average_late_minutes():
+    dates = np.array(["2025-03-04", "2025-03-11", "2025-03-18"], dtype="datetime64[D]")
+    codes = np.array([LATE, LATE, PRESENT], dtype=np.int8)
+    late = np.array([10, 5, 0], dtype=np.float64)
+
+    [march] = AttendanceAnalyticsService._monthly(dates, codes, late)
+
+    assert (march.month, march.lessons, march.attended, march.late) == (3, 3, 3, 2)
+    assert march.avg_late_minutes == 7.5
@@ -0,0 +1,110 @@
+"""
+배치 출결 체크 테스트 (AttendanceService.batch_create_attendances: 학생 수와 무관한 쿼리 수, 기존 출결 덮어쓰기)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.user import User, UserRole
+from app.schemas.attendance import BatchCreateAttendancePayload
+from app.services.attendance_rollup_service import AttendanceRollupService
+from app.services.attendance_service import AttendanceService
+
+
+def _past_schedule(db, group, title="수업"):
+    now = datetime.utcnow()
+    schedule = Schedule(group_id=group.id, title=title, type=ScheduleType.REGULAR,
+                        start_at=now - timedelta(hours=3), end_at=now - timedelta(hours=1),
+                        status=ScheduleStatus.DONE)
+    db.add(schedule)
+    db.commit()
+    return schedule.id
+
+
+def _payload(students, status="PRESENT", **extra):
+    return BatchCreateAttendancePayload(attendances=[
+        {"student_id": student_id, "status": status, **extra} for student_id in students
+    ])
+
+
+def _record(new_session, count_queries, teacher_id, schedule_id, payload):
+    """요청처럼 새 세션에서 실행하고 실행된 SQL 문 목록과 응답 반환"""
+    db = new_session()
+    teacher = db.get(User, teacher_id)
+    with count_queries() as statements:
+        result = AttendanceService.batch_create_attendances(db, teacher, schedule_id, payload)
+    db.close()
+    return statements, result
+
+
+def _matching(statements, *fragments):
+    return [s for s in statements if all(fragment in s for fragment in fragments)]
+
+
+def test_batch_query_count_is_constant(db_session, new_session, count_queries, test_teacher, test_student,
+                                       make_user, make_group):
+    students = [test_student] + [make_user(f"student{i}@test.com", UserRole.STUDENT, name=f"학생{i}")
+                                 for i in range(29)]
+    outsider = make_user("outsider@test.com", UserRole.STUDENT)
+    group = make_group(test_teacher, students=students)
+    one, many = _past_schedule(db_session, group, "한 명"), _past_schedule(db_session, group, "30명")
+
+    single, _ = _record(new_session, count_queries, test_teacher.id, one, _payload([test_student.id]))
+    # 그룹에 없는 학생은 건너뜀
+    batch, result = _record(new_session, count_queries, test_teacher.id, many,
+                            _payload([s.id for s in students] + [outsider.id]))
+
+    assert len(result.attendances) == 30
+    assert db_session.query(Attendance).filter(Attendance.schedule_id == many).count() == 30
+    # 멤버십/기존 출결 조회, upsert 각 1회 → 학생 수와 무관
+    assert len(single) == len(batch)
+    for statements in (single, batch):
+        assert len(_matching(statements, "SELECT group_members.user_id", "group_members.user_id IN (")) == 1
+        assert len(_matching(statements, "FROM attendances", "attendances.student_id IN (")) == 2
+        assert len(_matching(statements, "INSERT INTO attendances")) == 1
+        assert not _matching(statements, "UPDATE attendances")
+
+
+@pytest.mark.parametrize("dialect_name", ["sqlite", "mysql"])
+def test_batch_resubmit_overwrites_existing_rows(db_engine, db_session, new_session, count_queries, monkeypatch,
+                                                 dialect_name, test_teacher, test_student, make_user, make_group):
+    # mysql: ON CONFLICT가 없는 DB의 bulk INSERT/UPDATE 분기 (SQLite 엔진에서 분기만 전환)
+    monkeypatch.setattr(db_engine.dialect, "name", dialect_name)
+    students = [test_student] + [make_user(f"student{i}@test.com", UserRole.STUDENT) for i in range(2)]
+    group = make_group(test_teacher, students=students)
+    schedule_id = _past_schedule(db_session, group)
+    student_ids = [s.id for s in students]
+
+    first, _ = _record(new_session, count_queries, test_teacher.id, schedule_id, _payload(student_ids[:2]))
+    before = {
+        row.student_id: (row.id, row.recorded_at)
+        for row in db_session.query(Attendance).filter(Attendance.schedule_id == schedule_id)
+    }
+
+    # 기존 2명은 덮어쓰기, 마지막 학생은 새로 추가
+    second, result = _record(new_session, count_queries, test_teacher.id, schedule_id,
+                             _payload(student_ids, status="LATE", late_minutes=15, notes="버스 지연"))
+
+    assert [item.status for item in result.attendances] == ["LATE"] * 3
+    if dialect_name == "sqlite":
+        assert len(second) == len(first)
+        assert len(_matching(second, "INSERT INTO attendances", "ON CONFLICT")) == 1
+    else:
+        # 새 행 INSERT 1회 + 기존 행 UPDATE 1회 (executemany)
+        assert len(second) == len(first) + 1
+        assert len(_matching(second, "INSERT INTO attendances")) == 1
+        assert len(_matching(second, "UPDATE attendances")) == 1
+
+    db_session.expire_all()
+    rows = db_session.query(Attendance).filter(Attendance.schedule_id == schedule_id).all()
+    assert len(rows) == 3
+    for row in rows:
+        assert (row.status, row.late_minutes, row.memo) == (AttendanceStatus.LATE, 15, "버스 지연")
+        # ID/최초 기록 시각은 유지, 상태/지각/메모만 갱신
+        if row.student_id in before:
+            assert (row.id, row.recorded_at) == before[row.student_id]
+    # 월간 집계도 덮어쓴 상태 기준 (PRESENT -1, LATE +1)
+    assert AttendanceRollupService.verify(db_session, group.id) == []
@@ -0,0 +1,83 @@
+"""
+학생별 출결 목록 테스트 (GET /api/v1/attendances/students/{student_id}, 커서 페이지네이션)
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.user import UserRole
+from app.services.attendance_service import AttendanceService
+
+
+def _seed_attendances(db, group, student, count, base=datetime(2025, 3, 3, 15)):
+    """하루 간격 완료 일정 + 출결 count개 (기록 시각도 하루 간격), 생성 순서대로 ID 반환"""
+    attendance_ids = []
+    for i in range(count):
+        start_at = base + timedelta(days=i)
+        schedule = Schedule(group_id=group.id, title=f"수업 {i}", type=ScheduleType.REGULAR, start_at=start_at,
+                            end_at=start_at + timedelta(hours=2), status=ScheduleStatus.DONE)
+        db.add(schedule)
+        db.flush()
+        attendance = Attendance(schedule_id=schedule.id, student_id=student.id, status=AttendanceStatus.PRESENT,
+                                recorded_at=start_at + timedelta(hours=1))
+        db.add(attendance)
+        db.flush()
+        attendance_ids.append(attendance.id)
+    db.commit()
+    return attendance_ids
+
+
+def test_student_attendances_page_newest_first_with_cursor(client, db_session, test_teacher, test_student,
+                                                           teacher_auth_headers, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    attendance_ids = _seed_attendances(db_session, group, test_student, 5)
+    url = f"/api/v1/attendances/students/{test_student.id}"
+
+    first = client.get(url, params={"group_id": group.id, "limit": 2}, headers=teacher_auth_headers)
+    assert first.status_code == 200, first.text
+    page = first.json()["data"]
+    assert [item["attendance_id"] for item in page["items"]] == attendance_ids[::-1][:2]
+    assert page["items"][0]["student"]["name"] == test_student.name
+    assert (page["total"], page["has_more"]) == (5, True)
+
+    seen = [item["attendance_id"] for item in page["items"]]
+    while page["has_more"]:
+        response = client.get(url, params={"group_id": group.id, "limit": 2, "cursor": page["next_cursor"]},
+                              headers=teacher_auth_headers)
+        assert response.status_code == 200
+        page = response.json()["data"]
+        seen += [item["attendance_id"] for item in page["items"]]
+
+    assert seen == attendance_ids[::-1]
+    assert page["next_cursor"] is None
+
+
+def test_student_attendances_without_group_only_include_my_groups(db_session, test_teacher, test_student,
+                                                                  make_group, make_user):
+    other_teacher = make_user("teacher2@test.com", UserRole.TEACHER)
+    mine = make_group(test_teacher, students=[test_student])
+    other = make_group(other_teacher, students=[test_student], name="다른 반")
+    my_ids = _seed_attendances(db_session, mine, test_student, 2)
+    _seed_attendances(db_session, other, test_student, 3, base=datetime(2025, 4, 1, 15))
+
+    result = AttendanceService.get_attendances_by_student(db_session, test_teacher, test_student.id)
+
+    assert result.total == 2
+    assert [item.attendance_id for item in result.items] == my_ids[::-1]
+
+
+def test_student_attendances_query_count_is_constant(db_session, new_session, count_queries, test_teacher,
+                                                     test_student, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    _seed_attendances(db_session, group, test_student, 30)
+
+    group_id, student_id = group.id, test_student.id
+    db = new_session()
+    teacher = db.get(type(test_teacher), test_teacher.id)
+    with count_queries() as statements:
+        result = AttendanceService.get_attendances_by_student(db, teacher, student_id, group_id=group_id, limit=20)
+
+    assert len(result.items) == 20
+    # 멤버십 1 + 전체 개수 1 + 페이지(학생 이름 조인) 1
+    assert len(statements) == 3
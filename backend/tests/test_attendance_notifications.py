@@ -0,0 +1,62 @@
+"""
+출결 알림 수신자 테스트 (학부모 초대 가입 → 자녀 출결 알림)
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.group import GroupMember, GroupMemberRole, InviteCode
+from app.models.notification import Notification, NotificationType
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.user import User, UserRole
+
+
+def test_parent_signed_up_with_invite_gets_only_child_attendance(
+    client, db_session, test_teacher, test_student, teacher_auth_headers, make_group, make_user,
+):
+    sibling = make_user("student2@test.com", UserRole.STUDENT, name="다른 학생")
+    group = make_group(test_teacher, students=[test_student, sibling])
+    invite = InviteCode(code="PAR123", group_id=group.id, created_by=test_teacher.id,
+                        target_role=GroupMemberRole.PARENT, student_id=test_student.id,
+                        max_uses=1, expires_at=datetime.utcnow() + timedelta(days=7))
+    db_session.add(invite)
+    db_session.commit()
+
+    # 1. 학부모 초대 코드로 가입 → 자녀가 연결된 멤버
+    signup = client.post("/api/v1/auth/register", json={
+        "email": "new-parent@test.com",
+        "password": "Password123!",
+        "name": "새 학부모",
+        "role": "PARENT",
+        "invite_code": "PAR123",
+    })
+    assert signup.status_code == 201, signup.text
+    parent_id = signup.json()["data"]["user"]["user_id"]
+    member = db_session.query(GroupMember).filter(GroupMember.user_id == parent_id).one()
+    assert member.student_id == test_student.id
+    client.cookies.clear()  # 가입 응답의 학부모 인증 쿠키 제거 (이후 요청은 선생님 헤더로)
+
+    # 2. 학생 2명 그룹의 출결 기록 → 학부모에게 자녀 출결 1건
+    now = datetime.utcnow()
+    schedule = Schedule(group_id=group.id, title="수학 수업", type=ScheduleType.REGULAR,
+                        start_at=now - timedelta(hours=3), end_at=now - timedelta(hours=1),
+                        status=ScheduleStatus.DONE)
+    db_session.add(schedule)
+    db_session.commit()
+
+    response = client.post(
+        f"/api/v1/attendances/schedules/{schedule.id}/batch",
+        json={"attendances": [
+            {"student_id": test_student.id, "status": "ABSENT"},
+            {"student_id": sibling.id, "status": "PRESENT"},
+        ]},
+        headers=teacher_auth_headers,
+    )
+    assert response.status_code == 201, response.text
+
+    notifications = db_session.query(Notification).filter(
+        Notification.user_id == parent_id,
+        Notification.type == NotificationType.ATTENDANCE_CHANGED,
+    ).all()
+    assert len(notifications) == 1
+    assert "결석" in notifications[0].title
+    assert db_session.get(User, test_student.id).name in notifications[0].message
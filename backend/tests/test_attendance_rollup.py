@@ -0,0 +1,151 @@
+"""
+AttendanceRollupService 테스트 (월 단위 범위 판별, 증감/재계산 ↔ 원본 출결 일치)
+"""
+
+from datetime import date, datetime, timedelta
+
+from app.models.attendance import Attendance, AttendanceStatus, AttendanceMonthlyRollup
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.user import UserRole
+from app.schemas.attendance import CreateAttendancePayload, BatchCreateAttendancePayload
+from app.services.attendance_rollup_service import AttendanceRollupService, STATUS_COLUMNS
+from app.services.attendance_service import AttendanceService
+from app.services.schedule_service import ScheduleService
+
+
+def test_whole_month_span_for_full_months():
+    span = AttendanceRollupService.whole_month_span(date(2025, 1, 1), date(2025, 3, 31), today=date(2025, 6, 1))
+    assert span == ((2025, 1), (2025, 3))
+
+
+def test_whole_month_span_current_month_to_date():
+    span = AttendanceRollupService.whole_month_span(date(2025, 6, 1), date(2025, 6, 15), today=date(2025, 6, 15))
+    assert span == ((2025, 6), (2025, 6))
+
+
+def test_whole_month_span_rejects_partial_ranges():
+    today = date(2025, 6, 15)
+    assert AttendanceRollupService.whole_month_span(date(2025, 1, 2), date(2025, 1, 31), today=today) is None
+    assert AttendanceRollupService.whole_month_span(date(2025, 1, 1), date(2025, 1, 30), today=today) is None
+
+
+# ==========================
+# 통계: 월 단위(집계 테이블) ↔ 임의 범위(원본 출결) 일치
+# ==========================
+
+
+def test_stats_match_between_rollup_and_raw_ranges(db_session, test_teacher, test_student, make_group):
+    group = make_group(test_teacher, students=[test_student])
+
+    def add_lesson(start_at, attendance_status, recorded_at, schedule_status=ScheduleStatus.DONE):
+        schedule = Schedule(group_id=group.id, title="수업", type=ScheduleType.REGULAR, start_at=start_at,
+                            end_at=start_at.replace(hour=start_at.hour + 2), status=schedule_status)
+        db_session.add(schedule)
+        db_session.flush()
+        db_session.add(Attendance(schedule_id=schedule.id, student_id=test_student.id,
+                                  status=attendance_status, recorded_at=recorded_at))
+
+    add_lesson(datetime(2025, 3, 3, 15), AttendanceStatus.PRESENT, datetime(2025, 3, 3, 16))
+    add_lesson(datetime(2025, 3, 10, 15), AttendanceStatus.LATE, datetime(2025, 3, 10, 16))
+    # 월말 수업을 다음 달에 기록 → 수업 시작일(3월) 기준
+    add_lesson(datetime(2025, 3, 31, 20), AttendanceStatus.ABSENT, datetime(2025, 4, 1, 9))
+    # 취소된 일정의 출결 → 제외
+    add_lesson(datetime(2025, 3, 17, 15), AttendanceStatus.PRESENT, datetime(2025, 3, 17, 16),
+               schedule_status=ScheduleStatus.CANCELED)
+    # 3월에 기록된 2월 수업 → 3월 범위에서 제외
+    add_lesson(datetime(2025, 2, 27, 15), AttendanceStatus.PRESENT, datetime(2025, 3, 1, 9))
+    AttendanceRollupService.rebuild(db_session, group.id)
+    db_session.commit()
+
+    month = AttendanceService.get_attendance_stats(db_session, test_teacher, group.id,
+                                                   start_date="2025-03-01", end_date="2025-03-31")
+    # 하루 차이로 집계 테이블 대신 원본 출결 경로를 타는 범위 (2/28에는 수업 없음)
+    raw = AttendanceService.get_attendance_stats(db_session, test_teacher, group.id,
+                                                 start_date="2025-02-28", end_date="2025-03-31")
+
+    assert month.stats == raw.stats
+    assert (month.stats.total_sessions, month.stats.present, month.stats.late, month.stats.absent) == (3, 1, 1, 1)
+    assert [r.date for r in raw.recent_records] == ["2025-03-31", "2025-03-10", "2025-03-03"]
+
+
+# ==========================
+# 증감(apply_deltas) ↔ 원본 재집계(_aggregate_query) 일치
+# ==========================
+
+
+def _past_schedule(db, group, schedule_status=ScheduleStatus.DONE):
+    now = datetime.utcnow()
+    schedule = Schedule(group_id=group.id, title="수업", type=ScheduleType.REGULAR,
+                        start_at=now - timedelta(hours=3), end_at=now - timedelta(hours=1),
+                        status=schedule_status)
+    db.add(schedule)
+    db.commit()
+    return schedule
+
+
+def _rollup_rows(db, group_id):
+    return {
+        (row.student_id, row.year, row.month): (row.present_count, row.late_count, row.early_leave_count, row.absent_count)
+        for row in db.query(AttendanceMonthlyRollup).filter(AttendanceMonthlyRollup.group_id == group_id).all()
+    }
+
+
+def _expected_rows(db, group_id):
+    return {
+        (row.student_id, row.year, row.month): tuple(getattr(row, column) for column in STATUS_COLUMNS.values())
+        for row in db.execute(AttendanceRollupService._aggregate_query(group_id)).all()
+    }
+
+
+def test_rollup_matches_raw_after_single_create(db_session, test_teacher, test_student, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    schedule = _past_schedule(db_session, group)
+
+    AttendanceService.create_attendance(db_session, test_teacher, CreateAttendancePayload(
+        schedule_id=schedule.id, student_id=test_student.id, status="LATE", late_minutes=10,
+    ))
+
+    assert AttendanceRollupService.verify(db_session, group.id) == []
+    assert _rollup_rows(db_session, group.id) == _expected_rows(db_session, group.id)
+    assert list(_rollup_rows(db_session, group.id).values()) == [(0, 1, 0, 0)]
+
+
+def test_rollup_matches_raw_after_batch_overwrite(db_session, test_teacher, test_student, make_group, make_user):
+    sibling = make_user("student2@test.com", UserRole.STUDENT)
+    group = make_group(test_teacher, students=[test_student, sibling])
+    schedule = _past_schedule(db_session, group)
+
+    def record(student_status, sibling_status):
+        AttendanceService.batch_create_attendances(db_session, test_teacher, schedule.id, BatchCreateAttendancePayload(
+            attendances=[
+                {"student_id": test_student.id, "status": student_status},
+                {"student_id": sibling.id, "status": sibling_status},
+            ],
+        ))
+
+    record("PRESENT", "ABSENT")
+    # 기존 행 덮어쓰기: 한 명은 상태 변경, 한 명은 그대로
+    record("EARLY_LEAVE", "ABSENT")
+
+    assert AttendanceRollupService.verify(db_session, group.id) == []
+    rows = _rollup_rows(db_session, group.id)
+    assert rows == _expected_rows(db_session, group.id)
+    assert sorted(rows.values()) == [(0, 0, 0, 1), (0, 0, 1, 0)]
+
+
+def test_rollup_matches_raw_after_schedule_delete_and_rebuild(db_session, test_teacher, test_student, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    kept = _past_schedule(db_session, group)
+    deleted = _past_schedule(db_session, group, schedule_status=ScheduleStatus.SCHEDULED)
+    for schedule in (kept, deleted):
+        AttendanceService.batch_create_attendances(db_session, test_teacher, schedule.id, BatchCreateAttendancePayload(
+            attendances=[{"student_id": test_student.id, "status": "PRESENT"}],
+        ))
+    assert list(_rollup_rows(db_session, group.id).values()) == [(2, 0, 0, 0)]
+
+    # 일정 삭제 → 출결 CASCADE + 해당 월 재계산
+    ScheduleService.delete_schedule(db_session, test_teacher, deleted.id)
+
+    assert AttendanceRollupService.verify(db_session, group.id) == []
+    assert _rollup_rows(db_session, group.id) == _expected_rows(db_session, group.id)
+    assert list(_rollup_rows(db_session, group.id).values()) == [(1, 0, 0, 0)]
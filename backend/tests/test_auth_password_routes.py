@@ -0,0 +1,124 @@
+"""
+비밀번호 해싱 라우트 테스트 (로그인/회원가입/비밀번호 변경/재설정: 전용 해시 풀에서 await)
+"""
+
+import inspect
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core.limiter import limiter
+from app.core.security import password_hasher, pwd_context, create_password_reset_token
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.routers import auth, profiles
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """로그인/재설정 라우트의 분당 제한이 테스트 간에 누적되지 않도록 초기화"""
+    limiter.reset()
+    yield
+    limiter.reset()
+
+
+def test_password_routes_are_async():
+    # 동기 라우트는 bcrypt 동안 요청 스레드를 점유하므로 네 라우트 모두 이벤트 루프에서 await
+    for route in (auth.login, auth.register, auth.confirm_password_reset, profiles.change_password):
+        assert inspect.iscoroutinefunction(inspect.unwrap(route)), route.__name__
+
+
+def test_login_verifies_on_hash_pool_and_rehashes_old_cost(client, db_session, test_teacher):
+    # 다른 비용으로 만들어진 해시 → 로그인 성공 시 BCRYPT_ROUNDS로 재해싱
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash(b"password123")
+    test_teacher.password_hash = old_hash
+    db_session.commit()
+    completed = password_hasher.stats()["completed"]
+
+    wrong = client.post("/api/v1/auth/login", json={"email": test_teacher.email, "password": "wrong-password"})
+    assert wrong.status_code == 401
+    assert wrong.json()["detail"]["code"] == "AUTH004"
+
+    response = client.post("/api/v1/auth/login", json={"email": test_teacher.email, "password": "password123"})
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["user"]["email"] == test_teacher.email
+    assert "wetee_refresh_token" in response.cookies
+    client.cookies.clear()
+
+    assert password_hasher.stats()["completed"] == completed + 2
+    db_session.expire_all()
+    user = db_session.get(User, test_teacher.id)
+    assert user.password_hash != old_hash
+    assert not pwd_context.needs_update(user.password_hash)
+    assert user.last_login_at is not None
+
+
+def test_register_hashes_password_and_logs_in(client, db_session):
+    response = client.post("/api/v1/auth/register", json={
+        "email": "New-Teacher@test.com",
+        "password": "Password123!",
+        "name": "새 선생님",
+        "role": "TEACHER",
+    })
+    assert response.status_code == 201, response.text
+    assert "wetee_access_token" in response.cookies
+    client.cookies.clear()
+
+    user = db_session.query(User).filter(User.email == "new-teacher@test.com").one()
+    assert pwd_context.verify(b"Password123!", user.password_hash)
+
+    duplicate = client.post("/api/v1/auth/register", json={
+        "email": "new-teacher@test.com",
+        "password": "Password123!",
+        "name": "중복",
+        "role": "TEACHER",
+    })
+    assert duplicate.status_code == 409
+    assert duplicate.json()["detail"]["code"] == "AUTH001"
+
+
+def test_change_password_checks_current_and_stores_new_hash(client, db_session, test_teacher,
+                                                           teacher_auth_headers):
+    url = "/api/v1/users/me/change-password"
+    test_teacher.password_hash = pwd_context.hash(b"OldPassword1!")
+    db_session.commit()
+
+    wrong = client.post(url, headers=teacher_auth_headers,
+                        json={"current_password": "wrong-password", "new_password": "NewPassword1!"})
+    assert wrong.status_code == 400
+    assert wrong.json()["detail"] == "현재 비밀번호가 일치하지 않습니다"
+
+    same = client.post(url, headers=teacher_auth_headers,
+                       json={"current_password": "OldPassword1!", "new_password": "OldPassword1!"})
+    assert same.status_code == 400
+    assert same.json()["detail"] == "현재 비밀번호와 다른 비밀번호를 입력해주세요"
+
+    changed = client.post(url, headers=teacher_auth_headers,
+                          json={"current_password": "OldPassword1!", "new_password": "NewPassword1!"})
+    assert changed.status_code == 200, changed.text
+
+    db_session.expire_all()
+    password_hash = db_session.get(User, test_teacher.id).password_hash
+    assert pwd_context.verify(b"NewPassword1!", password_hash)
+    assert not pwd_context.verify(b"OldPassword1!", password_hash)
+
+
+def test_password_reset_confirm_stores_hash_and_revokes_sessions(client, db_session, test_teacher):
+    login = client.post("/api/v1/auth/login", json={"email": test_teacher.email, "password": "password123"})
+    assert login.status_code == 200
+    client.cookies.clear()
+
+    token = create_password_reset_token(test_teacher.id, test_teacher.email)
+    response = client.post("/api/v1/auth/password-reset/confirm",
+                           json={"token": token, "new_password": "ResetPassword1!"})
+    assert response.status_code == 200, response.text
+
+    db_session.expire_all()
+    assert pwd_context.verify(b"ResetPassword1!", db_session.get(User, test_teacher.id).password_hash)
+    tokens = db_session.query(RefreshToken).filter(RefreshToken.user_id == test_teacher.id).all()
+    assert tokens and all(token.revoked_at is not None for token in tokens)
+
+    invalid = client.post("/api/v1/auth/password-reset/confirm",
+                          json={"token": "not-a-token", "new_password": "ResetPassword1!"})
+    assert invalid.status_code == 400
+    assert invalid.json()["detail"]["code"] == "AUTH012"
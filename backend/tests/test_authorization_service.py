@@ -0,0 +1,46 @@
+"""
+AuthorizationService 권한 컨텍스트 캐시 단위 테스트
+"""
+
+from types import SimpleNamespace
+
+from app.core.cache import TTLCache
+from app.models.group import GroupMemberRole
+from app.services.authorization_service import AuthorizationContext, AuthorizationService, SESSION_INFO_KEY
+
+
+def _context(user_id, *group_ids):
+    return AuthorizationContext(user_id, {group_id: (GroupMemberRole.TEACHER, None) for group_id in group_ids})
+
+
+def test_context_is_reused_within_session_and_across_requests(monkeypatch):
+    cache = TTLCache(maxsize=10, ttl_seconds=60)
+    cache.set("user-1", _context("user-1", "group-1"))
+    monkeypatch.setattr(AuthorizationService, "_cache", cache)
+
+    # query 속성이 없는 세션: DB 조회가 일어나면 실패
+    db = SimpleNamespace(info={})
+    user = SimpleNamespace(id="user-1")
+
+    assert AuthorizationService.get_role(db, user, "group-1") == GroupMemberRole.TEACHER
+    assert AuthorizationService.is_member(db, user, "group-2") is False
+    assert db.info[SESSION_INFO_KEY]["user-1"] is cache.get("user-1")
+
+
+def test_invalidation_drops_cached_and_session_contexts(monkeypatch):
+    cache = TTLCache(maxsize=10, ttl_seconds=60)
+    for context in (_context("user-1", "group-1"), _context("user-2", "group-1", "group-2"), _context("user-3", "group-3")):
+        cache.set(context.user_id, context)
+    monkeypatch.setattr(AuthorizationService, "_cache", cache)
+    db = SimpleNamespace(info={SESSION_INFO_KEY: {"user-1": cache.get("user-1"), "user-3": cache.get("user-3")}})
+
+    AuthorizationService.invalidate_group("group-1", db)
+
+    assert cache.get("user-1") is None
+    assert cache.get("user-2") is None
+    assert cache.get("user-3") is not None
+    assert list(db.info[SESSION_INFO_KEY]) == ["user-3"]
+
+    AuthorizationService.invalidate_user("user-3", db)
+    assert cache.get("user-3") is None
+    assert db.info[SESSION_INFO_KEY] == {}
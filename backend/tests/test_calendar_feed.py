@@ -0,0 +1,134 @@
+"""
+캘린더 구독 피드 테스트 (GET /api/v1/schedules/calendar/{token}.ics, 캐시/무효화)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.services.calendar_service import CalendarFeedService
+from app.services.group_service import GroupService
+from app.schemas.group import GroupCreate
+
+
+@pytest.fixture(autouse=True)
+def clear_feed_cache():
+    """피드 캐시는 프로세스 전역이므로 테스트마다 비움"""
+    CalendarFeedService._cache.clear()
+    yield
+    CalendarFeedService._cache.clear()
+
+
+def _feed_url(client, headers):
+    response = client.get("/api/v1/schedules/calendar/subscription", headers=headers)
+    assert response.status_code == 200, response.text
+    return f"/api/v1/schedules/calendar/{response.json()['data']['token']}.ics"
+
+
+def _add_schedule(db, group, title, days=1):
+    start_at = datetime.utcnow().replace(microsecond=0) + timedelta(days=days)
+    db.add(Schedule(group_id=group.id, title=title, type=ScheduleType.REGULAR, start_at=start_at,
+                    end_at=start_at + timedelta(hours=2), status=ScheduleStatus.SCHEDULED))
+    db.commit()
+
+
+def test_feed_returns_calendar_and_304_for_matching_etag(client, db_session, test_teacher, test_student,
+                                                         student_auth_headers, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    _add_schedule(db_session, group, "수학 수업")
+    url = _feed_url(client, student_auth_headers)
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.headers["content-type"].startswith("text/calendar")
+    assert "SUMMARY:[테스트 반] 수학 수업" in first.text
+    etag = first.headers["etag"]
+
+    # 캐시 적중 + ETag 일치 → 304
+    cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    # 캐시 미스(재계산) + ETag 일치 → 304
+    CalendarFeedService._cache.clear()
+    recomputed = client.get(url, headers={"If-None-Match": etag})
+    assert recomputed.status_code == 304
+
+
+def test_schedule_create_invalidates_cached_feed(client, db_session, test_teacher, test_student,
+                                                 teacher_auth_headers, student_auth_headers, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    url = _feed_url(client, student_auth_headers)
+    client.cookies.clear()
+    etag = client.get(url).headers["etag"]
+
+    start_at = datetime.utcnow().replace(microsecond=0) + timedelta(days=3)
+    created = client.post("/api/v1/schedules", headers=teacher_auth_headers, json={
+        "group_id": group.id,
+        "title": "보강 수업",
+        "type": "MAKEUP",
+        "start_at": start_at.isoformat(),
+        "end_at": (start_at + timedelta(hours=2)).isoformat(),
+    })
+    assert created.status_code == 201, created.text
+
+    refreshed = client.get(url, headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert "SUMMARY:[테스트 반] 보강 수업" in refreshed.text
+
+
+def test_group_rename_invalidates_feed_and_changes_etag(client, db_session, test_teacher, test_student,
+                                                        teacher_auth_headers, student_auth_headers, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    _add_schedule(db_session, group, "수학 수업")
+    url = _feed_url(client, student_auth_headers)
+    client.cookies.clear()
+    etag = client.get(url).headers["etag"]
+
+    renamed = client.patch(f"/api/v1/groups/{group.id}", headers=teacher_auth_headers, json={"name": "심화 반"})
+    assert renamed.status_code == 200, renamed.text
+
+    # 캐시 무효화 → 새 이름으로 재계산
+    refreshed = client.get(url, headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert "SUMMARY:[심화 반] 수학 수업" in refreshed.text
+    assert refreshed.headers["etag"] != etag
+
+    # 캐시가 없어도(TTL 만료) 그룹 수정 시각이 ETag에 반영되어 이전 ETag로 304를 받지 않음
+    CalendarFeedService._cache.clear()
+    recomputed = client.get(url, headers={"If-None-Match": etag})
+    assert recomputed.status_code == 200
+    assert recomputed.headers["etag"] == refreshed.headers["etag"]
+
+
+def test_invalidation_during_stream_is_not_cached(db_session, test_teacher, test_student, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    _add_schedule(db_session, group, "수학 수업")
+    token = CalendarFeedService.get_or_create_feed_token(db_session, test_student)
+
+    feed = CalendarFeedService.prepare_feed(db_session, token)
+    stream = CalendarFeedService.stream_feed(db_session, token, feed)
+    next(stream)  # 본문 전송 중
+    CalendarFeedService.invalidate_group(group.id)
+    list(stream)
+
+    assert CalendarFeedService.get_cached_feed(token) is None
+
+    # 무효화가 없었으면 완성된 본문을 캐시
+    feed = CalendarFeedService.prepare_feed(db_session, token)
+    list(CalendarFeedService.stream_feed(db_session, token, feed))
+    assert CalendarFeedService.get_cached_feed(token)["etag"] == feed["etag"]
+
+
+def test_create_group_invalidates_owner_feed(db_session, test_teacher, make_group):
+    make_group(test_teacher)
+    token = CalendarFeedService.get_or_create_feed_token(db_session, test_teacher)
+    feed = CalendarFeedService.prepare_feed(db_session, token)
+    list(CalendarFeedService.stream_feed(db_session, token, feed))
+    assert CalendarFeedService.get_cached_feed(token) is not None
+
+    GroupService.create_group(db_session, test_teacher, GroupCreate(name="새 반", subject="영어"))
+
+    assert CalendarFeedService.get_cached_feed(token) is None
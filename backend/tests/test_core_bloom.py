@@ -0,0 +1,33 @@
+"""
+BloomFilter 단위 테스트
+"""
+
+from app.core.bloom import BloomFilter
+
+
+def test_added_items_are_always_found():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"family-{i}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert bloom.is_full
+
+
+def test_false_positive_rate_stays_near_design():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"family-{i}")
+
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300  # 설계 오판율 1% (여유 3배)
+
+
+def test_reset_clears_items():
+    bloom = BloomFilter(capacity=10)
+    bloom.add("family-1")
+    bloom.reset()
+
+    assert "family-1" not in bloom
+    assert bloom.count == 0
@@ -0,0 +1,46 @@
+"""
+TTLCache 단위 테스트
+"""
+
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_get_returns_default_when_missing():
+    cache = TTLCache(maxsize=2, ttl_seconds=60)
+    assert cache.get("missing") is None
+    assert cache.get("missing", "fallback") == "fallback"
+    assert cache.stats()["misses"] == 2
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a를 최근 사용으로 갱신
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(maxsize=10, ttl_seconds=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_delete_where_removes_matching_entries():
+    cache = TTLCache(maxsize=10, ttl_seconds=60)
+    cache.set("t1", {"group_ids": ["g1", "g2"]})
+    cache.set("t2", {"group_ids": ["g3"]})
+
+    removed = cache.delete_where(lambda _key, value: "g1" in value["group_ids"])
+
+    assert removed == 1
+    assert cache.get("t1") is None
+    assert cache.get("t2") == {"group_ids": ["g3"]}
@@ -0,0 +1,57 @@
+"""
+HashExecutor 단위 테스트
+"""
+
+import asyncio
+import threading
+
+from app.core.hash_executor import HashExecutor
+
+
+def test_run_returns_result_and_counts_completed():
+    executor = HashExecutor(max_workers=2)
+    try:
+        assert executor.run(lambda a, b: a + b, 1, 2) == 3
+        stats = executor.stats()
+        assert stats["completed"] == 1
+        assert stats["queued"] == 0
+        assert stats["running"] == 0
+    finally:
+        executor.shutdown()
+
+
+def test_queue_depth_is_bounded_by_workers():
+    executor = HashExecutor(max_workers=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    try:
+        futures = [executor.submit(blocking) for _ in range(3)]
+        started.wait(5)
+        stats = executor.stats()
+        assert stats["running"] == 1
+        assert stats["queued"] == 2
+        assert stats["max_queue_depth"] >= 2
+
+        release.set()
+        assert [f.result(5) for f in futures] == ["done"] * 3
+        assert executor.stats()["completed"] == 3
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_submit_can_be_awaited():
+    executor = HashExecutor(max_workers=1)
+    try:
+        async def main():
+            return await asyncio.wrap_future(executor.submit(str.upper, "bcrypt"))
+
+        assert asyncio.run(main()) == "BCRYPT"
+    finally:
+        executor.shutdown()
@@ -0,0 +1,45 @@
+"""
+Rate Limiter 저장소/식별자 단위 테스트
+"""
+
+from types import SimpleNamespace
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import STRATEGIES
+
+from app.core.limiter import BoundedMemoryStorage, get_identifier
+
+
+def _request(user=None, host="203.0.113.7"):
+    state = SimpleNamespace(user=user) if user else SimpleNamespace()
+    return SimpleNamespace(state=state, client=SimpleNamespace(host=host), headers={})
+
+
+def test_bounded_memory_storage_is_registered_scheme():
+    storage = storage_from_string("bounded-memory://", max_keys=5)
+    assert isinstance(storage, BoundedMemoryStorage)
+    assert storage.max_keys == 5
+
+
+def test_bounded_memory_storage_evicts_windows_closest_to_expiry():
+    storage = BoundedMemoryStorage(max_keys=10)
+    for i in range(11):
+        storage.incr(f"key-{i}", 60 + i)
+
+    assert len(storage.storage) <= 10
+    assert storage.get("key-10") == 1
+    assert storage.get("key-0") == 0
+
+
+def test_sliding_window_counter_enforces_limit():
+    limiter = STRATEGIES["sliding-window-counter"](BoundedMemoryStorage(max_keys=100))
+    item = parse("3/minute")
+
+    assert [limiter.hit(item, "ip:203.0.113.7") for _ in range(4)] == [True, True, True, False]
+    assert limiter.hit(item, "ip:198.51.100.1") is True
+
+
+def test_identifier_uses_authenticated_user_from_request_state():
+    assert get_identifier(_request(user=SimpleNamespace(id="user-1"))) == "user:user-1"
+    assert get_identifier(_request()) == "ip:203.0.113.7"
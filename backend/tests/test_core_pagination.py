@@ -0,0 +1,25 @@
+"""
+커서 페이지네이션 유틸 단위 테스트
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import encode_cursor, decode_cursor
+
+
+def test_cursor_round_trip():
+    recorded_at = datetime(2025, 11, 18, 16, 30, 0, 123456)
+    cursor = encode_cursor(recorded_at, "attendance-123")
+
+    assert decode_cursor(cursor, datetime, str) == [recorded_at, "attendance-123"]
+
+
+def test_invalid_cursor_raises_400():
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("not-a-cursor", datetime, str)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["code"] == "INVALID_CURSOR"
@@ -0,0 +1,40 @@
+"""
+전문 검색 n-gram 토큰화 유틸 단위 테스트
+"""
+
+import sqlite3
+
+from app.core.text_search import ngram_document, fts5_query, tsquery, query_terms, snippet
+
+
+def test_ngram_document_splits_words_into_bigrams():
+    assert ngram_document("이차방정식, 판별식!") == "이차 차방 방정 정식 판별 별식"
+    assert ngram_document("Ｘ축 A") == "x축 a"
+    assert ngram_document(None) == ""
+
+
+def test_queries_match_substrings_as_phrases():
+    assert fts5_query("방정식 수") == '"방정 정식" AND "수"*'
+    assert tsquery("방정식 수") == "(방정 <-> 정식) & 수:*"
+    assert fts5_query("!!!") is None
+    assert query_terms("함수 함수 그래프") == ["함수", "그래프"]
+
+
+def test_fts5_query_finds_word_inside_korean_sentence():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE VIRTUAL TABLE docs USING fts5(body)")
+    conn.execute("INSERT INTO docs VALUES (?)", (ngram_document("오늘은 이차방정식을 풀었습니다"),))
+    conn.execute("INSERT INTO docs VALUES (?)", (ngram_document("방과 정식 식사"),))
+
+    rows = conn.execute("SELECT rowid FROM docs WHERE docs MATCH ?", (fts5_query("방정식"),)).fetchall()
+
+    assert rows == [(1,)]
+
+
+def test_snippet_centers_on_first_match():
+    text = "가" * 100 + "이차방정식" + "나" * 100
+
+    preview = snippet(text, "방정식", width=40)
+
+    assert "방정식" in preview
+    assert preview.startswith("...") and preview.endswith("...")
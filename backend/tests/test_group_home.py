@@ -0,0 +1,214 @@
+"""
+그룹 홈 통합 조회 테스트 (GET /api/v1/groups/{group_id}/home, 역할별 범위, 고정 쿼리 수, 섹션 동시 조회)
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.database import Base, create_db_engine
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.group import Group, GroupMember, GroupMemberRole, GroupMemberInviteStatus
+from app.models.invoice import Invoice, InvoiceStatus
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.textbook import Textbook
+from app.models.user import User, UserRole
+from app.services.attendance_rollup_service import AttendanceRollupService
+from app.services.group_home_service import GroupHomeService
+
+
+def _seed_home(db, group, teacher, students, upcoming=3, textbooks=2):
+    """다가오는 일정/교재/이번 달 출결/청구서 생성 (students[0]: 출석 + 미결 1건, students[1]: 결석 + 연체 1건)"""
+    now = datetime.utcnow()
+    for i in range(upcoming):
+        db.add(Schedule(group_id=group.id, title=f"예정 수업 {i}", type=ScheduleType.REGULAR,
+                        start_at=now + timedelta(days=i + 1), end_at=now + timedelta(days=i + 1, hours=2),
+                        status=ScheduleStatus.SCHEDULED))
+    # 변경된 일정(RESCHEDULED) → 예정 일정에 포함
+    db.add(Schedule(group_id=group.id, title="변경된 수업", type=ScheduleType.MAKEUP,
+                    start_at=now + timedelta(days=upcoming + 1), end_at=now + timedelta(days=upcoming + 1, hours=2),
+                    status=ScheduleStatus.RESCHEDULED, reschedule_reason="학생 사정"))
+    # 취소된 미래 일정 → 제외
+    db.add(Schedule(group_id=group.id, title="취소된 수업", type=ScheduleType.REGULAR,
+                    start_at=now + timedelta(hours=5), end_at=now + timedelta(hours=7),
+                    status=ScheduleStatus.CANCELED))
+
+    for i in range(textbooks):
+        db.add(Textbook(group_id=group.id, title=f"교재 {i}", total_pages=100))
+    db.add(Textbook(group_id=group.id, title="보관된 교재", total_pages=100, is_active=False))
+
+    # 오늘 0시 수업 → 날짜와 무관하게 이번 달
+    midnight = datetime(now.year, now.month, now.day)
+    lesson = Schedule(group_id=group.id, title="오늘 수업", type=ScheduleType.REGULAR,
+                      start_at=midnight, end_at=midnight + timedelta(hours=1), status=ScheduleStatus.DONE)
+    db.add(lesson)
+    db.flush()
+    db.add(Attendance(schedule_id=lesson.id, student_id=students[0].id, status=AttendanceStatus.PRESENT))
+    db.add(Attendance(schedule_id=lesson.id, student_id=students[1].id, status=AttendanceStatus.ABSENT))
+    db.flush()
+    AttendanceRollupService.rebuild(db, group.id)
+
+    invoice_statuses = [
+        (students[0], InvoiceStatus.SENT),
+        (students[0], InvoiceStatus.PAID),  # 완납 → 제외
+        (students[1], InvoiceStatus.OVERDUE),
+    ]
+    for i, (student, invoice_status) in enumerate(invoice_statuses):
+        db.add(Invoice(invoice_number=f"INV-{group.id[:8]}-{i}", teacher_id=teacher.id, group_id=group.id,
+                       student_id=student.id, billing_period_start=date(2026, 1, 1),
+                       billing_period_end=date(2026, 1, 31), status=invoice_status,
+                       lesson_unit_price=50000, contracted_lessons=4, amount_due=200000,
+                       due_date=date(2026, 2, 10) + timedelta(days=i)))
+    db.commit()
+
+
+def test_home_scopes_sections_by_role(client, db_session, test_teacher, test_student, teacher_auth_headers,
+                                      student_auth_headers, make_user, make_group, auth_headers_for):
+    sibling = make_user("student2@test.com", UserRole.STUDENT, name="다른 학생")
+    parent = make_user("parent@test.com", UserRole.PARENT, name="학부모")
+    group = make_group(test_teacher, students=[test_student, sibling], parents=[(parent, test_student)])
+    _seed_home(db_session, group, test_teacher, [test_student, sibling])
+    url = f"/api/v1/groups/{group.id}/home"
+
+    # 선생님(그룹 소유자): 그룹 전체 출결 + 전체 미결 청구서
+    response = client.get(url, params={"schedule_limit": 2}, headers=teacher_auth_headers)
+    assert response.status_code == 200, response.text
+    home = response.json()["data"]
+    assert home["my_role"] == "TEACHER"
+    assert home["group"]["member_count"] == 4
+    assert [item["title"] for item in home["upcoming_schedules"]] == ["예정 수업 0", "예정 수업 1"]
+    home = client.get(url, headers=teacher_auth_headers).json()["data"]
+    assert [item["title"] for item in home["upcoming_schedules"]] == ["예정 수업 0", "예정 수업 1", "예정 수업 2",
+                                                                      "변경된 수업"]
+    assert home["upcoming_schedules"][-1]["status"] == "RESCHEDULED"
+    assert sorted(item["title"] for item in home["textbooks"]) == ["교재 0", "교재 1"]
+    assert home["attendance"]["student_id"] is None
+    stats = home["attendance"]["stats"]
+    assert (stats["total_sessions"], stats["present"], stats["absent"]) == (2, 1, 1)
+    assert stats["attendance_rate"] == 50.0
+    assert [item["status"] for item in home["open_invoices"]] == ["SENT", "OVERDUE"]
+
+    # 학생: 본인 출결/청구서만
+    home = client.get(url, headers=student_auth_headers).json()["data"]
+    assert home["my_role"] == "STUDENT"
+    assert home["attendance"]["student_id"] == test_student.id
+    assert home["attendance"]["stats"]["attendance_rate"] == 100.0
+    assert [item["student"]["user_id"] for item in home["open_invoices"]] == [test_student.id]
+
+    # 학부모: 연결된 자녀 기준
+    home = client.get(url, headers=auth_headers_for(parent)).json()["data"]
+    assert home["my_role"] == "PARENT"
+    assert home["attendance"]["student_id"] == test_student.id
+    assert [item["status"] for item in home["open_invoices"]] == ["SENT"]
+
+
+def test_home_rejects_non_member(client, test_teacher, test_student, make_group, make_user, auth_headers_for):
+    group = make_group(test_teacher, students=[test_student])
+    outsider = make_user("outsider@test.com", UserRole.STUDENT)
+
+    response = client.get(f"/api/v1/groups/{group.id}/home", headers=auth_headers_for(outsider))
+
+    assert response.status_code == 403
+
+
+def test_home_query_count_is_constant(db_session, new_session, count_queries, test_teacher, test_student,
+                                      make_user, make_group):
+    sibling = make_user("student2@test.com", UserRole.STUDENT, name="다른 학생")
+    small = make_group(test_teacher, students=[test_student, sibling], name="작은 반")
+    large = make_group(test_teacher, students=[test_student, sibling], name="큰 반")
+    _seed_home(db_session, small, test_teacher, [test_student, sibling], upcoming=1, textbooks=1)
+    _seed_home(db_session, large, test_teacher, [test_student, sibling], upcoming=10, textbooks=8)
+
+    counts = []
+    for group_id in (small.id, large.id):
+        db = new_session()
+        teacher = db.get(type(test_teacher), test_teacher.id)
+        with count_queries() as statements:
+            home = GroupHomeService.get_group_home(db, teacher, group_id, schedule_limit=10)
+        counts.append(len(statements))
+        db.close()
+
+    assert len(home.upcoming_schedules) == 10
+    assert len(home.textbooks) == 8
+    # 그룹 1 + 멤버십 1 + 섹션 5 (멤버/일정/교재/출결/청구서), 일정·교재 수와 무관
+    assert counts == [7, 7]
+
+
+# ==========================
+# 섹션 동시 조회 (GROUP_HOME_PARALLEL_QUERIES)
+# ==========================
+
+CONCURRENT_REQUESTS = 4
+
+
+@pytest.fixture
+def parallel_sessionmaker(tmp_path, monkeypatch):
+    # 최대 커넥션 수 = 동시 요청 수: 요청 스레드가 커넥션을 쥔 채 섹션을 기다리면 섹션이 커넥션을 못 얻음
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 2)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", CONCURRENT_REQUESTS - 2)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT_SECONDS", 3)
+    monkeypatch.setattr(settings, "GROUP_HOME_PARALLEL_QUERIES", True)
+    # SQLite 파일(WAL)은 연결 간 동시 읽기가 가능하므로 SQLite 제외 조건만 풀고 동시 실행 경로를 그대로 사용
+    monkeypatch.setattr(GroupHomeService, "_can_run_in_parallel", staticmethod(lambda bind: True))
+    monkeypatch.setattr(GroupHomeService, "_executor", None)
+    engine = create_db_engine(f"sqlite:///{os.path.join(tmp_path, 'home.db')}")
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    if GroupHomeService._executor is not None:
+        GroupHomeService._executor.shutdown(wait=True)
+    engine.dispose()
+
+
+def test_parallel_sections_do_not_exhaust_pool(parallel_sessionmaker):
+    Session = parallel_sessionmaker
+    db = Session()
+    teacher = User(email="teacher@test.com", password_hash="x", name="선생님", role=UserRole.TEACHER)
+    students = [User(email=f"student{i}@test.com", password_hash="x", name=f"학생{i}", role=UserRole.STUDENT)
+                for i in range(2)]
+    db.add_all([teacher, *students])
+    db.flush()
+    group = Group(name="테스트 반", subject="수학", owner_id=teacher.id)
+    db.add(group)
+    db.flush()
+    db.add_all([GroupMember(group_id=group.id, user_id=user.id, role=role,
+                            invite_status=GroupMemberInviteStatus.ACCEPTED)
+                for user, role in [(teacher, GroupMemberRole.TEACHER)] + [(s, GroupMemberRole.STUDENT) for s in students]])
+    _seed_home(db, group, teacher, students)
+    teacher_id, group_id = teacher.id, group.id
+    db.close()
+
+    section_threads = set()
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        section_threads.add(threading.current_thread().name)
+
+    event.listen(Session.kw["bind"], "before_cursor_execute", on_execute)
+    barrier = threading.Barrier(CONCURRENT_REQUESTS)
+
+    def request():
+        db = Session()
+        try:
+            # 인증 의존성처럼 요청 세션이 먼저 커넥션을 잡은 상태에서 동시에 시작
+            user = db.get(User, teacher_id)
+            barrier.wait(timeout=10)
+            return GroupHomeService.get_group_home(db, user, group_id)
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=CONCURRENT_REQUESTS) as pool:
+        homes = list(pool.map(lambda _: request(), range(CONCURRENT_REQUESTS)))
+
+    assert GroupHomeService._executor._max_workers == CONCURRENT_REQUESTS // 2
+    assert any(name.startswith("group-home") for name in section_threads)
+    for home in homes:
+        assert home.group.member_count == 3
+        assert [item.title for item in home.upcoming_schedules] == ["예정 수업 0", "예정 수업 1", "예정 수업 2", "변경된 수업"]
+        assert len(home.textbooks) == 2
+        assert home.attendance.stats.total_sessions == 2
+        assert [item.status for item in home.open_invoices] == ["SENT", "OVERDUE"]
@@ -0,0 +1,64 @@
+"""
+그룹 목록 API 테스트 (GET /api/v1/groups, 멤버 수 + 커서 페이지네이션)
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.group import GroupMember, GroupMemberRole, GroupMemberInviteStatus
+from app.models.user import UserRole
+from app.services.group_service import GroupService
+
+
+def _seed_groups(db, teacher, make_group, make_user, count):
+    """학생 수가 0..count-1명인 그룹 count개 (생성 시각 하루 간격, 최신이 마지막), 대기 중 멤버 1명씩"""
+    base = datetime(2025, 3, 1, 9)
+    groups = []
+    for i in range(count):
+        students = [make_user(f"s{i}-{j}@test.com", UserRole.STUDENT) for j in range(i)]
+        group = make_group(teacher, students=students, name=f"반 {i}")
+        group.created_at = base + timedelta(days=i)
+        pending = make_user(f"pending{i}@test.com", UserRole.STUDENT)
+        db.add(GroupMember(group_id=group.id, user_id=pending.id, role=GroupMemberRole.STUDENT,
+                           invite_status=GroupMemberInviteStatus.PENDING))
+        groups.append(group)
+    db.commit()
+    return [group.id for group in groups]
+
+
+def test_group_list_pages_with_cursor_and_member_counts(client, db_session, test_teacher, teacher_auth_headers,
+                                                        make_group, make_user):
+    group_ids = _seed_groups(db_session, test_teacher, make_group, make_user, 5)
+
+    first = client.get("/api/v1/groups", params={"size": 2}, headers=teacher_auth_headers)
+    assert first.status_code == 200, first.text
+    page = first.json()["data"]
+    assert page["pagination"]["total"] == 5
+    assert page["has_more"] is True
+
+    items = page["items"]
+    while page["has_more"]:
+        response = client.get("/api/v1/groups", params={"size": 2, "cursor": page["next_cursor"]},
+                              headers=teacher_auth_headers)
+        assert response.status_code == 200
+        page = response.json()["data"]
+        items += page["items"]
+
+    # 최신순, 승인된 멤버만 (선생님 1 + 학생 i명)
+    assert [item["group_id"] for item in items] == group_ids[::-1]
+    assert [item["member_count"] for item in items] == [5, 4, 3, 2, 1]
+    assert page["next_cursor"] is None
+
+
+def test_group_list_query_count_is_constant(db_session, new_session, count_queries, test_teacher,
+                                            make_group, make_user):
+    _seed_groups(db_session, test_teacher, make_group, make_user, 12)
+
+    db = new_session()
+    teacher = db.get(type(test_teacher), test_teacher.id)
+    with count_queries() as statements:
+        result = GroupService.get_groups_for_user(db, teacher, size=10)
+
+    assert len(result.items) == 10
+    assert result.items[0].member_count == 12
+    # 전체 개수 1 + 그룹/멤버 수 조인 1 (그룹별 COUNT 쿼리 없음)
+    assert len(statements) == 2
@@ -0,0 +1,109 @@
+"""
+초대 코드 동시 사용 테스트 (조건부 원자적 UPDATE + UNIQUE(group_id, user_id))
+
+요청마다 별도 세션/스레드가 필요하므로 공용 인메모리 DB 대신 임시 SQLite 파일을 사용합니다.
+"""
+
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.database import Base, create_db_engine
+from app.models.group import Group, GroupMember, GroupMemberRole, GroupMemberInviteStatus, InviteCode
+from app.models.user import User, UserRole
+from app.services.group_service import GroupService
+
+CONCURRENT_JOINS = 20
+
+
+@pytest.fixture
+def file_sessionmaker(tmp_path, monkeypatch):
+    # 스레드마다 Barrier에서 커넥션을 잡고 기다리므로 풀 크기를 동시 요청 수 이상으로
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", CONCURRENT_JOINS)
+    engine = create_db_engine(f"sqlite:///{os.path.join(tmp_path, 'invite.db')}")
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    engine.dispose()
+
+
+def _seed(Session, students: int, max_uses: int):
+    """선생님 1명, 그룹 1개, 학생 초대 코드 1개, 학생 N명"""
+    db = Session()
+    try:
+        teacher = User(email="teacher@test.com", password_hash="x", name="선생님", role=UserRole.TEACHER)
+        db.add(teacher)
+        db.flush()
+        group = Group(name="테스트 반", subject="수학", owner_id=teacher.id)
+        db.add(group)
+        db.flush()
+        db.add(GroupMember(group_id=group.id, user_id=teacher.id, role=GroupMemberRole.TEACHER,
+                           invite_status=GroupMemberInviteStatus.ACCEPTED))
+        invite_code = InviteCode(code=GroupService._generate_unique_code(db), group_id=group.id,
+                                 created_by=teacher.id, target_role=GroupMemberRole.STUDENT, max_uses=max_uses,
+                                 used_count=0, expires_at=datetime.utcnow() + timedelta(days=7), is_active=True)
+        db.add(invite_code)
+        users = [User(email=f"student{i}@test.com", password_hash="x", name=f"학생{i}", role=UserRole.STUDENT)
+                 for i in range(students)]
+        db.add_all(users)
+        db.commit()
+        return group.id, invite_code.id, invite_code.code, [user.id for user in users]
+    finally:
+        db.close()
+
+
+def _join_concurrently(Session, code, user_ids):
+    """모든 스레드가 동시에 출발하도록 Barrier로 맞춘 뒤 가입, 결과별 개수"""
+    barrier = threading.Barrier(len(user_ids))
+
+    def join(user_id):
+        db = Session()
+        try:
+            user = db.get(User, user_id)
+            barrier.wait(timeout=30)
+            _, member, error = GroupService.join_group_with_code(db, user, code)
+            return "joined" if member else error
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=len(user_ids)) as pool:
+        return Counter(pool.map(join, user_ids))
+
+
+def _final_state(Session, group_id, invite_code_id):
+    db = Session()
+    try:
+        invite_code = db.get(InviteCode, invite_code_id)
+        students = db.query(func.count(GroupMember.id)).filter(
+            GroupMember.group_id == group_id, GroupMember.role == GroupMemberRole.STUDENT,
+        ).scalar()
+        return invite_code.used_count, invite_code.is_active, students
+    finally:
+        db.close()
+
+
+def test_single_use_code_redeemed_once_under_concurrent_joins(file_sessionmaker):
+    group_id, invite_code_id, code, user_ids = _seed(file_sessionmaker, CONCURRENT_JOINS, max_uses=1)
+
+    results = _join_concurrently(file_sessionmaker, code, user_ids)
+
+    assert results["joined"] == 1
+    assert results["이미 사용된 초대 코드입니다. 선생님께 새 코드를 요청해주세요"] == CONCURRENT_JOINS - 1
+    assert _final_state(file_sessionmaker, group_id, invite_code_id) == (1, False, 1)
+
+
+def test_same_student_joining_concurrently_becomes_member_once(file_sessionmaker):
+    group_id, invite_code_id, code, user_ids = _seed(file_sessionmaker, 1, max_uses=CONCURRENT_JOINS)
+
+    results = _join_concurrently(file_sessionmaker, code, user_ids * 10)
+
+    assert results["joined"] == 1
+    assert results["이미 이 그룹에 참여하고 있습니다"] == 9
+    # 실패한 가입의 사용 횟수 증가는 함께 롤백
+    assert _final_state(file_sessionmaker, group_id, invite_code_id) == (1, True, 1)
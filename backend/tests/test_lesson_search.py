@@ -0,0 +1,99 @@
+"""
+수업 기록 전문 검색 테스트 (GET /api/v1/lesson-records/search, SQLite FTS5)
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.user import UserRole
+from app.schemas.lesson import CreateLessonRecordPayload, UpdateLessonRecordPayload
+from app.services.lesson_search_service import LessonSearchService
+from app.services.lesson_service import LessonService
+
+
+def _record(db, teacher, group, content, homework=None, days_ago=1):
+    """완료된 일정 + 수업 기록 작성 (서비스 경유, 검색 색인 동기화)"""
+    start_at = datetime.utcnow().replace(microsecond=0) - timedelta(days=days_ago, hours=3)
+    schedule = Schedule(group_id=group.id, title="수학 수업", type=ScheduleType.REGULAR, start_at=start_at,
+                        end_at=start_at + timedelta(hours=2), status=ScheduleStatus.DONE)
+    db.add(schedule)
+    db.commit()
+    return LessonService.create_lesson_record(
+        db, teacher, schedule.id, CreateLessonRecordPayload(content=content, homework=homework)
+    ).lesson_record_id
+
+
+def test_search_ranks_content_matches_and_filters_my_groups(client, db_session, test_teacher, test_student,
+                                                            student_auth_headers, make_group, make_user):
+    other_teacher = make_user("teacher2@test.com", UserRole.TEACHER)
+    group = make_group(test_teacher, students=[test_student])
+    other = make_group(other_teacher, name="다른 반")
+    in_content = _record(db_session, test_teacher, group, "오늘은 이차방정식의 근의 공식을 배웠습니다.", days_ago=3)
+    in_homework = _record(db_session, test_teacher, group, "함수의 그래프를 복습했습니다.",
+                          homework="이차방정식 문제 10개 풀기", days_ago=1)
+    _record(db_session, test_teacher, group, "삼각형의 넓이 공식을 배웠습니다.")
+    _record(db_session, other_teacher, other, "다른 반도 이차방정식을 배웠습니다.")
+
+    response = client.get("/api/v1/lesson-records/search", params={"q": "이차방정식"}, headers=student_auth_headers)
+
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    # 내 그룹 기록만, 내용 일치(가중치 높음)가 숙제 일치보다 먼저
+    assert [item["lesson_record_id"] for item in data["items"]] == [in_content, in_homework]
+    assert data["pagination"]["total"] == 2
+    assert "이차방정식" in data["items"][0]["snippet"]
+    assert data["items"][0]["group_name"] == "테스트 반"
+    assert data["items"][0]["score"] > data["items"][1]["score"] > 0
+
+    # 페이지네이션
+    second = client.get("/api/v1/lesson-records/search", params={"q": "이차방정식", "size": 1, "page": 2},
+                        headers=student_auth_headers).json()["data"]
+    assert [item["lesson_record_id"] for item in second["items"]] == [in_homework]
+    assert (second["pagination"]["has_prev"], second["pagination"]["has_next"]) == (True, False)
+
+    # 다른 그룹 지정 → 403
+    forbidden = client.get("/api/v1/lesson-records/search", params={"q": "이차방정식", "group_id": other.id},
+                           headers=student_auth_headers)
+    assert forbidden.status_code == 403
+
+
+def test_search_index_follows_update_and_delete(db_session, test_teacher, test_student, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    record_id = _record(db_session, test_teacher, group, "오늘은 이차방정식의 근의 공식을 배웠습니다.")
+
+    def hits(query):
+        return [item.lesson_record_id for item in LessonSearchService.search(db_session, test_student, query).items]
+
+    assert hits("근의 공식") == [record_id]
+
+    LessonService.update_lesson_record(db_session, test_teacher, record_id, UpdateLessonRecordPayload(
+        content="오늘은 판별식으로 근의 개수를 구했습니다.",
+    ))
+    assert hits("근의 공식") == []
+    assert hits("판별식") == [record_id]
+
+    LessonService.delete_lesson_record(db_session, test_teacher, record_id)
+    assert hits("판별식") == []
+
+
+def test_search_query_count_is_constant(db_session, new_session, count_queries, test_teacher, test_student,
+                                        make_group):
+    group = make_group(test_teacher, students=[test_student])
+    for i in range(15):
+        _record(db_session, test_teacher, group, f"{i}번째 수업: 이차방정식 응용 문제를 풀었습니다.", days_ago=i + 1)
+
+    group_id = group.id
+    db = new_session()
+    student = db.get(type(test_student), test_student.id)
+    with count_queries() as statements:
+        result = LessonSearchService.search(db, student, "이차방정식", size=10)
+    assert (len(result.items), result.pagination.total) == (10, 15)
+    # 전체 개수 1 + 페이지 1 (내 그룹은 서브쿼리)
+    assert len(statements) == 2
+
+    db = new_session()
+    student = db.get(type(test_student), test_student.id)
+    with count_queries() as statements:
+        LessonSearchService.search(db, student, "이차방정식", group_id=group_id, size=10)
+    # 멤버십 1 + 전체 개수 1 + 페이지 1
+    assert len(statements) == 3
@@ -0,0 +1,83 @@
+"""
+그룹 수업 기록 타임라인 API 테스트 (GET /api/v1/lesson-records/groups/{group_id})
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.lesson import LessonRecord, ProgressRecord
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.textbook import Textbook
+from app.models.user import UserRole
+from app.services.lesson_service import LessonService
+
+
+def _seed_lessons(db, group, teacher, count):
+    """일정 + 수업 기록 + 진도 기록 count개 (하루 간격, 최신이 마지막)"""
+    textbook = Textbook(group_id=group.id, title="수학의 정석", total_pages=300)
+    db.add(textbook)
+    db.flush()
+    base = datetime(2026, 3, 1, 15, 0)
+    record_ids = []
+    for i in range(count):
+        schedule = Schedule(group_id=group.id, title=f"수업 {i}", type=ScheduleType.REGULAR,
+                            start_at=base + timedelta(days=i), end_at=base + timedelta(days=i, hours=2),
+                            status=ScheduleStatus.DONE)
+        db.add(schedule)
+        db.flush()
+        record = LessonRecord(schedule_id=schedule.id, group_id=group.id, created_by=teacher.id,
+                              content=f"{i}번째 수업 내용입니다.")
+        db.add(record)
+        db.flush()
+        db.add(ProgressRecord(lesson_record_id=record.id, textbook_id=textbook.id,
+                              start_page=i * 10 + 1, end_page=i * 10 + 10))
+        record_ids.append(record.id)
+    db.commit()
+    return record_ids
+
+
+def test_timeline_pages_newest_first_with_cursor(client, db_session, test_teacher, test_student,
+                                                 student_auth_headers, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    record_ids = _seed_lessons(db_session, group, test_teacher, 5)
+    url = f"/api/v1/lesson-records/groups/{group.id}"
+
+    first = client.get(url, params={"limit": 3}, headers=student_auth_headers)
+    assert first.status_code == 200
+    page = first.json()["data"]
+    assert [item["lesson_record_id"] for item in page["items"]] == record_ids[::-1][:3]
+    assert page["has_more"] is True
+    assert page["items"][0]["teacher_name"] == test_teacher.name
+    assert page["items"][0]["progress_records"][0]["textbook_title"] == "수학의 정석"
+
+    second = client.get(url, params={"limit": 3, "cursor": page["next_cursor"]}, headers=student_auth_headers)
+    assert second.status_code == 200
+    page = second.json()["data"]
+    assert [item["lesson_record_id"] for item in page["items"]] == record_ids[::-1][3:]
+    assert page["has_more"] is False
+    assert page["next_cursor"] is None
+
+
+def test_timeline_rejects_non_member(client, test_teacher, test_student, make_group, make_user,
+                                     auth_headers_for):
+    group = make_group(test_teacher, students=[test_student])
+    outsider = make_user("outsider@test.com", UserRole.STUDENT)
+
+    response = client.get(f"/api/v1/lesson-records/groups/{group.id}", headers=auth_headers_for(outsider))
+
+    assert response.status_code == 403
+
+
+def test_timeline_query_count_is_constant(db_session, new_session, count_queries, test_teacher,
+                                          test_student, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    _seed_lessons(db_session, group, test_teacher, 12)
+
+    group_id = group.id
+    db = new_session()
+    student = db.get(type(test_student), test_student.id)
+    with count_queries() as statements:
+        result = LessonService.get_group_timeline(db, student, group_id, limit=10)
+
+    assert len(result.items) == 10
+    # 멤버십 1 + 목록 1 + 진도 기록(교재 조인) 1
+    assert len(statements) == 3
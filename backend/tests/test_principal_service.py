@@ -0,0 +1,80 @@
+"""
+PrincipalService 인증 사용자 캐시 테스트
+"""
+
+import pytest
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.shared_store import LocalStore
+from app.core.security import verify_password
+from app.models.user import User
+from app.services import principal_service
+from app.services.principal_service import PrincipalService, SHARED_KEY_PREFIX
+
+
+@pytest.fixture
+def principal_cache(monkeypatch):
+    cache = TTLCache(maxsize=10, ttl_seconds=60)
+    store = LocalStore()
+    monkeypatch.setattr(settings, "AUTH_PRINCIPAL_CACHE_TTL_SECONDS", 60)
+    monkeypatch.setattr(PrincipalService, "_cache", cache)
+    monkeypatch.setattr(principal_service, "get_shared_store", lambda: store)
+    return cache, store
+
+
+def test_cached_principal_is_attached_without_query(db_session, test_teacher, principal_cache):
+    cache, store = principal_cache
+    user_id = test_teacher.id
+
+    db_session.expunge_all()
+    PrincipalService.get_user(db_session, user_id)
+    assert cache.get(user_id)["email"] == "teacher@test.com"
+    assert store.get(SHARED_KEY_PREFIX + user_id) is not None
+
+    db_session.expunge_all()
+    user = PrincipalService.get_user(db_session, user_id)
+    assert user in db_session
+    assert user.name == "Test Teacher"
+    assert user.is_active is True
+    # 스냅샷에 없는 컬럼은 지연 로딩
+    assert verify_password("password123", user.password_hash)
+
+    # 캐시에서 복원한 사용자도 수정 사항이 저장됨
+    user.name = "Renamed Teacher"
+    db_session.commit()
+    db_session.expunge_all()
+    assert db_session.query(User).filter(User.id == user_id).one().name == "Renamed Teacher"
+
+
+def test_shared_store_hit_fills_local_cache(db_session, test_teacher, principal_cache):
+    cache, store = principal_cache
+    user_id = test_teacher.id
+
+    db_session.expunge_all()
+    PrincipalService.get_user(db_session, user_id)
+    cache.clear()
+
+    db_session.expunge_all()
+    user = PrincipalService.get_user(db_session, user_id)
+    assert user.email == "teacher@test.com"
+    assert cache.get(user_id) is not None
+
+
+def test_invalidate_user_drops_local_and_shared_entries(db_session, test_teacher, principal_cache):
+    cache, store = principal_cache
+    user_id = test_teacher.id
+
+    db_session.expunge_all()
+    PrincipalService.get_user(db_session, user_id)
+    PrincipalService.invalidate_user(user_id)
+
+    assert cache.get(user_id) is None
+    assert store.get(SHARED_KEY_PREFIX + user_id) is None
+
+
+def test_unknown_user_is_not_cached(db_session, principal_cache):
+    cache, _ = principal_cache
+
+    assert PrincipalService.get_user(db_session, "missing-user") is None
+    assert len(cache) == 0
@@ -0,0 +1,144 @@
+"""
+ReadReceiptService 읽음 상태 버퍼 테스트 (버퍼 병합, flush의 CASE UPDATE 기록, 워커 없을 때 즉시 기록)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.background import PeriodicWorker
+from app.models.lesson import LessonRecord
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.services import read_receipt_service
+from app.services.read_receipt_service import ReadReceiptService, PARENT_VIEWED, STUDENT_VIEWED
+
+
+def test_record_without_worker_asks_caller_to_write(monkeypatch):
+    monkeypatch.setattr(ReadReceiptService, "_worker", None)
+
+    assert ReadReceiptService.record("lesson-1", PARENT_VIEWED, datetime.utcnow()) is False
+
+
+def test_record_keeps_earliest_view_per_column(monkeypatch):
+    worker = PeriodicWorker("test-read-receipts", 3600, lambda: None)
+    worker.start()
+    monkeypatch.setattr(ReadReceiptService, "_worker", worker)
+    monkeypatch.setattr(ReadReceiptService, "_buffer", {})
+    try:
+        first = datetime(2025, 11, 18, 16, 30)
+        assert ReadReceiptService.record("lesson-1", PARENT_VIEWED, first + timedelta(minutes=5))
+        assert ReadReceiptService.record("lesson-1", PARENT_VIEWED, first)
+        assert ReadReceiptService.record("lesson-1", STUDENT_VIEWED, first + timedelta(hours=1))
+
+        assert ReadReceiptService.pending("lesson-1", PARENT_VIEWED) == first
+        assert ReadReceiptService.pending("lesson-1", STUDENT_VIEWED) == first + timedelta(hours=1)
+        assert ReadReceiptService.get_stats()["pending"] == 2
+    finally:
+        worker.stop()
+
+
+# ==========================
+# DB 기록 (flush / 즉시 기록)
+# ==========================
+
+
+def _seed_records(db, group, teacher, count):
+    base = datetime(2026, 3, 1, 15, 0)
+    record_ids = []
+    for i in range(count):
+        schedule = Schedule(group_id=group.id, title=f"수업 {i}", type=ScheduleType.REGULAR,
+                            start_at=base + timedelta(days=i), end_at=base + timedelta(days=i, hours=2),
+                            status=ScheduleStatus.DONE)
+        db.add(schedule)
+        db.flush()
+        record = LessonRecord(schedule_id=schedule.id, group_id=group.id, created_by=teacher.id,
+                              content=f"{i}번째 수업 내용입니다.")
+        db.add(record)
+        db.flush()
+        record_ids.append(record.id)
+    db.commit()
+    return record_ids
+
+
+def _viewed(db, record_id):
+    record = db.get(LessonRecord, record_id)
+    return record.parent_viewed_at, record.student_viewed_at
+
+
+@pytest.fixture
+def receipt_worker(db_engine, monkeypatch):
+    """실행 중인 워커(주기 flush 없음) + 테스트 DB에 기록하는 flush 세션"""
+    worker = PeriodicWorker("test-read-receipts", 3600, lambda: None)
+    worker.start()
+    monkeypatch.setattr(ReadReceiptService, "_worker", worker)
+    monkeypatch.setattr(ReadReceiptService, "_buffer", {})
+    monkeypatch.setattr(ReadReceiptService, "_stats", dict(ReadReceiptService._stats, flushes=0, flushed_rows=0))
+    monkeypatch.setattr(read_receipt_service, "SessionLocal", sessionmaker(bind=db_engine, autoflush=False))
+    yield worker
+    worker.stop()
+
+
+def test_flush_writes_buffered_views_with_case_update(receipt_worker, client, db_session, test_teacher,
+                                                      test_student, test_parent, student_auth_headers,
+                                                      make_group, auth_headers_for):
+    group = make_group(test_teacher, students=[test_student], parents=[(test_parent, test_student)])
+    first, second = _seed_records(db_session, group, test_teacher, 2)
+    # 이미 기록된 열람 시각은 덮어쓰지 않음
+    earlier = datetime(2026, 3, 2, 9, 0)
+    db_session.get(LessonRecord, second).parent_viewed_at = earlier
+    db_session.commit()
+    updated_at = {rid: db_session.get(LessonRecord, rid).updated_at for rid in (first, second)}
+
+    parent_headers = auth_headers_for(test_parent)
+    opened = client.get(f"/api/v1/lesson-records/{first}", headers=parent_headers).json()["data"]
+    reopened = client.get(f"/api/v1/lesson-records/{first}", headers=parent_headers).json()["data"]
+    student_views = {}
+    for record_id in (first, second):
+        response = client.get(f"/api/v1/lesson-records/{record_id}", headers=student_auth_headers)
+        assert response.status_code == 200, response.text
+        student_views[record_id] = response.json()["data"]["student_viewed_at"]
+    ReadReceiptService.record(second, PARENT_VIEWED, datetime(2026, 3, 5, 9, 0))
+
+    # 조회 시에는 커밋 없이 버퍼에만 (다시 열어도 같은 시각 표시)
+    assert opened["parent_viewed_at"] == reopened["parent_viewed_at"]
+    assert ReadReceiptService.get_stats()["pending"] == 4
+    db_session.expire_all()
+    assert _viewed(db_session, first) == (None, None)
+
+    assert ReadReceiptService.flush() == 3
+
+    db_session.expire_all()
+    parent_viewed, student_viewed = _viewed(db_session, first)
+    assert parent_viewed.isoformat() == opened["parent_viewed_at"]
+    assert student_viewed.isoformat() == student_views[first]
+    parent_viewed, student_viewed = _viewed(db_session, second)
+    assert parent_viewed == earlier
+    assert student_viewed.isoformat() == student_views[second]
+    assert {rid: db_session.get(LessonRecord, rid).updated_at for rid in (first, second)} == updated_at
+    stats = ReadReceiptService.get_stats()
+    assert (stats["pending"], stats["flushes"], stats["flushed_rows"]) == (0, 1, 3)
+    assert stats["last_flush"]["entries"] == 4
+
+    # 비어 있으면 DB 접근 없이 0
+    assert ReadReceiptService.flush() == 0
+
+
+def test_view_is_committed_immediately_without_worker(monkeypatch, client, db_session, test_teacher,
+                                                      test_student, student_auth_headers, make_group):
+    # 버퍼 비활성화(LESSON_READ_RECEIPT_BUFFER_ENABLED=False) → 워커 없음 → 조회 요청에서 바로 커밋
+    monkeypatch.setattr(ReadReceiptService, "_worker", None)
+    monkeypatch.setattr(ReadReceiptService, "_buffer", {})
+    group = make_group(test_teacher, students=[test_student])
+    (record_id,) = _seed_records(db_session, group, test_teacher, 1)
+    updated_at = db_session.get(LessonRecord, record_id).updated_at
+
+    first = client.get(f"/api/v1/lesson-records/{record_id}", headers=student_auth_headers).json()["data"]
+    again = client.get(f"/api/v1/lesson-records/{record_id}", headers=student_auth_headers).json()["data"]
+
+    assert ReadReceiptService.get_stats()["pending"] == 0
+    db_session.expire_all()
+    record = db_session.get(LessonRecord, record_id)
+    assert record.student_viewed_at.isoformat() == first["student_viewed_at"] == again["student_viewed_at"]
+    assert record.parent_viewed_at is None
+    assert record.updated_at == updated_at
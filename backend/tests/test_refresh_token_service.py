@@ -0,0 +1,84 @@
+"""
+RefreshTokenService 토큰 계열 교체/재사용 감지/정리 테스트
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.config import settings
+from app.core.bloom import BloomFilter
+from app.core.cache import TTLCache
+from app.core.security import decode_refresh_token
+from app.models.refresh_token import RefreshToken
+from app.services.refresh_token_service import RefreshTokenService
+
+
+@pytest.fixture(autouse=True)
+def revoked_memory(monkeypatch):
+    monkeypatch.setattr(RefreshTokenService, "_revoked_filter", BloomFilter(capacity=100))
+    monkeypatch.setattr(RefreshTokenService, "_revoked_recent", TTLCache(maxsize=100, ttl_seconds=60))
+    monkeypatch.setattr(settings, "REFRESH_TOKEN_REUSE_GRACE_SECONDS", 0)
+
+
+def _login(db, user):
+    token = RefreshTokenService.issue(db, user.id)
+    db.commit()
+    return decode_refresh_token(token)
+
+
+def test_rotation_keeps_family_and_marks_previous_token_used(db_session, test_teacher):
+    first = _login(db_session, test_teacher)
+
+    second = decode_refresh_token(RefreshTokenService.rotate(db_session, first))
+
+    assert second["fid"] == first["fid"]
+    assert second["jti"] != first["jti"]
+    used = db_session.get(RefreshToken, first["jti"])
+    db_session.refresh(used)
+    assert used.used_at is not None
+    assert db_session.get(RefreshToken, second["jti"]).parent_jti == first["jti"]
+
+
+def test_reuse_revokes_whole_family(db_session, test_teacher):
+    first = _login(db_session, test_teacher)
+    second = decode_refresh_token(RefreshTokenService.rotate(db_session, first))
+
+    # 이미 교체된 토큰 재사용 → 계열 폐기
+    with pytest.raises(HTTPException) as exc:
+        RefreshTokenService.rotate(db_session, first)
+    assert exc.value.status_code == 401
+
+    # 정상 사용자의 최신 토큰도 거절 (메모리에서 바로 거절)
+    assert RefreshTokenService.is_revoked_in_memory(first["fid"])
+    with pytest.raises(HTTPException):
+        RefreshTokenService.rotate(db_session, second)
+
+    db_session.expire_all()
+    rows = db_session.query(RefreshToken).filter(RefreshToken.family_id == first["fid"]).all()
+    assert rows and all(row.revoked_at is not None for row in rows)
+
+
+def test_concurrent_refresh_within_grace_is_not_reuse(db_session, test_teacher, monkeypatch):
+    monkeypatch.setattr(settings, "REFRESH_TOKEN_REUSE_GRACE_SECONDS", 30)
+    first = _login(db_session, test_teacher)
+
+    RefreshTokenService.rotate(db_session, first)
+    sibling = decode_refresh_token(RefreshTokenService.rotate(db_session, first))
+
+    assert sibling["fid"] == first["fid"]
+    assert not RefreshTokenService.is_revoked_in_memory(first["fid"])
+
+
+def test_revoke_user_and_purge_expired(db_session, test_teacher):
+    _login(db_session, test_teacher)
+    other = _login(db_session, test_teacher)
+
+    assert RefreshTokenService.revoke_user(db_session, test_teacher.id) == 2
+    assert RefreshTokenService.is_revoked_in_memory(other["fid"])
+
+    result = RefreshTokenService.purge_expired(db_session, now=datetime.utcnow() + timedelta(days=30), batch_size=1)
+    assert result["purged"] == 2
+    assert result["batches"] == 3
+    assert db_session.query(RefreshToken).count() == 0
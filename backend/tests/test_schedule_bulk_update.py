@@ -0,0 +1,138 @@
+"""
+일정 일괄 변경 API 테스트 (POST /api/v1/schedules/bulk)
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.notification import Notification, NotificationType
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.user import UserRole
+
+
+def _seed(db, group):
+    """
+    2일 뒤부터 하루 간격 일정 3개 + 변경 대상에서 제외되는 일정
+    (12시간 뒤 일정: 24시간 이내, 4일 뒤 완료 처리된 일정)
+    """
+    base = datetime.utcnow().replace(second=0, microsecond=0)
+    schedules = [
+        Schedule(group_id=group.id, title="수학 수업", type=ScheduleType.REGULAR,
+                 start_at=base + timedelta(days=days), end_at=base + timedelta(days=days, hours=2),
+                 status=schedule_status, location="학생 집")
+        for days, schedule_status in [
+            (2, ScheduleStatus.SCHEDULED),
+            (3, ScheduleStatus.SCHEDULED),
+            (4, ScheduleStatus.RESCHEDULED),
+            (0.5, ScheduleStatus.SCHEDULED),
+            (4, ScheduleStatus.DONE),
+        ]
+    ]
+    db.add_all(schedules)
+    db.commit()
+    targets = [schedule.id for schedule in schedules[:3]]
+    excluded = [schedule.id for schedule in schedules[3:]]
+    return base, targets, excluded
+
+
+def _bulk(client, headers, group_id, base, **body):
+    return client.post("/api/v1/schedules/bulk", headers=headers, json=dict(
+        group_id=group_id,
+        from_date=base.date().isoformat(),
+        to_date=(base + timedelta(days=7)).date().isoformat(),
+        **body,
+    ))
+
+
+def _member_notifications(db, user_ids):
+    return {
+        user_id: db.query(Notification).filter(Notification.user_id == user_id).all()
+        for user_id in user_ids
+    }
+
+
+def test_bulk_cancel_skips_within_24h_and_notifies_each_member_once(
+    client, db_session, test_teacher, test_student, teacher_auth_headers, make_group, make_user,
+):
+    sibling = make_user("student2@test.com", UserRole.STUDENT)
+    parent = make_user("parent2@test.com", UserRole.PARENT)
+    group = make_group(test_teacher, students=[test_student, sibling], parents=[(parent, test_student)])
+    base, targets, excluded = _seed(db_session, group)
+
+    response = _bulk(client, teacher_auth_headers, group.id, base, action="cancel", reason="연말 휴강 주간입니다")
+
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert data["updated_count"] == 3
+    assert data["schedule_ids"] == targets
+
+    db_session.expire_all()
+    assert all(db_session.get(Schedule, sid).status == ScheduleStatus.CANCELED for sid in targets)
+    assert [db_session.get(Schedule, sid).status for sid in excluded] == [ScheduleStatus.SCHEDULED, ScheduleStatus.DONE]
+
+    # 일정 3개여도 멤버별 알림 1건, 요청한 선생님은 제외
+    notifications = _member_notifications(db_session, [test_student.id, sibling.id, parent.id, test_teacher.id])
+    assert [len(notifications[uid]) for uid in (test_student.id, sibling.id, parent.id)] == [1, 1, 1]
+    assert notifications[test_teacher.id] == []
+    notification = notifications[test_student.id][0]
+    assert notification.type == NotificationType.SCHEDULE_CANCELLED
+    assert "3회" in notification.message and "연말 휴강 주간입니다" in notification.message
+
+
+def test_bulk_shift_moves_start_and_end_on_sqlite(
+    client, db_session, test_teacher, test_student, teacher_auth_headers, make_group,
+):
+    group = make_group(test_teacher, students=[test_student])
+    base, targets, excluded = _seed(db_session, group)
+    # 마이크로초가 있는 값도 그대로 유지되어야 함
+    db_session.get(Schedule, targets[0]).start_at += timedelta(microseconds=123456)
+    db_session.commit()
+    before = {sid: (db_session.get(Schedule, sid).start_at, db_session.get(Schedule, sid).end_at)
+              for sid in targets + excluded}
+
+    response = _bulk(client, teacher_auth_headers, group.id, base, action="shift", shift_minutes=90)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["schedule_ids"] == targets
+    db_session.expire_all()
+    for sid in targets:
+        schedule = db_session.get(Schedule, sid)
+        assert (schedule.start_at, schedule.end_at) == tuple(t + timedelta(minutes=90) for t in before[sid])
+        assert schedule.status == ScheduleStatus.RESCHEDULED
+    for sid in excluded:
+        schedule = db_session.get(Schedule, sid)
+        assert (schedule.start_at, schedule.end_at) == before[sid]
+
+    # 저장 형식이 다른 행과 같아야 경계 값(같은 시각) 비교에 포함됨
+    for sid in targets:
+        shifted_start, shifted_end = (t + timedelta(minutes=90) for t in before[sid])
+        assert db_session.query(Schedule.id).filter(
+            Schedule.start_at >= shifted_start, Schedule.end_at <= shifted_end
+        ).all() == [(sid,)]
+
+    notifications = _member_notifications(db_session, [test_student.id])[test_student.id]
+    assert len(notifications) == 1
+    assert notifications[0].type == NotificationType.SCHEDULE_CHANGED
+    assert "90분 늦춰졌습니다" in notifications[0].message
+
+
+def test_bulk_change_location(client, db_session, test_teacher, test_student, teacher_auth_headers, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    base, targets, excluded = _seed(db_session, group)
+
+    response = _bulk(client, teacher_auth_headers, group.id, base, action="change_location", location="스터디 카페")
+
+    assert response.status_code == 200, response.text
+    db_session.expire_all()
+    assert [db_session.get(Schedule, sid).location for sid in targets] == ["스터디 카페"] * 3
+    assert [db_session.get(Schedule, sid).location for sid in excluded] == ["학생 집"] * 2
+
+
+def test_bulk_rejects_malformed_dates_with_400(client, test_teacher, teacher_auth_headers, make_group):
+    group = make_group(test_teacher)
+    body = {"group_id": group.id, "action": "cancel", "reason": "연말 휴강 주간입니다"}
+
+    for from_date, to_date in [("2025-13-01", "2025-12-31"), ("next week", "2025-12-31"), ("2025-12-22", "2025-12-01")]:
+        response = client.post("/api/v1/schedules/bulk", headers=teacher_auth_headers,
+                               json=dict(body, from_date=from_date, to_date=to_date))
+        assert response.status_code == 400, (from_date, to_date, response.text)
+        assert response.json()["error"]["code"] == "VALIDATION_ERROR"
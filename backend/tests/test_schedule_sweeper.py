@@ -0,0 +1,85 @@
+"""
+지난 일정 자동 완료 처리 테스트 (ScheduleSweeperService.sweep: DONE 전환, 출결 누락 플래그, 배치 제한)
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.services.schedule_sweeper_service import ScheduleSweeperService
+
+NOW = datetime(2026, 3, 10, 12, 0)
+
+
+def _add_schedule(db, group, end_at, status=ScheduleStatus.SCHEDULED, student=None, title="수업"):
+    """end_at에 끝나는 2시간 일정 (student가 있으면 출석 기록 추가)"""
+    schedule = Schedule(group_id=group.id, title=title, type=ScheduleType.REGULAR,
+                        start_at=end_at - timedelta(hours=2), end_at=end_at, status=status)
+    db.add(schedule)
+    db.flush()
+    if student:
+        db.add(Attendance(schedule_id=schedule.id, student_id=student.id, status=AttendanceStatus.PRESENT))
+    return schedule.id
+
+
+def _state(db, schedule_id):
+    schedule = db.get(Schedule, schedule_id)
+    return schedule.status, schedule.attendance_missing
+
+
+def test_sweep_completes_finished_lessons_and_flags_missing_attendance(db_session, test_teacher, test_student,
+                                                                       make_group):
+    group = make_group(test_teacher, students=[test_student])
+    past = NOW - timedelta(hours=3)
+    done = _add_schedule(db_session, group, past, student=test_student)
+    moved = _add_schedule(db_session, group, past, status=ScheduleStatus.RESCHEDULED, student=test_student)
+    missing = _add_schedule(db_session, group, past)
+    canceled = _add_schedule(db_session, group, past, status=ScheduleStatus.CANCELED, student=test_student)
+    # 유예 시간(30분) 안에 끝난 수업 → 아직 대상 아님
+    in_grace = _add_schedule(db_session, group, NOW - timedelta(minutes=10), student=test_student)
+    db_session.commit()
+
+    result = ScheduleSweeperService.sweep(db_session, now=NOW)
+    db_session.expire_all()
+
+    assert (result["marked_done"], result["flagged_missing_attendance"]) == (2, 1)
+    assert _state(db_session, done) == (ScheduleStatus.DONE, False)
+    assert _state(db_session, moved) == (ScheduleStatus.DONE, False)
+    assert _state(db_session, missing) == (ScheduleStatus.SCHEDULED, True)
+    assert _state(db_session, canceled) == (ScheduleStatus.CANCELED, False)
+    assert _state(db_session, in_grace) == (ScheduleStatus.SCHEDULED, False)
+
+    # 나중에 출결을 기록하면 다음 실행에서 DONE, 플래그 해제 / 이미 처리된 일정은 다시 세지 않음
+    db_session.add(Attendance(schedule_id=missing, student_id=test_student.id, status=AttendanceStatus.LATE))
+    db_session.commit()
+
+    result = ScheduleSweeperService.sweep(db_session, now=NOW)
+    db_session.expire_all()
+
+    assert (result["marked_done"], result["flagged_missing_attendance"]) == (1, 0)
+    assert _state(db_session, missing) == (ScheduleStatus.DONE, False)
+
+
+def test_sweep_respects_batch_size_and_max_batches(db_session, test_teacher, test_student, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    schedule_ids = [
+        _add_schedule(db_session, group, NOW - timedelta(days=i + 1), student=test_student, title=f"수업 {i}")
+        for i in range(5)
+    ]
+    db_session.commit()
+
+    # 배치 2개 × 2행 → 4건만 처리 (출결 누락 작업은 빈 배치 1회)
+    result = ScheduleSweeperService.sweep(db_session, now=NOW, batch_size=2, max_batches=2)
+    db_session.expire_all()
+
+    assert result["marked_done"] == 4
+    assert result["batches"] == 3
+    statuses = [db_session.get(Schedule, schedule_id).status for schedule_id in schedule_ids]
+    assert statuses.count(ScheduleStatus.DONE) == 4
+
+    # 남은 1건은 다음 실행에서 처리 (배치 크기 미만이면 바로 종료)
+    result = ScheduleSweeperService.sweep(db_session, now=NOW, batch_size=2, max_batches=2)
+    db_session.expire_all()
+
+    assert (result["marked_done"], result["batches"]) == (1, 2)
+    assert all(db_session.get(Schedule, schedule_id).status == ScheduleStatus.DONE for schedule_id in schedule_ids)
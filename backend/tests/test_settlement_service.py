@@ -0,0 +1,40 @@
+"""
+SettlementService 청구 수업 횟수 계산 테스트 (완료된 일정만 청구)
+"""
+
+from datetime import date, datetime, timedelta
+
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.services.attendance_rollup_service import AttendanceRollupService
+from app.services.settlement_service import SettlementService
+
+
+def test_attended_lessons_count_done_schedules_only(db_session, test_teacher, test_student, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    lessons = [
+        (datetime(2025, 3, 3, 15), ScheduleStatus.DONE, AttendanceStatus.PRESENT),
+        (datetime(2025, 3, 10, 15), ScheduleStatus.DONE, AttendanceStatus.LATE),
+        (datetime(2025, 3, 17, 15), ScheduleStatus.DONE, AttendanceStatus.ABSENT),
+        # 출결은 기록됐지만 완료 처리되지 않은 일정 / 취소된 일정 → 청구하지 않음
+        (datetime(2025, 3, 24, 15), ScheduleStatus.SCHEDULED, AttendanceStatus.PRESENT),
+        (datetime(2025, 3, 26, 15), ScheduleStatus.CANCELED, AttendanceStatus.PRESENT),
+    ]
+    for start_at, schedule_status, attendance_status in lessons:
+        schedule = Schedule(group_id=group.id, title="수업", type=ScheduleType.REGULAR, start_at=start_at,
+                            end_at=start_at + timedelta(hours=2), status=schedule_status)
+        db_session.add(schedule)
+        db_session.flush()
+        db_session.add(Attendance(schedule_id=schedule.id, student_id=test_student.id, status=attendance_status))
+    AttendanceRollupService.rebuild(db_session, group.id)
+    db_session.commit()
+
+    # 월 단위 기간과 임의 기간이 같은 기준
+    month = SettlementService._calculate_attended_lessons(
+        db_session, group.id, test_student.id, date(2025, 3, 1), date(2025, 3, 31)
+    )
+    partial = SettlementService._calculate_attended_lessons(
+        db_session, group.id, test_student.id, date(2025, 3, 2), date(2025, 3, 30)
+    )
+
+    assert month == partial == (2, 1)
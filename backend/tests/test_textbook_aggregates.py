@@ -0,0 +1,92 @@
+"""
+교재 진도 집계(progress_*) 유지 테스트 (수업 기록 작성/수정/삭제 → 교재 목록)
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.textbook import Textbook
+from app.services.textbook_service import TextbookService
+
+
+def _done_schedule(db, group, days_ago):
+    start_at = datetime.utcnow().replace(microsecond=0) - timedelta(days=days_ago, hours=3)
+    schedule = Schedule(group_id=group.id, title="수학 수업", type=ScheduleType.REGULAR, start_at=start_at,
+                        end_at=start_at + timedelta(hours=2), status=ScheduleStatus.DONE)
+    db.add(schedule)
+    db.commit()
+    return schedule
+
+
+def _aggregates(db, textbook_id):
+    db.expire_all()
+    textbook = db.get(Textbook, textbook_id)
+    return (
+        textbook.progress_current_page,
+        textbook.progress_lesson_count,
+        textbook.progress_pages_covered,
+        textbook.progress_first_lesson_at,
+        textbook.progress_last_lesson_at,
+    )
+
+
+def test_textbook_aggregates_follow_lesson_record_create_edit_delete(
+    client, db_session, test_teacher, test_student, teacher_auth_headers, make_group,
+):
+    group = make_group(test_teacher, students=[test_student])
+    textbook = Textbook(group_id=group.id, title="수학의 정석", total_pages=100)
+    db_session.add(textbook)
+    db_session.commit()
+    textbook_id = textbook.id
+    first, second = _done_schedule(db_session, group, 7), _done_schedule(db_session, group, 1)
+
+    def create(schedule, start_page, end_page):
+        response = client.post(f"/api/v1/lesson-records/schedules/{schedule.id}", headers=teacher_auth_headers, json={
+            "content": "이차방정식의 근의 공식을 배웠습니다.",
+            "progress_records": [{"textbook_id": textbook_id, "start_page": start_page, "end_page": end_page}],
+        })
+        assert response.status_code == 201, response.text
+        return response.json()["data"]["lesson_record_id"]
+
+    # 1. 작성 → 집계 반영
+    create(first, 1, 20)
+    latest_id = create(second, 21, 35)
+    assert _aggregates(db_session, textbook_id) == (35, 2, 35, first.start_at, second.start_at)
+
+    listed = client.get(f"/api/v1/textbooks/groups/{group.id}", headers=teacher_auth_headers)
+    assert listed.status_code == 200
+    item = listed.json()["data"]["items"][0]
+    assert (item["current_page"], item["progress_percentage"]) == (35, 35.0)
+
+    # 2. 수정(진도 기록 변경 없음) → 집계 그대로
+    edited = client.patch(f"/api/v1/lesson-records/{latest_id}", headers=teacher_auth_headers,
+                          json={"content": "근의 공식과 판별식을 배웠습니다."})
+    assert edited.status_code == 200, edited.text
+    assert _aggregates(db_session, textbook_id) == (35, 2, 35, first.start_at, second.start_at)
+
+    # 3. 삭제 → 남은 진도 기록으로 재계산
+    deleted = client.delete(f"/api/v1/lesson-records/{latest_id}", headers=teacher_auth_headers)
+    assert deleted.status_code == 204, deleted.text
+    assert _aggregates(db_session, textbook_id) == (20, 1, 20, first.start_at, first.start_at)
+
+
+def test_textbook_list_query_count_is_constant(db_session, new_session, count_queries, test_teacher,
+                                               test_student, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    db_session.add_all([
+        Textbook(group_id=group.id, title=f"교재 {i}", total_pages=200, progress_current_page=i * 10,
+                 progress_lesson_count=i, progress_pages_covered=i * 10)
+        for i in range(1, 16)
+    ])
+    db_session.commit()
+
+    group_id = group.id
+    db = new_session()
+    student = db.get(type(test_student), test_student.id)
+    with count_queries() as statements:
+        textbooks = TextbookService.get_textbooks(db, student, group_id)
+
+    assert len(textbooks) == 15
+    assert sorted(tb.current_page for tb in textbooks) == [i * 10 for i in range(1, 16)]
+    # 그룹 1 + 멤버십 1 + 교재 목록 1 (교재별 진도 쿼리 없음)
+    assert len(statements) == 3
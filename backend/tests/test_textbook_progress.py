@@ -0,0 +1,90 @@
+"""
+교재 진도 요약/히스토리 테스트 (GET /api/v1/textbooks/groups/{group_id}/progress/{textbook_id})
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.lesson import LessonRecord, ProgressRecord
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.textbook import Textbook
+from app.models.user import UserRole
+from app.services.textbook_service import TextbookService
+
+
+def _seed_progress(db, group, teacher, pages, base=datetime(2025, 3, 3, 15)):
+    """교재 1개 + 수업별 (start_page, end_page) 진도 기록, 교재 진도 집계 갱신"""
+    textbook = Textbook(group_id=group.id, title="수학의 정석", publisher="성지출판", total_pages=200)
+    db.add(textbook)
+    db.flush()
+    for i, (start_page, end_page) in enumerate(pages):
+        start_at = base + timedelta(days=7 * i)
+        schedule = Schedule(group_id=group.id, title=f"수업 {i}", type=ScheduleType.REGULAR, start_at=start_at,
+                            end_at=start_at + timedelta(hours=2), status=ScheduleStatus.DONE)
+        db.add(schedule)
+        db.flush()
+        record = LessonRecord(schedule_id=schedule.id, group_id=group.id, created_by=teacher.id,
+                              content=f"{i}번째 수업: " + "이차방정식 풀이 " * 10)
+        db.add(record)
+        db.flush()
+        db.add(ProgressRecord(lesson_record_id=record.id, textbook_id=textbook.id,
+                              start_page=start_page, end_page=end_page))
+    db.flush()
+    TextbookService.refresh_progress(db, [textbook.id])
+    db.commit()
+    return textbook
+
+
+def test_progress_summary_history_and_chart(client, db_session, test_teacher, test_student,
+                                            student_auth_headers, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    textbook = _seed_progress(db_session, group, test_teacher, [(1, 10), (11, 25), (26, 30)])
+
+    response = client.get(f"/api/v1/textbooks/groups/{group.id}/progress/{textbook.id}",
+                          headers=student_auth_headers)
+
+    assert response.status_code == 200, response.text
+    progress = response.json()["data"]["progress"]
+    summary = progress["summary"]
+    assert summary["current_page"] == 30
+    assert summary["progress_percentage"] == 15.0
+    assert summary["total_lessons"] == 3
+    assert summary["average_pages_per_lesson"] == 10.0
+    assert (summary["first_lesson_date"], summary["last_lesson_date"]) == ("2025-03-03", "2025-03-17")
+
+    history = progress["history"]
+    assert [(item["start_page"], item["end_page"], item["pages_covered"]) for item in history] == [
+        (1, 10, 10), (11, 25, 15), (26, 30, 5),
+    ]
+    assert history[0]["lesson_date"] == "2025-03-03"
+    assert len(history[0]["content_preview"]) == TextbookService.CONTENT_PREVIEW_LENGTH + 3
+    assert history[0]["content_preview"].endswith("...")
+    assert progress["chart_labels"] == ["03/03", "03/10", "03/17"]
+    assert progress["chart_values"] == [10, 25, 30]
+
+
+def test_progress_summary_rejects_non_member(client, db_session, test_teacher, test_student, make_group,
+                                             make_user, auth_headers_for):
+    group = make_group(test_teacher, students=[test_student])
+    textbook = _seed_progress(db_session, group, test_teacher, [(1, 10)])
+    outsider = make_user("outsider@test.com", UserRole.STUDENT)
+
+    response = client.get(f"/api/v1/textbooks/groups/{group.id}/progress/{textbook.id}",
+                          headers=auth_headers_for(outsider))
+
+    assert response.status_code == 403
+
+
+def test_progress_summary_query_count_is_constant(db_session, new_session, count_queries, test_teacher,
+                                                  test_student, make_group):
+    group = make_group(test_teacher, students=[test_student])
+    textbook = _seed_progress(db_session, group, test_teacher, [(i * 5 + 1, i * 5 + 5) for i in range(25)])
+
+    group_id, textbook_id = group.id, textbook.id
+    db = new_session()
+    student = db.get(type(test_student), test_student.id)
+    with count_queries() as statements:
+        result = TextbookService.get_progress_summary(db, student, group_id, textbook_id)
+
+    assert len(result.history) == 25
+    # 그룹 1 + 멤버십 1 + 교재 1 + 진도 히스토리(수업 기록/일정 조인) 1 (기록 수와 무관)
+    assert len(statements) == 4
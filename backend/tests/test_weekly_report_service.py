@@ -0,0 +1,113 @@
+"""
+학부모 주간 리포트 파이프라인 테스트 (collect → render → send)
+"""
+
+from datetime import date, datetime, timedelta
+
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.lesson import LessonRecord, ProgressRecord
+from app.models.schedule import Schedule, ScheduleType, ScheduleStatus
+from app.models.settings import Settings
+from app.models.textbook import Textbook
+from app.models.user import UserRole
+from app.services.weekly_report_service import WeeklyReportService
+
+WEEK_START = date(2025, 3, 3)  # 월요일
+
+
+def _seed_family(db, make_user, make_group, teacher, suffix, email_enabled=True):
+    """학생 2명 그룹 + 첫째에 연결된 학부모, 주간 수업 2회(기록/숙제/출결/진도) + 취소된 수업 1회"""
+    first = make_user(f"child1-{suffix}@test.com", UserRole.STUDENT, name=f"첫째{suffix}")
+    second = make_user(f"child2-{suffix}@test.com", UserRole.STUDENT, name=f"둘째{suffix}")
+    parent = make_user(f"parent-{suffix}@test.com", UserRole.PARENT, name=f"학부모{suffix}")
+    group = make_group(teacher, students=[first, second], parents=[(parent, first)], name=f"수학반 {suffix}")
+    if not email_enabled:
+        db.add(Settings(user_id=parent.id, email_enabled=False))
+
+    textbook = Textbook(group_id=group.id, title="수학의 정석", total_pages=100, progress_current_page=40)
+    db.add(textbook)
+    db.flush()
+    for day, schedule_status, attendance_status, pages in [
+        (0, ScheduleStatus.DONE, AttendanceStatus.PRESENT, (1, 20)),
+        (2, ScheduleStatus.DONE, AttendanceStatus.LATE, (21, 40)),
+        (4, ScheduleStatus.CANCELED, None, None),
+    ]:
+        start_at = datetime.combine(WEEK_START, datetime.min.time()) + timedelta(days=day, hours=15)
+        schedule = Schedule(group_id=group.id, title="수학 수업", type=ScheduleType.REGULAR, start_at=start_at,
+                            end_at=start_at + timedelta(hours=2), status=schedule_status)
+        db.add(schedule)
+        db.flush()
+        if attendance_status is None:
+            continue
+        record = LessonRecord(schedule_id=schedule.id, group_id=group.id, created_by=teacher.id,
+                              content=f"{day}일차 이차방정식 수업", homework=f"{day}일차 숙제")
+        db.add(record)
+        db.flush()
+        db.add(ProgressRecord(lesson_record_id=record.id, textbook_id=textbook.id,
+                              start_page=pages[0], end_page=pages[1]))
+        db.add(Attendance(schedule_id=schedule.id, student_id=first.id, status=attendance_status))
+        db.add(Attendance(schedule_id=schedule.id, student_id=second.id, status=AttendanceStatus.ABSENT))
+    db.commit()
+    return parent
+
+
+class RecordingMailer:
+    """발송 대신 메시지를 기록 (EmailService.send_bulk와 같은 인터페이스)"""
+
+    def __init__(self):
+        self.messages = []
+
+    def send_bulk(self, messages, batch_size=100):
+        self.messages.extend(messages)
+        return {"sent": len(self.messages), "failed": 0, "skipped": 0}
+
+
+def test_collect_builds_child_report_in_five_queries(db_session, new_session, count_queries, test_teacher,
+                                                     make_user, make_group):
+    parents = [_seed_family(db_session, make_user, make_group, test_teacher, i) for i in range(3)]
+    _seed_family(db_session, make_user, make_group, test_teacher, "off", email_enabled=False)
+
+    parent_emails = [parent.email for parent in parents]
+    start, end = WeeklyReportService.week_bounds(WEEK_START)
+    db = new_session()
+    with count_queries() as statements:
+        reports = WeeklyReportService.collect(db, start, end)
+
+    # 가족 수와 무관하게 쿼리 5회
+    assert len(statements) == 5
+    # 이메일 수신을 끈 학부모 제외
+    assert sorted(report["to_email"] for report in reports) == sorted(parent_emails)
+
+    report = next(report for report in reports if report["to_email"] == parent_emails[0])
+    assert report["week_label"] == "03/03~03/09"
+    [child] = report["children"]  # 연결된 자녀만
+    assert (child["student_name"], child["group_name"]) == ("첫째0", "수학반 0")
+    # 취소된 수업 제외, 자녀의 출결만
+    assert [(lesson["attendance"], lesson["homework"]) for lesson in child["lessons"]] == [
+        ("PRESENT", "0일차 숙제"), ("LATE", "2일차 숙제"),
+    ]
+    assert child["attendance_counts"] == {"PRESENT": 1, "LATE": 1}
+    assert child["progress"] == [
+        {"title": "수학의 정석", "start_page": 1, "end_page": 40, "current_page": 40, "total_pages": 100},
+    ]
+
+
+def test_run_renders_and_sends_one_email_per_family(db_session, test_teacher, make_user, make_group):
+    parent = _seed_family(db_session, make_user, make_group, test_teacher, "a")
+    mailer = RecordingMailer()
+
+    metrics = WeeklyReportService.run(db_session, week_start=WEEK_START, workers=1, mailer=mailer)
+
+    assert (metrics["families"], metrics["children"], metrics["sent"]) == (1, 1, 1)
+    assert metrics["week_start"] == "2025-03-03"
+    assert all(metrics[key] >= 0 for key in ("collect_ms", "render_ms", "send_ms", "total_ms"))
+    [message] = mailer.messages
+    assert message["to_email"] == parent.email
+    assert "03/03~03/09" in message["subject"]
+    for text in ("첫째a", "0일차 이차방정식 수업", "2일차 숙제", "출석 1회", "지각 1회", "1~40쪽"):
+        assert text in message["html_body"]
+    assert "둘째a" not in message["html_body"]
+
+    dry_run = WeeklyReportService.run(db_session, week_start=WEEK_START, send=False, workers=1, mailer=mailer)
+    assert (dry_run["sent"], dry_run["skipped"]) == (0, 1)
+    assert len(mailer.messages) == 1